@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+batch_pipeline.py - Stufen-Pipeline mit begrenzten Warteschlangen
+
+Die stapelbasierte Verarbeitung ist ein Barrieren-Design: Templates erstellen,
+Pool laufen lassen, auf das langsamste Zeichen warten, GC, nächster Stapel.
+CPU-lastige Stufen (Rendern, Komponieren, PNG-Kodieren) und I/O (Schreiben)
+überlappen sich dabei nie.
+
+BatchPipeline verbindet Stufen über begrenzte Warteschlangen:
+- Jede Stufe hat eine eigene Anzahl Worker-Threads
+- Speicherbedarf ist durch Warteschlangentiefe begrenzt, nicht durch Stapelgröße
+- Optional geordnete Ausgabe (Umsortier-Puffer, z.B. für PDF-Seiten)
+- Fehler eines Elements überspringen die restlichen Stufen, nicht die Pipeline
+- Belegungszeit pro Stufe für die Export-Statistik
+- Optionale Zulassungskontrolle (z.B. MemoryScheduler: Speicherbudget statt fester Anzahl)
+
+Verwendung:
+    pipeline = BatchPipeline([
+        PipelineStage("render", render_func, workers=4),
+        PipelineStage("write", write_func, workers=1),
+    ], queue_depth=4)
+
+    for index, item, result, error in pipeline.run(items):
+        ...
+"""
+
+import time
+from dataclasses import dataclass
+from queue import Queue
+from threading import Event, Lock, Semaphore, Thread
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from logging_manager import LoggingManager
+from constants import DEFAULT_PIPELINE_QUEUE_DEPTH
+
+
+@dataclass
+class PipelineStage:
+    """
+    Eine Stufe der Pipeline
+
+    Attributes:
+        name: Name für Statistik und Logging
+        func: Verarbeitet den Wert der vorherigen Stufe und gibt den neuen Wert zurück
+        workers: Anzahl Worker-Threads dieser Stufe
+    """
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+
+
+class _Job:
+    """Element auf dem Weg durch die Pipeline"""
+
+    __slots__ = ('index', 'item', 'value', 'error', 'failed_stage', 'admission_token')
+
+    def __init__(self, index: int, item: Any):
+        self.index = index
+        self.item = item
+        self.value = item
+        self.error: Optional[Exception] = None
+        self.failed_stage: Optional[str] = None
+        self.admission_token: Any = None
+
+
+# Markiert das Ende einer Warteschlange (ein Exemplar pro Worker der Folgestufe)
+_END = object()
+
+
+class BatchPipeline:
+    """
+    Mehrstufige Thread-Pipeline mit begrenzten Warteschlangen
+
+    Eine Instanz kann mehrfach nacheinander run() ausführen, aber nicht parallel.
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        queue_depth: int = DEFAULT_PIPELINE_QUEUE_DEPTH,
+        ordered: bool = False,
+        max_in_flight: Optional[int] = None,
+        admission: Any = None
+    ):
+        """
+        Initialisiert Pipeline
+
+        Args:
+            stages: Stufen in Verarbeitungsreihenfolge
+            queue_depth: Max. wartende Elemente vor jeder Stufe
+            ordered: True = Ergebnisse in Eingabe-Reihenfolge liefern
+            max_in_flight: Max. Elemente gleichzeitig in der Pipeline inkl. Umsortier-Puffer
+                (default: Summe aus Workern und Warteschlangen)
+            admission: Optionale Zulassungskontrolle mit acquire(item) -> token und
+                release(token), z.B. MemoryScheduler. acquire() darf blockieren.
+        """
+        if not stages:
+            raise ValueError("Pipeline benötigt mindestens eine Stufe")
+
+        self.logger = LoggingManager().get_logger(__name__)
+        self.stages = stages
+        self.queue_depth = max(1, queue_depth)
+        self.ordered = ordered
+
+        if max_in_flight is None:
+            max_in_flight = sum(max(1, s.workers) for s in stages) + self.queue_depth * len(stages)
+        self.max_in_flight = max(1, max_in_flight)
+        self.admission = admission
+
+        self._stats_lock = Lock()
+        self._busy: Dict[str, float] = {}
+        self._items: Dict[str, int] = {}
+        self._wall_time = 0.0
+
+    def run(self, items: Iterable[Any]) -> Iterator[Tuple[int, Any, Any, Optional[Exception]]]:
+        """
+        Schickt Elemente durch alle Stufen
+
+        Der Aufrufer-Thread konsumiert die Ergebnisse (z.B. für Progress-Callbacks
+        oder einen PDF-Writer, der nur aus einem Thread benutzt werden darf).
+
+        Args:
+            items: Eingabe-Elemente (werden lazy gelesen)
+
+        Yields:
+            (index, item, result, error) - error ist None bei Erfolg,
+            sonst die Exception der fehlgeschlagenen Stufe (result ist dann None)
+        """
+        self._busy = {stage.name: 0.0 for stage in self.stages}
+        self._items = {stage.name: 0 for stage in self.stages}
+        start_time = time.time()
+
+        queues = [Queue(maxsize=self.queue_depth) for _ in self.stages]
+        output = Queue()
+        in_flight = Semaphore(self.max_in_flight)
+        cancelled = Event()
+        feeder_error: List[BaseException] = []
+        threads: List[Thread] = []
+
+        def feeder():
+            try:
+                for index, item in enumerate(items):
+                    in_flight.acquire()
+                    if cancelled.is_set():
+                        break
+                    job = _Job(index, item)
+                    if self.admission is not None:
+                        job.admission_token = self.admission.acquire(item)
+                        if cancelled.is_set():
+                            self._release_admission(job)
+                            break
+                    queues[0].put(job)
+            except BaseException as e:  # Fehler im Eingabe-Iterator an Aufrufer weitergeben
+                feeder_error.append(e)
+            finally:
+                for _ in range(self._worker_count(0)):
+                    queues[0].put(_END)
+
+        feeder_thread = Thread(target=feeder, name="pipeline-feeder", daemon=True)
+        threads.append(feeder_thread)
+
+        for stage_idx, stage in enumerate(self.stages):
+            remaining = [self._worker_count(stage_idx)]
+            remaining_lock = Lock()
+
+            def stage_worker(stage_idx=stage_idx, stage=stage, remaining=remaining,
+                             remaining_lock=remaining_lock):
+                inbox = queues[stage_idx]
+                is_last = stage_idx == len(self.stages) - 1
+                outbox = output if is_last else queues[stage_idx + 1]
+
+                while True:
+                    job = inbox.get()
+                    if job is _END:
+                        break
+
+                    if job.error is None and not cancelled.is_set():
+                        stage_start = time.time()
+                        try:
+                            job.value = stage.func(job.value)
+                        except Exception as e:
+                            job.value = None
+                            job.error = e
+                            job.failed_stage = stage.name
+                        with self._stats_lock:
+                            self._busy[stage.name] += time.time() - stage_start
+                            self._items[stage.name] += 1
+
+                    outbox.put(job)
+
+                # Letzter Worker dieser Stufe beendet die Folgestufe
+                with remaining_lock:
+                    remaining[0] -= 1
+                    last_worker = remaining[0] == 0
+                if last_worker:
+                    if is_last:
+                        output.put(_END)
+                    else:
+                        for _ in range(self._worker_count(stage_idx + 1)):
+                            outbox.put(_END)
+
+            for worker_idx in range(self._worker_count(stage_idx)):
+                threads.append(Thread(
+                    target=stage_worker,
+                    name="pipeline-{}-{}".format(stage.name, worker_idx),
+                    daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+
+        pending: Dict[int, _Job] = {}
+        next_index = 0
+        try:
+            while True:
+                job = output.get()
+                if job is _END:
+                    break
+
+                if not self.ordered:
+                    self._release_admission(job)
+                    in_flight.release()
+                    yield self._result(job)
+                    continue
+
+                # Umsortier-Puffer: durch max_in_flight begrenzt
+                pending[job.index] = job
+                while next_index in pending:
+                    ready = pending.pop(next_index)
+                    next_index += 1
+                    self._release_admission(ready)
+                    in_flight.release()
+                    yield self._result(ready)
+
+            # Sicherheitsnetz (Lücken nur bei abgebrochener Eingabe möglich)
+            for index in sorted(pending):
+                ready = pending.pop(index)
+                self._release_admission(ready)
+                yield self._result(ready)
+
+            if feeder_error:
+                raise feeder_error[0]
+
+        finally:
+            # Bei Abbruch durch den Aufrufer: restliche Elemente nur noch durchreichen
+            cancelled.set()
+            for _ in range(self.max_in_flight):
+                in_flight.release()
+            for job in pending.values():
+                self._release_admission(job)
+            # Feeder kann in admission.acquire() warten -> Rest einsammeln und freigeben
+            while feeder_thread.is_alive():
+                while not output.empty():
+                    job = output.get()
+                    if job is not _END:
+                        self._release_admission(job)
+                feeder_thread.join(timeout=0.05)
+            for thread in threads:
+                thread.join()
+            while not output.empty():
+                job = output.get()
+                if job is not _END:
+                    self._release_admission(job)
+            self._wall_time = time.time() - start_time
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Statistik des letzten Laufs
+
+        Returns:
+            dict: {stage_name: {items, workers, busy_s, utilization}}
+                utilization = Belegungszeit / (Laufzeit x Worker), 0..1
+        """
+        with self._stats_lock:
+            stats = {}
+            for stage_idx, stage in enumerate(self.stages):
+                workers = self._worker_count(stage_idx)
+                busy = self._busy.get(stage.name, 0.0)
+                capacity = self._wall_time * workers
+                stats[stage.name] = {
+                    'items': self._items.get(stage.name, 0),
+                    'workers': workers,
+                    'busy_s': busy,
+                    'utilization': busy / capacity if capacity > 0 else 0.0
+                }
+            return stats
+
+    def _worker_count(self, stage_idx: int) -> int:
+        """Worker-Anzahl einer Stufe (mindestens 1)"""
+        return max(1, self.stages[stage_idx].workers)
+
+    def _release_admission(self, job: _Job):
+        """Gibt die Zulassung eines Elements frei (genau einmal)"""
+        if self.admission is not None and job.admission_token is not None:
+            token, job.admission_token = job.admission_token, None
+            self.admission.release(token)
+
+    @staticmethod
+    def _result(job: _Job) -> Tuple[int, Any, Any, Optional[Exception]]:
+        """Ergebnis-Tupel für den Aufrufer"""
+        return job.index, job.item, job.value, job.error
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    import random
+
+    print("=" * 80)
+    print("BATCH-PIPELINE TEST")
+    print("=" * 80)
+
+    def slow_square(x):
+        time.sleep(random.uniform(0, 0.01))
+        return x * x
+
+    def fail_on_seven(x):
+        if x == 49:
+            raise ValueError("49")
+        return x + 1
+
+    pipeline = BatchPipeline([
+        PipelineStage("square", slow_square, workers=4),
+        PipelineStage("plus_one", fail_on_seven, workers=2),
+    ], queue_depth=2, ordered=True)
+
+    results = list(pipeline.run(range(20)))
+    print(f"\n[TEST 1] Reihenfolge: {[r[0] for r in results] == list(range(20))}")
+    print(f"[TEST 2] Fehler isoliert: {[r[0] for r in results if r[3] is not None]}")
+    print(f"[TEST 3] Statistik: {pipeline.get_stats()}")
+
+    print("\n" + "=" * 80)
+    print("[OK] Alle Tests abgeschlossen")
+    print("=" * 80)
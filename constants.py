@@ -262,8 +262,7 @@ DEFAULT_TEXT_BOTTOM_OFFSET_MM = 0.0  # Abstand zwischen Text (unten) und Sicherh
 # DEFAULT_FONT_SIZE bereits oben definiert
 # DEFAULT_FONT_FAMILY bereits oben definiert
 
-# Text-Messungs-Parameter
-TEMP_IMAGE_SIZE_PX = 1000  # Größe des temporären Images für Textmessungen (war 100px - zu klein!)
+# REMOVED: TEMP_IMAGE_SIZE_PX - Textmessung ohne temporäres Bild (font.getbbox, text_layout.py)
 
 # Platzhalter-Längen
 DEFAULT_OV_LENGTH = 16
@@ -458,10 +457,108 @@ EXPORT_PNG_COMPRESS_LEVEL = 6
 
 # NEW: Block-Größen für Ressourcen-Optimierung (v0.6.0)
 DEFAULT_PNG_CHUNK_MULTIPLIER = 4  # Stapelgröße = num_threads * multiplier
-DEFAULT_PDF_CHUNK_SIZE = 100  # Anzahl Seiten pro PDF-Datei
-DEFAULT_PDF_CHUNK_SIZE_SCHNITTBOGEN = 20  # Anzahl Seiten pro PDF-Datei
+DEFAULT_PDF_CHUNK_SIZE = 100  # Anzahl Seiten pro PDF-Datei (0 = eine Datei)
+DEFAULT_PDF_CHUNK_SIZE_SCHNITTBOGEN = 20  # Anzahl Seiten pro PDF-Datei (0 = eine Datei)
 MIN_PDF_LAST_CHUNK_SIZE = 5  # Minimale Seitenzahl für letzte PDF-Datei
 
+# NEW: Persistenter Raster-Cache für gerenderte SVG-Grafiken
+# Schlüssel: SVG-Inhalts-Hash + DPI + Ziel-Box (mm) + render_scale + RESAMPLING_FILTER + Renderer
+SYSTEM_RASTER_CACHE_DIR = BASE_DIR / "Cache" / "raster"
+SYSTEM_RASTER_CACHE_VERSION = 2  # Erhöhen wenn sich die Render-Pipeline ändert (invalidiert Cache)
+SYSTEM_RASTER_CACHE_COMPRESS_LEVEL = 1  # Schnelles Schreiben, Cache-Dateien sind temporär
+DEFAULT_RASTER_CACHE_ENABLED = True
+DEFAULT_RASTER_CACHE_MAX_MB = 1024  # Größenbudget, älteste Einträge werden verdrängt (LRU)
+
+# NEW: Render-Backend für Batch-Export
+# "thread":  SVG-Rendering in den Threads des Batch-Pools (bisheriges Verhalten)
+# "process": SVG-Rendering in langlebigen Worker-Prozessen (skaliert mit CPU-Kernen)
+RENDER_BACKEND_THREAD = "thread"
+RENDER_BACKEND_PROCESS = "process"
+AVAILABLE_RENDER_BACKENDS = [RENDER_BACKEND_THREAD, RENDER_BACKEND_PROCESS]
+DEFAULT_RENDER_BACKEND = RENDER_BACKEND_THREAD
+
+# NEW: SVG-Renderer (svg_renderer.py)
+# "auto":        Schnellster verfügbarer Renderer, Fallback auf ImageMagick (opt-in)
+# "imagemagick": Wand/ImageMagick (bisheriges Verhalten, Standard)
+# "cairosvg":    cairosvg in-process (optional, benötigt Cairo-Bibliothek)
+RENDER_ENGINE_AUTO = "auto"
+RENDER_ENGINE_IMAGEMAGICK = "imagemagick"
+RENDER_ENGINE_CAIROSVG = "cairosvg"
+AVAILABLE_RENDER_ENGINES = [RENDER_ENGINE_AUTO, RENDER_ENGINE_IMAGEMAGICK, RENDER_ENGINE_CAIROSVG]
+DEFAULT_RENDER_ENGINE = RENDER_ENGINE_IMAGEMAGICK
+SYSTEM_CSS_PX_PER_INCH = 96.0  # SVG-Benutzereinheiten (CSS-Pixel) pro Zoll
+SYSTEM_SVG_SOURCE_CACHE_MAX_MB = 64  # In-Memory-Cache für geladene SVG-Dokumente (pro Prozess)
+SYSTEM_FONT_CACHE_SIZE = 64  # Geladene Fonts (Pfad, Pixelgröße) im Speicher (font_registry.py)
+SYSTEM_TEXT_LAYOUT_CACHE_SIZE = 4096  # Gemessene Texte/Umbrüche pro (Font, Text) (text_layout.py)
+
+# NEW: Template-Speicher (template_store.py) - Text-/SVG-Templates über Stapelgrenzen hinweg
+# "batch":   Templates leben für einen Batch-Export
+# "session": Templates bleiben bis Programmende erhalten (Folge-Exporte profitieren)
+TEMPLATE_CACHE_SCOPE_BATCH = "batch"
+TEMPLATE_CACHE_SCOPE_SESSION = "session"
+AVAILABLE_TEMPLATE_CACHE_SCOPES = [TEMPLATE_CACHE_SCOPE_BATCH, TEMPLATE_CACHE_SCOPE_SESSION]
+DEFAULT_TEMPLATE_CACHE_SCOPE = TEMPLATE_CACHE_SCOPE_BATCH
+DEFAULT_TEMPLATE_CACHE_MAX_MB = 512  # Verdrängung nach Bytes (LRU), nicht nach Stapel
+
+# NEW: Batch-Engine (batch_pipeline.py)
+# "chunked":  Stapel nacheinander (Templates -> Pool -> Warten auf langsamstes Zeichen -> GC), Standard
+# "pipeline": Rendern -> Komponieren -> PNG-Kodieren -> Schreiben als Stufen mit
+#             begrenzten Warteschlangen (Speicher begrenzt durch Warteschlangentiefe, opt-in)
+BATCH_ENGINE_CHUNKED = "chunked"
+BATCH_ENGINE_PIPELINE = "pipeline"
+AVAILABLE_BATCH_ENGINES = [BATCH_ENGINE_CHUNKED, BATCH_ENGINE_PIPELINE]
+DEFAULT_BATCH_ENGINE = BATCH_ENGINE_CHUNKED
+DEFAULT_PIPELINE_QUEUE_DEPTH = 4  # Max. wartende Zeichen pro Stufe
+
+# NEW: Speicher-Scheduler (memory_scheduler.py) - ersetzt Größen-Schwellwerte für Threads/Stapel
+DEFAULT_MEMORY_BUDGET_MB = 0  # RAM für Zeichen in Bearbeitung (0 = automatisch)
+SYSTEM_MEMORY_BUDGET_AUTO_FRACTION = 0.5  # Automatisch: Anteil des verfügbaren RAM
+SYSTEM_MEMORY_BUDGET_FALLBACK_MB = 2048  # Automatisch, aber RAM nicht messbar
+SYSTEM_MEMORY_RSS_SAMPLE_INTERVAL_S = 0.5  # Mindestabstand der RSS-Messungen
+SYSTEM_PDF_PAGE_BYTES_RATIO = 0.35  # Komprimiertes PDF-Bild ≈ 35% der RGBA-Rohdaten
+SYSTEM_PDF_MIN_PAGES_IN_MEMORY = 1  # Untergrenze Seiten im Speicher (kleines Budget wird eingehalten)
+SYSTEM_PDF_COPY_WINDOW = 32  # Max. gehaltene Seiten für Kopien (ältere werden neu gerendert)
+
+# NEW: Bild-Kodierung im PDF (pdf_image_codec.py) - PIL-Pixel direkt komprimieren statt PNG-Umweg
+# "flate":    verlustfrei (zlib, Stufe einstellbar) - Standard für Zeichen
+# "jpeg2000": verlustfrei (JPXDecode), meist kleiner, langsamer zu kodieren
+# "jpeg":     verlustbehaftet (DCTDecode), für fotoähnliche Pseudo-SVGs
+PDF_IMAGE_CODEC_FLATE = "flate"
+PDF_IMAGE_CODEC_JPEG2000 = "jpeg2000"
+PDF_IMAGE_CODEC_JPEG = "jpeg"
+AVAILABLE_PDF_IMAGE_CODECS = [PDF_IMAGE_CODEC_FLATE, PDF_IMAGE_CODEC_JPEG2000, PDF_IMAGE_CODEC_JPEG]
+DEFAULT_PDF_IMAGE_CODEC = PDF_IMAGE_CODEC_FLATE
+DEFAULT_PDF_FLATE_LEVEL = 6  # zlib 1 (schnell) - 9 (klein)
+DEFAULT_PDF_JPEG_QUALITY = 95  # Nur für Codec "jpeg"
+
+# NEW: PDF-Exportmodus (vector_canvas.py)
+# "raster": Zeichen als Bild (DPI-abhängig) - bisheriges Verhalten
+# "vector": SVG als PDF-Vektorgrafik (svglib, optional), Text und Linien als PDF-Text/-Pfade;
+#           Pseudo-SVGs (und SVGs ohne svglib) werden als Bild eingebettet
+PDF_EXPORT_MODE_RASTER = "raster"
+PDF_EXPORT_MODE_VECTOR = "vector"
+AVAILABLE_PDF_EXPORT_MODES = [PDF_EXPORT_MODE_RASTER, PDF_EXPORT_MODE_VECTOR]
+DEFAULT_PDF_EXPORT_MODE = PDF_EXPORT_MODE_RASTER
+SYSTEM_VECTOR_DRAWING_CACHE_SIZE = 64  # Geladene SVG-Drawings (svglib) im Speicher
+
+# NEW: Parallele PDF-Dateien bei stapelbasiertem Export (pdf_file_pool.py)
+# Jede Datei in einem eigenen Prozess mit eigenem Generator (warme Caches)
+DEFAULT_PDF_FILE_WORKERS = 0  # 0 = automatisch (CPU-Kerne, begrenzt durch Speicherbudget), 1 = nacheinander
+
+# NEW: Eine PDF-Datei statt mehrerer (pdf_merge.py) - Teil-PDFs werden parallel erstellt und
+# ohne erneutes Rendern/Komprimieren zusammengefügt
+DEFAULT_PDF_SINGLE_FILE = False
+
+# NEW: PDF-Dateien werden segmentweise auf die Platte geschrieben (SegmentedCanvas) -
+# Speicher hängt nicht mehr von der Seitenzahl ab, Seiten pro Datei sind reine Einstellung
+SYSTEM_PDF_SEGMENT_PAGES = 25  # Seiten pro Segment (Obergrenze, sonst aus Speicherbudget)
+
+# NEW: Inhalts-Box Vorab-Pass (statt Trimmen des Vollbilds bei dpi * render_scale)
+SYSTEM_BBOX_CACHE_DIR = BASE_DIR / "Cache" / "bbox"
+SYSTEM_BBOX_CACHE_VERSION = 1
+SYSTEM_BBOX_CACHE_MAX_ENTRIES = 4096  # JSON-Dateien im Inhalts-Box-Cache, älteste werden verdrängt (LRU)
+SYSTEM_BBOX_PREPASS_MAX_PX = 512  # Längste Seite des Vorab-Rasters in Pixel
+
 
 # ================================================================================================
 # EXPORT-DATEINAMEN (Namenskonventionen)
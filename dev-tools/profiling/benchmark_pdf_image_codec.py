@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_pdf_image_codec.py - Micro-Benchmark Bild-Einbettung im PDF
+
+Vergleicht pro DPI-Stufe (ein Zeichen pro Seite, verschiedene Inhalte):
+- PNG:       img.save(PNG) + ImageReader + drawImage  (bisheriger Weg)
+- flate:     encode_pdf_image (zlib auf Rohdaten, Stufe aus RuntimeConfig)
+- jpeg2000:  encode_pdf_image (verlustfrei)
+- jpeg:      encode_pdf_image (Qualität aus RuntimeConfig)
+
+Gemessen werden Kodierung + Einbettung + canvas.save() und die Dateigröße,
+nicht das SVG-Rendering.
+
+Ausführung: python dev-tools/profiling/benchmark_pdf_image_codec.py [seiten]
+"""
+
+import sys
+import time
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image, ImageDraw
+from reportlab.pdfgen import canvas
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
+
+from logging_manager import LoggingManager
+from pdf_exporter import SharedImageXObjects
+from pdf_image_codec import encode_pdf_image, JPEG2000_AVAILABLE
+from runtime_config import get_config
+from constants import (
+    DPI_STUFEN,
+    DEFAULT_ZEICHEN_HOEHE_MM,
+    DEFAULT_BESCHNITTZUGABE_MM,
+    AVAILABLE_PDF_IMAGE_CODECS,
+    PDF_IMAGE_CODEC_JPEG2000
+)
+
+
+def _test_image(size_px: int, variant: int) -> Image.Image:
+    """Zeichenähnliches Testbild (weißer Grund, Rahmen, Kreis, Text) - pro Seite verschieden"""
+    image = Image.new('RGBA', (size_px, size_px), (255, 255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    margin = size_px // 10
+    draw.rectangle((margin, margin, size_px - margin, size_px - margin),
+                   outline=(0, 0, 160, 255), width=max(2, size_px // 100))
+    draw.ellipse((2 * margin, 2 * margin, size_px - 2 * margin, size_px - 2 * margin),
+                 fill=(200, 30, 30, 255))
+    draw.text((margin * 2, size_px - margin * 2), "OV Test {}".format(variant), fill=(0, 0, 0, 255))
+    return image
+
+
+def _write_pdf(path: Path, images, page_size: float, codec: str):
+    """Schreibt ein Bild pro Seite mit gewähltem Weg"""
+    c = canvas.Canvas(str(path), pagesize=(page_size, page_size))
+    shared = SharedImageXObjects(c)
+    for image in images:
+        if codec == "png":
+            buffer = BytesIO()
+            image.save(buffer, format='PNG')
+            buffer.seek(0)
+            c.drawImage(ImageReader(buffer), 0, 0, width=page_size, height=page_size,
+                        preserveAspectRatio=True)
+        else:
+            shared.draw(encode_pdf_image(image, codec), 0, 0, page_size, page_size)
+        c.showPage()
+    c.save()
+
+
+def benchmark(pages: int):
+    """Misst alle Wege für alle DPI-Stufen"""
+    config = get_config()
+    codecs = ["png"] + [
+        codec for codec in AVAILABLE_PDF_IMAGE_CODECS
+        if codec != PDF_IMAGE_CODEC_JPEG2000 or JPEG2000_AVAILABLE
+    ]
+
+    datei_mm = DEFAULT_ZEICHEN_HOEHE_MM + 2 * DEFAULT_BESCHNITTZUGABE_MM
+    page_size = datei_mm * mm
+
+    print("=" * 80)
+    print("PDF-BILDKODIERUNG ({} Seiten, Flate-Stufe {}, JPEG-Qualität {})".format(
+        pages, config.pdf_flate_level, config.pdf_jpeg_quality))
+    print("=" * 80)
+    print("")
+    print("  {:>5} {:>10} {:>10} {:>10} {:>9}".format("DPI", "Weg", "Zeit", "Größe", "Faktor"))
+    print("-" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for dpi in DPI_STUFEN:
+            size_px = int(datei_mm / 25.4 * dpi)
+            images = [_test_image(size_px, i) for i in range(pages)]
+
+            baseline = None
+            for codec in codecs:
+                path = Path(tmp) / "{}_{}.pdf".format(dpi, codec)
+                start = time.perf_counter()
+                _write_pdf(path, images, page_size, codec)
+                elapsed = time.perf_counter() - start
+                if baseline is None:
+                    baseline = elapsed
+
+                print("  {:>5} {:>10} {:>8.2f}s {:>8.1f}KB {:>8.1f}x".format(
+                    dpi, codec, elapsed, path.stat().st_size / 1024,
+                    baseline / elapsed if elapsed > 0 else 0.0
+                ))
+            print("")
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    LoggingManager(log_level="WARNING", log_to_console=False)
+
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    benchmark(pages)
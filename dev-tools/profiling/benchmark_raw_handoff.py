@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_raw_handoff.py - Micro-Benchmark Wand -> PIL Übergabe
+
+Vergleicht pro DPI-Stufe:
+- PNG:  img.make_blob('png') + Image.open(BytesIO(...))  (bisheriger Weg)
+- RAW:  wand_to_pil() (rohe RGBA-Bytes + Image.frombuffer)
+
+Gemessen wird nur die Übergabe, nicht das SVG-Rendering.
+
+Ausführung: python dev-tools/profiling/benchmark_raw_handoff.py [wiederholungen]
+"""
+
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+
+from logging_manager import LoggingManager
+from svg_renderer import wand_to_pil
+from constants import DPI_STUFEN, DEFAULT_ZEICHEN_HOEHE_MM
+
+
+# Testgrafik: Kreis + Text, Größe = Standard-Zeichenhöhe
+TEST_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="{size}mm" height="{size}mm" viewBox="0 0 100 100">'
+    '<circle cx="50" cy="50" r="45" fill="none" stroke="blue" stroke-width="4"/>'
+    '<text x="50" y="60" font-size="30" text-anchor="middle">TZ</text></svg>'
+).format(size=DEFAULT_ZEICHEN_HOEHE_MM)
+
+
+def _time(func, repeats: int) -> float:
+    """Mittlere Laufzeit in ms"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1000.0
+
+
+def benchmark(repeats: int):
+    """Misst PNG- und RAW-Übergabe für alle DPI-Stufen"""
+    from wand.image import Image as WandImage
+
+    print("=" * 80)
+    print("WAND -> PIL ÜBERGABE (Mittel aus {} Läufen)".format(repeats))
+    print("=" * 80)
+    print("")
+    print("  {:>5} {:>12} {:>10} {:>10} {:>9}".format("DPI", "Größe", "PNG", "RAW", "Faktor"))
+    print("-" * 80)
+
+    for dpi in DPI_STUFEN:
+        with WandImage(blob=TEST_SVG.encode('utf-8'), format='svg', resolution=dpi) as img:
+
+            def via_png():
+                with Image.open(BytesIO(img.make_blob('png'))) as decoded:
+                    decoded.load()
+
+            def via_raw():
+                wand_to_pil(img).load()
+
+            png_ms = _time(via_png, repeats)
+            raw_ms = _time(via_raw, repeats)
+
+            print("  {:>5} {:>12} {:>8.2f}ms {:>8.2f}ms {:>8.1f}x".format(
+                dpi, "{}x{}".format(img.width, img.height), png_ms, raw_ms,
+                png_ms / raw_ms if raw_ms > 0 else 0.0
+            ))
+
+    print("")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    LoggingManager(log_level="WARNING", log_to_console=False)
+
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    try:
+        benchmark(repeats)
+    except ImportError as e:
+        print("Wand/ImageMagick nicht verfügbar: {}".format(e))
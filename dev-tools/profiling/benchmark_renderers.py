@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_renderers.py - Vergleich der SVG-Renderer
+
+Rendert dieselben SVGs mit allen verfügbaren Renderern (svg_renderer.py)
+und gibt Zeit sowie Pixel-Abweichung zur ImageMagick-Referenz aus.
+
+Ausführung: python dev-tools/profiling/benchmark_renderers.py [anzahl_svgs] [dpi]
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logging_manager import LoggingManager
+from svg_renderer import compare_renderers, get_available_renderers
+from constants import DEFAULT_ZEICHEN_DIR, DEFAULT_DPI
+
+
+def benchmark(svg_paths, dpi: int):
+    """Vergleicht alle Renderer und gibt Tabelle + Summen aus"""
+
+    print("=" * 80)
+    print("SVG-RENDERER BENCHMARK")
+    print("=" * 80)
+    print("")
+    print("Renderer: {}".format([r.name for r in get_available_renderers()]))
+    print("SVGs:     {}".format(len(svg_paths)))
+    print("DPI:      {}".format(dpi))
+    print("")
+
+    results = compare_renderers(svg_paths, dpi=dpi)
+
+    print("  {:<30} {:<12} {:>9} {:>12} {:>9}".format("SVG", "Renderer", "Zeit", "Größe", "Abw."))
+    print("-" * 80)
+
+    totals = {}
+    for row in results:
+        if row['error']:
+            print("  {:<30} {:<12} FEHLER: {}".format(row['svg'][:30], row['renderer'], row['error']))
+            continue
+        print("  {:<30} {:<12} {:>8.3f}s {:>12} {:>8.2f}%".format(
+            row['svg'][:30], row['renderer'], row['seconds'],
+            "{}x{}".format(*row['size']), row['diff_percent']
+        ))
+        total = totals.setdefault(row['renderer'], [0.0, 0])
+        total[0] += row['seconds']
+        total[1] += 1
+
+    print("")
+    print("SUMME:")
+    print("-" * 80)
+    for renderer, (seconds, count) in totals.items():
+        print("  {:<12} {:>8.3f}s  ({} SVGs, {:.3f}s/SVG)".format(
+            renderer, seconds, count, seconds / count if count else 0.0
+        ))
+    print("")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    LoggingManager(log_level="WARNING", log_to_console=False)
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    dpi = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_DPI
+
+    svgs = sorted(DEFAULT_ZEICHEN_DIR.rglob("*.svg"))[:count]
+    if svgs:
+        benchmark(svgs, dpi)
+    else:
+        print("Keine SVG gefunden!")
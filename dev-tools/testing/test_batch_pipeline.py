@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_batch_pipeline.py - Unit-Tests fuer die Stufen-Pipeline
+
+Testet:
+- Geordnete Ausgabe trotz paralleler Stufen
+- Fehler eines Elements ueberspringen nur dessen restliche Stufen
+- Speicher begrenzt: max. Elemente gleichzeitig in der Pipeline
+- Abbruch durch den Aufrufer beendet alle Threads
+- Batch-Export: Pipeline und Stapel liefern identische PNGs (Blanko-Zeichen)
+
+Ausfuehrung: python dev-tools/testing/test_batch_pipeline.py
+"""
+
+import sys
+import time
+import random
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from batch_pipeline import BatchPipeline, PipelineStage
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+def _jitter(value):
+    """Zufaellige Verzoegerung, damit Elemente sich ueberholen"""
+    time.sleep(random.uniform(0, 0.005))
+    return value
+
+
+def test_ordered_output():
+    """
+    Test 1: ordered=True liefert Eingabe-Reihenfolge, ordered=False alle Elemente
+    """
+    print_test("Geordnete Ausgabe")
+
+    stages = [
+        PipelineStage("a", lambda x: _jitter(x * 2), workers=4),
+        PipelineStage("b", lambda x: _jitter(x + 1), workers=3),
+    ]
+
+    ordered = list(BatchPipeline(stages, queue_depth=2, ordered=True).run(range(50)))
+    assert [r[0] for r in ordered] == list(range(50)), "FEHLER: Reihenfolge falsch"
+    assert all(r[2] == r[1] * 2 + 1 for r in ordered), "FEHLER: Falsches Ergebnis"
+
+    unordered = list(BatchPipeline(stages, queue_depth=2).run(range(50)))
+    assert sorted(r[0] for r in unordered) == list(range(50)), "FEHLER: Elemente fehlen"
+
+    print("  [OK] Reihenfolge und Vollstaendigkeit korrekt")
+    return True
+
+
+def test_error_isolation():
+    """
+    Test 2: Fehler ueberspringt restliche Stufen nur fuer das betroffene Element
+    """
+    print_test("Fehler-Isolation")
+
+    seen_by_b = []
+
+    def stage_a(x):
+        if x == 3:
+            raise ValueError("kaputt")
+        return x
+
+    def stage_b(x):
+        seen_by_b.append(x)
+        return x
+
+    pipeline = BatchPipeline([
+        PipelineStage("a", stage_a, workers=2),
+        PipelineStage("b", stage_b, workers=1),
+    ], ordered=True)
+    results = list(pipeline.run(range(6)))
+
+    errors = [(r[0], str(r[3])) for r in results if r[3] is not None]
+    assert errors == [(3, "kaputt")], "FEHLER: Fehler falsch zugeordnet: {}".format(errors)
+    assert 3 not in seen_by_b, "FEHLER: Fehlerhaftes Element lief weiter"
+    assert len(results) == 6, "FEHLER: Elemente fehlen"
+
+    stats = pipeline.get_stats()
+    assert stats['a']['items'] == 6 and stats['b']['items'] == 5, "FEHLER: Statistik: {}".format(stats)
+
+    print("  [OK] Fehler bleibt auf Element beschraenkt")
+    return True
+
+
+def test_bounded_in_flight():
+    """
+    Test 3: Nie mehr als max_in_flight Elemente gleichzeitig (auch im Umsortier-Puffer)
+    """
+    print_test("Begrenzter Speicher")
+
+    lock = threading.Lock()
+    alive = [0]
+    peak = [0]
+
+    def produce(x):
+        with lock:
+            alive[0] += 1
+            peak[0] = max(peak[0], alive[0])
+        # Element 0 ist langsam -> Umsortier-Puffer fuellt sich
+        time.sleep(0.1 if x == 0 else 0.001)
+        return x
+
+    pipeline = BatchPipeline(
+        [PipelineStage("produce", produce, workers=4)], queue_depth=1, ordered=True, max_in_flight=6
+    )
+    for _ in pipeline.run(range(40)):
+        with lock:
+            alive[0] -= 1
+
+    assert peak[0] <= 6, "FEHLER: {} Elemente gleichzeitig (max 6)".format(peak[0])
+
+    print("  [OK] Max. {} Elemente gleichzeitig".format(peak[0]))
+    return True
+
+
+def test_consumer_abort():
+    """
+    Test 4: Bricht der Aufrufer ab, enden alle Pipeline-Threads
+    """
+    print_test("Abbruch durch Aufrufer")
+
+    before = threading.active_count()
+    pipeline = BatchPipeline([
+        PipelineStage("a", _jitter, workers=3),
+        PipelineStage("b", _jitter, workers=2),
+    ], queue_depth=1)
+
+    results = pipeline.run(range(1000))
+    next(results)
+    results.close()
+
+    assert threading.active_count() == before, "FEHLER: Threads laufen weiter"
+
+    print("  [OK] Threads beendet")
+    return True
+
+
+def test_batch_engines_identical():
+    """
+    Test 5: Pipeline und Stapel-Verarbeitung erzeugen identische Dateien (auch mit Stapelgroesse)
+    """
+    print_test("Batch-Export: Pipeline vs. Stapel")
+
+    from runtime_config import get_config
+    from constants import BATCH_ENGINE_CHUNKED, BATCH_ENGINE_PIPELINE, MODUS_FREITEXT
+    from taktische_zeichen_generator import TaktischeZeichenGenerator, ZeichenConfig
+
+    generator = TaktischeZeichenGenerator()
+    config = get_config()
+    previous_engine = config.batch_engine
+
+    try:
+        outputs = {}
+        for engine, chunk_size in ((BATCH_ENGINE_PIPELINE, None), (BATCH_ENGINE_PIPELINE, 2),
+                                   (BATCH_ENGINE_CHUNKED, None)):
+            config.batch_engine = engine
+            with tempfile.TemporaryDirectory() as tmp:
+                svg_path = Path("BLANKO_freitext")
+                tasks = [
+                    (svg_path, ZeichenConfig(
+                        zeichen_id="blanko_{:03d}".format(i), svg_path=svg_path,
+                        modus=MODUS_FREITEXT, freitext="Test {}".format(i % 2),
+                        output_dir=Path(tmp)
+                    ))
+                    for i in range(6)
+                ]
+                files, errors = generator.create_zeichen_batch(tasks, num_threads=2, chunk_size=chunk_size)
+                assert not errors, "FEHLER ({}): {}".format(engine, errors)
+                outputs[(engine, chunk_size)] = {f.name: f.read_bytes() for f in files}
+    finally:
+        config.batch_engine = previous_engine
+
+    pipeline = outputs[(BATCH_ENGINE_PIPELINE, None)]
+    assert len(pipeline) == 6, "FEHLER: Dateien fehlen"
+    assert pipeline == outputs[(BATCH_ENGINE_CHUNKED, None)], "FEHLER: Dateien unterschiedlich"
+    assert pipeline == outputs[(BATCH_ENGINE_PIPELINE, 2)], "FEHLER: Stapelgroesse veraendert Ausgabe"
+
+    print("  [OK] Identische Ausgabe")
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("BATCH-PIPELINE UNIT TESTS")
+
+    tests = [
+        test_ordered_output,
+        test_error_isolation,
+        test_bounded_in_flight,
+        test_consumer_abort,
+        test_batch_engines_identical,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
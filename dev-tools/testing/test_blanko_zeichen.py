@@ -284,7 +284,7 @@ def test_sanitize_svg_content_with_blanko():
         print("  [INFO] Test wird uebersprungen (erfordert vollstaendige Abhaengigkeiten)")
         return True
 
-    # Blanko-Zeichen sollten unveraendert zurueckgegeben werden (kein Lesen)
+    # Blanko-Zeichen haben keinen SVG-Inhalt (kein Lesen -> None)
     blanko_paths = [
         Path("BLANKO_ov_staerke"),
         Path(BLANKO_S1_LINIEN_STAERKE),
@@ -292,11 +292,11 @@ def test_sanitize_svg_content_with_blanko():
 
     for path in blanko_paths:
         result = generator._sanitize_svg_content(path)
-        assert result == path, (
-            "FEHLER: _sanitize_svg_content({}) != original path\n"
-            "HINWEIS: Blanko-Zeichen sollten unveraendert zurueckgegeben werden!"
+        assert result is None, (
+            "FEHLER: _sanitize_svg_content({}) liefert Inhalt\n"
+            "HINWEIS: Blanko-Zeichen duerfen nicht gelesen werden!"
         ).format(path)
-        print("  [OK] {} -> unveraendert (korrekt)".format(path.stem))
+        print("  [OK] {} -> None (korrekt)".format(path.stem))
 
     return True
 
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_font_registry.py - Unit-Tests fuer die prozessweite Schriftarten-Registry (FontRegistry)
+
+Testet:
+- Schriftfamilie wird einmal aufgeloest, Fonts pro (Pfad, Pixelgroesse) wiederverwendet
+- LRU-Verdraengung bei vollem Font-Cache
+- Gleichzeitige Zugriffe liefern dasselbe Font-Objekt
+- TextOverlayPlaceholder._load_font() nutzt die Registry (kein FontManager pro Aufruf)
+- clear() leert auch die Layout-Caches (text_layout)
+
+Ausfuehrung: python dev-tools/testing/test_font_registry.py
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from font_manager import FontManager
+from font_registry import FontRegistry
+
+
+# Nicht installierte Schriftart -> Fallback-Kette, ohne dass ein Test-Font noetig ist
+MISSING_FONT = "Nicht Vorhandene Testschrift"
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+class _CountingFontManager:
+    """Zaehlt check_and_get_font()-Aufrufe (Kontextmanager, stellt Original wieder her)"""
+
+    def __enter__(self):
+        self.calls = 0
+        self._original = FontManager.check_and_get_font
+
+        def counting(manager, preferred_font):
+            self.calls += 1
+            return self._original(manager, preferred_font)
+
+        FontManager.check_and_get_font = counting
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        FontManager.check_and_get_font = self._original
+        return False
+
+
+def test_resolve_once():
+    """
+    Test 1: Schriftfamilie einmal aufgeloest, gleicher Font fuer gleiche Groesse
+    """
+    print_test("Einmalige Aufloesung und Font-Wiederverwendung")
+
+    registry = FontRegistry(max_fonts=8)
+    with _CountingFontManager() as counter:
+        first = registry.get_font(MISSING_FONT, 40)
+        for _ in range(5):
+            assert registry.get_font(MISSING_FONT, 40) is first, "FEHLER: Font neu geladen"
+        registry.get_font(MISSING_FONT, 50)
+
+    assert counter.calls == 1, "FEHLER: {} Aufloesungen statt 1".format(counter.calls)
+    assert registry.hits == 5, "FEHLER: {} Cache-Treffer statt 5".format(registry.hits)
+
+    actual_font, font_path = registry.resolve(MISSING_FONT)
+    print("  [OK] {} -> {} ({}), {} Treffer / {} geladen".format(
+        MISSING_FONT, actual_font, font_path or "Default-Font", registry.hits, registry.misses))
+    return True
+
+
+def test_lru_eviction():
+    """
+    Test 2: Aeltester Font wird bei vollem Cache verdraengt, zuletzt genutzter bleibt
+    """
+    print_test("LRU-Verdraengung")
+
+    registry = FontRegistry(max_fonts=2)
+    font_10 = registry.get_font(MISSING_FONT, 10)
+    font_20 = registry.get_font(MISSING_FONT, 20)
+    assert registry.get_font(MISSING_FONT, 10) is font_10  # 10 zuletzt genutzt
+    registry.get_font(MISSING_FONT, 30)                     # verdraengt 20
+
+    assert registry.get_font(MISSING_FONT, 10) is font_10, "FEHLER: Zuletzt genutzter Font verdraengt"
+    assert len(registry._fonts) == 2, "FEHLER: Cache ueber Limit ({})".format(len(registry._fonts))
+    font_path = registry.resolve(MISSING_FONT)[1]
+    assert (font_path, 20) not in registry._fonts, "FEHLER: Aeltester Font nicht verdraengt"
+    assert registry.get_font(MISSING_FONT, 20) is not font_20, "FEHLER: Font 20 nicht neu geladen"
+
+    print("  [OK] Max. 2 Fonts, aeltester verdraengt")
+    return True
+
+
+def test_concurrent_access():
+    """
+    Test 3: Parallele Zugriffe liefern dasselbe Objekt pro (Pfad, Groesse)
+    """
+    print_test("Thread-safe Zugriff")
+
+    registry = FontRegistry(max_fonts=8)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        fonts = list(pool.map(lambda i: registry.get_font(MISSING_FONT, 12 + i % 2), range(64)))
+
+    assert len({id(font) for font in fonts}) == 2, "FEHLER: Mehr als ein Font pro Groesse"
+    assert len(registry._paths) == 1, "FEHLER: Schriftfamilie mehrfach registriert"
+
+    print("  [OK] 64 Zugriffe, 2 Font-Objekte")
+    return True
+
+
+def test_text_overlay_uses_registry():
+    """
+    Test 4: Text-Overlay loest Schriftart nicht mehr pro Zeichen auf
+    """
+    print_test("Text-Overlay ohne Font-Aufloesung pro Zeichen")
+
+    from text_overlay import TextOverlayPlaceholder, ZeichenConfig
+    from constants import MODUS_FREITEXT
+
+    overlay = TextOverlayPlaceholder()
+    config = ZeichenConfig(zeichen_id="x", svg_path=Path("test.svg"), dpi=150,
+                           modus=MODUS_FREITEXT, freitext="Test", font_family=MISSING_FONT)
+
+    overlay._load_font(config.font_size, config.dpi, config.font_family)
+    with _CountingFontManager() as counter:
+        for _ in range(3):
+            overlay._load_font(config.font_size, config.dpi, config.font_family)
+            overlay.calculate_text_width_mm(config)
+
+    assert counter.calls == 0, "FEHLER: FontManager {}x aufgerufen".format(counter.calls)
+
+    print("  [OK] Fonts aus der Registry")
+    return True
+
+
+def test_clear_resets_text_layout():
+    """
+    Test 5: clear() leert Fonts und die daran haengenden Text-Messungen
+    """
+    print_test("clear() leert Layout-Caches")
+
+    import text_layout
+
+    registry = FontRegistry(max_fonts=8)
+    font = registry.get_font(MISSING_FONT, 40)
+    text_layout.text_width_px(font, "OV: ____")
+    text_layout.wrap_to_two_lines(font, "Technisches Hilfswerk", 10)
+    assert text_layout.text_bbox.cache_info().currsize > 0
+
+    registry.clear()
+
+    assert not registry._fonts and not registry._paths, "FEHLER: Registry nicht geleert"
+    for cached in (text_layout.text_bbox, text_layout.wrap_to_two_lines, text_layout.find_two_line_split):
+        assert cached.cache_info().currsize == 0, "FEHLER: {} nicht geleert".format(cached.__name__)
+
+    print("  [OK] Fonts und Layout-Caches geleert")
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("FONT-REGISTRY UNIT TESTS")
+
+    tests = [
+        test_resolve_once,
+        test_lru_eviction,
+        test_concurrent_access,
+        test_text_overlay_uses_registry,
+        test_clear_resets_text_layout,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_memory_scheduler.py - Unit-Tests fuer den Speicherbudget-Scheduler
+
+Testet:
+- Schaetzung waechst mit DPI und render_scale
+- Planung richtet sich nach dem GROESSTEN Zeichen (nicht nach dem ersten)
+- Zulassung blockiert bei vollem Budget, uebergrosse Zeichen laufen einzeln
+- BatchPipeline mit Zulassung: Budget wird eingehalten, Abbruch beendet Threads
+- Gemessener Speicher (Caches, zurueckbehaltener Heap) blockiert die Zulassung nicht
+
+Ausfuehrung: python dev-tools/testing/test_memory_scheduler.py
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import memory_scheduler
+from memory_scheduler import MemoryScheduler, estimate_zeichen_bytes
+from batch_pipeline import BatchPipeline, PipelineStage
+from text_overlay import ZeichenConfig
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+def _task(name: str, size_mm: float = 45.0, dpi: int = 600, render_scale: float = 1.0):
+    """Task-Tupel (svg_path, config) mit gegebener Groesse"""
+    svg_path = Path("{}.svg".format(name))
+    return (svg_path, ZeichenConfig(
+        zeichen_id=name, svg_path=svg_path, dpi=dpi, render_scale=render_scale,
+        zeichen_hoehe_mm=size_mm, zeichen_breite_mm=size_mm
+    ))
+
+
+def test_estimate_scaling():
+    """
+    Test 1: Schaetzung ~ DPI² und waechst mit render_scale
+    """
+    print_test("Schaetzung pro Zeichen")
+
+    low = estimate_zeichen_bytes(_task("a", dpi=300)[1])
+    high = estimate_zeichen_bytes(_task("a", dpi=600)[1])
+    scaled = estimate_zeichen_bytes(_task("a", dpi=300, render_scale=2.0)[1])
+
+    assert 3.5 < high / low < 4.5, "FEHLER: DPI-Verdopplung ergibt Faktor {:.2f}".format(high / low)
+    assert scaled > low, "FEHLER: render_scale ohne Einfluss"
+
+    print("  [OK] 300 DPI: {:.1f} MB | 600 DPI: {:.1f} MB".format(low / 1024 / 1024, high / 1024 / 1024))
+    return True
+
+
+def test_plan_uses_largest_zeichen():
+    """
+    Test 2: Gemischter Auftrag - kleines erstes Zeichen, grosses Zeichen am Ende
+    (nach Position 50, damit auch die PDF-Planung alle Auftraege betrachtet)
+    """
+    print_test("Planung nach groesstem Zeichen")
+
+    scheduler = MemoryScheduler(budget_mb=512)
+    small_only = [_task("klein_{}".format(i)) for i in range(60)]
+    mixed = small_only + [_task("gross", size_mm=300.0)]
+
+    assert scheduler.plan_threads(small_only, 8) == 8, "FEHLER: Kleine Zeichen gedrosselt"
+    mixed_threads = scheduler.plan_threads(mixed, 8)
+    assert mixed_threads < 8, "FEHLER: Grosses Zeichen am Ende ignoriert"
+
+    chunk = scheduler.plan_chunk_size(mixed, mixed_threads)
+    assert mixed_threads <= chunk <= len(mixed), "FEHLER: Stapelgroesse {}".format(chunk)
+
+    pages = scheduler.plan_pdf_pages(mixed, 100)
+    assert 1 <= pages <= 100, "FEHLER: PDF-Seiten {}".format(pages)
+    assert pages < scheduler.plan_pdf_pages(small_only, 100), "FEHLER: Grosses Zeichen bei PDF-Seiten ignoriert"
+
+    files = scheduler.plan_pdf_files(mixed, pages, mixed_threads, 4)
+    assert files < scheduler.plan_pdf_files(small_only, pages, mixed_threads, 4), \
+        "FEHLER: Grosses Zeichen bei PDF-Dateien ignoriert"
+
+    print("  [OK] Threads: {} (gemischt) | Stapel: {} | PDF-Seiten: {} | PDF-Dateien: {}".format(
+        mixed_threads, chunk, pages, files))
+    return True
+
+
+def test_acquire_blocks_and_admits_oversize():
+    """
+    Test 3: Volles Budget blockiert, release() gibt frei; Zeichen > Budget laufen allein
+    """
+    print_test("Zulassung nach Budget")
+
+    task = _task("a")
+    needed = estimate_zeichen_bytes(task[1])
+    scheduler = MemoryScheduler(budget_mb=256)
+    scheduler.budget_bytes = int(needed * 2.5)
+    scheduler._baseline_rss = None  # Nur Schaetzung (Test unabhaengig vom Prozess-Speicher)
+
+    tokens = [scheduler.acquire(task), scheduler.acquire(task)]
+    admitted = threading.Event()
+
+    def third():
+        tokens.append(scheduler.acquire(task))
+        admitted.set()
+
+    thread = threading.Thread(target=third)
+    thread.start()
+    assert not admitted.wait(0.2), "FEHLER: Drittes Zeichen trotz vollem Budget zugelassen"
+
+    scheduler.release(tokens.pop(0))
+    assert admitted.wait(2.0), "FEHLER: Freigabe weckt wartendes Zeichen nicht"
+    thread.join()
+    for token in tokens:
+        scheduler.release(token)
+
+    # Uebergrosses Zeichen: ohne andere Zeichen sofort zugelassen
+    scheduler.budget_bytes = needed // 2
+    scheduler.release(scheduler.acquire(task))
+    assert scheduler.get_stats()['waits'] == 1, "FEHLER: Wartezaehler {}".format(scheduler.get_stats())
+
+    print("  [OK] Budget eingehalten, kein Stillstand")
+    return True
+
+
+def test_pipeline_admission():
+    """
+    Test 4: BatchPipeline haelt Budget ein und endet bei Abbruch trotz wartender Zulassung
+    """
+    print_test("Pipeline mit Speicher-Zulassung")
+
+    tasks = [_task("z_{:02d}".format(i), size_mm=45.0 if i % 3 else 120.0) for i in range(30)]
+    scheduler = MemoryScheduler(budget_mb=256)
+    scheduler.budget_bytes = estimate_zeichen_bytes(tasks[0][1]) * 2
+    scheduler._baseline_rss = None
+
+    def work(task):
+        time.sleep(0.002)
+        return task[1].zeichen_id
+
+    pipeline = BatchPipeline(
+        [PipelineStage("work", work, workers=8)], queue_depth=4, ordered=True, admission=scheduler
+    )
+    results = list(pipeline.run(tasks))
+    assert [r[2] for r in results] == [t[1].zeichen_id for t in tasks], "FEHLER: Ergebnisse falsch"
+    assert scheduler.get_stats()['peak_estimated_mb'] * 1024 * 1024 <= scheduler.budget_bytes, \
+        "FEHLER: Budget ueberschritten: {}".format(scheduler.get_stats())
+    assert scheduler._in_flight_count == 0, "FEHLER: Zulassungen nicht freigegeben"
+
+    # Abbruch, waehrend der Feeder auf Zulassung wartet
+    before = threading.active_count()
+    results = pipeline.run(tasks)
+    next(results)
+    results.close()
+    assert threading.active_count() == before, "FEHLER: Threads laufen weiter"
+    assert scheduler._in_flight_count == 0, "FEHLER: Zulassungen nach Abbruch belegt"
+
+    print("  [OK] Spitze {:.1f} MB von {:.1f} MB".format(
+        scheduler.get_stats()['peak_estimated_mb'], scheduler.budget_bytes / 1024 / 1024))
+    return True
+
+
+def test_measured_growth_does_not_gate():
+    """
+    Test 5: RSS-Zuwachs ueber dem Budget blockiert nicht, neue Basis wenn nichts in Bearbeitung
+    """
+    print_test("Messung korrigiert nur die Schaetzung")
+
+    task = _task("a")
+    needed = estimate_zeichen_bytes(task[1])
+    rss = [1000 * 1024 * 1024]
+    original_rss = memory_scheduler.get_process_rss_bytes
+    memory_scheduler.get_process_rss_bytes = lambda: rss[0]
+    try:
+        scheduler = MemoryScheduler(budget_mb=256)
+        scheduler.budget_bytes = needed * 3
+
+        # Prozess waechst (z.B. Caches) weit ueber das Budget, ohne Zeichen in Bearbeitung
+        rss[0] += scheduler.budget_bytes * 4
+        tokens = [scheduler.acquire(task), scheduler.acquire(task)]
+        assert scheduler.get_stats()['waits'] == 0, "FEHLER: Gemessener Speicher blockiert Zulassung"
+        assert scheduler._baseline_rss == rss[0], "FEHLER: Basis nicht neu gesetzt"
+
+        # Zeichen wachsen wie geschaetzt -> Zuwachs vor der Zulassung verfaelscht Korrektur nicht
+        rss[0] += sum(tokens)
+        scheduler._sample_locked(force=True)
+        assert scheduler.get_stats()['correction'] == 1.0, "FEHLER: Korrektur {}".format(
+            scheduler.get_stats()['correction'])
+
+        # Zeichen wachsen doppelt so stark wie geschaetzt -> Schaetzung steigt
+        rss[0] += sum(tokens)
+        scheduler._sample_locked(force=True)
+        assert scheduler.get_stats()['correction'] > 1.0, "FEHLER: Messung nicht beruecksichtigt"
+        for token in tokens:
+            scheduler.release(token)
+    finally:
+        memory_scheduler.get_process_rss_bytes = original_rss
+
+    print("  [OK] Korrektur {:.2f}, keine Wartezeit".format(scheduler.get_stats()['correction']))
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("MEMORY-SCHEDULER UNIT TESTS")
+
+    tests = [
+        test_estimate_scaling,
+        test_plan_uses_largest_zeichen,
+        test_acquire_blocks_and_admits_oversize,
+        test_pipeline_admission,
+        test_measured_growth_does_not_gate,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
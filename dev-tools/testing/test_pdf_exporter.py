@@ -7,6 +7,14 @@ Testet die PDF-Export-Funktionalitaet, insbesondere:
 - create_pdf_filename() Funktionssignatur und Ausgabe
 - Dateinamen-Konventionen
 - Keine Namenskonflikte zwischen constants.py und pdf_exporter.py
+- Paralleles Streaming: gleiche PDF wie sequentiell (Seiten in Task-Reihenfolge)
+- Kopien (nur zeichen_id verschieden) werden einmal gerendert
+- Identische Bilder werden einmal pro PDF eingebettet (SharedImageXObjects)
+- Direkte Bild-Kodierung (Flate/JPEG 2000 verlustfrei, JPEG lesbar)
+- Vektor-Export: gleiche Zeichenbefehle wie im Raster-Export, keine Bilder im PDF
+- Stapel-Export: Dateien parallel in Worker-Prozessen wie nacheinander
+- Fehler eines Workers: keine (halben) PDF-Dateien bleiben liegen
+- Eine Datei: Teil-PDFs zusammengefuegt, gleiche Bilder nur einmal eingebettet
 
 WICHTIG: Diese Tests verhindern Regression des v0.8.3 Bugs, bei dem
 eine lokale Funktion create_pdf_filename() den Import ueberschrieben hat.
@@ -208,6 +216,576 @@ def test_timestamp_format():
     return True
 
 
+def _blanko_tasks(count: int):
+    """Blanko-Zeichen als PDF-Tasks (kein SVG-Rendering noetig)"""
+    from constants import MODUS_FREITEXT
+    from text_overlay import ZeichenConfig
+
+    svg_path = Path("BLANKO_freitext")
+    return [
+        (svg_path, ZeichenConfig(
+            zeichen_id="blanko_{:03d}".format(i), svg_path=svg_path, dpi=150,
+            modus=MODUS_FREITEXT, freitext="Seite {}".format(i)
+        ))
+        for i in range(count)
+    ]
+
+
+def test_parallel_streaming_identical():
+    """
+    Test 6: Paralleles Rendern ergibt dieselbe PDF wie ein Thread (Reihenfolge erhalten)
+    """
+    print_test("Paralleles PDF-Streaming")
+
+    import tempfile
+    from reportlab import rl_config
+    import pdf_exporter
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    generator = TaktischeZeichenGenerator()
+    tasks = _blanko_tasks(12)
+    previous_invariant = rl_config.invariant
+    rl_config.invariant = 1  # Reproduzierbare PDF-Bytes (keine Zeitstempel/IDs)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            outputs = {}
+            for threads in (1, 4):
+                for name, func in (("einzel", pdf_exporter.create_einzelzeichen_pdf_streaming),
+                                   ("bogen", pdf_exporter.create_schnittbogen_pdf_streaming)):
+                    path = Path(tmp) / "{}_{}.pdf".format(name, threads)
+                    func(generator, tasks, path, 150, num_threads=threads)
+                    outputs[(name, threads)] = path.read_bytes()
+    finally:
+        rl_config.invariant = previous_invariant
+
+    for name in ("einzel", "bogen"):
+        assert outputs[(name, 1)] == outputs[(name, 4)], \
+            "FEHLER: {}-PDF mit 4 Threads weicht ab".format(name)
+
+    print("  [OK] Identische PDFs mit 1 und 4 Threads")
+    return True
+
+
+def test_copies_rendered_once():
+    """
+    Test 7: Kopien eines Zeichens werden einmal gerendert und mehrfach platziert
+    """
+    print_test("Kopien-Erkennung im PDF-Export")
+
+    import tempfile
+    import threading
+    import pdf_exporter
+    from dataclasses import replace
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    generator = TaktischeZeichenGenerator()
+    # 3 verschiedene Zeichen mit je 4 Kopien (abwechselnd, wie bei gemischten Auftraegen)
+    originals = _blanko_tasks(3)
+    tasks = [
+        (svg_path, replace(config, zeichen_id="{}_{:03d}".format(config.zeichen_id, copy)))
+        for copy in range(4)
+        for svg_path, config in originals
+    ]
+
+    calls = []
+    lock = threading.Lock()
+    create_zeichen = generator.create_zeichen
+
+    def counting_create_zeichen(*args, **kwargs):
+        with lock:
+            calls.append(1)
+        return create_zeichen(*args, **kwargs)
+
+    generator.create_zeichen = counting_create_zeichen
+
+    with tempfile.TemporaryDirectory() as tmp:
+        placed = []
+
+        def progress(current, total, name, status):
+            placed.append(current)
+
+        pdf_exporter.create_schnittbogen_pdf_streaming(
+            generator, tasks, Path(tmp) / "bogen.pdf", 150, progress_callback=progress, num_threads=4
+        )
+
+    assert len(calls) == 3, "FEHLER: {} Renderings fuer 3 verschiedene Zeichen".format(len(calls))
+    assert placed == list(range(1, 13)), "FEHLER: Zellen nicht in Task-Reihenfolge: {}".format(placed)
+
+    # Fenster kleiner als der Abstand der Kopien: Seiten werden nicht gehalten, sondern neu gerendert
+    window = pdf_exporter.SYSTEM_PDF_COPY_WINDOW
+    pdf_exporter.SYSTEM_PDF_COPY_WINDOW = 2
+    try:
+        windowed = [(i, value) for i, _, _, value, _ in pdf_exporter._render_pdf_images(
+            generator, tasks, False, 2, {}, lambda image, config: image.size
+        )]
+    finally:
+        pdf_exporter.SYSTEM_PDF_COPY_WINDOW = window
+    assert len(calls) == 3 + 12, "FEHLER: {} Renderings mit Fenster 2".format(len(calls) - 3)
+    assert [i for i, _ in windowed] == list(range(12)), "FEHLER: Reihenfolge mit Fenster"
+
+    print("  [OK] 12 Zellen aus 3 Renderings (Fenster 2: 12 Renderings)")
+    return True
+
+
+def test_shared_image_xobjects():
+    """
+    Test 8: Identische PNG-Bytes -> ein XObject, verschiedene -> eigene XObjects
+    """
+    print_test("Geteilte Bild-XObjects")
+
+    import tempfile
+    from PIL import Image
+    from reportlab.pdfgen import canvas
+    from pdf_exporter import SharedImageXObjects
+    from pdf_image_codec import encode_pdf_image
+
+    red = encode_pdf_image(Image.new('RGB', (50, 50), (255, 0, 0)), "flate", 6, 95)
+    blue = encode_pdf_image(Image.new('RGB', (50, 50), (0, 0, 255)), "flate", 6, 95)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "shared.pdf"
+        c = canvas.Canvas(str(path))
+        shared = SharedImageXObjects(c)
+        for i in range(10):
+            shared.draw(red, 10 * i, 10, 20, 20)
+        shared.draw(blue, 10, 100, 20, 20)
+        shared.draw(red, 10, 200, 40, 40)  # Andere Groesse -> eigenes Form XObject
+        c.save()
+        pdf_bytes = path.read_bytes()
+
+    assert shared.placed == 12, "FEHLER: {} platziert".format(shared.placed)
+    assert shared.embedded == 2, "FEHLER: {} Bilder eingebettet (erwartet 2)".format(shared.embedded)
+    assert pdf_bytes.count(b"/Subtype /Image") == 2, "FEHLER: Bild-XObjects mehrfach eingebettet"
+
+    print("  [OK] 12 Platzierungen, 2 Bilder eingebettet")
+    return True
+
+
+def test_pdf_image_codecs():
+    """
+    Test 9: encode_pdf_image - Flate und JPEG 2000 verlustfrei, Alpha verworfen, JPEG lesbar
+    """
+    print_test("PDF-Bildkodierung")
+
+    import zlib
+    from io import BytesIO
+    from PIL import Image, ImageDraw
+    from pdf_image_codec import encode_pdf_image, JPEG2000_AVAILABLE
+
+    image = Image.new('RGBA', (120, 80), (255, 255, 255, 255))
+    ImageDraw.Draw(image).ellipse((10, 10, 110, 70), fill=(200, 30, 30, 255))
+    expected = image.convert('RGB').tobytes()
+
+    flate = encode_pdf_image(image, "flate", 9, 95)
+    assert flate.filters == ('FlateDecode',) and flate.color_space == 'DeviceRGB'
+    assert zlib.decompress(flate.data) == expected, "FEHLER: Flate nicht verlustfrei"
+
+    if JPEG2000_AVAILABLE:
+        jpx = encode_pdf_image(image, "jpeg2000", 6, 95)
+        assert jpx.filters == ('JPXDecode',), "FEHLER: JPEG 2000 Filter {}".format(jpx.filters)
+        with Image.open(BytesIO(jpx.data)) as decoded:
+            assert decoded.convert('RGB').tobytes() == expected, "FEHLER: JPEG 2000 nicht verlustfrei"
+
+    jpeg = encode_pdf_image(image, "jpeg", 6, 90)
+    assert jpeg.filters == ('DCTDecode',)
+    with Image.open(BytesIO(jpeg.data)) as decoded:
+        assert decoded.size == (120, 80), "FEHLER: JPEG-Groesse {}".format(decoded.size)
+
+    print("  [OK] Flate {} B | JPEG {} B | JPEG 2000 verfuegbar: {}".format(
+        len(flate.data), len(jpeg.data), JPEG2000_AVAILABLE))
+    return True
+
+
+def _replay_on_image(vector_canvas):
+    """Spielt aufgezeichnete VectorCanvas-Befehle mit PIL ab (Vergleich mit Raster-Export)"""
+    from PIL import Image, ImageDraw
+
+    image = Image.new('RGBA', vector_canvas.size, (255, 255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    for op in vector_canvas._ops:
+        kind = op[0]
+        if kind == 'canvas':
+            image.paste(_replay_on_image(op[3]), (op[1], op[2]))
+        elif kind == 'line':
+            draw.line(list(op[1]), fill=op[2], width=op[3])
+        elif kind == 'rect':
+            draw.rectangle((op[1], op[2], op[3], op[4]), fill=op[5], outline=op[6], width=op[7])
+        elif kind == 'text':
+            draw.text((op[1], op[2]), op[3], fill=op[4], font=op[5],
+                      stroke_width=op[6], stroke_fill=op[7])
+        else:
+            raise AssertionError("FEHLER: Unerwartete Operation {} fuer Blanko-Zeichen".format(kind))
+    return image
+
+
+def test_vector_canvas_records_raster_layout():
+    """
+    Test 10: VectorCanvas zeichnet exakt die Befehle des Raster-Exports auf
+    """
+    print_test("Vektor-Zeichenflaeche (Layout wie Raster)")
+
+    from runtime_config import get_config
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+    from text_overlay import ZeichenConfig
+
+    config = get_config()
+    generator = TaktischeZeichenGenerator()
+    checked = 0
+
+    for svg_path, zeichen_config in _blanko_tasks(2):
+        raster = generator.create_zeichen(svg_path, zeichen_config, return_image=True)
+        vector = generator.create_zeichen(svg_path, zeichen_config, return_image=True, vector=True)
+        assert vector.size == raster.size, "FEHLER: Groesse {} != {}".format(vector.size, raster.size)
+        assert _replay_on_image(vector).convert(raster.mode).tobytes() == raster.tobytes(), \
+            "FEHLER: Vektor-Befehle weichen vom Raster-Export ab"
+        checked += 1
+
+    for name in ("BLANKO_S1_LEER", "BLANKO_S1_LINIEN_STAERKE"):
+        svg_path = Path(name)
+        zeichen_config = ZeichenConfig(
+            zeichen_id=name, svg_path=svg_path, dpi=150,
+            zeichen_hoehe_mm=config.s1_zeichen_hoehe_mm,
+            zeichen_breite_mm=config.s1_zeichen_breite_mm,
+            sicherheitsabstand_mm=config.s1_sicherheitsabstand_mm,
+            beschnittzugabe_mm=config.s1_beschnittzugabe_mm
+        )
+        raster = generator.create_zeichen_s1(svg_path, zeichen_config, return_image=True)
+        vector = generator.create_zeichen_s1(svg_path, zeichen_config, return_image=True, vector=True)
+        assert _replay_on_image(vector).convert(raster.mode).tobytes() == raster.tobytes(), \
+            "FEHLER: S1-Vektor-Befehle weichen vom Raster-Export ab ({})".format(name)
+        checked += 1
+
+    print("  [OK] {} Zeichen: Vektor-Befehle ergeben das Raster-Bild".format(checked))
+    return True
+
+
+def test_vector_pdf_export():
+    """
+    Test 11: Vektor-Export - keine Bild-XObjects, Kopien einmal als Form XObject
+    """
+    print_test("Vektor-PDF-Export")
+
+    import tempfile
+    import pdf_exporter
+    from constants import PDF_EXPORT_MODE_VECTOR
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    generator = TaktischeZeichenGenerator()
+    # 3 verschiedene Zeichen, je 4 Kopien
+    tasks = _blanko_tasks(3) * 4
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = {}
+        for name, func in (("einzel", pdf_exporter.create_einzelzeichen_pdf_streaming),
+                           ("bogen", pdf_exporter.create_schnittbogen_pdf_streaming)):
+            path = Path(tmp) / "{}.pdf".format(name)
+            func(generator, tasks, path, 150, export_mode=PDF_EXPORT_MODE_VECTOR)
+            outputs[name] = path.read_bytes()
+
+    for name, pdf_bytes in outputs.items():
+        assert pdf_bytes.count(b"/Subtype /Image") == 0, \
+            "FEHLER: {}-PDF enthaelt Rasterbilder".format(name)
+        assert pdf_bytes.count(b"/Subtype /Form") == 3, \
+            "FEHLER: {}-PDF: {} Form XObjects (erwartet 3)".format(
+                name, pdf_bytes.count(b"/Subtype /Form"))
+        assert b"FontFile2" in pdf_bytes, "FEHLER: {}-PDF ohne eingebettete Schrift".format(name)
+
+    print("  [OK] Einzelzeichen {} B | Schnittbogen {} B - ohne Rasterbilder".format(
+        len(outputs["einzel"]), len(outputs["bogen"])))
+    return True
+
+
+def test_parallel_pdf_files():
+    """
+    Test 12: Stapel-Export mit parallelen Dateien - gleiche Dateien, Fortschritt ueber alle Dateien
+    """
+    print_test("Parallele PDF-Dateien (Stapel-Export)")
+
+    import tempfile
+    import pdf_exporter
+    from runtime_config import get_config
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    config = get_config()
+    generator = TaktischeZeichenGenerator()
+    # 23 Zeichen, 5 pro Datei -> letzte Datei (3) wird in die vorletzte integriert
+    tasks = _blanko_tasks(23)
+    previous_workers = config.pdf_file_workers
+
+    results = {}
+    try:
+        for workers in (1, 2):
+            config.pdf_file_workers = workers
+            progress = []
+            with tempfile.TemporaryDirectory() as tmp:
+                files = pdf_exporter.create_einzelzeichen_pdf_chunked(
+                    generator, tasks, Path(tmp), 150, chunk_size=5, num_threads=2,
+                    progress_callback=lambda current, total, name, status: progress.append(current)
+                )
+                results[workers] = ([f.name.split("_", 2)[2] for f in files],
+                                    [f.stat().st_size for f in files], progress)
+    finally:
+        config.pdf_file_workers = previous_workers
+
+    names, sizes, progress = results[2]
+    assert len(names) == 4 and names[-1].startswith("Einzelzeichen_Zeichen_16_bis_23"), \
+        "FEHLER: Merge der letzten Datei fehlt: {}".format(names)
+    assert results[1][:2] == (names, sizes), "FEHLER: Parallele Dateien weichen ab"
+    assert progress == list(range(1, 24)), "FEHLER: Fortschritt nicht zusammengezaehlt: {}".format(progress)
+
+    print("  [OK] {} Dateien parallel wie nacheinander, Fortschritt 1..23".format(len(names)))
+    return True
+
+
+def test_single_file_merge():
+    """
+    Test 13: Eine Datei aus Teil-PDFs - alle Seiten, Bilder teiluebergreifend einmal
+    """
+    print_test("Eine PDF-Datei aus Teil-PDFs")
+
+    import re
+    import tempfile
+    from dataclasses import replace
+    import pdf_exporter
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    generator = TaktischeZeichenGenerator()
+    # 3 verschiedene Zeichen, je 5 Kopien auf 3 Teil-PDFs verteilt
+    tasks = [
+        (svg_path, replace(config, zeichen_id="{}_{}".format(config.zeichen_id, copy)))
+        for copy in range(5)
+        for svg_path, config in _blanko_tasks(3)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = pdf_exporter.create_einzelzeichen_pdf_chunked(
+            generator, tasks, Path(tmp), 150, chunk_size=5, num_threads=2, single_file=True
+        )
+        remaining = sorted(p.name for p in Path(tmp).iterdir())
+        pdf_bytes = files[0].read_bytes()
+
+    assert len(files) == 1 and files[0].name.endswith("Zeichen_1_bis_15_Datei_1_von_1.pdf"), \
+        "FEHLER: Dateiname {}".format(files[0].name)
+    assert remaining == [files[0].name], "FEHLER: Teil-PDFs nicht entfernt: {}".format(remaining)
+    assert b"/Count 15 /Kids" in pdf_bytes, "FEHLER: Seitenbaum ohne 15 Seiten"
+    assert len(re.findall(rb"/Type /Page\b(?!s)", pdf_bytes)) == 15, "FEHLER: Seitenanzahl"
+    assert pdf_bytes.count(b"/Subtype /Image") == 3, \
+        "FEHLER: {} Bilder eingebettet (erwartet 3)".format(pdf_bytes.count(b"/Subtype /Image"))
+    assert b"/Subject (15 taktische Zeichen)" in pdf_bytes, "FEHLER: Betreff nicht angepasst"
+
+    print("  [OK] 15 Seiten aus 3 Teilen, 3 Bilder eingebettet")
+    return True
+
+
+def test_segmented_pdf_writer():
+    """
+    Test 14: Segmentweises Schreiben - eine Datei, alle Seiten, Bilder einmal
+    """
+    print_test("PDF segmentweise auf die Platte schreiben")
+
+    import re
+    import tempfile
+    from dataclasses import replace
+    from unittest import mock
+    import pdf_exporter
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    generator = TaktischeZeichenGenerator()
+    tasks = [
+        (svg_path, replace(config, zeichen_id="{}_{}".format(config.zeichen_id, copy)))
+        for copy in range(4)
+        for svg_path, config in _blanko_tasks(3)
+    ]
+
+    # 12 Seiten in Segmenten zu 5 Seiten (5 + 5 + 2)
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.object(pdf_exporter, "SYSTEM_PDF_SEGMENT_PAGES", 5):
+        output_path = pdf_exporter.create_einzelzeichen_pdf_streaming(
+            generator, tasks, Path(tmp) / "segmente.pdf", 150, num_threads=2
+        )
+        remaining = sorted(p.name for p in Path(tmp).iterdir())
+        pdf_bytes = output_path.read_bytes()
+
+    assert remaining == ["segmente.pdf"], "FEHLER: Zusaetzliche Dateien: {}".format(remaining)
+    assert b"/Count 12 /Kids" in pdf_bytes, "FEHLER: Seitenbaum ohne 12 Seiten"
+    assert len(re.findall(rb"/Type /Page\b(?!s)", pdf_bytes)) == 12, "FEHLER: Seitenanzahl"
+    assert pdf_bytes.count(b"/Subtype /Image") == 3, \
+        "FEHLER: {} Bilder eingebettet (erwartet 3)".format(pdf_bytes.count(b"/Subtype /Image"))
+
+    print("  [OK] 12 Seiten in 3 Segmenten, 3 Bilder eingebettet")
+    return True
+
+
+def test_schnittbogen_page_template():
+    """
+    Test 15: Schnittbogen-Layout gecacht, statische Seitenebene als Form XObject
+    """
+    print_test("Schnittbogen-Layout und Seitenvorlage")
+
+    from io import BytesIO
+    from reportlab.pdfgen import canvas
+    from schnittbogen_layout import SchnittbogenPageTemplate, get_schnittbogen_layout
+
+    layout = get_schnittbogen_layout(45.0, 45.0, 10, 10)
+    assert layout is get_schnittbogen_layout(45, 45, 10.0, 10.0), "FEHLER: Layout nicht gecacht"
+    assert (layout.cols, layout.rows, layout.orientation) == (4, 6, "Hochformat"), \
+        "FEHLER: Layout {}".format(layout.describe())
+    # Raster zentriert: 190mm verfügbar, 180mm genutzt -> 5mm zusätzlich links
+    assert abs(layout.cell_origin(0)[0] - 15 * 72 / 25.4) < 1e-6, "FEHLER: Grid nicht zentriert"
+
+    # 2 volle Seiten + 1 Seite mit fehlgeschlagenem Zeichen + 1 Seite mit 5 Zeichen
+    c = canvas.Canvas(BytesIO(), pagesize=layout.pagesize, pageCompression=0)
+    template = SchnittbogenPageTemplate(layout)
+    for placed in (range(24), range(24), [p for p in range(24) if p != 7], range(5)):
+        template.stamp(c, placed)
+        c.showPage()
+    pdf_bytes = c.getpdfdata()
+
+    assert pdf_bytes.count(b"/Subtype /Form") == 1, "FEHLER: Seitenvorlage mehrfach definiert"
+    assert pdf_bytes.count(b"/FormXob.Schnittbogenseite Do") == 2, "FEHLER: Volle Seiten ohne Vorlage"
+    # Form: 24 Rahmen, Seite mit Fehler: 23 Rahmen, letzte Seite: 5 Rahmen (je ein Pfad)
+    assert pdf_bytes.count(b" re") == 52, "FEHLER: {} Rahmen (erwartet 52)".format(pdf_bytes.count(b" re"))
+
+    print("  [OK] {}".format(layout.describe()))
+    print("  [OK] Vorlage einmal definiert, 2 volle Seiten referenzieren sie")
+    return True
+
+
+def test_final_size_render():
+    """
+    Test 16: Schnittbogen-Zeichen direkt in fertiger Groesse = mit Beschnitt erstellt und zugeschnitten
+    """
+    print_test("Zeichen in fertiger Groesse (ohne Beschnitt)")
+
+    from PIL import ImageChops
+    from constants import calculate_print_dimensions
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    generator = TaktischeZeichenGenerator()
+    svg_path, config = _blanko_tasks(1)[0]
+    dims = calculate_print_dimensions(
+        config.dpi, config.zeichen_hoehe_mm, config.zeichen_breite_mm,
+        config.sicherheitsabstand_mm, config.beschnittzugabe_mm
+    )
+    bleed = dims['beschnitt_px']
+    box = (bleed, bleed, bleed + dims['endgroesse_breite_px'], bleed + dims['endgroesse_hoehe_px'])
+
+    for draw_cut_lines in (False, True):
+        with_bleed = generator.create_zeichen(svg_path, config, draw_cut_lines, return_image=True)
+        final = generator.create_zeichen(svg_path, config, draw_cut_lines, return_image=True,
+                                         final_size=True)
+        assert final.size == (dims['endgroesse_breite_px'], dims['endgroesse_hoehe_px']), \
+            "FEHLER: Groesse {}".format(final.size)
+        assert ImageChops.difference(final, with_bleed.crop(box)).getbbox() is None, \
+            "FEHLER: Abweichung bei draw_cut_lines={}".format(draw_cut_lines)
+
+    print("  [OK] {}x{}px, identisch mit zugeschnittenem Zeichen (mit/ohne Schnittlinien)".format(
+        *final.size))
+    return True
+
+
+def test_single_print_buffer():
+    """
+    Test 17: Text-Template direkt im Ausgabebild = Text auf eigenem Canvas gezeichnet
+    """
+    print_test("Zeichen in einem Ausgabebild komponiert")
+
+    from PIL import ImageChops
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    generator = TaktischeZeichenGenerator()
+    svg_path, config = _blanko_tasks(1)[0]
+    text_template = generator._create_text_template(config)
+
+    for draw_cut_lines in (False, True):
+        drawn = generator.create_zeichen(svg_path, config, draw_cut_lines, return_image=True)
+        templated = generator.create_zeichen(svg_path, config, draw_cut_lines,
+                                             text_template=text_template, return_image=True)
+        assert ImageChops.difference(drawn, templated).getbbox() is None, \
+            "FEHLER: Abweichung bei draw_cut_lines={}".format(draw_cut_lines)
+        assert drawn.info.get('dpi') == (config.dpi, config.dpi), "FEHLER: DPI-Metadaten fehlen"
+
+    print("  [OK] {}x{}px, mit/ohne Template und Schnittlinien identisch".format(*drawn.size))
+    return True
+
+
+def test_cut_line_overlay_cache():
+    """
+    Test 18: Schneidelinien aus gecachter Ebene = direkt gezeichnet (bis auf Label-Kanten)
+    """
+    print_test("Schneidelinien-Ebene einmal pro Druckmaß")
+
+    from PIL import ImageChops, ImageDraw
+    import print_preparer
+    from print_preparer import PrintPreparer
+
+    preparer = PrintPreparer()
+    buffer, _, dims = preparer.create_print_buffer(dpi=150)
+    print_preparer._get_cut_line_overlay.cache_clear()
+
+    first = preparer.finish_print_buffer(buffer.copy(), dims, draw_cut_lines=True, s1_border_x=40)
+    second = preparer.finish_print_buffer(buffer.copy(), dims, draw_cut_lines=True, s1_border_x=40)
+    info = print_preparer._get_cut_line_overlay.cache_info()
+    assert (info.misses, info.hits) == (1, 1), "FEHLER: Ebene nicht wiederverwendet ({})".format(info)
+    assert first.tobytes() == second.tobytes()
+
+    drawn = buffer.copy()
+    print_preparer._draw_cut_lines(ImageDraw.Draw(drawn), dims, s1_border_x=40)
+    diff = ImageChops.difference(first, drawn)
+    max_diff = max(high for _, high in diff.getextrema())
+    assert max_diff <= 16, "FEHLER: Abweichung {} zu direkt gezeichneten Linien".format(max_diff)
+
+    overlay = print_preparer._get_cut_line_overlay(
+        tuple(sorted(dims.items())), buffer.size, buffer.mode, 0, 40
+    )
+    share = overlay.pixels / (buffer.size[0] * buffer.size[1])
+    assert share < 0.5, "FEHLER: Ebene nicht auf Linienbereiche beschränkt"
+
+    print("  [OK] {} Bereiche ({:.0f}% der Fläche), max. Abweichung {}".format(
+        len(overlay.regions), 100 * share, max_diff))
+    return True
+
+
+def _write_or_fail(generator, tasks, output_path, progress_callback, fail_name=None):
+    """Test-Schreibfunktion fuer PdfFilePool (Modulebene, wird an Worker uebergeben)"""
+    output_path.write_bytes(b"%PDF-1.4 halb")
+    if fail_name and output_path.name.endswith(fail_name):
+        raise RuntimeError("Testfehler beim Schreiben")
+
+
+def test_file_pool_cleanup():
+    """
+    Test 19: Fehler in einem Worker -> keine Dateien dieses Laufs, Erfolg -> nur Zielnamen
+    """
+    print_test("PDF-Datei-Pool raeumt bei Fehler auf")
+
+    import tempfile
+    from pdf_file_pool import PdfFilePool
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        chunks = [([], tmp_dir / "a.pdf"), ([], tmp_dir / "b.pdf"), ([], tmp_dir / "c.pdf")]
+
+        with PdfFilePool(2) as pool:
+            try:
+                pool.write_files(_write_or_fail, chunks, {'fail_name': "b.pdf"})
+                assert False, "FEHLER: Worker-Fehler nicht weitergegeben"
+            except RuntimeError:
+                pass
+            assert not list(tmp_dir.iterdir()), "FEHLER: Dateien nach Fehler: {}".format(
+                sorted(p.name for p in tmp_dir.iterdir()))
+
+            files = pool.write_files(_write_or_fail, chunks, {})
+
+        assert files == [path for _, path in chunks], "FEHLER: Rueckgabe {}".format(files)
+        assert sorted(p.name for p in tmp_dir.iterdir()) == ["a.pdf", "b.pdf", "c.pdf"], \
+            "FEHLER: Temporaere Dateien verblieben"
+
+    print("  [OK] Fehler: 0 Dateien, Erfolg: 3 Dateien unter Zielnamen")
+    return True
+
+
 def run_all_tests():
     """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
     print_section("PDF-EXPORTER UNIT TESTS (v1.0)")
@@ -219,6 +797,20 @@ def run_all_tests():
         test_create_pdf_filename_einzelzeichen,
         test_no_name_collision,
         test_timestamp_format,
+        test_parallel_streaming_identical,
+        test_copies_rendered_once,
+        test_shared_image_xobjects,
+        test_pdf_image_codecs,
+        test_vector_canvas_records_raster_layout,
+        test_vector_pdf_export,
+        test_parallel_pdf_files,
+        test_single_file_merge,
+        test_segmented_pdf_writer,
+        test_schnittbogen_page_template,
+        test_final_size_render,
+        test_single_print_buffer,
+        test_cut_line_overlay_cache,
+        test_file_pool_cleanup,
     ]
 
     passed = 0
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_raster_cache.py - Unit-Tests fuer den persistenten Raster-Cache
+
+Testet:
+- Schluessel-Bildung (Inhalts-Hash + Render-Parameter)
+- Treffer/Miss und Wiederherstellung des Bildes
+- Beschaedigte Eintraege werden verworfen
+- LRU-Verdraengung bei ueberschrittenem Groessenbudget
+
+Ausfuehrung: python dev-tools/testing/test_raster_cache.py
+"""
+
+import sys
+import os
+import time
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+
+from raster_cache import RasterCache
+
+
+SVG_CONTENT = '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><rect/></svg>'
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+def _make_svg(directory: Path, name: str = "test.svg", content: str = SVG_CONTENT) -> Path:
+    """Erstellt SVG-Testdatei"""
+    svg_path = directory / name
+    svg_path.write_text(content, encoding='utf-8')
+    return svg_path
+
+
+def test_key_depends_on_content_and_params():
+    """
+    Test 1: Schluessel haengt von Inhalt und Render-Parametern ab, nicht vom Pfad
+    """
+    print_test("Schluessel-Bildung")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        cache = RasterCache(cache_dir=tmp_dir / "cache", max_size_mb=10, enabled=True)
+
+        svg_a = _make_svg(tmp_dir, "a.svg")
+        svg_b = _make_svg(tmp_dir, "b.svg")
+        svg_c = _make_svg(tmp_dir, "c.svg", SVG_CONTENT.replace("10", "20"))
+
+        key_a = cache.make_key(svg_a, 300, 30.0, 30.0, 2.0)
+
+        assert key_a == cache.make_key(svg_b, 300, 30.0, 30.0, 2.0), (
+            "FEHLER: Identischer Inhalt muss identischen Schluessel ergeben"
+        )
+        assert key_a != cache.make_key(svg_c, 300, 30.0, 30.0, 2.0), (
+            "FEHLER: Anderer Inhalt muss anderen Schluessel ergeben"
+        )
+        assert key_a != cache.make_key(svg_a, 600, 30.0, 30.0, 2.0), "FEHLER: DPI fehlt im Schluessel"
+        assert key_a != cache.make_key(svg_a, 300, 31.0, 30.0, 2.0), "FEHLER: Box fehlt im Schluessel"
+        assert key_a != cache.make_key(svg_a, 300, 30.0, 30.0, 1.0), (
+            "FEHLER: render_scale fehlt im Schluessel"
+        )
+
+    print("  [OK] Schluessel korrekt gebildet")
+    return True
+
+
+def test_put_get_roundtrip():
+    """
+    Test 2: Eintrag schreiben und identisch wieder lesen
+    """
+    print_test("Schreiben/Lesen")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        cache = RasterCache(cache_dir=tmp_dir / "cache", max_size_mb=10, enabled=True)
+        svg_path = _make_svg(tmp_dir)
+        key = cache.make_key(svg_path, 300, 30.0, 30.0, 2.0)
+
+        assert cache.get(key) is None, "FEHLER: Leerer Cache muss Miss liefern"
+
+        original = Image.new('RGBA', (64, 32), (10, 20, 30, 128))
+        cache.put(key, original)
+        restored = cache.get(key)
+
+        assert restored is not None, "FEHLER: Eintrag nicht gefunden"
+        assert restored.mode == original.mode, "FEHLER: Farbmodus veraendert"
+        assert restored.tobytes() == original.tobytes(), "FEHLER: Pixeldaten veraendert"
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1, "FEHLER: Statistik falsch: {}".format(stats)
+
+        leftovers = [p for p in (tmp_dir / "cache").iterdir() if p.name.startswith(".tmp_")]
+        assert not leftovers, "FEHLER: Temp-Dateien nicht aufgeraeumt"
+
+    print("  [OK] Eintrag verlustfrei gespeichert")
+    return True
+
+
+def test_corrupt_entry_is_discarded():
+    """
+    Test 3: Beschaedigte Cache-Datei wird als Miss behandelt und geloescht
+    """
+    print_test("Beschaedigter Eintrag")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        cache = RasterCache(cache_dir=tmp_dir / "cache", max_size_mb=10, enabled=True)
+        svg_path = _make_svg(tmp_dir)
+        key = cache.make_key(svg_path, 300, 30.0, 30.0, 2.0)
+
+        entry = cache._entry_path(key)
+        entry.write_bytes(b"\x89PNG kaputt")
+
+        assert cache.get(key) is None, "FEHLER: Beschaedigter Eintrag darf nicht geliefert werden"
+        assert not entry.exists(), "FEHLER: Beschaedigter Eintrag wurde nicht geloescht"
+
+    print("  [OK] Beschaedigter Eintrag verworfen")
+    return True
+
+
+def test_lru_eviction():
+    """
+    Test 4: Bei ueberschrittenem Budget wird der am laengsten ungenutzte Eintrag verdraengt
+    """
+    print_test("LRU-Verdraengung")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        cache = RasterCache(cache_dir=tmp_dir / "cache", max_size_mb=1, enabled=True)
+
+        # Rauschen laesst sich kaum komprimieren -> jeder Eintrag ca. 400 KB
+        keys = []
+        for i in range(3):
+            svg_path = _make_svg(tmp_dir, "s{}.svg".format(i), SVG_CONTENT + str(i))
+            key = cache.make_key(svg_path, 300, 30.0, 30.0, 2.0)
+            cache.put(key, Image.frombytes('RGBA', (320, 320), os.urandom(320 * 320 * 4)))
+            keys.append(key)
+            # Eindeutige mtimes, erster Eintrag wird danach erneut benutzt
+            past = time.time() - 100 + i
+            os.utime(cache._entry_path(key), (past, past))
+            if i == 1:
+                assert cache.get(keys[0]) is not None, "FEHLER: Erster Eintrag fehlt"
+
+        assert cache.get_stats()['size_mb'] <= 1.0, "FEHLER: Budget ueberschritten"
+        assert cache._entry_path(keys[0]).exists(), "FEHLER: Zuletzt benutzter Eintrag verdraengt"
+        assert not cache._entry_path(keys[1]).exists(), "FEHLER: Aeltester Eintrag nicht verdraengt"
+
+    print("  [OK] LRU-Verdraengung funktioniert")
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("RASTER-CACHE UNIT TESTS")
+
+    tests = [
+        test_key_depends_on_content_and_params,
+        test_put_get_roundtrip,
+        test_corrupt_entry_is_discarded,
+        test_lru_eviction,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
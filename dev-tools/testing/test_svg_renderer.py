@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_svg_renderer.py - Unit-Tests fuer die SVG-Renderer-Auswahl
+
+Testet:
+- Ergebnis-Validierung (leer, zu gross, gueltig)
+- Fallback auf naechsten Renderer bei Fehler / ungueltigem Ergebnis
+- Verworfene Renderer werden fuer dasselbe SVG nicht erneut versucht
+- SVG-Geometrie (viewBox, Einheiten) und Zwei-Stufen-Rendering mit Inhalts-Box
+- Inhalts-Box-Speicher ist begrenzt (LRU-Verdraengung)
+
+Die Renderer werden durch Test-Renderer ersetzt - kein ImageMagick/Cairo noetig.
+
+Ausfuehrung: python dev-tools/testing/test_svg_renderer.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image, ImageDraw
+
+from svg_renderer import (
+    SVGRenderer,
+    SVGRendererChain,
+    ContentBoxStore,
+    is_valid_render_output,
+    parse_svg_geometry
+)
+from constants import RENDER_ENGINE_AUTO, mm_to_pixels
+
+
+class _TestRenderer(SVGRenderer):
+    """Test-Renderer mit festem Verhalten ('ok', 'empty' oder 'error')"""
+
+    def __init__(self, name: str, behaviour: str):
+        super().__init__()
+        self.name = name
+        self.behaviour = behaviour
+        self.calls = 0
+
+    def render(self, svg_path, max_height_mm, max_width_mm, dpi, render_scale=1.0):
+        self.calls += 1
+        if self.behaviour == 'error':
+            raise RuntimeError("Test-Fehler")
+        size = (mm_to_pixels(max_width_mm, dpi), mm_to_pixels(max_height_mm, dpi))
+        if self.behaviour == 'empty':
+            return Image.new('RGBA', size, (0, 0, 0, 0))
+        return Image.new('RGBA', size, (255, 0, 0, 255))
+
+
+class _RectRenderer(SVGRenderer):
+    """
+    Test-Renderer: rastert ein festes Rechteck (Benutzereinheiten) gemaess Root-viewBox
+
+    Ersetzt eine echte SVG-Bibliothek - ausreichend um die Geometrie-Berechnung
+    des Zwei-Stufen-Renderings zu pruefen.
+    """
+
+    name = "rechteck"
+    RECT = (20.0, 30.0, 60.0, 50.0)  # x0, y0, x1, y1 in Benutzereinheiten
+
+    def __init__(self, box_dir: Path):
+        super().__init__()
+        self.content_boxes = ContentBoxStore(box_dir)
+        self.resolutions = []
+        self.sizes = []
+
+    def _rasterize(self, svg_data, resolution, svg_path):
+        self.resolutions.append(resolution)
+        geometry = parse_svg_geometry(svg_data.decode('utf-8'))
+        scale = resolution / 96.0 * geometry.px_per_unit  # Pixel pro Benutzereinheit
+        vx, vy, vw, vh = geometry.viewbox
+        image = Image.new('RGBA', (round(vw * scale), round(vh * scale)), (0, 0, 0, 0))
+        x0, y0, x1, y1 = self.RECT
+        ImageDraw.Draw(image).rectangle(
+            [(x0 - vx) * scale, (y0 - vy) * scale, (x1 - vx) * scale - 1, (y1 - vy) * scale - 1],
+            fill=(255, 0, 0, 255)
+        )
+        self.sizes.append(image.size)
+        return image
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+def test_output_validation():
+    """
+    Test 1: Leere und zu grosse Ergebnisse werden verworfen
+    """
+    print_test("Ergebnis-Validierung")
+
+    content = Image.new('RGBA', (10, 10), (0, 0, 0, 0))
+    content.putpixel((5, 5), (0, 0, 0, 255))
+
+    assert not is_valid_render_output(None, 20, 20), "FEHLER: None muss ungueltig sein"
+    assert not is_valid_render_output(Image.new('RGBA', (10, 10)), 20, 20), (
+        "FEHLER: Vollstaendig transparentes Bild muss ungueltig sein"
+    )
+    assert not is_valid_render_output(Image.new('RGB', (10, 10), 'white'), 20, 20), (
+        "FEHLER: Einfarbiges RGB-Bild muss ungueltig sein"
+    )
+    assert not is_valid_render_output(content.resize((40, 10)), 20, 20), (
+        "FEHLER: Zu breites Bild muss ungueltig sein"
+    )
+    assert is_valid_render_output(content, 20, 20), "FEHLER: Bild mit Inhalt muss gueltig sein"
+
+    print("  [OK] Validierung korrekt")
+    return True
+
+
+def test_fallback_on_error_and_empty():
+    """
+    Test 2: Fehler und leere Ergebnisse fuehren zum naechsten Renderer
+    """
+    print_test("Fallback")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg_path = Path(tmp) / "test.svg"
+        svg_path.write_text('<svg xmlns="http://www.w3.org/2000/svg"/>', encoding='utf-8')
+
+        failing = _TestRenderer("fehler", 'error')
+        empty = _TestRenderer("leer", 'empty')
+        working = _TestRenderer("ok", 'ok')
+        chain = SVGRendererChain(RENDER_ENGINE_AUTO, renderers=[failing, empty, working])
+
+        image = chain.render(svg_path, 10.0, 10.0, 300)
+
+        assert image.size == (mm_to_pixels(10.0, 300), mm_to_pixels(10.0, 300)), (
+            "FEHLER: Falsche Ergebnisgroesse {}".format(image.size)
+        )
+        assert failing.calls == 1 and empty.calls == 1 and working.calls == 1, (
+            "FEHLER: Nicht alle Renderer der Reihe nach versucht"
+        )
+
+    print("  [OK] Fallback funktioniert")
+    return True
+
+
+def test_rejected_renderer_is_skipped():
+    """
+    Test 3: Ein fuer ein SVG verworfener Renderer wird fuer dieses SVG uebersprungen
+    """
+    print_test("Verworfene Renderer")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg_a = Path(tmp) / "a.svg"
+        svg_b = Path(tmp) / "b.svg"
+        for svg in (svg_a, svg_b):
+            svg.write_text('<svg xmlns="http://www.w3.org/2000/svg"/>', encoding='utf-8')
+
+        failing = _TestRenderer("fehler", 'error')
+        working = _TestRenderer("ok", 'ok')
+        # Gewaehlter Renderer wird zuerst versucht
+        chain = SVGRendererChain("fehler", renderers=[working, failing])
+        assert chain.renderers[0] is failing, "FEHLER: Gewaehlter Renderer nicht zuerst"
+
+        chain.render(svg_a, 10.0, 10.0, 300)
+        chain.render(svg_a, 10.0, 10.0, 300)
+        assert failing.calls == 1, "FEHLER: Verworfener Renderer erneut versucht"
+
+        chain.render(svg_b, 10.0, 10.0, 300)
+        assert failing.calls == 2, "FEHLER: Anderes SVG muss erneut versucht werden"
+
+    print("  [OK] Verworfene Renderer werden uebersprungen")
+    return True
+
+
+def test_svg_geometry():
+    """
+    Test 4: viewBox und intrinsische Groesse werden korrekt gelesen
+    """
+    print_test("SVG-Geometrie")
+
+    geometry = parse_svg_geometry(
+        '<?xml version="1.0"?><svg xmlns="http://www.w3.org/2000/svg" stroke-width="3" '
+        'width="25.4mm" height="12.7mm" viewBox="0 0 200 100"><rect/></svg>'
+    )
+    assert geometry is not None, "FEHLER: Geometrie nicht erkannt"
+    assert geometry.viewbox == (0.0, 0.0, 200.0, 100.0), "FEHLER: viewBox {}".format(geometry.viewbox)
+    assert abs(geometry.width_px - 96.0) < 1e-6, "FEHLER: mm nicht umgerechnet"
+
+    only_size = parse_svg_geometry('<svg width="40" height="20"></svg>')
+    assert only_size.viewbox == (0.0, 0.0, 40.0, 20.0), "FEHLER: viewBox aus width/height"
+
+    assert parse_svg_geometry('<svg width="100%" height="50%"></svg>') is None, (
+        "FEHLER: Prozentangaben muessen abgelehnt werden"
+    )
+    assert parse_svg_geometry('<svg width="100" height="100" viewBox="0 0 100 50"></svg>') is None, (
+        "FEHLER: Nicht-uniforme Skalierung muss abgelehnt werden"
+    )
+
+    print("  [OK] Geometrie korrekt gelesen")
+    return True
+
+
+def test_two_stage_render():
+    """
+    Test 5: Vorab-Pass einmal pro SVG, danach nur Ausschnitt in Zielgroesse
+    """
+    print_test("Zwei-Stufen-Rendering")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        svg_path = tmp_dir / "rechteck.svg"
+        svg_path.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100" viewBox="0 0 100 100">'
+            '<rect x="20" y="30" width="40" height="20"/></svg>',
+            encoding='utf-8'
+        )
+
+        renderer = _RectRenderer(tmp_dir / "bbox")
+        image = renderer.render(svg_path, 10.0, 30.0, 300, render_scale=2.0)
+
+        # Rechteck 40x20 -> begrenzt durch Hoehe: 10mm @ 300 DPI
+        expected_h = mm_to_pixels(10.0, 300)
+        assert image.height == expected_h and abs(image.width - expected_h * 2) <= 1, (
+            "FEHLER: Ergebnisgroesse {}".format(image.size)
+        )
+        assert len(renderer.resolutions) == 2, "FEHLER: Erwartet Vorab-Pass + Ausschnitt"
+        assert any((tmp_dir / "bbox").glob("*.json")), "FEHLER: Inhalts-Box nicht gespeichert"
+
+        # Ausschnitt-Raster hat Zielgroesse plus Vorab-Pass-Rand (kein render_scale-Vielfaches)
+        crop_w, crop_h = renderer.sizes[1]
+        assert crop_h <= expected_h * 1.1 and crop_w <= expected_h * 2 * 1.1, \
+            "FEHLER: Ausschnitt zu gross gerastert: {}x{}px".format(crop_w, crop_h)
+
+        # Zweites Rendering: kein Vorab-Pass mehr (auch mit neuem Renderer-Objekt)
+        second = _RectRenderer(tmp_dir / "bbox")
+        second.render(svg_path, 20.0, 20.0, 300)
+        assert len(second.resolutions) == 1, "FEHLER: Vorab-Pass wiederholt"
+
+    print("  [OK] Zwei-Stufen-Rendering funktioniert")
+    return True
+
+
+def test_content_box_store_limit():
+    """
+    Test 6: Inhalts-Box-Speicher verdraengt aelteste Eintraege, zuletzt genutzte bleiben
+    """
+    print_test("Inhalts-Box-Speicher mit Limit")
+
+    import os
+
+    with tempfile.TemporaryDirectory() as tmp:
+        box_dir = Path(tmp) / "bbox"
+        store = ContentBoxStore(box_dir, max_entries=10)
+        for i in range(10):
+            store.put("box_{:02d}".format(i), {'box': [0, 0, i, i]})
+            # Eindeutige mtime-Reihenfolge (Dateisystem-Aufloesung)
+            os.utime(box_dir / "box_{:02d}.json".format(i), (1000 + i, 1000 + i))
+
+        # box_00 wird von einem neuen Prozess gelesen -> zuletzt genutzt
+        assert ContentBoxStore(box_dir, max_entries=10).get("box_00") is not None
+        store.put("box_10", {'box': [0, 0, 10, 10]})
+
+        names = sorted(p.stem for p in box_dir.glob("*.json"))
+        assert len(names) <= 10, "FEHLER: {} Dateien ueber Limit".format(len(names))
+        assert "box_00" in names and "box_10" in names, "FEHLER: Zuletzt genutzte verdraengt: {}".format(names)
+        assert "box_01" not in names, "FEHLER: Aeltester Eintrag nicht verdraengt"
+        assert len(store._memo) <= 10, "FEHLER: In-Memory ueber Limit"
+
+    print("  [OK] {} von 11 Eintraegen behalten".format(len(names)))
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("SVG-RENDERER UNIT TESTS")
+
+    tests = [
+        test_output_validation,
+        test_fallback_on_error_and_empty,
+        test_rejected_renderer_is_skipped,
+        test_svg_geometry,
+        test_two_stage_render,
+        test_content_box_store_limit,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
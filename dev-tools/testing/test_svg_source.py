@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_svg_source.py - Unit-Tests fuer das einmal geladene SVG-Dokument (SvgSource)
+
+Testet:
+- Memoisierung pro Pfad/mtime/Groesse und Inhalts-Hash (kein erneutes Lesen)
+- Bereinigung ungueltiger UTF-8-Zeichen
+- Gueltigkeit, Pseudo-SVG-Erkennung und eingebettetes PNG
+- Font-Extraktion (Text-Elemente und alle Elemente)
+- Stat-Index waechst nicht mit Aenderungen und Verdraengung
+
+Ausfuehrung: python dev-tools/testing/test_svg_source.py
+"""
+
+import base64
+import os
+import sys
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+
+from svg_source import SvgSourceCache
+from constants import BLANKO_S1_LINIEN_STAERKE
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+def test_memoization_and_sanitizing():
+    """
+    Test 1: Inhalt wird einmal geladen, geteilt und bei Aenderung neu gelesen
+    """
+    print_test("Memoisierung und Bereinigung")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg_a = Path(tmp) / "a.svg"
+        svg_b = Path(tmp) / "b.svg"
+        content = b'<svg xmlns="http://www.w3.org/2000/svg"><text>\xff</text></svg>'
+        svg_a.write_bytes(content)
+        svg_b.write_bytes(content)
+
+        cache = SvgSourceCache(max_size_mb=1)
+        source = cache.get(svg_a)
+
+        assert source is not None and b'\xff' not in source.sanitized, (
+            "FEHLER: Ungueltiges UTF-8 nicht entfernt"
+        )
+        assert not source.is_valid, "FEHLER: Ungueltige Kodierung muss ungueltig sein"
+        assert cache.get(svg_a) is source, "FEHLER: Zweiter Zugriff nicht aus dem Cache"
+        assert cache.get(svg_b) is source, "FEHLER: Identischer Inhalt nicht geteilt"
+        assert cache.misses == 2 and cache.hits == 1, "FEHLER: Statistik {} / {}".format(
+            cache.hits, cache.misses
+        )
+
+        svg_a.write_bytes(b'<svg xmlns="http://www.w3.org/2000/svg"><rect/></svg>')
+        os.utime(svg_a, ns=(0, 10 ** 9))
+        changed = cache.get(svg_a)
+        assert changed is not source and b'<rect/>' in changed.sanitized, (
+            "FEHLER: Geaenderte Datei nicht neu gelesen"
+        )
+
+        assert cache.get(Path(tmp) / "fehlt.svg") is None, "FEHLER: Fehlende Datei muss None liefern"
+        assert cache.get(Path(BLANKO_S1_LINIEN_STAERKE)) is None, "FEHLER: Blanko darf nicht gelesen werden"
+
+    print("  [OK] Memoisierung funktioniert")
+    return True
+
+
+def test_pseudo_svg_and_embedded_png():
+    """
+    Test 2: Pseudo-SVG (nur PNG) wird erkannt und PNG dekodiert
+    """
+    print_test("Pseudo-SVG")
+
+    buffer = BytesIO()
+    Image.new('RGB', (4, 3), 'red').save(buffer, format='PNG')
+    png_b64 = base64.b64encode(buffer.getvalue()).decode('ascii')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pseudo = Path(tmp) / "pseudo.svg"
+        pseudo.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg"><image href="data:image/png;base64,{}"/></svg>'.format(png_b64),
+            encoding='utf-8'
+        )
+        vector = Path(tmp) / "vector.svg"
+        vector.write_text('<svg xmlns="http://www.w3.org/2000/svg"><rect/></svg>', encoding='utf-8')
+
+        cache = SvgSourceCache(max_size_mb=1)
+        pseudo_source = cache.get(pseudo)
+        vector_source = cache.get(vector)
+
+        assert pseudo_source.is_valid and pseudo_source.is_pseudo, "FEHLER: Pseudo-SVG nicht erkannt"
+        assert not vector_source.is_pseudo, "FEHLER: Vektor-SVG als Pseudo erkannt"
+        assert vector_source.embedded_png is None, "FEHLER: Vektor-SVG hat kein PNG"
+
+        with Image.open(BytesIO(pseudo_source.embedded_png)) as image:
+            assert image.size == (4, 3), "FEHLER: Eingebettetes PNG falsch dekodiert"
+
+    print("  [OK] Pseudo-SVG erkannt")
+    return True
+
+
+def test_font_extraction():
+    """
+    Test 3: Schriftarten aus Text-Elementen und allen Elementen
+    """
+    print_test("Font-Extraktion")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg_path = Path(tmp) / "fonts.svg"
+        svg_path.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<g font-family="Verdana"><text style="font-size:4px;font-family:\'DejaVu Sans\', serif">A'
+            '<tspan font-family="Arial">B</tspan></text></g></svg>',
+            encoding='utf-8'
+        )
+
+        source = SvgSourceCache(max_size_mb=1).get(svg_path)
+
+        has_text, text_fonts = source.text_font_info
+        assert has_text, "FEHLER: Text-Elemente nicht erkannt"
+        assert text_fonts == {'DejaVu Sans', 'serif', 'Arial'}, "FEHLER: Text-Fonts {}".format(text_fonts)
+        assert source.font_families == {'Verdana', 'DejaVu Sans', 'Arial'}, (
+            "FEHLER: Font-Familien {}".format(source.font_families)
+        )
+
+    print("  [OK] Fonts korrekt extrahiert")
+    return True
+
+
+def test_parse_error():
+    """
+    Test 4: Ungueltiges XML liefert Parse-Fehler und leere Font-Mengen
+    """
+    print_test("Parse-Fehler")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg_path = Path(tmp) / "kaputt.svg"
+        svg_path.write_text('<svg><text font-family="Arial">', encoding='utf-8')
+
+        source = SvgSourceCache(max_size_mb=1).get(svg_path)
+
+        assert source.is_valid, "FEHLER: Beginnt mit '<' - Grundpruefung muss bestehen"
+        assert source.parse_error is not None, "FEHLER: Parse-Fehler nicht erkannt"
+        assert source.text_font_info == (False, set()), "FEHLER: Text-Fonts trotz Parse-Fehler"
+        assert source.font_families == set(), "FEHLER: Font-Familien trotz Parse-Fehler"
+
+    print("  [OK] Parse-Fehler behandelt")
+    return True
+
+
+def test_stat_index_bounded():
+    """
+    Test 5: Erneut gespeicherte / verdraengte Dateien hinterlassen keine Stat-Schluessel
+    """
+    print_test("Stat-Index begrenzt")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg_a = Path(tmp) / "a.svg"
+        svg_a.write_bytes(b'<svg xmlns="http://www.w3.org/2000/svg"/>')
+        cache = SvgSourceCache(max_size_mb=1)
+
+        # Gleicher Inhalt, neue mtime (erneut gespeichert) -> ein Schluessel pro Pfad
+        for second in range(1, 6):
+            os.utime(svg_a, ns=(0, second * 10 ** 9))
+            cache.get(svg_a)
+        assert len(cache._by_stat) == 1, "FEHLER: {} Stat-Schluessel fuer eine Datei".format(len(cache._by_stat))
+
+        # Verdraengte Inhalte nehmen ihre Stat-Schluessel mit
+        cache.max_size_bytes = 200
+        for i in range(20):
+            path = Path(tmp) / "z_{:02d}.svg".format(i)
+            path.write_bytes('<svg xmlns="http://www.w3.org/2000/svg"><!-- {} --></svg>'.format(i).encode())
+            cache.get(path)
+        assert set(cache._by_stat.values()) <= set(cache._by_digest), "FEHLER: Schluessel auf verdraengte Inhalte"
+        assert len(cache._by_stat) == len(cache._stat_by_path) <= len(cache._by_digest) + 1, \
+            "FEHLER: Stat-Index waechst ({} Schluessel, {} Inhalte)".format(len(cache._by_stat), len(cache._by_digest))
+
+    print("  [OK] {} Schluessel fuer {} Inhalte".format(len(cache._by_stat), len(cache._by_digest)))
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("SVG-SOURCE UNIT TESTS")
+
+    tests = [
+        test_memoization_and_sanitizing,
+        test_pseudo_svg_and_embedded_png,
+        test_font_extraction,
+        test_parse_error,
+        test_stat_index_bounded,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
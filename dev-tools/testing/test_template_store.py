@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_template_store.py - Unit-Tests fuer den stapeluebergreifenden Template-Speicher
+
+Testet:
+- Treffer/Miss und get_or_create (Factory nur bei Miss)
+- LRU-Verdraengung nach Bytes
+- Templates groesser als das Budget werden nicht gespeichert
+- Speicher-Schluessel des Generators (Zeichen-ID egal, Abmessungen/SVG-Inhalt nicht)
+- Zeichen starten, sobald ihr eigenes Template fertig ist (_compose_chunk)
+
+Ausfuehrung: python dev-tools/testing/test_template_store.py
+"""
+
+import sys
+import time
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+
+from template_store import TemplateStore, image_size_bytes
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+def test_get_or_create():
+    """
+    Test 1: Factory wird nur bei Miss aufgerufen, Zaehler stimmen
+    """
+    print_test("Treffer/Miss + get_or_create")
+
+    store = TemplateStore(max_size_mb=10)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return Image.new('RGBA', (100, 100))
+
+    first = store.get_or_create("text", factory)
+    second = store.get_or_create("text", factory)
+
+    assert first is second, "FEHLER: Zweiter Aufruf liefert anderes Objekt"
+    assert len(calls) == 1, "FEHLER: Factory {} mal aufgerufen".format(len(calls))
+
+    stats = store.get_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1, "FEHLER: Zaehler falsch: {}".format(stats)
+    assert stats['entries'] == 1, "FEHLER: Eintraege falsch: {}".format(stats)
+
+    print("  [OK] Factory nur bei Miss, Zaehler korrekt")
+    return True
+
+
+def test_lru_eviction_by_bytes():
+    """
+    Test 2: Zuletzt benutzte Templates bleiben, aelteste werden verdraengt
+    """
+    print_test("LRU-Verdraengung nach Bytes")
+
+    store = TemplateStore(max_size_mb=1)
+    # 256x256 RGBA = 0.25 MB -> 4 passen ins Budget
+    for key in ("a", "b", "c", "d"):
+        store.put(key, Image.new('RGBA', (256, 256)))
+
+    assert store.get("a") is not None, "FEHLER: 'a' fehlt vor Verdraengung"
+    store.put("e", Image.new('RGBA', (256, 256)))
+
+    assert store.get("a") is not None, "FEHLER: Zuletzt benutztes Template verdraengt"
+    assert store.get("b") is None, "FEHLER: Aeltestes Template nicht verdraengt"
+
+    stats = store.get_stats()
+    assert stats['evictions'] == 1, "FEHLER: Verdraengungen falsch: {}".format(stats)
+    assert stats['size_mb'] <= stats['max_mb'], "FEHLER: Budget ueberschritten: {}".format(stats)
+
+    print("  [OK] LRU-Verdraengung funktioniert")
+    return True
+
+
+def test_oversize_and_budget_change():
+    """
+    Test 3: Zu grosse Templates werden uebersprungen, Budget-Reduktion verdraengt sofort
+    """
+    print_test("Uebergrosse Templates + Budget-Aenderung")
+
+    store = TemplateStore(max_size_mb=1)
+    big = Image.new('RGBA', (1024, 1024))
+    assert image_size_bytes(big) > store.max_size_bytes
+
+    store.put("big", big)
+    assert store.get("big") is None, "FEHLER: Uebergrosses Template gespeichert"
+
+    store.put("small", Image.new('RGB', (100, 100)))
+    store.set_max_size_mb(0)
+    assert store.get_stats()['entries'] == 0, "FEHLER: Budget 0 verdraengt nicht"
+
+    print("  [OK] Budget wird eingehalten")
+    return True
+
+
+def test_generator_store_key():
+    """
+    Test 4: Speicher-Schluessel ignoriert Zeichen-ID, beruecksichtigt Abmessungen und SVG-Inhalt
+    """
+    print_test("Speicher-Schluessel des Generators")
+
+    from taktische_zeichen_generator import TaktischeZeichenGenerator, ZeichenConfig
+
+    generator = TaktischeZeichenGenerator()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg_path = Path(tmp) / "zeichen.svg"
+        svg_path.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><rect/></svg>',
+            encoding='utf-8'
+        )
+
+        config_a = ZeichenConfig(zeichen_id="a", svg_path=svg_path)
+        config_b = ZeichenConfig(zeichen_id="b", svg_path=svg_path)
+        config_c = ZeichenConfig(zeichen_id="c", svg_path=svg_path, zeichen_hoehe_mm=60.0)
+
+        key_a = generator._template_store_key("svg", "k", config_a, svg_path)
+        key_b = generator._template_store_key("svg", "k", config_b, svg_path)
+        key_c = generator._template_store_key("svg", "k", config_c, svg_path)
+
+        assert key_a == key_b, "FEHLER: Zeichen-ID beeinflusst Schluessel"
+        assert key_a != key_c, "FEHLER: Abmessung beeinflusst Schluessel nicht"
+
+        svg_path.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><circle/></svg>',
+            encoding='utf-8'
+        )
+        key_changed = generator._template_store_key("svg", "k", config_a, svg_path)
+        assert key_a != key_changed, "FEHLER: Geaenderter SVG-Inhalt ergibt gleichen Schluessel"
+
+    print("  [OK] Schluessel korrekt")
+    return True
+
+
+def test_compose_starts_per_template():
+    """
+    Test 5: Zeichen warten nur auf ihr eigenes Template, gespeicherte Templates rendern nicht
+    """
+    print_test("Template-Futures im Stapel")
+
+    from taktische_zeichen_generator import TaktischeZeichenGenerator, ZeichenConfig
+
+    generator = TaktischeZeichenGenerator()
+    generator.template_store = TemplateStore(max_size_mb=10)
+
+    slow_done = threading.Event()
+    slow_image = Image.new('RGBA', (10, 10))
+    fast_image = Image.new('RGBA', (20, 20))
+    cached_image = Image.new('RGBA', (30, 30))
+    generator.template_store.put("store-cached", cached_image)
+
+    def render_slow():
+        time.sleep(0.3)
+        slow_done.set()
+        return slow_image
+
+    def render_cached():
+        raise AssertionError("Gespeichertes Template wurde erneut gerendert")
+
+    jobs = {
+        "slow": (Path("slow.svg"), "store-slow", render_slow),
+        "fast": (Path("fast.svg"), "store-fast", lambda: fast_image),
+        "cached": (Path("cached.svg"), "store-cached", render_cached),
+    }
+    tasks = [(Path("{}.svg".format(name)), ZeichenConfig(zeichen_id=name, svg_path=Path("x.svg")))
+             for name in ("slow", "fast", "cached")]
+
+    def worker(svg_path, config, svg_template):
+        return (svg_template, slow_done.is_set())
+
+    svg_templates = {}
+    results = {
+        config.zeichen_id: result
+        for _, config, result in generator._compose_chunk(
+            tasks, jobs, svg_templates, lambda path, config: path.stem, worker, num_threads=4
+        )
+    }
+
+    assert results["slow"][0] is slow_image, "FEHLER: Falsches Template fuer 'slow'"
+    assert results["fast"][0] is fast_image, "FEHLER: Falsches Template fuer 'fast'"
+    assert results["cached"][0] is cached_image, "FEHLER: Gespeichertes Template nicht genutzt"
+    assert not results["fast"][1], "FEHLER: 'fast' hat auf fremdes Template gewartet"
+    assert generator.template_store.get("store-slow") is slow_image, "FEHLER: Template nicht gespeichert"
+    assert len(svg_templates) == 3, "FEHLER: Stapel-Templates unvollstaendig"
+
+    print("  [OK] Zeichen starten pro Template")
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("TEMPLATE-STORE UNIT TESTS")
+
+    tests = [
+        test_get_or_create,
+        test_lru_eviction_by_bytes,
+        test_oversize_and_budget_change,
+        test_generator_store_key,
+        test_compose_starts_per_template,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
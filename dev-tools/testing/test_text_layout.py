@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_text_layout.py - Unit-Tests fuer die memoisierte Textmessung (text_layout)
+
+Testet:
+- font.getbbox() misst wie ImageDraw.textbbox((0, 0), ...) (auch VectorCanvas.textbbox)
+- Zwei-Zeilen-Umbruch (Wortgrenzen, Bindestriche, harter Umbruch)
+- Text-Overlay misst ohne temporaere Bilder, Messungen werden wiederverwendet
+
+Ausfuehrung: python dev-tools/testing/test_text_layout.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image, ImageDraw, ImageFont
+
+import text_layout
+from text_layout import text_bbox, text_width_px, wrap_to_two_lines
+
+
+SAMPLES = [text_layout.METRICS_TEST_STRING, "OV: ________  ", "Stärke: __/__/__/__", "", "  x"]
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+def _test_font():
+    """Skalierbarer Standard-Font (ohne installierte Schriftarten)"""
+    try:
+        return ImageFont.load_default(size=40)
+    except TypeError:
+        # Pillow < 10.1: nur Bitmap-Font
+        return ImageFont.load_default()
+
+
+def test_bbox_matches_textbbox():
+    """
+    Test 1: Messung ohne Bild = ImageDraw.textbbox() (und VectorCanvas.textbbox())
+    """
+    print_test("getbbox() misst wie textbbox()")
+
+    from vector_canvas import VectorCanvas
+
+    font = _test_font()
+    draw = ImageDraw.Draw(Image.new('RGB', (1000, 1000)))
+    for sample in SAMPLES:
+        expected = tuple(draw.textbbox((0, 0), sample, font=font))
+        assert text_bbox(font, sample) == expected, "FEHLER: '{}' {} != {}".format(
+            sample, text_bbox(font, sample), expected)
+        assert tuple(VectorCanvas.textbbox((7, 3), sample, font=font)) == \
+            tuple(draw.textbbox((7, 3), sample, font=font)), "FEHLER: VectorCanvas '{}'".format(sample)
+
+    print("  [OK] {} Texte identisch gemessen".format(len(SAMPLES)))
+    return True
+
+
+def test_wrap_to_two_lines():
+    """
+    Test 2: Umbruch mit moeglichst vielen Woertern in Zeile 1
+    """
+    print_test("Zwei-Zeilen-Umbruch")
+
+    font = _test_font()
+    max_width = text_width_px(font, "aaa bbb")
+
+    assert wrap_to_two_lines(font, "aaa", max_width) == ("", "aaa"), "FEHLER: Einzeilig nicht unten"
+    assert wrap_to_two_lines(font, "aaa bbb ccc", max_width) == ("aaa bbb", "ccc"), \
+        "FEHLER: Umbruch {}".format(wrap_to_two_lines(font, "aaa bbb ccc", max_width))
+    hyphen_width = text_width_px(font, "aaa- bbb-")
+    assert wrap_to_two_lines(font, "aaa-bbb-ccc", hyphen_width) == ("aaa- bbb-", "ccc"), \
+        "FEHLER: Bindestrich-Umbruch {}".format(wrap_to_two_lines(font, "aaa-bbb-ccc", hyphen_width))
+    assert wrap_to_two_lines(font, "abcdefghijkl", 1) == ("abcdef", "ghijkl"), "FEHLER: Harter Umbruch"
+
+    print("  [OK] Wortgrenzen, Bindestriche, harter Umbruch")
+    return True
+
+
+def test_overlay_measures_without_images():
+    """
+    Test 3: Text-Hoehe/-Breite ohne temporaere Bilder, wiederholte Messung aus dem Cache
+    """
+    print_test("Text-Overlay misst ohne Bilder")
+
+    from text_overlay import TextOverlayPlaceholder, ZeichenConfig
+    from constants import MODUS_OV_STAERKE, MODUS_FREITEXT
+
+    overlay = TextOverlayPlaceholder()
+    configs = [
+        ZeichenConfig(zeichen_id="ov", svg_path=Path("test.svg"), dpi=300, modus=MODUS_OV_STAERKE),
+        ZeichenConfig(zeichen_id="frei", svg_path=Path("test.svg"), dpi=300, modus=MODUS_FREITEXT,
+                      freitext="Technisches Hilfswerk Ortsverband"),
+    ]
+    first = [(overlay.calculate_text_height_mm(c), overlay.calculate_text_width_mm(c)) for c in configs]
+
+    created = []
+    original_new = Image.new
+
+    def counting_new(*args, **kwargs):
+        created.append(args)
+        return original_new(*args, **kwargs)
+
+    hits_before = text_layout.text_bbox.cache_info().hits
+    misses_before = text_layout.text_bbox.cache_info().misses
+    Image.new = counting_new
+    try:
+        second = [(overlay.calculate_text_height_mm(c), overlay.calculate_text_width_mm(c)) for c in configs]
+    finally:
+        Image.new = original_new
+
+    info = text_layout.text_bbox.cache_info()
+    assert second == first, "FEHLER: Messung nicht reproduzierbar"
+    assert not created, "FEHLER: {} temporaere Bilder erzeugt".format(len(created))
+    assert info.misses == misses_before, "FEHLER: Text erneut gemessen"
+    assert info.hits > hits_before
+
+    print("  [OK] 0 Bilder, {} Messungen aus dem Cache".format(info.hits - hits_before))
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("TEXT-LAYOUT UNIT TESTS")
+
+    tests = [
+        test_bbox_matches_textbbox,
+        test_wrap_to_two_lines,
+        test_overlay_measures_without_images,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+font_registry.py - Einmal aufgelöste Schriftarten und geladene Fonts für alle Zeichen
+
+TextOverlayPlaceholder._load_font() hat bisher bei jedem Aufruf (mehrmals pro
+Zeichen) einen FontManager erzeugt, check_and_get_font() aufgerufen und bis zu
+fünf Pfade mit ImageFont.truetype() durchprobiert. Hier:
+
+- Schriftfamilie -> Datei-Pfad wird einmal pro Prozess aufgelöst
+  (inkl. Fallback über FontManager, Warnung nur einmal)
+- Geladene FreeTypeFont-Objekte liegen in einem LRU-Cache pro (Pfad, Pixelgröße)
+- Thread-safe
+
+Verwendung:
+    font = get_font("Arial", 83)
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+from PIL import ImageFont
+
+from logging_manager import LoggingManager
+from constants import SYSTEM_FONT_CACHE_SIZE
+
+
+FontType = Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
+
+
+def _font_path_candidates(actual_font: str) -> List[str]:
+    """
+    Pfad-Varianten für eine Schriftart (mehrere Varianten wegen Encoding-/Schreibweisen-Problemen)
+
+    Args:
+        actual_font: Verfügbare Schriftart (nach FontManager-Fallback)
+
+    Returns:
+        Pfade in Prüf-Reihenfolge
+    """
+    return [
+        # Variante 1: Original-Name (Case-Sensitive)
+        f"{actual_font}.ttf",
+        # Variante 2: Windows Fonts mit Original-Name
+        f"C:/Windows/Fonts/{actual_font}.ttf",
+        # Variante 3: Lowercase (für Standard-Fonts wie "arial")
+        f"{actual_font.lower()}.ttf",
+        # Variante 4: Windows Fonts mit Lowercase
+        f"C:/Windows/Fonts/{actual_font.lower()}.ttf",
+        # Variante 5: Vollständiger Name als Fallback
+        actual_font
+    ]
+
+
+class FontRegistry:
+    """
+    Prozessweite Schriftarten-Registry
+
+    - resolve(): Schriftfamilie -> (verfügbare Schriftart, Pfad oder None = Default-Font)
+    - get_font(): FreeTypeFont pro (Pfad, Pixelgröße) aus LRU-Cache
+    """
+
+    def __init__(self, max_fonts: int = SYSTEM_FONT_CACHE_SIZE):
+        """
+        Args:
+            max_fonts: Max. geladene Fonts im Speicher (verschiedene Pfade/Größen)
+        """
+        self.logger = LoggingManager().get_logger(__name__)
+        self.max_fonts = max(1, max_fonts)
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = Lock()
+        self._paths: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._fonts: "OrderedDict[Hashable, FontType]" = OrderedDict()
+
+    def resolve(self, font_family: str, font_size_px: int = 12) -> Tuple[str, Optional[str]]:
+        """
+        Löst Schriftfamilie einmal auf
+
+        Args:
+            font_family: Gewünschte Schriftart (z.B. aus RuntimeConfig)
+            font_size_px: Größe für den Lade-Versuch (der geladene Font wird gecacht)
+
+        Returns:
+            (verfügbare Schriftart, Pfad für ImageFont.truetype() oder None = Default-Font)
+        """
+        with self._lock:
+            resolved = self._paths.get(font_family)
+        if resolved is not None:
+            return resolved
+
+        from font_manager import FontManager
+        actual_font, _ = FontManager().check_and_get_font(font_family)
+
+        font_path = None
+        for candidate in _font_path_candidates(actual_font):
+            try:
+                font = ImageFont.truetype(candidate, font_size_px)
+            except Exception:
+                # Nächste Variante probieren
+                continue
+            font_path = candidate
+            self.logger.debug(f"Schriftart aufgelöst: {font_family} -> {actual_font} via '{candidate}'")
+            with self._lock:
+                self._fonts.setdefault((font_path, font_size_px), font)
+            break
+        else:
+            self.logger.warning(
+                f"Schriftart '{actual_font}' konnte nicht geladen werden. "
+                f"Verwende Default-Font. Alle Pfade getestet: {len(_font_path_candidates(actual_font))}"
+            )
+
+        with self._lock:
+            return self._paths.setdefault(font_family, (actual_font, font_path))
+
+    def get_font(self, font_family: str, font_size_px: int) -> FontType:
+        """
+        Liefert geladenen Font (gecacht pro Pfad und Pixelgröße)
+
+        Args:
+            font_family: Gewünschte Schriftart
+            font_size_px: Schriftgröße in Pixeln
+
+        Returns:
+            FreeTypeFont bei Erfolg, ImageFont.load_default() als Fallback
+        """
+        _, font_path = self.resolve(font_family, font_size_px)
+        key = (font_path, font_size_px)
+
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                self.hits += 1
+                return font
+
+        font = ImageFont.truetype(font_path, font_size_px) if font_path else ImageFont.load_default()
+
+        with self._lock:
+            self.misses += 1
+            font = self._fonts.setdefault(key, font)
+            self._fonts.move_to_end(key)
+            while len(self._fonts) > self.max_fonts:
+                self._fonts.popitem(last=False)
+            return font
+
+    def clear(self):
+        """
+        Leert Registry (z.B. nach Installation einer Schriftart)
+
+        Die Layout-Caches (text_layout) sind pro Font-Objekt memoisiert und werden
+        mitgeleert - sonst halten sie alte Fonts und deren Messungen weiter fest.
+        """
+        with self._lock:
+            self._paths.clear()
+            self._fonts.clear()
+
+        import text_layout
+        text_layout.clear_caches()
+
+
+# Prozessweite Registry (Text-Overlay, Templates und Generator teilen sich die Fonts)
+_font_registry = FontRegistry()
+
+
+def get_font(font_family: str, font_size_px: int) -> FontType:
+    """
+    Liefert den (gecachten) Font für Schriftfamilie und Pixelgröße
+
+    Args:
+        font_family: Gewünschte Schriftart
+        font_size_px: Schriftgröße in Pixeln
+
+    Returns:
+        FreeTypeFont bei Erfolg, ImageFont.load_default() als Fallback
+    """
+    return _font_registry.get_font(font_family, font_size_px)
+
+
+def get_font_registry() -> FontRegistry:
+    """Prozessweite FontRegistry (Statistik, clear())"""
+    return _font_registry
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 80)
+    print("FONT-REGISTRY TEST")
+    print("=" * 80)
+
+    registry = get_font_registry()
+    actual, path = registry.resolve("Arial")
+    print(f"\nArial -> {actual} ({path or 'Default-Font'})")
+
+    font = get_font("Arial", 83)
+    assert get_font("Arial", 83) is font, "Font nicht gecacht"
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        get_font("Arial", 83)
+    print(f"1000x get_font(): {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"Cache: {registry.hits} Treffer, {registry.misses} geladen")
+
+    print("\n" + "=" * 80)
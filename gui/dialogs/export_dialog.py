@@ -85,6 +85,7 @@ class ExportWorker(QThread):
 
     def run(self):
         """Führt Export aus"""
+        generator = None  # NEW: Für Cleanup des Render-Prozess-Pools im finally-Block
         try:
             # NEW: Sofortiges Feedback
             self.preparing.emit("Export wird vorbereitet...")
@@ -156,8 +157,9 @@ class ExportWorker(QThread):
                 sicherheitsabstand_mm = config.sicherheitsabstand_mm
                 beschnittzugabe_mm = config.beschnittzugabe_mm
 
-            # Render-Profil einmalig berechnen (optimiert DPI, Threads, render_scale)
+            # Render-Profil einmalig berechnen (optimiert DPI, render_scale)
             # basierend auf Zeichengröße und gewählter DPI
+            # CHANGED: Thread-Anzahl kommt aus dem Speicherbudget (MemoryScheduler, siehe unten)
             render_profile = calculate_render_profile(
                 zeichen_hoehe_mm,
                 zeichen_breite_mm,
@@ -165,14 +167,6 @@ class ExportWorker(QThread):
                 max_threads=self.num_threads
             )
 
-            # Verwende optimierte Thread-Anzahl aus Profil
-            optimized_threads = render_profile.threads
-            if optimized_threads < self.num_threads:
-                self.logger.info(
-                    f"Thread-Anzahl reduziert: {self.num_threads} -> {optimized_threads} "
-                    f"(Zeichengröße: {zeichen_hoehe_mm}x{zeichen_breite_mm}mm, Layout: {self.active_layout.upper()})"
-                )
-
             # Tasks erstellen
             # OPTIMIERUNG (v7.3): Für PNG nur unique Zeichen, für PDF alle Kopien
             tasks = []
@@ -242,6 +236,10 @@ class ExportWorker(QThread):
                     modus_for_filename = "s1_layout" if self.active_layout == "s1" else item.params.modus
                     copy_map[zeichen_base_id] = (item.anzahl_kopien, modus_for_filename)
 
+            # CHANGED: Thread-Anzahl aus Speicherbudget für ALLE Tasks (statt Megapixel-Stufen)
+            from memory_scheduler import MemoryScheduler
+            optimized_threads = MemoryScheduler().plan_threads(tasks, self.num_threads)
+
             # Progress-Callback
             def progress_callback(current, total, svg_name, status):
                 self.progress.emit(current, total, svg_name, status)
@@ -258,22 +256,11 @@ class ExportWorker(QThread):
 
                 # NEW: Stapelbasierte PDF-Export-Funktionen verwenden
                 from pdf_exporter import create_einzelzeichen_pdf_chunked, create_schnittbogen_pdf_chunked
-                from constants import DEFAULT_PDF_CHUNK_SIZE
 
                 if self.output_format == "PDF - Einzelzeichen":
                     # Variante 1: Einzelzeichen (stapelbasiert)
                     self.preparing.emit("Erstelle Einzelzeichen-PDFs (stapelweise)...")
 
-                    # Dynamische Stapelgröße basierend auf Zeichengröße (für häufigere GC)
-                    # CRITICAL: Layout-abhängige Abmessungen verwenden (bereits berechnet oben)
-                    max_dimension = max(zeichen_hoehe_mm, zeichen_breite_mm)
-                    if max_dimension > 150:
-                        pdf_chunk_size = 25  # Sehr große Zeichen: Kleinere Stapel
-                    elif max_dimension > 100:
-                        pdf_chunk_size = 50  # Große Zeichen: Mittlere Stapel
-                    else:
-                        pdf_chunk_size = DEFAULT_PDF_CHUNK_SIZE  # Normale Zeichen: Standard
-
                     pdf_files = create_einzelzeichen_pdf_chunked(
                         generator=generator,
                         tasks=tasks,
@@ -281,13 +268,13 @@ class ExportWorker(QThread):
                         dpi=self.dpi,
                         draw_cut_lines=self.draw_cut_lines,
                         progress_callback=progress_callback,
-                        chunk_size=pdf_chunk_size,
+                        chunk_size=None,  # CHANGED: Seiten pro Datei aus Einstellungen (pdf_chunk_size*)
                         export_format=export_format,  # NEW (v0.6.0)
                         # CRITICAL: Layout-abhängige Abmessungen (S1 vs S2)
                         zeichen_hoehe_mm=zeichen_hoehe_mm,
                         zeichen_breite_mm=zeichen_breite_mm,
                         beschnittzugabe_mm=beschnittzugabe_mm,
-                        num_threads=optimized_threads,  # Optimiert basierend auf Zeichengröße
+                        num_threads=optimized_threads,  # Aus Speicherbudget
                         # NEW: S1-Layout Parameter
                         s1_links_prozent=config.s1_links_prozent,
                         s1_anzahl_schreiblinien=config.s1_anzahl_schreiblinien,
@@ -298,16 +285,6 @@ class ExportWorker(QThread):
                     # Variante 2: Schnittbogen (stapelbasiert)
                     self.preparing.emit("Erstelle Schnittbogen-PDFs (stapelweise)...")
 
-                    # Dynamische Stapelgröße basierend auf Zeichengröße (für häufigere GC)
-                    # CRITICAL: Layout-abhängige Abmessungen verwenden (bereits berechnet oben)
-                    max_dimension = max(zeichen_hoehe_mm, zeichen_breite_mm)
-                    if max_dimension > 150:
-                        schnittbogen_chunk_size = 10  # Sehr große Zeichen: Sehr kleine Stapel
-                    elif max_dimension > 100:
-                        schnittbogen_chunk_size = 20  # Große Zeichen: Kleine Stapel
-                    else:
-                        schnittbogen_chunk_size = 50  # Normale Zeichen: Standard (50 Seiten)
-
                     pdf_files = create_schnittbogen_pdf_chunked(
                         generator=generator,
                         tasks=tasks,
@@ -315,14 +292,14 @@ class ExportWorker(QThread):
                         dpi=self.dpi,
                         draw_cut_lines=self.draw_cut_lines,
                         progress_callback=progress_callback,
-                        chunk_size=schnittbogen_chunk_size,  # Dynamisch angepasst
+                        chunk_size=None,  # CHANGED: Seiten pro Datei aus Einstellungen (pdf_chunk_size*)
                         export_format=export_format,  # NEW (v0.6.0)
                         # CRITICAL: Layout-abhängige Abmessungen (S1 vs S2)
                         zeichen_hoehe_mm=zeichen_hoehe_mm,
                         zeichen_breite_mm=zeichen_breite_mm,
                         beschnittzugabe_mm=beschnittzugabe_mm,
                         sicherheitsabstand_mm=sicherheitsabstand_mm,
-                        num_threads=optimized_threads,  # Optimiert basierend auf Zeichengröße
+                        num_threads=optimized_threads,  # Aus Speicherbudget
                         # NEW: S1-Layout Parameter
                         s1_links_prozent=config.s1_links_prozent,
                         s1_anzahl_schreiblinien=config.s1_anzahl_schreiblinien,
@@ -344,7 +321,7 @@ class ExportWorker(QThread):
                         s1_anzahl_schreiblinien=config.s1_anzahl_schreiblinien,
                         s1_staerke_anzeigen=config.s1_staerke_anzeigen,
                         draw_cut_lines=self.draw_cut_lines,
-                        num_threads=optimized_threads,  # Optimiert basierend auf Zeichengröße
+                        num_threads=optimized_threads,  # Aus Speicherbudget
                         progress_callback=progress_callback,
                         preparing_callback=preparing_callback,  # NEW: Template-Vorbereitung
                         use_templates=True  # NEW: Template-Optimierung aktiviert
@@ -355,7 +332,7 @@ class ExportWorker(QThread):
                     successful_files, errors = generator.create_zeichen_batch(
                         tasks=tasks,
                         draw_cut_lines=self.draw_cut_lines,
-                        num_threads=optimized_threads,  # Optimiert basierend auf Zeichengröße
+                        num_threads=optimized_threads,  # Aus Speicherbudget
                         progress_callback=progress_callback,
                         preparing_callback=preparing_callback,  # NEW
                         use_templates=True
@@ -418,6 +395,11 @@ class ExportWorker(QThread):
             self.logger.error(f"Export-Fehler: {e}")
             self.error.emit(str(e))
 
+        finally:
+            # NEW: Worker-Prozesse des Render-Backends beenden
+            if generator is not None:
+                generator.shutdown_render_pool()
+
 
 class ExportDialog(QDialog):
     """
@@ -17,6 +17,7 @@ from PyQt6.QtGui import QPixmap, QImage
 from wand.image import Image as WandImage
 
 from logging_manager import LoggingManager
+from svg_renderer import wand_to_raw_rgba
 
 
 class SVGPreviewWidget(QLabel):
@@ -121,16 +122,13 @@ class SVGPreviewWidget(QLabel):
                 # Auf Vorschau-Größe skalieren (Aspect Ratio beibehalten)
                 img.transform(resize=f"{self.preview_width}x{self.preview_height}")
 
-                # Format: PNG für beste Qualität
-                img.format = 'png'
+                # CHANGED: Rohe RGBA-Pixel statt PNG-Blob (kein Kodieren/Dekodieren)
+                width, height, data = wand_to_raw_rgba(img)
 
-                # Zu Bytes konvertieren
-                blob = img.make_blob()
+                # QImage direkt auf dem Puffer (keine Kopie)
+                qimage = QImage(data, width, height, width * 4, QImage.Format.Format_RGBA8888)
 
-                # QImage aus Bytes erstellen
-                qimage = QImage.fromData(blob)
-
-                # QPixmap aus QImage
+                # QPixmap aus QImage (kopiert - danach wird der Puffer nicht mehr benötigt)
                 pixmap = QPixmap.fromImage(qimage)
 
                 return pixmap
@@ -110,4 +110,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # NEW: Notwendig für Render-Prozess-Pool in der PyInstaller-EXE (Windows)
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     sys.exit(main())
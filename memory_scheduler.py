@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+memory_scheduler.py - Speicherbudget statt Größen-Schwellwerte
+
+Parallelität kam bisher aus festen Regeln: Megapixel-Stufen für Threads,
+Größen-Stufen im Render-Profil und ein Stapel-Multiplikator, der nur die
+Größe des ERSTEN Zeichens betrachtete. Gemischte Aufträge liefen dadurch
+entweder in den Swap oder ließen Kerne ungenutzt.
+
+MemoryScheduler arbeitet mit einem RAM-Budget:
+- Schätzt Bytes pro gleichzeitig bearbeitetem Zeichen aus
+  calculate_print_dimensions() und render_scale
+- Lässt neue Zeichen nur zu, solange die reservierten Bytes der Zeichen in
+  Bearbeitung ins Budget passen
+- Misst den tatsächlichen Prozess-Speicher (RSS) und korrigiert damit nur die
+  Schätzung pro Zeichen - ohne bekannte Caches (Templates, SVG-Quellen) und
+  mit neuer Basis, sobald kein Zeichen mehr in Bearbeitung ist
+- Leitet Thread-Anzahl, Stapelgröße, PDF-Seiten pro Datei und gleichzeitig
+  erstellte PDF-Dateien aus dem Budget ab
+
+RSS-Messung: psutil (optional), sonst /proc (Linux) bzw. Windows-API.
+Ohne Messmöglichkeit wird nur mit der Schätzung gearbeitet.
+
+Verwendung:
+    scheduler = MemoryScheduler()
+    threads = scheduler.plan_threads(tasks, max_threads=8)
+
+    token = scheduler.acquire(task)   # blockiert, bis das Zeichen ins Budget passt
+    ...
+    scheduler.release(token)
+"""
+
+import os
+import sys
+import time
+from threading import Condition
+from typing import Dict, List, Optional, Tuple
+
+from logging_manager import LoggingManager
+from constants import (
+    calculate_print_dimensions,
+    SYSTEM_MEMORY_BUDGET_AUTO_FRACTION,
+    SYSTEM_MEMORY_BUDGET_FALLBACK_MB,
+    SYSTEM_MEMORY_RSS_SAMPLE_INTERVAL_S,
+    SYSTEM_PDF_MIN_PAGES_IN_MEMORY,
+    SYSTEM_PDF_PAGE_BYTES_RATIO,
+)
+
+# Optional: psutil für plattformunabhängige Speicher-Abfrage
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+# Bytes pro Pixel (RGBA)
+_BYTES_PER_PIXEL = 4
+
+# Grenzen für den Korrekturfaktor (Messung / Schätzung)
+_CORRECTION_MIN = 0.5
+_CORRECTION_MAX = 4.0
+_CORRECTION_SMOOTHING = 0.3
+
+
+def get_process_rss_bytes() -> Optional[int]:
+    """
+    Aktueller Arbeitsspeicher (RSS) dieses Prozesses
+
+    Returns:
+        Bytes oder None, wenn nicht messbar
+    """
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss
+
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/statm', 'r') as f:
+                resident_pages = int(f.read().split()[1])
+            return resident_pages * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            return None
+
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ('cb', wintypes.DWORD),
+                    ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t),
+                    ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t),
+                    ('PeakPagefileUsage', ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+        except (OSError, AttributeError):
+            return None
+
+    return None
+
+
+def get_available_memory_bytes() -> Optional[int]:
+    """
+    Verfügbarer Arbeitsspeicher des Systems
+
+    Returns:
+        Bytes oder None, wenn nicht messbar
+    """
+    if PSUTIL_AVAILABLE:
+        return psutil.virtual_memory().available
+
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/meminfo', 'r') as f:
+                for line in f:
+                    if line.startswith('MemAvailable:'):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            return None
+
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ('dwLength', ctypes.c_ulong),
+                    ('dwMemoryLoad', ctypes.c_ulong),
+                    ('ullTotalPhys', ctypes.c_ulonglong),
+                    ('ullAvailPhys', ctypes.c_ulonglong),
+                    ('ullTotalPageFile', ctypes.c_ulonglong),
+                    ('ullAvailPageFile', ctypes.c_ulonglong),
+                    ('ullTotalVirtual', ctypes.c_ulonglong),
+                    ('ullAvailVirtual', ctypes.c_ulonglong),
+                    ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(status)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return status.ullAvailPhys
+        except (OSError, AttributeError):
+            return None
+
+    return None
+
+
+def known_cache_bytes() -> int:
+    """
+    Speicher der bekannten Caches (bleibt nach einem Zeichen belegt, ist kein Zeichenbedarf)
+
+    Template-Speicher und SVG-Quellen; Font-, Layout- und Schneidelinien-Caches
+    sind vergleichsweise klein, Raster- und Inhalts-Box-Cache liegen auf der Platte.
+
+    Returns:
+        Bytes
+    """
+    from template_store import get_template_store_bytes
+    from svg_source import get_svg_source_cache_bytes
+    return get_template_store_bytes() + get_svg_source_cache_bytes()
+
+
+def estimate_zeichen_bytes(config) -> int:
+    """
+    Geschätzter Spitzenbedarf eines Zeichens in Bearbeitung
+
+    Summe der gleichzeitig lebenden Raster (RGBA):
+    - SVG-Raster: Canvas-Fläche x render_scale² (Obergrenze des Render-Rasters)
+    - Canvas (Text + Grafik)
+    - Druckbild (Canvas + Beschnittzugabe)
+    - PNG-/PDF-Kodierung (ca. ein Viertel des Druckbilds)
+
+    Args:
+        config: ZeichenConfig
+
+    Returns:
+        Bytes
+    """
+    dims = calculate_print_dimensions(
+        config.dpi,
+        config.zeichen_hoehe_mm,
+        config.zeichen_breite_mm,
+        config.sicherheitsabstand_mm,
+        config.beschnittzugabe_mm
+    )
+    canvas_px = dims['canvas_hoehe_px'] * dims['canvas_breite_px']
+    datei_px = dims['datei_hoehe_px'] * dims['datei_breite_px']
+    render_scale = max(1.0, getattr(config, 'render_scale', 1.0) or 1.0)
+
+    render_bytes = canvas_px * render_scale * render_scale * _BYTES_PER_PIXEL
+    canvas_bytes = canvas_px * _BYTES_PER_PIXEL
+    print_bytes = datei_px * _BYTES_PER_PIXEL
+    encode_bytes = print_bytes // 4
+
+    return int(render_bytes + canvas_bytes + print_bytes + encode_bytes)
+
+
+def estimate_pdf_page_bytes(config) -> int:
+    """
+    Geschätzter Speicher eines Zeichens im offenen PDF (bis canvas.save())
+
+    Args:
+        config: ZeichenConfig
+
+    Returns:
+        Bytes (komprimiertes Bild)
+    """
+    dims = calculate_print_dimensions(
+        config.dpi,
+        config.zeichen_hoehe_mm,
+        config.zeichen_breite_mm,
+        config.sicherheitsabstand_mm,
+        config.beschnittzugabe_mm
+    )
+    datei_px = dims['datei_hoehe_px'] * dims['datei_breite_px']
+    return int(datei_px * _BYTES_PER_PIXEL * SYSTEM_PDF_PAGE_BYTES_RATIO)
+
+
+class MemoryScheduler:
+    """
+    Zulassung von Zeichen nach Speicherbudget (thread-safe)
+
+    Kompatibel mit BatchPipeline(admission=...): acquire(item) / release(token).
+    """
+
+    def __init__(self, budget_mb: Optional[int] = None):
+        """
+        Initialisiert Scheduler
+
+        Args:
+            budget_mb: RAM-Budget in MB für Zeichen in Bearbeitung
+                (None = aus RuntimeConfig, 0 = automatisch aus verfügbarem RAM)
+        """
+        self.logger = LoggingManager().get_logger(__name__)
+
+        if budget_mb is None:
+            from runtime_config import get_config
+            budget_mb = get_config().memory_budget_mb
+
+        self.budget_bytes = self._resolve_budget(budget_mb)
+
+        self._condition = Condition()
+        self._in_flight_bytes = 0
+        self._in_flight_count = 0
+        self._correction = 1.0
+
+        self._baseline_rss = None
+        self._baseline_cache_bytes = 0
+        self._observed_bytes = 0
+        self._last_sample = 0.0
+        self.reset_baseline()
+
+        self.peak_in_flight_bytes = 0
+        self.peak_observed_bytes = 0
+        self.waits = 0
+
+        self.logger.info("Speicher-Scheduler: Budget {:.0f} MB (RSS-Messung: {})".format(
+            self.budget_bytes / 1024 / 1024, "ja" if self._baseline_rss is not None else "nein"))
+
+    def reset_baseline(self):
+        """
+        Neue RSS-Basis (Batch-Start bzw. kein Zeichen in Bearbeitung)
+
+        Speicher, der nach einem Zeichen belegt bleibt (Caches, vom Allocator
+        nicht zurückgegebener Heap), zählt danach nicht mehr als Zeichenbedarf.
+        """
+        self._baseline_rss = get_process_rss_bytes()
+        self._baseline_cache_bytes = known_cache_bytes() if self._baseline_rss is not None else 0
+        self._observed_bytes = 0
+
+    def _resolve_budget(self, budget_mb: int) -> int:
+        """Budget in Bytes (0 = Anteil des verfügbaren Arbeitsspeichers)"""
+        if budget_mb and budget_mb > 0:
+            return int(budget_mb) * 1024 * 1024
+
+        available = get_available_memory_bytes()
+        if available is None:
+            return SYSTEM_MEMORY_BUDGET_FALLBACK_MB * 1024 * 1024
+        return int(available * SYSTEM_MEMORY_BUDGET_AUTO_FRACTION)
+
+    # --------------------------------------------------------------------------------------------
+    # Planung (vor dem Lauf)
+    # --------------------------------------------------------------------------------------------
+
+    def estimate(self, config) -> int:
+        """Geschätzter Bedarf eines Zeichens inkl. Korrektur aus RSS-Messungen"""
+        return int(estimate_zeichen_bytes(config) * self._correction)
+
+    @staticmethod
+    def _distinct_configs(tasks: List[Tuple]) -> List:
+        """Ein Config je Zeichengröße/DPI/Render-Skalierung (über alle Aufträge)"""
+        distinct = {}
+        for _, config in tasks:
+            key = (config.dpi, config.zeichen_hoehe_mm, config.zeichen_breite_mm,
+                   config.sicherheitsabstand_mm, config.beschnittzugabe_mm, config.render_scale)
+            distinct.setdefault(key, config)
+        return list(distinct.values())
+
+    def _peak_estimate(self, tasks: List[Tuple]) -> int:
+        """Größter Einzelbedarf im Auftrag (gemischte Aufträge: das größte Zeichen zählt)"""
+        return max(1, max((self.estimate(config) for config in self._distinct_configs(tasks)), default=0))
+
+    def _peak_page_estimate(self, tasks: List[Tuple]) -> int:
+        """Größtes Zeichen im offenen PDF (über alle Aufträge, nicht nur die ersten)"""
+        return max(1, max((estimate_pdf_page_bytes(config) for config in self._distinct_configs(tasks)),
+                          default=0))
+
+    def plan_threads(self, tasks: List[Tuple], max_threads: int) -> int:
+        """
+        Thread-Anzahl, bei der die größten Zeichen gleichzeitig ins Budget passen
+
+        Args:
+            tasks: Liste von (svg_path, config) Tupeln
+            max_threads: Obergrenze (aus Einstellungen)
+
+        Returns:
+            Thread-Anzahl (1..max_threads)
+        """
+        if not tasks:
+            return max(1, max_threads)
+
+        peak = self._peak_estimate(tasks)
+        threads = max(1, min(max_threads, self.budget_bytes // peak))
+
+        if threads < max_threads:
+            self.logger.info("Thread-Anzahl durch Speicherbudget begrenzt: {} -> {} ({:.0f} MB pro Zeichen)".format(
+                max_threads, threads, peak / 1024 / 1024))
+        return threads
+
+    def plan_chunk_size(self, tasks: List[Tuple], num_threads: int) -> int:
+        """
+        Stapelgröße für die stapelbasierte Verarbeitung
+
+        Ein Stapel hält Templates und Ergebnisse seiner Zeichen gleichzeitig,
+        daher so viele Zeichen, wie nach Budget nebeneinander Platz haben.
+
+        Args:
+            tasks: Liste von (svg_path, config) Tupeln
+            num_threads: Anzahl Threads (Untergrenze)
+
+        Returns:
+            Zeichen pro Stapel
+        """
+        if not tasks:
+            return max(1, num_threads)
+
+        fits = self.budget_bytes // self._peak_estimate(tasks)
+        return max(1, num_threads, min(len(tasks), fits))
+
+    def plan_pdf_pages(self, tasks: List[Tuple], default_pages: int, zeichen_per_page: int = 1) -> int:
+        """
+        Seiten pro PDF-Segment (ReportLab hält alle Seiten eines Segments im Speicher,
+        danach schreibt SegmentedCanvas sie auf die Platte)
+
+        Args:
+            tasks: Liste von (svg_path, config) Tupeln
+            default_pages: Obergrenze (SYSTEM_PDF_SEGMENT_PAGES)
+            zeichen_per_page: Zeichen pro Seite (Schnittbogen > 1)
+
+        Returns:
+            Seiten pro Segment (SYSTEM_PDF_MIN_PAGES_IN_MEMORY..default_pages)
+        """
+        if not tasks:
+            return default_pages
+
+        page_bytes = self._peak_page_estimate(tasks)
+        page_bytes *= max(1, zeichen_per_page)
+
+        # Hälfte des Budgets für das offene PDF, Rest für Zeichen in Bearbeitung
+        pages = int(self.budget_bytes * 0.5 // page_bytes)
+        return max(SYSTEM_PDF_MIN_PAGES_IN_MEMORY, min(default_pages, pages))
+
+    def plan_pdf_files(
+        self,
+        tasks: List[Tuple],
+        pages_per_file: int,
+        threads_per_file: int,
+        max_files: int,
+        zeichen_per_page: int = 1
+    ) -> int:
+        """
+        Anzahl gleichzeitig erstellter PDF-Dateien (je ein Worker-Prozess)
+
+        Jede Datei hält ein Segment im Speicher und hat eigene Zeichen in Bearbeitung.
+
+        Args:
+            tasks: Liste von (svg_path, config) Tupeln
+            pages_per_file: Seiten im Speicher pro Datei (Segmentgröße)
+            threads_per_file: Render-Threads pro Datei
+            max_files: Obergrenze (Anzahl Dateien bzw. Einstellung)
+            zeichen_per_page: Zeichen pro Seite (Schnittbogen > 1)
+
+        Returns:
+            Dateien gleichzeitig (1..max_files)
+        """
+        if not tasks or max_files <= 1:
+            return 1
+
+        page_bytes = self._peak_page_estimate(tasks)
+        file_bytes = (pages_per_file * max(1, zeichen_per_page) * page_bytes
+                      + max(1, threads_per_file) * self._peak_estimate(tasks))
+        files = max(1, min(max_files, self.budget_bytes // file_bytes))
+
+        if files < max_files:
+            self.logger.info("PDF-Dateien gleichzeitig durch Speicherbudget begrenzt: {} -> {} "
+                             "({:.0f} MB pro Datei)".format(max_files, files, file_bytes / 1024 / 1024))
+        return files
+
+    # --------------------------------------------------------------------------------------------
+    # Zulassung (während des Laufs)
+    # --------------------------------------------------------------------------------------------
+
+    def acquire(self, task) -> int:
+        """
+        Wartet, bis das Zeichen ins Budget passt, und reserviert den Speicher
+
+        Ist nichts in Bearbeitung, wird immer zugelassen (sonst Stillstand bei
+        Zeichen größer als das Budget).
+
+        Args:
+            task: (svg_path, config) Tupel
+
+        Returns:
+            Token für release() (reservierte Bytes)
+        """
+        _, config = task
+        with self._condition:
+            needed = self.estimate(config)
+            waited = False
+            while self._in_flight_count > 0 and not self._fits_locked(needed):
+                waited = True
+                self._condition.wait()
+            if waited:
+                self.waits += 1
+
+            if self._in_flight_count == 0 and self._baseline_rss is not None:
+                # Nichts in Bearbeitung: bisheriger Zuwachs (Caches, Heap) ist kein Zeichenbedarf
+                self.reset_baseline()
+            self._in_flight_bytes += needed
+            self._in_flight_count += 1
+            self.peak_in_flight_bytes = max(self.peak_in_flight_bytes, self._in_flight_bytes)
+            return needed
+
+    def release(self, token: int):
+        """
+        Gibt reservierten Speicher frei und passt die Schätzung an die Messung an
+
+        Args:
+            token: Rückgabewert von acquire()
+        """
+        with self._condition:
+            self._sample_locked()
+            self._in_flight_bytes = max(0, self._in_flight_bytes - token)
+            self._in_flight_count = max(0, self._in_flight_count - 1)
+            self._condition.notify_all()
+
+    def _fits_locked(self, needed: int) -> bool:
+        """
+        Passt needed zusätzlich ins Budget? (nur reservierte Bytes - RSS enthält auch
+        Caches und nicht zurückgegebenen Heap und würde die Zulassung dauerhaft drosseln)
+        """
+        return self._in_flight_bytes + needed <= self.budget_bytes
+
+    def _sample_locked(self, force: bool = False):
+        """Misst RSS (höchstens alle SYSTEM_MEMORY_RSS_SAMPLE_INTERVAL_S) und korrigiert Schätzung"""
+        if self._baseline_rss is None:
+            return
+
+        now = time.time()
+        if not force and now - self._last_sample < SYSTEM_MEMORY_RSS_SAMPLE_INTERVAL_S:
+            return
+        self._last_sample = now
+
+        rss = get_process_rss_bytes()
+        if rss is None:
+            return
+
+        # Zuwachs seit der Basis ohne Wachstum der bekannten Caches
+        cache_growth = known_cache_bytes() - self._baseline_cache_bytes
+        self._observed_bytes = max(0, rss - self._baseline_rss - cache_growth)
+        self.peak_observed_bytes = max(self.peak_observed_bytes, self._observed_bytes)
+
+        # Korrektur nur mit genug Zeichen in Bearbeitung (einzelne Ausreißer glätten)
+        if self._in_flight_bytes > 0 and self._in_flight_count >= 2:
+            ratio = self._observed_bytes / self._in_flight_bytes
+            ratio = min(_CORRECTION_MAX, max(_CORRECTION_MIN, ratio))
+            self._correction += (ratio - self._correction) * _CORRECTION_SMOOTHING
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Statistik für das Export-Log
+
+        Returns:
+            dict: budget_mb, peak_estimated_mb, peak_measured_mb, correction, waits
+        """
+        with self._condition:
+            return {
+                'budget_mb': self.budget_bytes / 1024 / 1024,
+                'peak_estimated_mb': self.peak_in_flight_bytes / 1024 / 1024,
+                'peak_measured_mb': self.peak_observed_bytes / 1024 / 1024,
+                'correction': self._correction,
+                'waits': self.waits
+            }
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    from pathlib import Path
+    from text_overlay import ZeichenConfig
+
+    print("=" * 80)
+    print("MEMORY-SCHEDULER TEST")
+    print("=" * 80)
+
+    small = ZeichenConfig(zeichen_id="klein", svg_path=Path("a.svg"), dpi=600)
+    large = ZeichenConfig(zeichen_id="gross", svg_path=Path("b.svg"), dpi=300,
+                          zeichen_hoehe_mm=445.0, zeichen_breite_mm=445.0)
+
+    print(f"\n[TEST 1] RSS: {get_process_rss_bytes()} | Verfügbar: {get_available_memory_bytes()}")
+    print(f"[TEST 2] Schätzung 45mm@600: {estimate_zeichen_bytes(small) / 1024 / 1024:.1f} MB")
+    print(f"[TEST 3] Schätzung 445mm@300: {estimate_zeichen_bytes(large) / 1024 / 1024:.1f} MB")
+
+    scheduler = MemoryScheduler(budget_mb=1024)
+    tasks = [(Path("a.svg"), small)] * 10 + [(Path("b.svg"), large)]
+    print(f"[TEST 4] Threads (max 8): {scheduler.plan_threads(tasks, 8)}")
+    print(f"[TEST 5] Stapelgröße: {scheduler.plan_chunk_size(tasks, 4)}")
+    print(f"[TEST 6] PDF-Seiten: {scheduler.plan_pdf_pages(tasks, 100)}")
+    print(f"[TEST 7] PDF-Dateien gleichzeitig (max 4): {scheduler.plan_pdf_files(tasks[:10], 20, 2, 4)}")
+
+    print("\n" + "=" * 80)
+    print("[OK] Alle Tests abgeschlossen")
+    print("=" * 80)
@@ -13,7 +13,6 @@ Funktionalität:
 """
 
 from pathlib import Path
-import xml.etree.ElementTree as ET
 from typing import Set, Dict, List, Optional
 import logging
 from collections import defaultdict
@@ -108,56 +107,18 @@ class MissingFontsTracker:
         Returns:
             Set von Schriftarten-Namen
         """
-        fonts = set()
-
-        try:
-            tree = ET.parse(svg_path)
-            root = tree.getroot()
-
-            # SVG-Namespace
-            ns = {'svg': 'http://www.w3.org/2000/svg'}
-
-            # Methode 1: font-family Attribute direkt
-            for elem in root.iter():
-                font_family = elem.get('font-family')
-                if font_family:
-                    # Mehrere Schriftarten möglich: "Arial, sans-serif"
-                    for font in font_family.split(','):
-                        font = font.strip().strip("'\"")
-                        # Generische Schriftarten ignorieren
-                        if font not in ['serif', 'sans-serif', 'monospace', 'cursive', 'fantasy']:
-                            fonts.add(font)
-
-            # Methode 2: style-Attribut mit CSS-Eigenschaften
-            for elem in root.iter():
-                style = elem.get('style')
-                if style and 'font-family' in style:
-                    # Parse CSS: "font-size:12px;font-family:'Arial';color:black"
-                    for declaration in style.split(';'):
-                        if 'font-family' in declaration:
-                            # "font-family:'Arial'" → "'Arial'"
-                            font_value = declaration.split(':', 1)[1].strip()
-                            # Mehrere Schriftarten möglich
-                            for font in font_value.split(','):
-                                font = font.strip().strip("'\"")
-                                if font not in ['serif', 'sans-serif', 'monospace', 'cursive', 'fantasy']:
-                                    fonts.add(font)
-
-            # Methode 3: <text> Elemente mit font-family
-            for text_elem in root.findall('.//svg:text', ns):
-                font_family = text_elem.get('font-family')
-                if font_family:
-                    for font in font_family.split(','):
-                        font = font.strip().strip("'\"")
-                        if font not in ['serif', 'sans-serif', 'monospace', 'cursive', 'fantasy']:
-                            fonts.add(font)
-
-        except ET.ParseError as e:
-            self.logger.error(f"Fehler beim Parsen von {svg_path.name}: {e}")
-        except Exception as e:
-            self.logger.error(f"Unerwarteter Fehler bei {svg_path.name}: {e}")
-
-        return fonts
+        # CHANGED: Einmal geladenes und geparstes SvgSource (kein eigenes ET.parse)
+        from svg_source import get_svg_source
+        source = get_svg_source(svg_path)
+        if source is None:
+            self.logger.error(f"SVG nicht lesbar: {svg_path.name}")
+            return set()
+
+        if source.parse_error is not None:
+            self.logger.error(f"Fehler beim Parsen von {svg_path.name}: {source.parse_error}")
+            return set()
+
+        return set(source.font_families)
 
     def _get_system_font_directories(self) -> List[Path]:
         """
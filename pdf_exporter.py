@@ -10,22 +10,28 @@ Zwei Export-Varianten:
 Version: 1.0.0
 """
 
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple
 from PIL import Image
 from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
+from reportlab.lib.boxstuff import aspectRatioFix
 from io import BytesIO
 from datetime import datetime
 import gc
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+import os
 
 from logging_manager import LoggingManager
 from runtime_config import get_config
-from settings_manager import SettingsManager
+from memory_scheduler import MemoryScheduler
+from batch_pipeline import BatchPipeline, PipelineStage
+from pdf_image_codec import EncodedImage, PdfImageXObject, encode_pdf_image
+from vector_canvas import VectorCanvas
+from pdf_merge import PdfPartWriter
+from schnittbogen_layout import SchnittbogenPageTemplate, draw_print_hint, get_schnittbogen_layout
 from constants import (
     PROGRAM_NAME,
     PROGRAM_VERSION,
@@ -33,14 +39,13 @@ from constants import (
     DEFAULT_ZEICHEN_BREITE_MM,
     DEFAULT_BESCHNITTZUGABE_MM,
     DEFAULT_SICHERHEITSABSTAND_MM,
-    DEFAULT_PDF_CHUNK_SIZE,
-    DEFAULT_PDF_CHUNK_SIZE_SCHNITTBOGEN,
     DEFAULT_S1_LINKS_PROZENT,
     DEFAULT_S1_ANZAHL_SCHREIBLINIEN,
     DEFAULT_S1_STAERKE_ANZEIGEN,
-    DIN_A4_WIDTH_MM,
-    DIN_A4_HEIGHT_MM,
+    PDF_EXPORT_MODE_VECTOR,
     MIN_PDF_LAST_CHUNK_SIZE,
+    SYSTEM_PDF_SEGMENT_PAGES,
+    SYSTEM_PDF_COPY_WINDOW,
     EXPORT_TIMESTAMP_FORMAT,
     create_pdf_filename
 )
@@ -239,99 +244,13 @@ class PDFExporter:
 
         self.logger.info("Erstelle Schnittbogen-PDF: {} Zeichen".format(len(images)))
 
-        # A4-Seitengröße
-        page_width, page_height = A4
-
-        # Seitenränder aus Settings laden (NEW v0.8.2)
-        from settings_manager import SettingsManager
-        settings = SettingsManager().load_settings()
-
-        if hasattr(settings, 'pdf_margin_horizontal_mm'):
-            margin_h = settings.pdf_margin_horizontal_mm * mm  # Links/Rechts
-        else:
-            margin_h = 10 * mm  # Fallback
-
-        if hasattr(settings, 'pdf_margin_vertical_mm'):
-            margin_v = settings.pdf_margin_vertical_mm * mm  # Oben/Unten
-        else:
-            margin_v = 10 * mm  # Fallback
-
-        # NEW v0.8.2: Automatische Hoch/Quer-Erkennung
-        # Berechne für beide Orientierungen, wie viele Zeichen passen
-        # Portrait: 210x297mm
-        portrait_width = DIN_A4_WIDTH_MM * mm
-        portrait_height = DIN_A4_HEIGHT_MM * mm
-        portrait_avail_w = portrait_width - 2 * margin_h
-        portrait_avail_h = portrait_height - 2 * margin_v
-        portrait_cols = int(portrait_avail_w / (zeichen_breite_mm * mm))
-        portrait_rows = int(portrait_avail_h / (zeichen_hoehe_mm * mm))
-        portrait_per_page = portrait_cols * portrait_rows
-
-        # Landscape: 297x210mm
-        landscape_width = DIN_A4_HEIGHT_MM * mm
-        landscape_height = DIN_A4_WIDTH_MM * mm
-        landscape_avail_w = landscape_width - 2 * margin_h
-        landscape_avail_h = landscape_height - 2 * margin_v
-        landscape_cols = int(landscape_avail_w / (zeichen_breite_mm * mm))
-        landscape_rows = int(landscape_avail_h / (zeichen_hoehe_mm * mm))
-        landscape_per_page = landscape_cols * landscape_rows
-
-        # Wähle die Orientierung mit mehr Zeichen/Seite
-        if landscape_per_page > portrait_per_page:
-            # Querformat ist besser
-            page_width = landscape_width
-            page_height = landscape_height
-            pagesize = landscape(A4)
-            orientation = "Querformat"
-            self.logger.info(
-                "Automatische Orientierung: Querformat gewählt "
-                f"({landscape_per_page} Zeichen/Seite vs {portrait_per_page} im Hochformat)"
-            )
-        else:
-            # Hochformat ist besser (oder gleich)
-            page_width = portrait_width
-            page_height = portrait_height
-            pagesize = A4
-            orientation = "Hochformat"
-            self.logger.info(
-                "Automatische Orientierung: Hochformat gewählt "
-                f"({portrait_per_page} Zeichen/Seite vs {landscape_per_page} im Querformat)"
-            )
-
-        # Verfügbare Fläche (mit horizontalen und vertikalen Rändern)
-        available_width = page_width - 2 * margin_h
-        available_height = page_height - 2 * margin_v
-
-        # Zeichen-Größe: fertige Größe (z.B. 45mm oder 56×96mm)
-        zeichen_hoehe = zeichen_hoehe_mm * mm
-        zeichen_breite = zeichen_breite_mm * mm
-
-        # Optimale Anzahl Spalten/Zeilen berechnen (RECHTECKIG!)
-        # v7.1 FIX: Verwende tatsächliche Dimensionen statt max()
-        # Spalten = Breite des Zeichens, Zeilen = Höhe des Zeichens
-        cols = int(available_width / zeichen_breite)
-        rows = int(available_height / zeichen_hoehe)
-
-        zeichen_per_page = cols * rows
-
-        # NEW v0.8.2.1: Grid zentrieren (horizontal und vertikal)
-        # Tatsächlich genutzte Grid-Größe
-        grid_width = cols * zeichen_breite
-        grid_height = rows * zeichen_hoehe
-
-        # Überschüssiger Platz
-        excess_width = available_width - grid_width
-        excess_height = available_height - grid_height
-
-        # Grid-Offset für Zentrierung
-        grid_offset_x = margin_h + (excess_width / 2)
-        grid_offset_y = margin_v + (excess_height / 2)
-
-        self.logger.info(
-            "Schnittbogen-Layout: {}x{} = {} Zeichen/Seite (A4 {} mit {}mm h / {}mm v Rand, zentriert)".format(
-                cols, rows, zeichen_per_page, orientation, margin_h / mm, margin_v / mm
-            )
-        )
+        # CHANGED: Orientierung und Raster aus gecachtem Layout (schnittbogen_layout.py)
+        layout = get_schnittbogen_layout(zeichen_breite_mm, zeichen_hoehe_mm)
+        pagesize = layout.pagesize
+        zeichen_per_page = layout.zeichen_per_page
+        zeichen_hoehe = layout.cell_height
+        zeichen_breite = layout.cell_width
+        self.logger.info("Schnittbogen-Layout: {}".format(layout.describe()))
 
         # PDF-Canvas erstellen
         c = canvas.Canvas(str(output_path), pagesize=pagesize)
@@ -345,21 +264,6 @@ class PDFExporter:
         # NEW v0.8.2: ViewerPreferences setzen (verhindert Adobe Auto-Skalierung)
         set_no_print_scaling(c)
 
-        # NEW v0.8.2.1: Hinweistext für Druckeinstellungen (falls ViewerPreferences nicht greifen)
-        def draw_print_hint(canvas_obj, pagesize):
-            """Zeichnet Hinweistext für korrekte Druckeinstellungen (oben UND unten)"""
-            w, h = pagesize
-            canvas_obj.saveState()
-            canvas_obj.setFont("Helvetica", 8)
-            canvas_obj.setFillColorRGB(0.5, 0.5, 0.5)  # Grau
-            hint_text = "WICHTIG: In Druckeinstellungen 'Tatsächliche Größe' (100%) wählen - NICHT skalieren!"
-            text_width = canvas_obj.stringWidth(hint_text, "Helvetica", 8)
-            # Zentriert am oberen Rand, knapp unterhalb
-            canvas_obj.drawString((w - text_width) / 2, h - 8 * mm, hint_text)
-            # Zentriert am unteren Rand, knapp oberhalb
-            canvas_obj.drawString((w - text_width) / 2, 8 * mm, hint_text)
-            canvas_obj.restoreState()
-
         # Zeichen auf Seiten verteilen
         page_num = 0
 
@@ -376,8 +280,6 @@ class PDFExporter:
 
             # Position auf aktueller Seite
             pos_on_page = idx % zeichen_per_page
-            col = pos_on_page % cols
-            row = pos_on_page // cols
 
             # Neue Seite wenn nötig
             if idx > 0 and pos_on_page == 0:
@@ -392,13 +294,8 @@ class PDFExporter:
                 img, dpi, zeichen_hoehe_mm, zeichen_breite_mm, beschnittzugabe_mm
             )
 
-            # X, Y Position berechnen (zentriert)
-            # ReportLab: (0,0) ist links-unten
-            # FIXED: Verwende tatsächliche Dimensionen für Grid-Layout (rechteckig!)
-            # NEW v0.8.2.1: Zentriertes Grid mit Offset
-            x = grid_offset_x + col * zeichen_breite
-            # Y von oben zählen, mit Zentrierung
-            y = page_height - grid_offset_y - (row + 1) * zeichen_hoehe
+            # X, Y Position berechnen (zentriertes Grid, ReportLab: (0,0) ist links-unten)
+            x, y = layout.cell_origin(pos_on_page)
 
             # Image zu ImageReader konvertieren
             img_buffer = BytesIO()
@@ -570,13 +467,19 @@ def create_einzelzeichen_pdf_streaming(
     beschnittzugabe_mm: float = None,
     s1_links_prozent: int = DEFAULT_S1_LINKS_PROZENT,
     s1_anzahl_schreiblinien: int = DEFAULT_S1_ANZAHL_SCHREIBLINIEN,
-    s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN
+    s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN,
+    num_threads: int = 4,  # NEW: Parallele Render-Threads
+    image_codec: Optional[str] = None,  # NEW: "flate", "jpeg2000", "jpeg" (default: RuntimeConfig)
+    export_mode: Optional[str] = None  # NEW: "raster" oder "vector" (default: RuntimeConfig)
 ) -> Path:
     """
     Erstellt Einzelzeichen-PDF mit Streaming (RAM-effizient)
 
     STREAMING: Rendert Zeichen einzeln, fügt sie sofort zur PDF hinzu
     und gibt RAM frei. Keine Liste von Images im RAM!
+    CHANGED: Rendern parallel vor dem PDF-Writer, Seiten in Task-Reihenfolge.
+    CHANGED: Seiten werden segmentweise auf die Platte geschrieben (SegmentedCanvas),
+    der Speicher bleibt auch bei einer einzigen großen Datei konstant.
 
     Args:
         generator: TaktischeZeichenGenerator Instanz
@@ -590,6 +493,10 @@ def create_einzelzeichen_pdf_streaming(
         zeichen_hoehe_mm: Höhe des fertigen Zeichens
         zeichen_breite_mm: Breite des fertigen Zeichens
         beschnittzugabe_mm: Beschnittzugabe
+        num_threads: Anzahl paralleler Render-Threads (Seiten bleiben in Task-Reihenfolge)
+        image_codec: Bild-Kodierung im PDF (default: RuntimeConfig.pdf_image_codec)
+        export_mode: "raster" = Zeichen als Bild, "vector" = SVG/Text/Linien als PDF-Vektoren
+            (default: RuntimeConfig.pdf_export_mode)
 
     Returns:
         Path zur erstellten PDF-Datei
@@ -604,99 +511,89 @@ def create_einzelzeichen_pdf_streaming(
         zeichen_breite_mm = config.zeichen_breite_mm
     if beschnittzugabe_mm is None:
         beschnittzugabe_mm = config.beschnittzugabe_mm
+    vector = (export_mode or config.pdf_export_mode) == PDF_EXPORT_MODE_VECTOR
 
     if total_zeichen is None:
         total_zeichen = len(tasks)
 
-    logger.info(f"Erstelle Einzelzeichen-PDF (Streaming): {len(tasks)} Zeichen")
+    logger.info(f"Erstelle Einzelzeichen-PDF (Streaming{', Vektor' if vector else ''}): {len(tasks)} Zeichen")
 
     # PDF-Canvas erstellen
     datei_hoehe_mm = zeichen_hoehe_mm + 2 * beschnittzugabe_mm
     datei_breite_mm = zeichen_breite_mm + 2 * beschnittzugabe_mm
     page_size = (datei_breite_mm * mm, datei_hoehe_mm * mm)
-    c = canvas.Canvas(str(output_path), pagesize=page_size)
-
-    # Metadaten
-    c.setTitle("Taktische Zeichen - Einzelzeichen")
-    c.setAuthor(f"{PROGRAM_NAME}")
-    c.setSubject(f"{len(tasks)} taktische Zeichen")
-    c.setCreator(f"{PROGRAM_NAME} {PROGRAM_VERSION}")
 
-    # NEW v0.8.2: ViewerPreferences setzen (verhindert Adobe Auto-Skalierung)
-    set_no_print_scaling(c)
+    def setup_canvas(c):
+        # Metadaten
+        c.setTitle("Taktische Zeichen - Einzelzeichen")
+        c.setAuthor(f"{PROGRAM_NAME}")
+        c.setSubject(f"{len(tasks)} taktische Zeichen")
+        c.setCreator(f"{PROGRAM_NAME} {PROGRAM_VERSION}")
 
-    # STREAMING: Zeichen einzeln rendern und direkt zur PDF hinzufügen
-    for idx, (svg_path, config) in enumerate(tasks):
-        try:
-            # Progress Callback
-            if progress_callback:
-                progress_callback(
-                    chunk_start + idx + 1,
-                    total_zeichen,
-                    svg_path.stem,
-                    "Erstelle PDF-Seite"
-                )
+        # NEW v0.8.2: ViewerPreferences setzen (verhindert Adobe Auto-Skalierung)
+        set_no_print_scaling(c)
 
-            # CRITICAL: S1-Layout erkennen (2:1 Aspect Ratio)
-            is_s1_layout = False
-            expected_breite = config.zeichen_hoehe_mm * 2.0
-            if abs(config.zeichen_breite_mm - expected_breite) < 0.1:  # Toleranz 0.1mm
-                is_s1_layout = True
-
-            # Zeichen als Image rendern (nur 1 im RAM!)
-            # NEW: Layout-spezifische Methode aufrufen
-            if is_s1_layout:
-                img = generator.create_zeichen_s1(
-                    svg_path=svg_path,
-                    config=config,
-                    s1_links_prozent=s1_links_prozent,
-                    s1_anzahl_schreiblinien=s1_anzahl_schreiblinien,
-                    s1_staerke_anzeigen=s1_staerke_anzeigen,
-                    draw_cut_lines=draw_cut_lines,
-                    return_image=True
-                )
-            else:
-                img = generator.create_zeichen(
-                    svg_path=svg_path,
-                    config=config,
-                    draw_cut_lines=draw_cut_lines,
-                    return_image=True
-                )
+    # CHANGED: Segmentweise auf die Platte schreiben (Speicher unabhängig von der Seitenzahl)
+    document = SegmentedCanvas(
+        output_path, page_size, setup_canvas,
+        MemoryScheduler().plan_pdf_pages(tasks, SYSTEM_PDF_SEGMENT_PAGES)
+    )
 
-            # Image zu ImageReader konvertieren
-            img_buffer = BytesIO()
-            img.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
-            img_reader = ImageReader(img_buffer)
+    # CHANGED: Zeichen parallel rendern, Seiten in Task-Reihenfolge schreiben
+    s1_options = {
+        's1_links_prozent': s1_links_prozent,
+        's1_anzahl_schreiblinien': s1_anzahl_schreiblinien,
+        's1_staerke_anzeigen': s1_staerke_anzeigen
+    }
+    # NEW: Vektor-Modus - Seite als VectorCanvas, nur eingefügte Bilder werden kodiert
+    if vector:
+        def finish(page, _config):
+            return page.encode_images(image_codec)
+    else:
+        def finish(img, _config):
+            return encode_pdf_image(img, image_codec)
 
-            # Image auf Seite platzieren
-            c.drawImage(
-                img_reader,
-                0, 0,
-                width=datei_breite_mm * mm,
-                height=datei_hoehe_mm * mm,
-                preserveAspectRatio=True
+    rendered = _render_pdf_images(
+        generator, tasks, draw_cut_lines, num_threads, s1_options, finish=finish, vector=vector
+    )
+    shared_images = document.shared_images
+
+    for idx, svg_path, _config, encoded, error in rendered:
+        # Progress Callback
+        if progress_callback:
+            progress_callback(
+                chunk_start + idx + 1,
+                total_zeichen,
+                svg_path.stem,
+                "Erstelle PDF-Seite"
             )
 
+        if error is not None:
+            logger.error(f"Fehler bei {svg_path.stem}: {error}")
+            continue  # Weitermachen mit nächstem Zeichen
+
+        try:
+            # CHANGED: Image auf Seite platzieren (identische Bilder nur einmal eingebettet)
+            if vector:
+                shared_images.draw_vector(encoded, 0, 0, datei_breite_mm * mm, datei_hoehe_mm * mm)
+            else:
+                shared_images.draw(encoded, 0, 0, datei_breite_mm * mm, datei_hoehe_mm * mm)
+
             # Nächste Seite (außer bei letztem Zeichen)
             if idx < len(tasks) - 1:
-                c.showPage()
+                document.show_page()
 
             # RAM SOFORT freigeben!
-            del img
-            del img_buffer
-            del img_reader
-
-            # Alle 5 Zeichen: Garbage Collection
-            if (idx + 1) % 5 == 0:
-                gc.collect()
+            del encoded
 
         except Exception as e:
             logger.error(f"Fehler bei {svg_path.stem}: {e}")
             # Weitermachen mit nächstem Zeichen
 
-    # PDF speichern
-    c.save()
+    # PDF speichern (letztes Segment, Seitenbaum, xref)
+    document.save()
+    shared_images.log_stats(logger)
+    document.log_stats(logger)
 
     # Finale GC
     gc.collect()
@@ -720,13 +617,17 @@ def create_schnittbogen_pdf_streaming(
     sicherheitsabstand_mm: float = None,
     s1_links_prozent: int = DEFAULT_S1_LINKS_PROZENT,
     s1_anzahl_schreiblinien: int = DEFAULT_S1_ANZAHL_SCHREIBLINIEN,
-    s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN
+    s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN,
+    num_threads: int = 4,  # NEW: Parallele Render-Threads
+    image_codec: Optional[str] = None,  # NEW: "flate", "jpeg2000", "jpeg" (default: RuntimeConfig)
+    export_mode: Optional[str] = None  # NEW: "raster" oder "vector" (default: RuntimeConfig)
 ) -> Path:
     """
     Erstellt Schnittbogen-PDF mit Streaming (RAM-effizient)
 
     STREAMING: Rendert Zeichen einzeln, platziert sie direkt auf A4-Seiten.
     Keine Liste von Images im RAM!
+    CHANGED: Rendern parallel vor dem PDF-Writer, Zellen in Task-Reihenfolge.
 
     Args:
         generator: TaktischeZeichenGenerator Instanz
@@ -741,6 +642,10 @@ def create_schnittbogen_pdf_streaming(
         zeichen_breite_mm: Breite des fertigen Zeichens
         beschnittzugabe_mm: Beschnittzugabe
         sicherheitsabstand_mm: Sicherheitsabstand
+        num_threads: Anzahl paralleler Render-Threads (Zellen bleiben in Task-Reihenfolge)
+        image_codec: Bild-Kodierung im PDF (default: RuntimeConfig.pdf_image_codec)
+        export_mode: "raster" = Zeichen als Bild, "vector" = SVG/Text/Linien als PDF-Vektoren
+            (default: RuntimeConfig.pdf_export_mode)
 
     Returns:
         Path zur erstellten PDF-Datei
@@ -757,135 +662,66 @@ def create_schnittbogen_pdf_streaming(
         beschnittzugabe_mm = config.beschnittzugabe_mm
     if sicherheitsabstand_mm is None:
         sicherheitsabstand_mm = config.sicherheitsabstand_mm
+    vector = (export_mode or config.pdf_export_mode) == PDF_EXPORT_MODE_VECTOR
 
     if total_zeichen is None:
         total_zeichen = len(tasks)
 
-    logger.info(f"Erstelle Schnittbogen-PDF (Streaming): {len(tasks)} Zeichen")
+    logger.info(f"Erstelle Schnittbogen-PDF (Streaming{', Vektor' if vector else ''}): {len(tasks)} Zeichen")
 
-    # Seitenränder aus Settings laden (NEW v0.8.2)
-    settings = SettingsManager().load_settings()
+    # CHANGED: Orientierung und Raster aus gecachtem Layout (schnittbogen_layout.py)
+    layout = get_schnittbogen_layout(zeichen_breite_mm, zeichen_hoehe_mm)
+    pagesize = layout.pagesize
+    zeichen_per_page = layout.zeichen_per_page
+    logger.info("Schnittbogen-Layout: {}".format(layout.describe()))
 
-    if hasattr(settings, 'pdf_margin_horizontal_mm'):
-        margin_h = settings.pdf_margin_horizontal_mm * mm  # Links/Rechts
-    else:
-        margin_h = 10 * mm  # Fallback
-
-    if hasattr(settings, 'pdf_margin_vertical_mm'):
-        margin_v = settings.pdf_margin_vertical_mm * mm  # Oben/Unten
-    else:
-        margin_v = 10 * mm  # Fallback
-
-    # NEW v0.8.2: Automatische Hoch/Quer-Erkennung
-    # Berechne für beide Orientierungen, wie viele Zeichen passen
-    # Portrait: 210x297mm
-    portrait_width = DIN_A4_WIDTH_MM * mm
-    portrait_height = DIN_A4_HEIGHT_MM * mm
-    portrait_avail_w = portrait_width - 2 * margin_h
-    portrait_avail_h = portrait_height - 2 * margin_v
-    portrait_cols = int(portrait_avail_w / (zeichen_breite_mm * mm))
-    portrait_rows = int(portrait_avail_h / (zeichen_hoehe_mm * mm))
-    portrait_per_page = portrait_cols * portrait_rows
-
-    # Landscape: 297x210mm
-    landscape_width = DIN_A4_HEIGHT_MM * mm
-    landscape_height = DIN_A4_WIDTH_MM * mm
-    landscape_avail_w = landscape_width - 2 * margin_h
-    landscape_avail_h = landscape_height - 2 * margin_v
-    landscape_cols = int(landscape_avail_w / (zeichen_breite_mm * mm))
-    landscape_rows = int(landscape_avail_h / (zeichen_hoehe_mm * mm))
-    landscape_per_page = landscape_cols * landscape_rows
-
-    # Wähle die Orientierung mit mehr Zeichen/Seite
-    if landscape_per_page > portrait_per_page:
-        # Querformat ist besser
-        pagesize = landscape(A4)
-        orientation = "Querformat"
-        logger.info(
-            "Automatische Orientierung: Querformat gewählt "
-            f"({landscape_per_page} Zeichen/Seite vs {portrait_per_page} im Hochformat)"
-        )
-    else:
-        # Hochformat ist besser (oder gleich)
-        pagesize = A4
-        orientation = "Hochformat"
-        logger.info(
-            "Automatische Orientierung: Hochformat gewählt "
-            f"({portrait_per_page} Zeichen/Seite vs {landscape_per_page} im Querformat)"
-        )
-
-    # A4-Canvas erstellen mit optimaler Orientierung
-    c = canvas.Canvas(str(output_path), pagesize=pagesize)
-    page_width, page_height = pagesize
-
-    # Metadaten
-    c.setTitle("Taktische Zeichen - Schnittbogen")
-    c.setAuthor(f"{PROGRAM_NAME}")
-    c.setSubject(f"{len(tasks)} taktische Zeichen")
-    c.setCreator(f"{PROGRAM_NAME} {PROGRAM_VERSION}")
-
-    # NEW v0.8.2: ViewerPreferences setzen (verhindert Adobe Auto-Skalierung)
-    set_no_print_scaling(c)
-
-    # Verfügbare Fläche (mit horizontalen und vertikalen Rändern)
-    available_width = page_width - 2 * margin_h
-    available_height = page_height - 2 * margin_v
-
-    # Zeichen-Größe: fertige Größe (z.B. 45x45mm oder 45x90mm)
-    zeichen_hoehe = zeichen_hoehe_mm * mm
-    zeichen_breite = zeichen_breite_mm * mm
-
-    # CRITICAL FIX: Grid IMMER auf finale Größe berechnen!
-    # Schnittlinien dürfen Layout NICHT ändern (User-Anforderung)
-    # Grid-Zellen-Größe = Fertige Zeichengröße (NACH Zuschnitt)
-    grid_cell_width = zeichen_breite
-    grid_cell_height = zeichen_hoehe
-
-    # Optimale Anzahl Spalten/Zeilen berechnen (basierend auf finaler Zeichengröße!)
-    cols = int(available_width / zeichen_breite)
-    rows = int(available_height / zeichen_hoehe)
-    zeichen_per_page = cols * rows
-
-    # NEW v0.8.2.1: Grid zentrieren (horizontal und vertikal)
-    # Tatsächlich genutzte Grid-Größe
-    grid_width = cols * zeichen_breite
-    grid_height = rows * zeichen_hoehe
-
-    # Überschüssiger Platz
-    excess_width = available_width - grid_width
-    excess_height = available_height - grid_height
+    def setup_canvas(c):
+        # Metadaten
+        c.setTitle("Taktische Zeichen - Schnittbogen")
+        c.setAuthor(f"{PROGRAM_NAME}")
+        c.setSubject(f"{len(tasks)} taktische Zeichen")
+        c.setCreator(f"{PROGRAM_NAME} {PROGRAM_VERSION}")
 
-    # Grid-Offset für Zentrierung
-    grid_offset_x = margin_h + (excess_width / 2)
-    grid_offset_y = margin_v + (excess_height / 2)
+        # NEW v0.8.2: ViewerPreferences setzen (verhindert Adobe Auto-Skalierung)
+        set_no_print_scaling(c)
 
-    logger.info(
-        "Schnittbogen-Layout: {}x{} = {} Zeichen/Seite ({:.1f}x{:.1f}mm Zeichen, A4 {} mit {:.0f}mm h / {:.0f}mm v Rand)".format(
-            cols, rows, zeichen_per_page, zeichen_breite_mm, zeichen_hoehe_mm,
-            orientation, margin_h / mm, margin_v / mm
-        )
+    # CHANGED: Segmentweise auf die Platte schreiben (Speicher unabhängig von der Seitenzahl)
+    document = SegmentedCanvas(
+        output_path, pagesize, setup_canvas,
+        MemoryScheduler().plan_pdf_pages(tasks, SYSTEM_PDF_SEGMENT_PAGES, zeichen_per_page=zeichen_per_page)
+    )
+    c = document.canvas
+
+    # NEW: Hinweistext + Schnittrahmen einmal als Form XObject, jede Seite referenziert sie
+    page_template = SchnittbogenPageTemplate(layout)
+    placed_cells = []  # Positionen der platzierten Zeichen auf der aktuellen Seite
+
+    # CHANGED: PNG-Kodieren in Worker-Threads, Platzieren in Task-Reihenfolge
+    # CRITICAL FIX: IMMER in finaler Größe (auch mit Schnittlinien!)
+    # Beschnittzugabe entfällt - rote Linie liegt außerhalb (User-Anforderung)
+    # Layout muss IDENTISCH sein mit/ohne Schnittlinien
+    # CHANGED: Zeichen werden direkt in fertiger Größe erstellt (final_size), statt mit
+    # Beschnitt zu komponieren und ihn hier wieder abzuschneiden
+    def encode_final(img, _config) -> EncodedImage:
+        logger.debug(f"Schnittbogen: draw_cut_lines={draw_cut_lines}, img_size={img.size}")
+        return encode_pdf_image(img, image_codec)
+
+    def encode_vector(page, _config) -> VectorCanvas:
+        # NEW: Vektor-Modus - Zuschnitt erst beim Platzieren (Clipping auf die Zelle)
+        return page.encode_images(image_codec)
+
+    s1_options = {
+        's1_links_prozent': s1_links_prozent,
+        's1_anzahl_schreiblinien': s1_anzahl_schreiblinien,
+        's1_staerke_anzeigen': s1_staerke_anzeigen
+    }
+    rendered = _render_pdf_images(
+        generator, tasks, draw_cut_lines, num_threads, s1_options,
+        finish=encode_vector if vector else encode_final, vector=vector, final_size=not vector
     )
+    shared_images = document.shared_images
 
-    # NEW v0.8.2.1: Hinweistext für Druckeinstellungen (falls ViewerPreferences nicht greifen)
-    def draw_print_hint(canvas_obj, pagesize_tuple):
-        """Zeichnet Hinweistext für korrekte Druckeinstellungen (oben UND unten)"""
-        w, h = pagesize_tuple
-        canvas_obj.saveState()
-        canvas_obj.setFont("Helvetica", 8)
-        canvas_obj.setFillColorRGB(0.5, 0.5, 0.5)  # Grau
-        hint_text = "WICHTIG: In Druckeinstellungen 'Tatsächliche Größe' (100%) wählen - NICHT skalieren!"
-        text_width = canvas_obj.stringWidth(hint_text, "Helvetica", 8)
-        # Zentriert am oberen Rand, knapp unterhalb
-        canvas_obj.drawString((w - text_width) / 2, h - 8 * mm, hint_text)
-        # Zentriert am unteren Rand, knapp oberhalb
-        canvas_obj.drawString((w - text_width) / 2, 8 * mm, hint_text)
-        canvas_obj.restoreState()
-
-    # Hinweistext auf erste Seite zeichnen
-    draw_print_hint(c, pagesize)
-
-    # STREAMING: Zeichen einzeln rendern und direkt platzieren
-    for idx, (svg_path, config) in enumerate(tasks):
+    for idx, svg_path, _config, encoded, error in rendered:
         try:
             # Progress Callback
             if progress_callback:
@@ -898,107 +734,62 @@ def create_schnittbogen_pdf_streaming(
 
             # Position auf aktueller Seite
             pos_on_page = idx % zeichen_per_page
-            col = pos_on_page % cols
-            row = pos_on_page // cols
 
-            # Neue Seite wenn nötig
+            # Neue Seite wenn nötig (statische Ebene der fertigen Seite zuerst)
             if idx > 0 and pos_on_page == 0:
-                c.showPage()
-                # Hinweistext auf neue Seite zeichnen
-                draw_print_hint(c, pagesize)
-
-            # CRITICAL: S1-Layout erkennen (2:1 Aspect Ratio)
-            is_s1_layout = False
-            expected_breite = config.zeichen_hoehe_mm * 2.0
-            if abs(config.zeichen_breite_mm - expected_breite) < 0.1:  # Toleranz 0.1mm
-                is_s1_layout = True
-
-            # Zeichen als Image rendern (nur 1 im RAM!)
-            # NEW: Layout-spezifische Methode aufrufen
-            if is_s1_layout:
-                img = generator.create_zeichen_s1(
-                    svg_path=svg_path,
-                    config=config,
-                    s1_links_prozent=s1_links_prozent,
-                    s1_anzahl_schreiblinien=s1_anzahl_schreiblinien,
-                    s1_staerke_anzeigen=s1_staerke_anzeigen,
-                    draw_cut_lines=draw_cut_lines,
-                    return_image=True
-                )
-            else:
-                img = generator.create_zeichen(
-                    svg_path=svg_path,
-                    config=config,
-                    draw_cut_lines=draw_cut_lines,
-                    return_image=True
-                )
-
-            logger.debug(f"Schnittbogen: draw_cut_lines={draw_cut_lines}, img_size={img.size}")
+                page_template.stamp(c, placed_cells)
+                placed_cells = []
+                document.show_page()
+                c = document.canvas  # Neues Segment nach dem Schreiben auf die Platte
 
-            # CRITICAL FIX: IMMER auf finale Größe croppen (auch mit Schnittlinien!)
-            # Beschnittzugabe wird abgeschnitten - rote Linie liegt außerhalb (User-Anforderung)
-            # Layout muss IDENTISCH sein mit/ohne Schnittlinien
-            beschnitt_px = int((beschnittzugabe_mm / 25.4) * dpi)
-            final_width_px = int((zeichen_breite_mm / 25.4) * dpi)
-            final_height_px = int((zeichen_hoehe_mm / 25.4) * dpi)
-
-            img_cropped = img.crop((
-                beschnitt_px,
-                beschnitt_px,
-                beschnitt_px + final_width_px,
-                beschnitt_px + final_height_px
-            ))
+            if error is not None:
+                logger.error(f"Fehler bei {svg_path.stem}: {error}")
+                continue  # Zelle bleibt leer, weitermachen mit nächstem Zeichen
 
             # Zeichen IMMER in finaler Größe (Layout-konstant!)
             display_width_mm = zeichen_breite_mm
             display_height_mm = zeichen_hoehe_mm
 
-            # Position berechnen (zentriert mit grid_offset)
-            # ReportLab: (0,0) ist links-unten
+            # Position berechnen (zentriertes Grid, ReportLab: (0,0) ist links-unten)
             # Grid basiert auf finaler Zeichengröße (IMMER gleich!)
-            # X-Position: von links nach rechts
-            x = grid_offset_x + (col * grid_cell_width)
-            # Y-Position: von oben nach unten (Y von oben zählen)
-            y = page_height - grid_offset_y - ((row + 1) * grid_cell_height)
-
-            # Image zu ImageReader konvertieren
-            img_buffer = BytesIO()
-            img_cropped.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
-            img_reader = ImageReader(img_buffer)
-
-            # Image platzieren (Größe abhängig von Schnittlinien)
-            c.drawImage(
-                img_reader,
-                x, y,
-                width=display_width_mm * mm,
-                height=display_height_mm * mm,
-                preserveAspectRatio=True
-            )
+            x, y = layout.cell_origin(pos_on_page)
+
+            # CHANGED: Image platzieren (identische Bilder nur einmal eingebettet)
+            if vector:
+                # NEW: Ganze Datei-Fläche um Beschnitt versetzt, auf fertige Größe geclippt
+                c.saveState()
+                clip = c.beginPath()
+                clip.rect(x, y, display_width_mm * mm, display_height_mm * mm)
+                c.clipPath(clip, stroke=0, fill=0)
+                shared_images.draw_vector(
+                    encoded,
+                    x - beschnittzugabe_mm * mm,
+                    y - beschnittzugabe_mm * mm,
+                    (zeichen_breite_mm + 2 * beschnittzugabe_mm) * mm,
+                    (zeichen_hoehe_mm + 2 * beschnittzugabe_mm) * mm
+                )
+                c.restoreState()
+            else:
+                shared_images.draw(encoded, x, y, display_width_mm * mm, display_height_mm * mm)
 
-            # IMMER schwarzen Rahmen zeichnen (Schnittlinie)
-            # Zeigt dem User wo geschnitten werden muss
-            from reportlab.lib.colors import black
-            c.setStrokeColor(black)
-            c.setLineWidth(0.5)  # 0.5pt dünne Linie
-            c.rect(x, y, display_width_mm * mm, display_height_mm * mm, stroke=1, fill=0)
+            # CHANGED: Schwarzer Rahmen (Schnittlinie) kommt aus page_template
+            placed_cells.append(pos_on_page)
 
             # RAM SOFORT freigeben!
-            del img
-            del img_cropped
-            del img_buffer
-            del img_reader
-
-            # Alle 5 Zeichen: Garbage Collection
-            if (idx + 1) % 5 == 0:
-                gc.collect()
+            del encoded
 
         except Exception as e:
             logger.error(f"Fehler bei {svg_path.stem}: {e}")
             # Weitermachen mit nächstem Zeichen
 
-    # PDF speichern
-    c.save()
+    # Statische Ebene der letzten Seite
+    page_template.stamp(c, placed_cells)
+
+    # PDF speichern (letztes Segment, Seitenbaum, xref)
+    document.save()
+    shared_images.log_stats(logger)
+    document.log_stats(logger)
+    logger.info("Seitenvorlage als Form XObject: {} Seiten".format(page_template.stamped))
 
     # Finale GC
     gc.collect()
@@ -1007,93 +798,482 @@ def create_schnittbogen_pdf_streaming(
     return output_path
 
 
-def _generate_images_parallel(
+def _is_s1_layout(config) -> bool:
+    """S1-Layout erkennen (2:1 Aspect Ratio, Toleranz 0.1mm)"""
+    return abs(config.zeichen_breite_mm - config.zeichen_hoehe_mm * 2.0) < 0.1
+
+
+def _page_key(svg_path: Path, config) -> Tuple[str, str]:
+    """
+    Schlüssel für identische Seiten: Tasks, die sich nur in zeichen_id unterscheiden,
+    ergeben dasselbe Bild (Kopien eines Zeichens)
+    """
+    return (str(svg_path), repr(replace(config, zeichen_id="")))
+
+
+def _render_pdf_images(
     generator,
     tasks: List,
     draw_cut_lines: bool,
     num_threads: int,
-    progress_callback: Optional[callable] = None,
-    chunk_start: int = 0,
-    total_zeichen: int = None
-) -> List[Image.Image]:
+    s1_options: dict,
+    finish: Callable,
+    vector: bool = False,
+    final_size: bool = False
+) -> Iterator[Tuple[int, Path, object, object, Optional[Exception]]]:
     """
-    Generiert Images parallel mit Multithreading (Hilfsfunktion für PDF-Export)
+    Rendert Zeichen parallel und liefert sie in Task-Reihenfolge (Hilfsfunktion für PDF-Export)
+
+    CHANGED: Ersetzt _generate_images_parallel (lud alle Images eines Stapels in den RAM).
+    Die Zeichen laufen durch eine geordnete BatchPipeline: Rendern und Komponieren
+    parallel, finish() (z.B. Zuschneiden + PNG-Kodieren) ebenfalls in Worker-Threads.
+    Der Umsortier-Puffer ist begrenzt (max_in_flight) und zusätzlich durch den
+    MemoryScheduler - der Speicher bleibt so flach wie beim sequentiellen Streaming.
 
-    NEW (v7.2): Fügt Multithreading zum PDF-Export hinzu
+    NEW: Text-/SVG-Templates aus dem Template-Speicher (wie create_zeichen_batch) und
+    Kopien-Erkennung: Tasks, die sich nur in zeichen_id unterscheiden, werden einmal
+    gerendert. Das Ergebnis wird bis zur letzten Kopie gehalten und mehrfach geliefert.
+
+    FIXED: Gehalten werden höchstens SYSTEM_PDF_COPY_WINDOW Seiten (LRU über die Tasks).
+    Eine Kopie, deren Seite das Fenster verlassen hat, wird neu gerendert - der Speicher
+    wächst nicht mehr mit der Zahl verschiedener Seiten. Im PDF landet das Bild trotzdem
+    nur einmal (SharedImageXObjects erkennt gleiche Bytes).
 
     Args:
         generator: TaktischeZeichenGenerator Instanz
         tasks: Liste von (svg_path, config) Tupeln
         draw_cut_lines: Schnittlinien zeichnen
         num_threads: Anzahl paralleler Threads
-        progress_callback: Optional callback(current, total, zeichen_name, status)
-        chunk_start: Start-Index für Progress-Callback (für stapelbasierte Verarbeitung)
-        total_zeichen: Gesamtzahl Zeichen für Progress-Callback
+        s1_options: S1-Parameter (s1_links_prozent, s1_anzahl_schreiblinien, s1_staerke_anzeigen)
+        finish: Worker-Funktion finish(image, config) -> Wert für den PDF-Writer
+        vector: True = Zeichen als VectorCanvas statt Bild (Vektor-PDF, ohne Templates)
+        final_size: True = Zeichen in fertiger Größe ohne Beschnitt (Schnittbogen, nur Raster)
 
-    Returns:
-        List[Image.Image]: Liste der generierten PIL Images
+    Yields:
+        (idx, svg_path, config, value, error) in Task-Reihenfolge - error ist None bei Erfolg
     """
     logger = LoggingManager().get_logger(__name__)
 
-    if total_zeichen is None:
-        total_zeichen = len(tasks)
+    # Kopien erkennen: eindeutige Seiten in Reihenfolge ihres ersten Auftretens.
+    # Nur Seiten im Fenster (zuletzt genutzt) werden wiederverwendet, ältere neu gerendert
+    unique_tasks = []
+    unique_index = OrderedDict()  # page_key -> unique_idx (LRU, max. SYSTEM_PDF_COPY_WINDOW)
+    task_unique = []
+    for svg_path, config in tasks:
+        key = _page_key(svg_path, config)
+        if key in unique_index:
+            unique_index.move_to_end(key)
+        else:
+            unique_index[key] = len(unique_tasks)
+            unique_tasks.append((svg_path, config))
+            if len(unique_index) > SYSTEM_PDF_COPY_WINDOW:
+                unique_index.popitem(last=False)
+        task_unique.append(unique_index[key])
+
+    remaining_uses = [0] * len(unique_tasks)
+    for u in task_unique:
+        remaining_uses[u] += 1
+
+    # Layout pro Task erkennen: S1- und Standard-Stufen teilen sich die Worker
+    s2_render, s2_compose = generator.create_pipeline_stages(
+        draw_cut_lines, num_threads, vector=vector, final_size=final_size
+    )
+    s1_render, s1_compose = generator.create_pipeline_stages(
+        draw_cut_lines, num_threads, s1_options=s1_options, vector=vector, final_size=final_size
+    )
 
-    images = []
-    completed = 0
-    stats_lock = Lock()
+    def render(task):
+        return (s1_render if _is_s1_layout(task[1]) else s2_render).func(task)
+
+    def compose(job):
+        return (s1_compose if _is_s1_layout(job.config) else s2_compose).func(job)
+
+    def finish_stage(job):
+        value = finish(job.image, job.config)
+        job.image = None  # Rohbild sofort freigeben
+        return value
+
+    pipeline = BatchPipeline(
+        [
+            PipelineStage("render", render, workers=s2_render.workers),
+            PipelineStage("compose", compose, workers=s2_compose.workers),
+            PipelineStage("finish", finish_stage, workers=max(1, num_threads // 2)),
+        ],
+        queue_depth=get_config().pipeline_queue_depth,
+        ordered=True,
+        max_in_flight=max(2, num_threads * 2),
+        # Vektor-Seiten belegen kaum Speicher - Budget nur für Raster-Bilder
+        admission=None if vector else MemoryScheduler()
+    )
 
-    def worker(idx: int, svg_path, config):
-        """Worker-Funktion für Thread-Pool"""
-        try:
-            # Zeichen als Image erstellen (NICHT speichern!)
-            img = generator.create_zeichen(
-                svg_path=svg_path,
-                config=config,
-                draw_cut_lines=draw_cut_lines,
-                return_image=True  # WICHTIG: Gibt PIL Image zurück
+    generator.begin_template_batch()
+    held = {}  # unique_idx -> (value, error) bis zur letzten Kopie (max. Fenstergröße)
+    next_task = 0
+    try:
+        for u, _, value, error in pipeline.run(unique_tasks):
+            held[u] = (value, error)
+
+            # Alle Tasks liefern, deren Seite schon vorliegt (eindeutige Seiten sind geordnet)
+            while next_task < len(tasks) and task_unique[next_task] <= u:
+                task_u = task_unique[next_task]
+                task_value, task_error = held[task_u]
+                remaining_uses[task_u] -= 1
+                if remaining_uses[task_u] == 0:
+                    del held[task_u]
+                svg_path, config = tasks[next_task]
+                yield next_task, svg_path, config, task_value, task_error
+                next_task += 1
+    finally:
+        generator.end_template_batch()
+
+    stats = pipeline.get_stats()
+    template_stats = generator.template_store.get_stats()
+    logger.info(
+        "PDF-Rendering: {} Zeichen, {} gerendert ({} Kopien wiederverwendet) mit {} Threads | "
+        "Templates: {} Treffer / {} Misses | Auslastung: {}".format(
+            len(tasks), len(unique_tasks), len(tasks) - len(unique_tasks), num_threads,
+            template_stats['hits'], template_stats['misses'],
+            ", ".join("{} {:.0f}%".format(name, s['utilization'] * 100) for name, s in stats.items())
+        )
+    )
+
+
+class SharedImageXObjects:
+    """
+    Bettet identische Zeichen-Bilder nur einmal pro PDF ein (Form XObject)
+
+    Bisher erhielt jede Seite/Zelle ein eigenes ImageReader-Objekt. ReportLab
+    erkennt Duplikate zwar, dekodiert dafür aber jedes PNG vollständig und
+    hasht die Rohdaten. Hier wird über den Hash der kodierten Bytes erkannt:
+    - Erstes Vorkommen: Bild-XObject + Form XObject (Bild in fester Größe)
+    - Jedes weitere: nur Verweis "/Name Do" an neuer Position
+
+    CHANGED: Nimmt fertig kodierte Bilder (EncodedImage) statt PNG-Bytes - die
+    Pixel werden nur einmal komprimiert (siehe pdf_image_codec.py).
+
+    NEW: Vektor-Seiten (VectorCanvas) werden ebenso einmal als Form XObject
+    abgelegt; darin eingefügte Bilder (Pseudo-SVGs) teilen sich die Bild-XObjects.
+
+    Pro Canvas eine Instanz (XObjects gelten nur innerhalb einer PDF-Datei);
+    bei SegmentedCanvas wird sie mit reset_canvas() an das nächste Segment übergeben.
+
+    ReportLab: Platzieren nur über die öffentliche API (beginForm/endForm/doForm).
+    Für fertig kodierte Bilder gibt es keine öffentliche Registrierung - das
+    Bild-XObject wird wie in Canvas.drawImage über canvas._doc.Reference()
+    angemeldet (unverändert in ReportLab 4.x und 5.0, Versionsbereich in requirements.txt).
+    """
+
+    def __init__(self, canvas_obj):
+        """
+        Initialisiert Verwaltung für ein Canvas
+
+        Args:
+            canvas_obj: ReportLab Canvas
+        """
+        self.canvas = canvas_obj
+        self._forms = {}  # (digest, breite, höhe) -> Form-Name
+        self._images = {}  # digest -> Name des Bild-XObjects
+        self.placed = 0
+        self.placed_bytes = 0
+        self.embedded = 0
+        self.embedded_bytes = 0
+        self.vector_placed = 0
+        self.vector_embedded = 0
+
+    def reset_canvas(self, canvas_obj):
+        """
+        Wechselt auf ein neues Canvas (Namen gelten nur im alten), Statistik bleibt erhalten
+
+        Args:
+            canvas_obj: ReportLab Canvas des nächsten Segments
+        """
+        self.canvas = canvas_obj
+        self._forms = {}
+        self._images = {}
+
+    def draw(self, encoded: EncodedImage, x: float, y: float, width: float, height: float):
+        """
+        Platziert ein Bild (einbetten beim ersten Vorkommen, sonst verweisen)
+
+        Args:
+            encoded: Kodiertes Bild (encode_pdf_image)
+            x, y: Position (links unten, Punkte)
+            width, height: Größe (Punkte, Seitenverhältnis bleibt erhalten)
+        """
+        key = (encoded.digest, round(width, 3), round(height, 3))
+        name = self._forms.get(key)
+
+        if name is None:
+            name = "Zeichen{}".format(len(self._forms))
+            self.canvas.beginForm(name, 0, 0, width, height)
+            self._draw_image(encoded, width, height)
+            self.canvas.endForm()
+            self._forms[key] = name
+
+        self.canvas.saveState()
+        self.canvas.translate(x, y)
+        self.canvas.doForm(name)
+        self.canvas.restoreState()
+        self.placed += 1
+        self.placed_bytes += len(encoded.data)
+
+    def draw_vector(self, page: VectorCanvas, x: float, y: float, width: float, height: float):
+        """
+        Platziert eine Vektor-Seite (Form XObject beim ersten Vorkommen, sonst verweisen)
+
+        Args:
+            page: Aufgezeichnetes Zeichen (Bilder bereits kodiert)
+            x, y: Position (links unten, Punkte)
+            width, height: Größe (Punkte)
+        """
+        key = ('vector', page.digest, round(width, 3), round(height, 3))
+        name = self._forms.get(key)
+
+        if name is None:
+            name = "Zeichen{}".format(len(self._forms))
+            self.canvas.beginForm(name, 0, 0, width, height)
+            page.draw_pdf(self.canvas, 0, 0, width, height, self._draw_image)
+            self.canvas.endForm()
+            self._forms[key] = name
+            self.vector_embedded += 1
+
+        self.canvas.saveState()
+        self.canvas.translate(x, y)
+        self.canvas.doForm(name)
+        self.canvas.restoreState()
+        self.vector_placed += 1
+
+    def _draw_image(self, encoded: EncodedImage, width: float, height: float):
+        """
+        Zeichnet Bild-XObject in den aktuellen Stream (wie Canvas.drawImage mit
+        preserveAspectRatio, aber ohne ImageReader und erneute Kompression)
+        """
+        c = self.canvas
+        image_name = self._images.get(encoded.digest)
+        if image_name is None:
+            image_name = "ZeichenBild{}".format(len(self._images))
+            # Registrierung wie in Canvas.drawImage (einzige Stelle ohne öffentliche API)
+            c._doc.Reference(PdfImageXObject(image_name, encoded), c._doc.getXObjectName(image_name))
+            self._images[encoded.digest] = image_name
+            self.embedded += 1
+            self.embedded_bytes += len(encoded.data)
+
+        x, y, draw_width, draw_height, _ = aspectRatioFix(
+            True, 'c', 0, 0, width, height, encoded.width, encoded.height
+        )
+        c.saveState()
+        c.translate(x, y)
+        c.scale(draw_width, draw_height)
+        # CHANGED: doForm() erzeugt denselben "/Name Do"-Verweis (gilt für jedes XObject)
+        c.doForm(image_name)
+        c.restoreState()
+
+    def log_stats(self, logger):
+        """Schreibt Dedupe-Verhältnis ins Export-Log"""
+        if self.vector_placed:
+            logger.info("PDF-Vektorseiten: {} platziert, {} eingebettet, {} Bilder darin".format(
+                self.vector_placed, self.vector_embedded, self.embedded))
+        if not self.placed:
+            return
+        logger.info(
+            "PDF-Bilder: {} platziert, {} eingebettet (Dedupe {:.1f}x, {:.1f} MB statt {:.1f} MB)".format(
+                self.placed, self.embedded, self.placed / max(1, self.embedded),
+                self.embedded_bytes / 1024 / 1024, self.placed_bytes / 1024 / 1024
             )
-            return (idx, img, None)
-        except Exception as e:
-            logger.error("Fehler bei {}: {}".format(svg_path.stem, str(e)))
-            return (idx, None, str(e))
+        )
 
-    # ThreadPoolExecutor für parallele Verarbeitung
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        # Tasks submiten
-        futures = {}
-        for idx, (svg_path, config) in enumerate(tasks):
-            future = executor.submit(worker, idx, svg_path, config)
-            futures[future] = (idx, svg_path)
 
-        # Images in richtiger Reihenfolge sammeln (wichtig für PDF!)
-        results = {}
-        for future in as_completed(futures):
-            idx, svg_path = futures[future]
-            task_idx, img, error = future.result()
+class SegmentedCanvas:
+    """
+    ReportLab-Canvas, die alle paar Seiten auf die Platte geschrieben wird
 
-            # Thread-safe Update
-            with stats_lock:
-                completed += 1
+    ReportLab hält alle Seiten- und Bild-Objekte bis save() im Speicher, daher
+    mussten Exporte bisher in kleine Dateien aufgeteilt werden. Hier wird nach
+    pages_per_segment Seiten ein Segment (eigene Canvas) erzeugt und über
+    PdfPartWriter sofort in die Zieldatei geschrieben; Seitenbaum und xref folgen
+    in save(). Bilder aus früheren Segmenten werden nicht erneut geschrieben.
 
-                if img is not None:
-                    results[task_idx] = img
+    Nach show_page() immer .canvas neu abfragen (kann ein neues Segment sein).
+    """
 
-                # Progress Callback (bei jedem Zeichen, nicht nur alle 5)
-                if progress_callback:
-                    progress_callback(
-                        chunk_start + completed,
-                        total_zeichen,
-                        svg_path.stem,
-                        "Generiere Zeichen"
-                    )
+    def __init__(
+        self,
+        output_path: Path,
+        pagesize: Tuple[float, float],
+        setup: Callable[[canvas.Canvas], None],
+        pages_per_segment: int
+    ):
+        """
+        Öffnet Zieldatei und erstes Segment
 
-    # Images in richtiger Reihenfolge zurückgeben
-    images = [results[i] for i in range(len(tasks)) if i in results]
+        Args:
+            output_path: Ziel-PDF
+            pagesize: Seitengröße (Punkte)
+            setup: setup(canvas) für jedes Segment (Metadaten, ViewerPreferences)
+            pages_per_segment: Seiten im Speicher, bevor geschrieben wird
+        """
+        self.pagesize = pagesize
+        self.pages_per_segment = max(1, pages_per_segment)
+        self._setup = setup
+        self._writer = PdfPartWriter(output_path)
+
+        self.canvas = None
+        self.shared_images = SharedImageXObjects(None)
+        self.pages = 0
+        self.segments = 0
+        self._segment_pages = 0
+        self._new_segment()
+
+    def _new_segment(self):
+        """Beginnt neues Segment (eigene Canvas im Speicher)"""
+        self.canvas = canvas.Canvas(BytesIO(), pagesize=self.pagesize)
+        self._setup(self.canvas)
+        self.shared_images.reset_canvas(self.canvas)
+        self._segment_pages = 0
+
+    def _write_segment(self):
+        """Schreibt aktuelles Segment in die Zieldatei"""
+        self._writer.add_part(self.canvas.getpdfdata())
+        self.segments += 1
+
+    def show_page(self):
+        """Schließt aktuelle Seite ab (wie Canvas.showPage) und schreibt ggf. das Segment"""
+        self.canvas.showPage()
+        self.pages += 1
+        self._segment_pages += 1
+        if self._segment_pages >= self.pages_per_segment:
+            self._write_segment()
+            self._new_segment()
+
+    def save(self):
+        """Schreibt letzte Seite/Segment, Seitenbaum und xref (wie Canvas.save)"""
+        # Leeres Segment nach einem Schreibvorgang nicht als leere Seite anhängen
+        if self.canvas._code or self._segment_pages or self.segments == 0:
+            if self.canvas._code:
+                self.pages += 1
+            self._write_segment()
+        self.canvas = None
+        self._writer.close()
+
+    def log_stats(self, logger):
+        """Schreibt Segment- und Objekt-Statistik ins Export-Log"""
+        stats = self._writer.stats or {}
+        logger.info("PDF segmentweise geschrieben: {} Seiten in {} Segmenten, {} von {} Objekten".format(
+            self.pages, self.segments, stats.get('objects_written', 0), stats.get('objects_read', 0)))
+
+
+def _write_pdf_files(
+    generator,
+    write_func: Callable,
+    tasks: List,
+    chunks: List[Tuple[int, int, Path]],
+    pages_per_file: int,
+    zeichen_per_page: int,
+    num_threads: int,
+    render_backend: Optional[str],
+    progress_callback: Optional[callable],
+    merged_path: Optional[Path] = None,
+    **kwargs
+) -> List[Path]:
+    """
+    Schreibt die Dateien eines stapelbasierten Exports - nacheinander oder parallel
 
-    logger.info("Parallel-Generierung abgeschlossen: {} Images mit {} Threads".format(
-        len(images), num_threads))
+    NEW: Stapel sind unabhängig, daher mehrere Dateien gleichzeitig in Worker-Prozessen
+    (pdf_file_pool.py). Anzahl aus RuntimeConfig.pdf_file_workers, begrenzt durch das
+    Speicherbudget. Threads und Speicherbudget werden auf die Worker aufgeteilt.
 
-    return images
+    NEW: Mit merged_path werden die Stapel als Teil-PDFs erstellt und ohne erneutes
+    Rendern zu einer Datei zusammengefügt (pdf_merge.py).
+
+    Args:
+        generator: TaktischeZeichenGenerator Instanz (nur beim Schreiben nacheinander)
+        write_func: create_einzelzeichen_pdf_streaming oder create_schnittbogen_pdf_streaming
+        tasks: Alle (svg_path, config) Tupel
+        chunks: Liste von (start, end, pdf_path) je Datei
+        pages_per_file: Seiten pro Datei (Speicherplanung)
+        zeichen_per_page: Zeichen pro Seite (Speicherplanung)
+        num_threads: Threads insgesamt
+        render_backend: "thread" oder "process" (nur beim Schreiben nacheinander)
+        progress_callback: Optional callback(current, total, svg_name, status)
+        merged_path: Ziel für eine einzige Datei (None = eine Datei pro Stapel)
+        **kwargs: Weitere Argumente für write_func
+
+    Returns:
+        List[Path]: Erstellte Dateien in Datei-Reihenfolge
+    """
+    logger = LoggingManager().get_logger(__name__)
+    total_zeichen = len(tasks)
+
+    if merged_path is not None and len(chunks) > 1:
+        import tempfile
+        from pdf_merge import merge_pdf_parts
+
+        # Teil-PDFs im Ausgabe-Ordner (gleiches Laufwerk), nach dem Zusammenfügen gelöscht
+        with tempfile.TemporaryDirectory(prefix=".teile_", dir=merged_path.parent) as parts_dir:
+            parts = [
+                (start, end, Path(parts_dir) / "teil_{:04d}.pdf".format(part_idx + 1))
+                for part_idx, (start, end, _) in enumerate(chunks)
+            ]
+            part_files = _write_pdf_files(
+                generator, write_func, tasks, parts, pages_per_file, zeichen_per_page,
+                num_threads, render_backend, progress_callback, **kwargs
+            )
+            merge_pdf_parts(part_files, merged_path,
+                            subject="{} taktische Zeichen".format(total_zeichen))
+        return [merged_path]
+
+    max_files = min(len(chunks), get_config().pdf_file_workers or os.cpu_count() or 1)
+    num_files = 1
+    if max_files > 1:
+        scheduler = MemoryScheduler()
+        # CHANGED: Im Speicher ist je Datei nur ein Segment, nicht die ganze Datei
+        num_files = scheduler.plan_pdf_files(
+            tasks, min(pages_per_file, SYSTEM_PDF_SEGMENT_PAGES),
+            max(1, num_threads // max_files), max_files, zeichen_per_page
+        )
+
+    if num_files > 1:
+        from pdf_file_pool import PdfFilePool
+
+        threads_per_file = max(1, num_threads // num_files)
+        budget_mb = max(1, scheduler.budget_bytes // num_files // (1024 * 1024))
+        logger.info("Erstelle {} PDF-Dateien parallel ({} Threads und {} MB je Datei)".format(
+            num_files, threads_per_file, budget_mb))
+
+        with PdfFilePool(num_files, config_overrides={'memory_budget_mb': budget_mb}) as pool:
+            return pool.write_files(
+                write_func,
+                [(tasks[start:end], pdf_path) for start, end, pdf_path in chunks],
+                dict(kwargs, num_threads=threads_per_file),
+                progress_callback,
+                total_zeichen
+            )
+
+    # Nacheinander: Render-Backend aktivieren (SVG-Rendering ggf. im Prozess-Pool)
+    generator.apply_render_backend(render_backend, num_threads)
+
+    pdf_files = []
+    for start, end, pdf_path in chunks:
+        # STREAMING (v7.3): Zeichen einzeln rendern statt alle im RAM
+        # Spart massiv RAM bei großen Zeichen!
+        write_func(
+            generator=generator,
+            tasks=tasks[start:end],
+            output_path=pdf_path,
+            progress_callback=progress_callback,
+            chunk_start=start,
+            total_zeichen=total_zeichen,
+            num_threads=num_threads,  # FIXED: Wurde bisher ignoriert
+            **kwargs
+        )
+
+        pdf_files.append(pdf_path)
+        logger.info("PDF erstellt: {}".format(pdf_path.name))
+
+        # GC nach jedem Stapel (zusätzlich zu GC in Streaming-Funktion)
+        gc.collect()
+
+    return pdf_files
 
 
 def create_einzelzeichen_pdf_chunked(
@@ -1103,7 +1283,7 @@ def create_einzelzeichen_pdf_chunked(
     dpi: int,
     draw_cut_lines: bool = False,
     progress_callback: Optional[callable] = None,
-    chunk_size: int = DEFAULT_PDF_CHUNK_SIZE,
+    chunk_size: Optional[int] = None,  # CHANGED: None = aus RuntimeConfig, 0 = eine Datei
     export_format: str = "Einzelzeichen",  # NEW (v0.6.0)
     zeichen_hoehe_mm: float = None,  # NEW (v7.1): Aus Settings
     zeichen_breite_mm: float = None,  # NEW (v7.1): Aus Settings
@@ -1111,7 +1291,11 @@ def create_einzelzeichen_pdf_chunked(
     num_threads: int = 6,  # Erhöht von 4 auf 6 (moderne CPUs)
     s1_links_prozent: int = DEFAULT_S1_LINKS_PROZENT,
     s1_anzahl_schreiblinien: int = DEFAULT_S1_ANZAHL_SCHREIBLINIEN,
-    s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN
+    s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN,
+    render_backend: Optional[str] = None,  # NEW: "thread" oder "process"
+    image_codec: Optional[str] = None,  # NEW: Bild-Kodierung im PDF (default: RuntimeConfig)
+    export_mode: Optional[str] = None,  # NEW: "raster" oder "vector" (default: RuntimeConfig)
+    single_file: Optional[bool] = None  # NEW: Eine Datei statt mehrerer (default: RuntimeConfig)
 ) -> List[Path]:
     """
     Erstellt mehrere Einzelzeichen-PDFs mit Stapelbasierter Verarbeitung
@@ -1119,6 +1303,7 @@ def create_einzelzeichen_pdf_chunked(
     NEW (v0.6.0): Reduziert RAM-Verbrauch von ~12,5 GB auf ~2,5 GB
     NEW (v7.1): Unterstützt dynamische Zeichengrößen aus Settings
     NEW (v7.2): Multithreading für deutlich schnellere PDF-Generierung
+    NEW: Mehrere Dateien gleichzeitig in Worker-Prozessen (RuntimeConfig.pdf_file_workers)
 
     Args:
         generator: TaktischeZeichenGenerator Instanz
@@ -1127,12 +1312,18 @@ def create_einzelzeichen_pdf_chunked(
         dpi: Auflösung
         draw_cut_lines: Schnittlinien zeichnen
         progress_callback: Optional callback(current, total, status)
-        chunk_size: Anzahl Seiten pro PDF-Datei (default: 100)
+        chunk_size: Anzahl Seiten pro PDF-Datei, 0 = alle Seiten in einer Datei
+            (default: RuntimeConfig.pdf_chunk_size)
         export_format: Exportformat für Dateinamen (default: "Einzelzeichen")
         zeichen_hoehe_mm: Höhe des fertigen Zeichens (aus Settings)
         zeichen_breite_mm: Breite des fertigen Zeichens (aus Settings)
         beschnittzugabe_mm: Beschnittzugabe (aus Settings)
-        num_threads: Anzahl paralleler Threads (default: 4)
+        num_threads: Anzahl paralleler Threads insgesamt (bei parallelen Dateien aufgeteilt)
+        render_backend: "thread" oder "process" (default: aus RuntimeConfig)
+        image_codec: "flate", "jpeg2000" oder "jpeg" (default: aus RuntimeConfig)
+        export_mode: "raster" oder "vector" (default: aus RuntimeConfig)
+        single_file: Stapel als Teil-PDFs erstellen und zu einer Datei zusammenfügen
+            (default: aus RuntimeConfig)
 
     Returns:
         List[Path]: Liste aller erstellten PDF-Dateien
@@ -1153,6 +1344,8 @@ def create_einzelzeichen_pdf_chunked(
         zeichen_breite_mm = config.zeichen_breite_mm
     if beschnittzugabe_mm is None:
         beschnittzugabe_mm = config.beschnittzugabe_mm
+    if single_file is None:
+        single_file = config.pdf_single_file
 
     total_zeichen = len(tasks)
     logger = LoggingManager().get_logger(__name__)
@@ -1163,6 +1356,13 @@ def create_einzelzeichen_pdf_chunked(
     # Zeitstempel für alle PDFs gleich (aus constants.py)
     timestamp = datetime.now().strftime(EXPORT_TIMESTAMP_FORMAT)
 
+    # CHANGED: Seiten pro Datei sind eine Einstellung - Speicher begrenzt jetzt das
+    # segmentweise Schreiben (SegmentedCanvas), nicht mehr die Dateigröße
+    if chunk_size is None:
+        chunk_size = config.pdf_chunk_size
+    if chunk_size <= 0:
+        chunk_size = max(1, total_zeichen)
+
     # Stapel-Berechnung mit Merge-Logik
     num_chunks_raw = (total_zeichen + chunk_size - 1) // chunk_size
     last_chunk_size = total_zeichen % chunk_size if total_zeichen % chunk_size != 0 else chunk_size
@@ -1176,7 +1376,7 @@ def create_einzelzeichen_pdf_chunked(
 
     logger.info("Erstelle {} PDF-Dateien (Stapelgröße: {})".format(num_chunks, chunk_size))
 
-    pdf_files = []
+    chunks = []
 
     for chunk_idx in range(num_chunks):
         # Stapel-Grenzen berechnen
@@ -1204,32 +1404,40 @@ def create_einzelzeichen_pdf_chunked(
             file_idx=chunk_idx + 1,
             total_files=num_chunks
         )
-        pdf_path = output_dir / pdf_filename
+        chunks.append((start, end, output_dir / pdf_filename))
 
-        # STREAMING (v7.3): Zeichen einzeln rendern statt alle im RAM
-        # Spart massiv RAM bei großen Zeichen!
-        create_einzelzeichen_pdf_streaming(
-            generator=generator,
-            tasks=chunk_tasks,
-            output_path=pdf_path,
-            dpi=dpi,
-            draw_cut_lines=draw_cut_lines,
-            progress_callback=progress_callback,
-            chunk_start=start,
-            total_zeichen=total_zeichen,
-            zeichen_hoehe_mm=zeichen_hoehe_mm,
-            zeichen_breite_mm=zeichen_breite_mm,
-            beschnittzugabe_mm=beschnittzugabe_mm,
-            s1_links_prozent=s1_links_prozent,
-            s1_anzahl_schreiblinien=s1_anzahl_schreiblinien,
-            s1_staerke_anzeigen=s1_staerke_anzeigen
+    # NEW: Eine Datei - Stapel werden Teil-PDFs und danach zusammengefügt
+    merged_path = None
+    if single_file:
+        merged_path = output_dir / create_pdf_filename(
+            timestamp=timestamp,
+            export_format=export_format,
+            start_idx=1,
+            end_idx=total_zeichen,
+            file_idx=1,
+            total_files=1
         )
 
-        pdf_files.append(pdf_path)
-        logger.info("PDF erstellt: {}".format(pdf_filename))
-
-        # GC nach jedem Stapel (zusätzlich zu GC in Streaming-Funktion)
-        gc.collect()
+    # CHANGED: Dateien ggf. parallel in Worker-Prozessen (statt immer nacheinander)
+    pdf_files = _write_pdf_files(
+        generator, create_einzelzeichen_pdf_streaming, tasks, chunks,
+        pages_per_file=chunk_size,
+        zeichen_per_page=1,
+        num_threads=num_threads,
+        render_backend=render_backend,
+        progress_callback=progress_callback,
+        merged_path=merged_path,
+        dpi=dpi,
+        draw_cut_lines=draw_cut_lines,
+        zeichen_hoehe_mm=zeichen_hoehe_mm,
+        zeichen_breite_mm=zeichen_breite_mm,
+        beschnittzugabe_mm=beschnittzugabe_mm,
+        s1_links_prozent=s1_links_prozent,
+        s1_anzahl_schreiblinien=s1_anzahl_schreiblinien,
+        s1_staerke_anzeigen=s1_staerke_anzeigen,
+        image_codec=image_codec,
+        export_mode=export_mode
+    )
 
     logger.info("Alle {} PDF-Dateien erstellt".format(len(pdf_files)))
     return pdf_files
@@ -1242,7 +1450,7 @@ def create_schnittbogen_pdf_chunked(
     dpi: int,
     draw_cut_lines: bool = False,
     progress_callback: Optional[callable] = None,
-    chunk_size: int = DEFAULT_PDF_CHUNK_SIZE_SCHNITTBOGEN,
+    chunk_size: Optional[int] = None,  # CHANGED: None = aus RuntimeConfig, 0 = eine Datei
     export_format: str = "Schnittbogen",  # NEW (v0.6.0)
     zeichen_hoehe_mm: float = None,  # NEW (v7.1): Aus Settings
     zeichen_breite_mm: float = None,  # NEW (v7.1): Aus Settings
@@ -1251,7 +1459,11 @@ def create_schnittbogen_pdf_chunked(
     num_threads: int = 6,  # Erhöht von 4 auf 6 (moderne CPUs)
     s1_links_prozent: int = DEFAULT_S1_LINKS_PROZENT,
     s1_anzahl_schreiblinien: int = DEFAULT_S1_ANZAHL_SCHREIBLINIEN,
-    s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN
+    s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN,
+    render_backend: Optional[str] = None,  # NEW: "thread" oder "process"
+    image_codec: Optional[str] = None,  # NEW: Bild-Kodierung im PDF (default: RuntimeConfig)
+    export_mode: Optional[str] = None,  # NEW: "raster" oder "vector" (default: RuntimeConfig)
+    single_file: Optional[bool] = None  # NEW: Eine Datei statt mehrerer (default: RuntimeConfig)
 ) -> List[Path]:
     """
     Erstellt mehrere Schnittbogen-PDFs mit Stapelbasierter Verarbeitung
@@ -1259,6 +1471,7 @@ def create_schnittbogen_pdf_chunked(
     NEW (v0.6.0): Reduziert RAM-Verbrauch bei großen Schnittbögen
     NEW (v7.1): Unterstützt dynamische Zeichengrößen aus Settings
     NEW (v7.2): Multithreading für deutlich schnellere PDF-Generierung
+    NEW: Mehrere Dateien gleichzeitig in Worker-Prozessen (RuntimeConfig.pdf_file_workers)
 
     HINWEIS: Stapelgröße ist in SEITEN (nicht Zeichen!)
     Bei 24 Zeichen/Seite: 50 Seiten = 1200 Zeichen
@@ -1270,13 +1483,19 @@ def create_schnittbogen_pdf_chunked(
         dpi: Auflösung
         draw_cut_lines: Schnittlinien zeichnen
         progress_callback: Optional callback(current, total, status)
-        chunk_size: Anzahl SEITEN pro PDF-Datei (default: 50)
+        chunk_size: Anzahl SEITEN pro PDF-Datei, 0 = alle Seiten in einer Datei
+            (default: RuntimeConfig.pdf_chunk_size_schnittbogen)
         export_format: Exportformat für Dateinamen (default: "Schnittbogen")
         zeichen_hoehe_mm: Höhe des fertigen Zeichens (aus Settings)
         zeichen_breite_mm: Breite des fertigen Zeichens (aus Settings)
         beschnittzugabe_mm: Beschnittzugabe (aus Settings)
         sicherheitsabstand_mm: Sicherheitsabstand (aus Settings)
-        num_threads: Anzahl paralleler Threads (default: 4)
+        num_threads: Anzahl paralleler Threads insgesamt (bei parallelen Dateien aufgeteilt)
+        render_backend: "thread" oder "process" (default: aus RuntimeConfig)
+        image_codec: "flate", "jpeg2000" oder "jpeg" (default: aus RuntimeConfig)
+        export_mode: "raster" oder "vector" (default: aus RuntimeConfig)
+        single_file: Stapel als Teil-PDFs erstellen und zu einer Datei zusammenfügen
+            (default: aus RuntimeConfig)
 
     Returns:
         List[Path]: Liste aller erstellten PDF-Dateien
@@ -1291,6 +1510,8 @@ def create_schnittbogen_pdf_chunked(
         beschnittzugabe_mm = config.beschnittzugabe_mm
     if sicherheitsabstand_mm is None:
         sicherheitsabstand_mm = config.sicherheitsabstand_mm
+    if single_file is None:
+        single_file = config.pdf_single_file
 
     total_zeichen = len(tasks)
     logger = LoggingManager().get_logger(__name__)
@@ -1301,9 +1522,15 @@ def create_schnittbogen_pdf_chunked(
     # Zeitstempel für alle PDFs gleich (aus constants.py)
     timestamp = datetime.now().strftime(EXPORT_TIMESTAMP_FORMAT)
 
-    # Berechne Zeichen pro Seite (A4, 45mm Zeichen)
-    # Optimale Anzahl: 4 Spalten x 6 Zeilen = 24 Zeichen/Seite
-    zeichen_per_page = 24
+    # CHANGED: Zeichen pro Seite aus dem Schnittbogen-Layout (statt fest 24 für 45mm Zeichen)
+    zeichen_per_page = max(1, get_schnittbogen_layout(zeichen_breite_mm, zeichen_hoehe_mm).zeichen_per_page)
+
+    # CHANGED: Seiten pro Datei sind eine Einstellung - Speicher begrenzt jetzt das
+    # segmentweise Schreiben (SegmentedCanvas), nicht mehr die Dateigröße
+    if chunk_size is None:
+        chunk_size = config.pdf_chunk_size_schnittbogen
+    if chunk_size <= 0:
+        chunk_size = max(1, (total_zeichen + zeichen_per_page - 1) // zeichen_per_page)
 
     # Zeichen pro Chunk (nicht Seiten!)
     zeichen_per_chunk = chunk_size * zeichen_per_page
@@ -1322,7 +1549,7 @@ def create_schnittbogen_pdf_chunked(
 
     logger.info("Erstelle {} Schnittbogen-PDFs (Stapelgröße: {} Seiten)".format(num_chunks, chunk_size))
 
-    pdf_files = []
+    chunks = []
 
     for chunk_idx in range(num_chunks):
         # Stapel-Grenzen berechnen
@@ -1351,33 +1578,41 @@ def create_schnittbogen_pdf_chunked(
             file_idx=chunk_idx + 1,
             total_files=num_chunks
         )
-        pdf_path = output_dir / pdf_filename
+        chunks.append((start, end, output_dir / pdf_filename))
 
-        # STREAMING (v7.3): Zeichen einzeln rendern statt alle im RAM
-        # Spart massiv RAM bei großen Zeichen!
-        create_schnittbogen_pdf_streaming(
-            generator=generator,
-            tasks=chunk_tasks,
-            output_path=pdf_path,
-            dpi=dpi,
-            draw_cut_lines=draw_cut_lines,
-            progress_callback=progress_callback,
-            chunk_start=start,
-            total_zeichen=total_zeichen,
-            zeichen_hoehe_mm=zeichen_hoehe_mm,
-            zeichen_breite_mm=zeichen_breite_mm,
-            beschnittzugabe_mm=beschnittzugabe_mm,
-            sicherheitsabstand_mm=sicherheitsabstand_mm,
-            s1_links_prozent=s1_links_prozent,
-            s1_anzahl_schreiblinien=s1_anzahl_schreiblinien,
-            s1_staerke_anzeigen=s1_staerke_anzeigen
+    # NEW: Eine Datei - Stapel werden Teil-PDFs und danach zusammengefügt
+    merged_path = None
+    if single_file:
+        merged_path = output_dir / create_pdf_filename(
+            timestamp=timestamp,
+            export_format=export_format,
+            start_idx=1,
+            end_idx=total_zeichen,
+            file_idx=1,
+            total_files=1
         )
 
-        pdf_files.append(pdf_path)
-        logger.info("PDF erstellt: {}".format(pdf_filename))
-
-        # GC nach jedem Stapel (zusätzlich zu GC in Streaming-Funktion)
-        gc.collect()
+    # CHANGED: Dateien ggf. parallel in Worker-Prozessen (statt immer nacheinander)
+    pdf_files = _write_pdf_files(
+        generator, create_schnittbogen_pdf_streaming, tasks, chunks,
+        pages_per_file=chunk_size,
+        zeichen_per_page=zeichen_per_page,
+        num_threads=num_threads,
+        render_backend=render_backend,
+        progress_callback=progress_callback,
+        merged_path=merged_path,
+        dpi=dpi,
+        draw_cut_lines=draw_cut_lines,
+        zeichen_hoehe_mm=zeichen_hoehe_mm,
+        zeichen_breite_mm=zeichen_breite_mm,
+        beschnittzugabe_mm=beschnittzugabe_mm,
+        sicherheitsabstand_mm=sicherheitsabstand_mm,
+        s1_links_prozent=s1_links_prozent,
+        s1_anzahl_schreiblinien=s1_anzahl_schreiblinien,
+        s1_staerke_anzeigen=s1_staerke_anzeigen,
+        image_codec=image_codec,
+        export_mode=export_mode
+    )
 
     logger.info("Alle {} PDF-Dateien erstellt".format(len(pdf_files)))
     return pdf_files
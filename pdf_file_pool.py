@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pdf_file_pool.py - PDF-Dateien eines stapelbasierten Exports parallel erstellen
+
+create_*_pdf_chunked() hat die Dateien bisher nacheinander geschrieben,
+obwohl die Stapel voneinander unabhängig sind. Der Pool verteilt ganze
+Dateien auf Worker-Prozesse:
+
+- Jeder Worker erzeugt genau einen Generator (Initializer), Raster- und
+  Template-Cache bleiben über alle Dateien dieses Workers warm
+- Worker übernehmen die RuntimeConfig des Elternprozesses
+  (auch nicht gespeicherte Änderungen)
+- Fortschritt wird über eine Queue gemeldet und im Elternprozess
+  über alle Dateien zusammengezählt
+- Worker schreiben unter temporärem Namen, umbenannt wird erst wenn alle
+  Dateien fertig sind - bei einem Fehler bleiben keine (halben) PDFs liegen
+
+Verwendung:
+    with PdfFilePool(num_workers=3, config_overrides={'memory_budget_mb': 1024}) as pool:
+        pdf_files = pool.write_files(create_einzelzeichen_pdf_streaming, chunks, kwargs,
+                                     progress_callback, total_zeichen)
+"""
+
+import gc
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from logging_manager import LoggingManager
+
+
+# Worker-lokaler Generator und Fortschritts-Queue (pro Prozess einmal im Initializer)
+_worker_generator = None
+_worker_progress = None
+
+# Wartezeit beim Abholen der Fortschrittsmeldungen (Sekunden)
+_PROGRESS_POLL_S = 0.1
+
+# Präfix der temporären PDF-Dateien (wie Raster-Cache)
+_TEMP_PREFIX = ".tmp_"
+
+
+def _temp_path(output_path: Path) -> Path:
+    """Temporärer Name im Zielverzeichnis (os.replace bleibt atomar)"""
+    return output_path.with_name(_TEMP_PREFIX + output_path.name)
+
+
+def _init_worker(config_values: Dict[str, Any], progress_queue):
+    """
+    Initialisiert Worker-Prozess
+
+    Args:
+        config_values: RuntimeConfig.to_dict() des Elternprozesses (plus Überschreibungen)
+        progress_queue: Queue für Fortschrittsmeldungen an den Elternprozess
+    """
+    global _worker_generator, _worker_progress
+
+    from runtime_config import get_config
+    config = get_config()
+    for key, value in config_values.items():
+        setattr(config, key, Path(value) if key == 'zeichen_dir' else value)
+
+    from taktische_zeichen_generator import TaktischeZeichenGenerator
+
+    _worker_generator = TaktischeZeichenGenerator()
+    _worker_progress = progress_queue
+
+
+def _write_file_in_worker(
+    write_func: Callable,
+    file_idx: int,
+    chunk_tasks: List[Tuple],
+    output_path: str,
+    kwargs: Dict[str, Any]
+) -> str:
+    """
+    Schreibt eine PDF-Datei im Worker-Prozess
+
+    Args:
+        write_func: create_einzelzeichen_pdf_streaming oder create_schnittbogen_pdf_streaming
+        file_idx: Index der Datei (für Fortschrittsmeldungen)
+        chunk_tasks: (svg_path, config) Tupel dieser Datei
+        output_path: Ziel-PDF
+        kwargs: Weitere Argumente für write_func
+
+    Returns:
+        Pfad der erstellten Datei
+    """
+    def progress(current, total, svg_name, status):
+        _worker_progress.put((file_idx, svg_name, status))
+
+    write_func(
+        generator=_worker_generator,
+        tasks=chunk_tasks,
+        output_path=Path(output_path),
+        progress_callback=progress,
+        **kwargs
+    )
+    gc.collect()
+    return output_path
+
+
+class PdfFilePool:
+    """
+    Prozess-Pool für ganze PDF-Dateien
+
+    Nur aus einem Thread verwenden (write_files() ruft progress_callback im
+    aufrufenden Thread auf).
+    """
+
+    def __init__(self, num_workers: int, config_overrides: Optional[Dict[str, Any]] = None):
+        """
+        Startet Pool
+
+        Args:
+            num_workers: Anzahl Worker-Prozesse (= gleichzeitig geschriebene Dateien)
+            config_overrides: RuntimeConfig-Werte, die in den Workern abweichen
+                (z.B. anteiliges Speicherbudget)
+        """
+        from runtime_config import get_config
+
+        self.logger = LoggingManager().get_logger(__name__)
+        self.num_workers = max(1, num_workers)
+
+        config_values = get_config().to_dict()
+        config_values.update(config_overrides or {})
+
+        self._progress = multiprocessing.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=_init_worker,
+            initargs=(config_values, self._progress)
+        )
+
+        self.logger.info(f"PDF-Datei-Pool gestartet: {self.num_workers} Worker")
+
+    def write_files(
+        self,
+        write_func: Callable,
+        chunks: List[Tuple[List[Tuple], Path]],
+        kwargs: Dict[str, Any],
+        progress_callback: Optional[Callable] = None,
+        total_zeichen: Optional[int] = None
+    ) -> List[Path]:
+        """
+        Schreibt alle Dateien parallel (blockierend)
+
+        Args:
+            write_func: Streaming-Funktion (Modulebene, wird an Worker übergeben)
+            chunks: Liste von (chunk_tasks, output_path) in Datei-Reihenfolge
+            kwargs: Gemeinsame Argumente für write_func (ohne generator/tasks/output_path)
+            progress_callback: Optional callback(current, total, svg_name, status)
+                - current zählt über alle Dateien
+            total_zeichen: Gesamtzahl Zeichen (default: Summe der Stapel)
+
+        Returns:
+            List[Path]: Erstellte Dateien in Datei-Reihenfolge
+
+        Raises:
+            Exception: Fehler eines Workers (übrige Dateien werden abgebrochen,
+                temporäre Dateien dieses Laufs gelöscht)
+        """
+        if total_zeichen is None:
+            total_zeichen = sum(len(chunk_tasks) for chunk_tasks, _ in chunks)
+
+        # FIXED: Worker schreiben unter temporärem Namen (kein halbes PDF unter dem Zielnamen)
+        temp_paths = [_temp_path(Path(output_path)) for _, output_path in chunks]
+        futures = [
+            self._executor.submit(_write_file_in_worker, write_func, file_idx,
+                                  chunk_tasks, str(temp_path), kwargs)
+            for file_idx, ((chunk_tasks, _), temp_path) in enumerate(zip(chunks, temp_paths))
+        ]
+
+        reported = 0
+        pending = list(futures)
+        try:
+            while pending:
+                reported += self._drain_progress(progress_callback, reported, total_zeichen)
+                for future in [f for f in pending if f.done()]:
+                    pending.remove(future)
+                    if future.exception() is not None:
+                        raise future.exception()
+                    self.logger.info("PDF erstellt: {}".format(chunks[futures.index(future)][1].name))
+        except BaseException:
+            # Wartende Dateien abbrechen, laufende abwarten (schreiben sonst weiter)
+            for other in pending:
+                other.cancel()
+            wait(pending)
+            self._remove_files(temp_paths)
+            raise
+
+        # Erst wenn alle Dateien fertig sind: unter Zielnamen ablegen
+        output_paths = [Path(output_path) for _, output_path in chunks]
+        for temp_path, output_path in zip(temp_paths, output_paths):
+            os.replace(temp_path, output_path)
+
+        # Meldungen, die nach dem Ergebnis ankommen (eigene Queue je Richtung)
+        while reported < total_zeichen:
+            received = self._drain_progress(progress_callback, reported, total_zeichen, wait_all=True)
+            if received == 0:
+                break
+            reported += received
+
+        return output_paths
+
+    def _remove_files(self, paths: List[Path]):
+        """Löscht Dateien dieses Laufs (fehlende werden ignoriert)"""
+        for path in paths:
+            try:
+                path.unlink()
+                self.logger.debug(f"Unvollständige Datei gelöscht: {path.name}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"Datei konnte nicht gelöscht werden: {path.name} ({e})")
+
+    def _drain_progress(
+        self,
+        progress_callback: Optional[Callable],
+        reported: int,
+        total_zeichen: int,
+        wait_all: bool = False
+    ) -> int:
+        """
+        Holt wartende Fortschrittsmeldungen ab und meldet sie weiter
+
+        Args:
+            progress_callback: Callback des Aufrufers
+            reported: Bisher gemeldete Zeichen
+            total_zeichen: Gesamtzahl Zeichen
+            wait_all: Bis zur Zeitüberschreitung weiter abholen (Abschluss)
+
+        Returns:
+            Anzahl abgeholter Meldungen
+        """
+        received = 0
+        try:
+            while True:
+                if received == 0 or wait_all:
+                    _, svg_name, status = self._progress.get(timeout=_PROGRESS_POLL_S)
+                else:
+                    _, svg_name, status = self._progress.get_nowait()
+                received += 1
+                if progress_callback:
+                    progress_callback(reported + received, total_zeichen, svg_name, status)
+        except queue.Empty:
+            pass
+        return received
+
+    def shutdown(self):
+        """Beendet alle Worker-Prozesse"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._progress.close()
+        self.logger.info("PDF-Datei-Pool beendet")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
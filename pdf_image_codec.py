@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pdf_image_codec.py - PIL-Bilder direkt als PDF-Bild-XObject kodieren
+
+Bisher: img.save(BytesIO, 'PNG') -> ImageReader -> ReportLab dekodiert das PNG
+wieder und komprimiert die Rohdaten erneut mit zlib (plus ASCII85, +25% Größe).
+Jedes Bild wurde also zweimal komprimiert und einmal dekodiert.
+
+Hier werden die Pixel einmal komprimiert, wahlweise:
+- "flate":    zlib auf Rohdaten (verlustfrei, Stufe einstellbar)
+- "jpeg2000": verlustfreies JPEG 2000 (JPXDecode), falls Pillow mit OpenJPEG gebaut ist
+- "jpeg":     JPEG (DCTDecode), für fotoähnliche Pseudo-SVGs
+
+Die Kodierung läuft in Worker-Threads (z.B. "finish"-Stufe der PDF-Pipeline),
+der PDF-Writer bettet nur noch fertige Bytes ein.
+
+Verwendung:
+    encoded = encode_pdf_image(pil_image)           # Codec aus RuntimeConfig
+    xobject = PdfImageXObject(name, encoded)         # für ReportLab-Dokument
+"""
+
+import hashlib
+import zlib
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Optional, Tuple
+
+from PIL import Image, features
+from reportlab.pdfbase.pdfdoc import PDFImageXObject
+
+from logging_manager import LoggingManager
+from constants import (
+    PDF_IMAGE_CODEC_FLATE,
+    PDF_IMAGE_CODEC_JPEG2000,
+    PDF_IMAGE_CODEC_JPEG,
+    AVAILABLE_PDF_IMAGE_CODECS
+)
+
+# PDF-Farbraum je PIL-Modus (wie ReportLab)
+_COLOR_SPACES = {'L': 'DeviceGray', 'RGB': 'DeviceRGB', 'CMYK': 'DeviceCMYK'}
+
+# JPEG 2000 nur mit OpenJPEG-Unterstützung in Pillow
+JPEG2000_AVAILABLE = features.check('jpg_2000')
+
+_jpeg2000_warned = False
+
+
+@dataclass
+class EncodedImage:
+    """
+    Fertig kodiertes Bild für ein PDF-Bild-XObject
+
+    Attributes:
+        width: Breite in Pixeln
+        height: Höhe in Pixeln
+        color_space: PDF-Farbraum ("DeviceRGB", "DeviceGray", "DeviceCMYK")
+        filters: PDF-Filter (z.B. ("FlateDecode",))
+        data: Komprimierte Bilddaten
+        digest: SHA1 der Bilddaten (Erkennung identischer Bilder)
+    """
+    width: int
+    height: int
+    color_space: str
+    filters: Tuple[str, ...]
+    data: bytes
+    digest: str
+
+
+def _to_pdf_mode(image: Image.Image) -> Image.Image:
+    """
+    Bringt Bild in einen PDF-Farbraum (Alpha wird verworfen, wie bei ReportLab ohne Maske)
+
+    Args:
+        image: PIL Image
+
+    Returns:
+        PIL Image im Modus L, RGB oder CMYK
+    """
+    if image.mode in ('L', 'RGB', 'CMYK'):
+        return image
+    if image.mode == 'LA':
+        return image.convert('L')
+    return image.convert('RGB')
+
+
+def encode_pdf_image(
+    image: Image.Image,
+    codec: Optional[str] = None,
+    flate_level: Optional[int] = None,
+    jpeg_quality: Optional[int] = None
+) -> EncodedImage:
+    """
+    Kodiert ein PIL Image für die Einbettung im PDF (thread-safe)
+
+    Args:
+        image: PIL Image (RGBA wird zu RGB, Alpha verworfen)
+        codec: "flate", "jpeg2000" oder "jpeg" (default: aus RuntimeConfig)
+        flate_level: zlib-Stufe 1-9 (default: aus RuntimeConfig)
+        jpeg_quality: JPEG-Qualität (default: aus RuntimeConfig)
+
+    Returns:
+        EncodedImage
+
+    Raises:
+        ValueError: Bei unbekanntem Codec
+    """
+    global _jpeg2000_warned
+
+    if codec is None or flate_level is None or jpeg_quality is None:
+        from runtime_config import get_config
+        config = get_config()
+        codec = codec or config.pdf_image_codec
+        flate_level = flate_level or config.pdf_flate_level
+        jpeg_quality = jpeg_quality or config.pdf_jpeg_quality
+
+    if codec not in AVAILABLE_PDF_IMAGE_CODECS:
+        raise ValueError("Unbekannte PDF-Bildkodierung: {}".format(codec))
+
+    if codec == PDF_IMAGE_CODEC_JPEG2000 and not JPEG2000_AVAILABLE:
+        if not _jpeg2000_warned:
+            LoggingManager().get_logger(__name__).warning(
+                "JPEG 2000 nicht verfügbar (Pillow ohne OpenJPEG) - verwende Flate")
+            _jpeg2000_warned = True
+        codec = PDF_IMAGE_CODEC_FLATE
+
+    image = _to_pdf_mode(image)
+
+    if codec == PDF_IMAGE_CODEC_FLATE:
+        data = zlib.compress(image.tobytes(), flate_level)
+        filters = ('FlateDecode',)
+    else:
+        if codec == PDF_IMAGE_CODEC_JPEG and image.mode == 'CMYK':
+            image = image.convert('RGB')  # Adobe-CMYK-JPEGs bräuchten invertiertes Decode-Array
+        buffer = BytesIO()
+        if codec == PDF_IMAGE_CODEC_JPEG:
+            image.save(buffer, format='JPEG', quality=jpeg_quality, subsampling=0)
+            filters = ('DCTDecode',)
+        else:
+            image.save(buffer, format='JPEG2000', irreversible=False)
+            filters = ('JPXDecode',)
+        data = buffer.getvalue()
+
+    return EncodedImage(
+        width=image.width,
+        height=image.height,
+        color_space=_COLOR_SPACES[image.mode],
+        filters=filters,
+        data=data,
+        digest=hashlib.sha1(data).hexdigest()
+    )
+
+
+class PdfImageXObject(PDFImageXObject):
+    """
+    ReportLab Bild-XObject aus bereits kodierten Daten (keine erneute Kompression)
+    """
+
+    def __init__(self, name: str, encoded: EncodedImage):
+        """
+        Initialisiert XObject
+
+        Args:
+            name: Interner Name (eindeutig pro Dokument)
+            encoded: Kodiertes Bild
+        """
+        super().__init__(name)
+        self.width = encoded.width
+        self.height = encoded.height
+        self.bitsPerComponent = 8
+        self.colorSpace = encoded.color_space
+        self._filters = encoded.filters
+        self.streamContent = encoded.data
+        self.mask = None
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("PDF-IMAGE-CODEC TEST")
+    print("=" * 80)
+
+    test_image = Image.new('RGBA', (400, 400), (255, 255, 255, 255))
+    for codec in AVAILABLE_PDF_IMAGE_CODECS:
+        encoded = encode_pdf_image(test_image, codec=codec, flate_level=6, jpeg_quality=95)
+        print(f"\n[{codec}] {encoded.width}x{encoded.height} {encoded.color_space} "
+              f"{encoded.filters} {len(encoded.data)} Bytes")
+
+    print(f"\nJPEG 2000 verfügbar: {JPEG2000_AVAILABLE}")
+
+    print("\n" + "=" * 80)
+    print("[OK] Alle Tests abgeschlossen")
+    print("=" * 80)
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pdf_merge.py - Teil-PDFs auf Objekt-Ebene zu einer Datei zusammenfügen
+
+Eine einzige ReportLab-Canvas für 1000 Seiten ist langsam und hält alles bis
+c.save() im Speicher. Für "eine Datei" werden daher Teil-PDFs parallel erstellt
+(pdf_file_pool.py) und anschließend zusammengefügt:
+
+- Objekte werden nur umnummeriert und unverändert kopiert
+  (kein erneutes Rendern, keine erneute Kompression)
+- Gleiche Objekte aus verschiedenen Teilen (Bild- und Form-XObjects, Schriften)
+  werden nur einmal geschrieben
+- Seiten und Seitenbaum werden in Teil-Reihenfolge neu aufgebaut,
+  Katalog (ViewerPreferences) und Info kommen aus dem ersten Teil
+- PdfPartWriter schreibt jeden Teil sofort auf die Platte - auch für kleine
+  Segmente einer einzelnen Datei (SegmentedCanvas in pdf_exporter.py)
+
+Nur für Teil-PDFs dieses Programms (ReportLab: klassische xref-Tabelle,
+keine Objekt-Streams, keine Verschlüsselung) - andere PDFs werden abgelehnt.
+
+Verwendung:
+    stats = merge_pdf_parts([teil1, teil2, teil3], ziel_pdf, subject="1200 taktische Zeichen")
+
+    with PdfPartWriter(ziel_pdf) as writer:
+        writer.add_part(segment_bytes)
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from logging_manager import LoggingManager
+
+
+# Indirekte Referenz "12 0 R" (nur im Dictionary-Teil eines Objekts, nie in Stream-Daten)
+_REF_PATTERN = re.compile(rb'(?<![\d.])(\d+) 0 R\b')
+_OBJ_HEADER_PATTERN = re.compile(rb'(\d+) 0 obj\r?\n')
+_STARTXREF_PATTERN = re.compile(rb'startxref\s+(\d+)\s+%%EOF\s*$')
+_PAGE_TYPE_PATTERN = re.compile(rb'/Type /Page\b(?!s)')
+_STREAM_START = b'>>\nstream\n'
+
+# Feste Objekt-Nummern in der Zieldatei
+_CATALOG_NUM = 1
+_PAGES_NUM = 2
+_INFO_NUM = 3
+
+_PDF_HEADER = b'%PDF-1.4\n%\x93\x8c\x8b\x9e ReportLab Generated PDF document (merged)\n'
+
+
+def _read_part(data: bytes, name: str) -> Tuple[Dict[int, bytes], int, int]:
+    """
+    Liest alle Objekte eines Teil-PDFs
+
+    Args:
+        data: Teil-PDF (von ReportLab erzeugt)
+        name: Name für Fehlermeldungen
+
+    Returns:
+        Tuple (objekte {nummer: inhalt zwischen "obj" und "endobj"}, root, info)
+
+    Raises:
+        ValueError: Wenn das PDF nicht dem erwarteten Aufbau entspricht
+    """
+    match = _STARTXREF_PATTERN.search(data[-64:])
+    if match is None:
+        raise ValueError("Kein startxref gefunden: {}".format(name))
+    xref_offset = int(match.group(1))
+    if data[xref_offset:xref_offset + 4] != b'xref':
+        raise ValueError("Keine klassische xref-Tabelle: {}".format(name))
+
+    # xref: "xref\n0 N\n" + N Einträge à 20 Bytes
+    section_end = data.index(b'\n', data.index(b'\n', xref_offset) + 1) + 1
+    first, count = (int(v) for v in data[data.index(b'\n', xref_offset) + 1:section_end].split())
+    offsets = {}
+    for i in range(count):
+        entry = data[section_end + 20 * i:section_end + 20 * (i + 1)]
+        if entry[17:18] == b'n':
+            offsets[first + i] = int(entry[:10])
+
+    trailer = data[section_end + 20 * count:]
+    root = re.search(rb'/Root (\d+) 0 R', trailer)
+    info = re.search(rb'/Info (\d+) 0 R', trailer)
+    if root is None or b'/Encrypt' in trailer:
+        raise ValueError("Nicht unterstütztes PDF (Root/Verschlüsselung): {}".format(name))
+
+    # Objekt reicht bis zum nächsten Objekt (bzw. xref) - Streams werden nicht geparst
+    boundaries = sorted(offsets.values()) + [xref_offset]
+    next_offset = {start: end for start, end in zip(boundaries, boundaries[1:])}
+    objects = {}
+    for num, offset in offsets.items():
+        header = _OBJ_HEADER_PATTERN.match(data, offset)
+        if header is None or int(header.group(1)) != num:
+            raise ValueError("Objekt {} nicht an xref-Position: {}".format(num, name))
+        body = data[header.end():next_offset[offset]].rstrip()
+        if not body.endswith(b'endobj'):
+            raise ValueError("Objekt {} ohne endobj: {}".format(num, name))
+        objects[num] = body[:-len(b'endobj')]
+
+    return objects, int(root.group(1)), int(info.group(1)) if info else 0
+
+
+def _split_stream(body: bytes) -> Tuple[bytes, bytes]:
+    """Trennt Dictionary-Teil und Stream-Daten (Referenzen nur im Dictionary-Teil)"""
+    index = body.find(_STREAM_START)
+    if index < 0:
+        return body, b''
+    return body[:index + 2], body[index + 2:]
+
+
+def _remap(head: bytes, mapping: Dict[int, int]) -> bytes:
+    """Ersetzt Objekt-Referenzen durch die neuen Nummern"""
+    return _REF_PATTERN.sub(lambda m: b'%d 0 R' % mapping[int(m.group(1))], head)
+
+
+def _pdf_string(text: str) -> bytes:
+    """PDF-Literal-String (Latin-1, Klammern und Backslash maskiert)"""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return b'(' + escaped.encode('latin-1', errors='replace') + b')'
+
+
+class PdfPartWriter:
+    """
+    Schreibt Teil-PDFs fortlaufend in eine Zieldatei
+
+    Jeder Teil wird sofort auf die Platte geschrieben; im Speicher bleiben nur
+    Seitenliste, xref-Positionen und die Hashes bereits geschriebener Objekte.
+    Die xref-Tabelle folgt in close().
+
+    Verwendung:
+        with PdfPartWriter(ziel_pdf) as writer:
+            writer.add_part(teil_bytes)
+    """
+
+    def __init__(self, output_path: Path, subject: Optional[str] = None):
+        """
+        Öffnet Zieldatei
+
+        Args:
+            output_path: Ziel-PDF
+            subject: Neuer Betreff im Info-Dictionary (default: aus erstem Teil)
+        """
+        self.output_path = Path(output_path)
+        self.subject = subject
+
+        # Feste Nummern: 1 = Katalog, 2 = Seitenbaum, 3 = Info
+        self._next_num = 4
+        self._shared: Dict[str, int] = {}  # Inhalts-Hash -> neue Nummer
+        self._kids: List[int] = []
+        self._offsets: Dict[int, int] = {}
+        self._digest = hashlib.md5()
+        self._position = 0
+
+        self.parts = 0
+        self.objects_read = 0
+        self.stats: Optional[Dict[str, int]] = None
+
+        self._output = open(self.output_path, 'wb')
+        self._write(_PDF_HEADER)
+
+    def _write(self, data: bytes):
+        self._output.write(data)
+        self._digest.update(data)
+        self._position += len(data)
+
+    def _write_object(self, num: int, body: bytes):
+        self._offsets[num] = self._position
+        self._write(b'%d 0 obj\n' % num + body + b'endobj\n')
+
+    def add_part(self, part: Union[Path, bytes]):
+        """
+        Hängt alle Seiten eines Teil-PDFs an
+
+        Args:
+            part: Teil-PDF als Datei oder Bytes (von ReportLab erzeugt)
+
+        Raises:
+            ValueError: Bei nicht unterstütztem PDF-Aufbau
+        """
+        if isinstance(part, (bytes, bytearray)):
+            name = "Teil {}".format(self.parts + 1)
+        else:
+            name = Path(part).name
+            part = Path(part).read_bytes()
+
+        objects, root, info = _read_part(part, name)
+        self.objects_read += len(objects)
+
+        catalog_head, _ = _split_stream(objects[root])
+        part_pages = re.search(rb'/Pages (\d+) 0 R', catalog_head)
+        if part_pages is None:
+            raise ValueError("Katalog ohne Seitenbaum: {}".format(name))
+        part_pages = int(part_pages.group(1))
+        part_kids = re.search(rb'/Kids \[([^\]]*)\]', objects[part_pages]).group(1)
+        part_kids = [int(num) for num in _REF_PATTERN.findall(part_kids)]
+
+        mapping = {root: _CATALOG_NUM, part_pages: _PAGES_NUM}
+        if info:
+            mapping[info] = _INFO_NUM
+        on_stack = set()
+
+        def visit(num: int) -> int:
+            """Kopiert Objekt samt Abhängigkeiten (Tiefensuche, gleiche Objekte einmal)"""
+            if num in mapping:
+                return mapping[num]
+            if num in on_stack:
+                # Zyklus: Nummer vorab vergeben, Objekt wird nicht geteilt
+                mapping[num] = self._next_num
+                self._next_num += 1
+                return mapping[num]
+
+            on_stack.add(num)
+            head, stream = _split_stream(objects[num])
+            for child in _REF_PATTERN.findall(head):
+                visit(int(child))
+            on_stack.discard(num)
+
+            body = _remap(head, mapping) + stream
+            if num in mapping:
+                self._write_object(mapping[num], body)
+                return mapping[num]
+
+            key = None
+            if not _PAGE_TYPE_PATTERN.search(head):
+                key = hashlib.sha1(body).hexdigest()
+                if key in self._shared:
+                    mapping[num] = self._shared[key]
+                    return mapping[num]
+
+            mapping[num] = self._next_num
+            self._next_num += 1
+            self._write_object(mapping[num], body)
+            if key is not None:
+                self._shared[key] = mapping[num]
+            return mapping[num]
+
+        self._kids.extend(visit(num) for num in part_kids)
+
+        if self.parts == 0:
+            # Katalog (inkl. ViewerPreferences) und Info aus dem ersten Teil
+            for child in _REF_PATTERN.findall(catalog_head):
+                visit(int(child))
+            self._write_object(_CATALOG_NUM, _remap(catalog_head, mapping))
+
+            info_body = objects[info] if info else b'<<\n>>\n'
+            if self.subject is not None:
+                info_body = re.sub(rb'/Subject \((?:\\.|[^\\)])*\)',
+                                   lambda m: b'/Subject ' + _pdf_string(self.subject), info_body)
+            self._write_object(_INFO_NUM, info_body)
+
+        self.parts += 1
+
+    def close(self) -> Dict[str, int]:
+        """
+        Schreibt Seitenbaum, xref und Trailer und schließt die Datei
+
+        Returns:
+            dict: parts, pages, objects_read, objects_written
+
+        Raises:
+            ValueError: Wenn kein Teil hinzugefügt wurde
+        """
+        if self.stats is not None:
+            return self.stats
+        if self.parts == 0:
+            self._output.close()
+            raise ValueError("Keine Seiten für {}".format(self.output_path.name))
+
+        self._write_object(_PAGES_NUM, b'<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>\n' % (
+            len(self._kids), b' '.join(b'%d 0 R' % num for num in self._kids)))
+
+        size = self._next_num
+        xref_offset = self._position
+        lines = [b'xref\n0 %d\n' % size, b'0000000000 65535 f \n']
+        for num in range(1, size):
+            lines.append(b'%010d 00000 n \n' % self._offsets[num])
+        file_id = self._digest.hexdigest().encode('ascii')
+        lines.append(b'trailer\n<<\n/ID \n[<%s><%s>]\n/Info %d 0 R\n/Root %d 0 R\n/Size %d\n>>\n'
+                     % (file_id, file_id, _INFO_NUM, _CATALOG_NUM, size))
+        lines.append(b'startxref\n%d\n%%%%EOF\n' % xref_offset)
+        self._write(b''.join(lines))
+        self._output.close()
+
+        self.stats = {
+            'parts': self.parts,
+            'pages': len(self._kids),
+            'objects_read': self.objects_read,
+            'objects_written': size - 1
+        }
+        return self.stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._output.close()
+        return False
+
+
+def merge_pdf_parts(
+    part_paths: List[Path],
+    output_path: Path,
+    subject: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Fügt Teil-PDFs in Reihenfolge zu einer Datei zusammen
+
+    Hält immer nur ein Teil-PDF im Speicher, die Zieldatei wird fortlaufend geschrieben.
+
+    Args:
+        part_paths: Teil-PDFs in Seiten-Reihenfolge
+        output_path: Ziel-PDF
+        subject: Neuer Betreff im Info-Dictionary (default: aus erstem Teil)
+
+    Returns:
+        dict: parts, pages, objects_read, objects_written
+
+    Raises:
+        ValueError: Bei nicht unterstütztem PDF-Aufbau
+    """
+    with PdfPartWriter(output_path, subject) as writer:
+        for part_path in part_paths:
+            writer.add_part(Path(part_path))
+    stats = writer.stats
+
+    LoggingManager().get_logger(__name__).info(
+        "PDF zusammengefügt: {} Teile, {} Seiten, {} von {} Objekten geschrieben".format(
+            stats['parts'], stats['pages'], stats['objects_written'], stats['objects_read']))
+    return stats
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    import tempfile
+    from PIL import Image
+    from reportlab.pdfgen import canvas
+    from pdf_image_codec import encode_pdf_image
+
+    print("=" * 80)
+    print("PDF-MERGE TEST")
+    print("=" * 80)
+
+    from pdf_exporter import SharedImageXObjects
+
+    red = encode_pdf_image(Image.new('RGB', (200, 200), (255, 0, 0)), "flate", 6, 95)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        parts = []
+        for part in range(3):
+            path = Path(tmp) / "teil_{}.pdf".format(part)
+            c = canvas.Canvas(str(path), pagesize=(200, 200))
+            c.setSubject("2 taktische Zeichen")
+            shared = SharedImageXObjects(c)
+            for page in range(2):
+                shared.draw(red, 0, 0, 200, 200)
+                c.drawString(10, 10, "Teil {} Seite {}".format(part, page))
+                c.showPage()
+            c.save()
+            parts.append(path)
+
+        output = Path(tmp) / "gesamt.pdf"
+        stats = merge_pdf_parts(parts, output, subject="6 taktische Zeichen")
+        data = output.read_bytes()
+
+        print(f"\nTeile: {stats['parts']} | Seiten: {stats['pages']} | "
+              f"Objekte: {stats['objects_written']} von {stats['objects_read']}")
+        print(f"Bild-XObjects im Ergebnis: {data.count(b'/Subtype /Image')} (Teile: 3)")
+        print(f"Größe: {len(data)} Bytes (Teile: {sum(p.stat().st_size for p in parts)} Bytes)")
+
+    print("\n" + "=" * 80)
+    print("[OK] Alle Tests abgeschlossen")
+    print("=" * 80)
@@ -13,7 +13,9 @@ FUNKTIONSWEISE:
 
 from PIL import Image, ImageDraw, ImageFont
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 from constants import (
     DEFAULT_ZEICHEN_HOEHE_MM,
@@ -30,6 +32,7 @@ from constants import (
     CUT_LINE_COLOR_BESCHNITT,
     CUT_LINE_COLOR_SCHNITT,
     CUT_LINE_COLOR_SICHERHEIT,
+    CUT_LINE_COLOR_S1_BORDER,
     PNG_COLOR_MODE,  # NEW: Farbmodus (RGBA fuer Transparenz)
     PNG_COLOR_MODE_RGBA,  # NEW: RGBA-Konstante
     PNG_BACKGROUND_COLOR_TRANSPARENT,  # NEW: Transparente Hintergrundfarbe
@@ -37,6 +40,7 @@ from constants import (
     mm_to_pixels,
     calculate_print_dimensions
 )
+from vector_canvas import VectorCanvas, get_draw
 
 
 class PrintPreparer:
@@ -49,6 +53,8 @@ class PrintPreparer:
       1. Sicherheitsrand (3mm) -> 45x45mm
       2. Beschnittzugabe (3mm) -> 51x51mm
     - KEINE Positionierung mehr!
+    - CHANGED: Beides in einem Ausgabebild; create_print_buffer() erlaubt es,
+      Zeichen direkt hinein zu komponieren
     """
     
     def __init__(self):
@@ -64,7 +70,9 @@ class PrintPreparer:
         zeichen_hoehe_mm: float = None,
         zeichen_breite_mm: float = None,
         sicherheitsabstand_mm: float = None,
-        beschnittzugabe_mm: float = None
+        beschnittzugabe_mm: float = None,
+        final_size: bool = False,
+        s1_border_x: Optional[int] = None
     ) -> Image.Image:
         """
         Bereitet Canvas fuer Druck vor (RECHTECKIGE Zeichen unterstützt!)
@@ -79,6 +87,11 @@ class PrintPreparer:
         3. Beschnittzugabe (3mm) -> datei_groesse
         4. Optional: Schneidelinien
 
+        NEW: final_size=True liefert das Zeichen in fertiger Größe (ohne Beschnitt) für
+        Schnittbögen, die den Beschnitt sonst sofort wieder abschneiden. Ohne Schneidelinien
+        entfällt der Beschnitt ganz; Schneidelinien werden um den Beschnitt verschoben
+        gezeichnet (was außerhalb liegt, schneidet PIL ab - nur PIL Images).
+
         Args:
             canvas: PIL Image (Canvas = zeichen_hoehe/breite - 2×sicherheitsabstand)
             dpi: Aufloesung
@@ -87,9 +100,12 @@ class PrintPreparer:
             zeichen_breite_mm: Breite des fertigen Zeichens (NACH Zuschnitt)
             sicherheitsabstand_mm: Sicherheitsabstand (Grafik/Text zum fertigen Rand)
             beschnittzugabe_mm: Beschnittzugabe (wird rund um das Zeichen hinzugefügt)
+            final_size: True = fertige Größe (endgroesse) statt Datei-Größe mit Beschnitt
+            s1_border_x: S1-Layout: Grenze Links/Rechts in Canvas-Pixeln (orange Trennlinie
+                bei Schneidelinien)
 
         Returns:
-            PIL Image (druckfertig mit Beschnitt)
+            PIL Image (druckfertig mit Beschnitt, bei final_size in fertiger Größe)
 
         Beispiel:
             zeichen_hoehe=45mm, zeichen_breite=45mm, rand=3mm
@@ -102,24 +118,11 @@ class PrintPreparer:
             → Mit Rand: 28×32mm (endgroesse)
             → Mit Beschnitt: 34×38mm (datei_groesse, Output)
         """
-        # RuntimeConfig-Defaults laden falls nicht angegeben
-        from runtime_config import get_config
-        config = get_config()
-        if dpi is None:
-            dpi = config.export_dpi
-        if zeichen_hoehe_mm is None:
-            zeichen_hoehe_mm = config.zeichen_hoehe_mm
-        if zeichen_breite_mm is None:
-            zeichen_breite_mm = config.zeichen_breite_mm
-        if sicherheitsabstand_mm is None:
-            sicherheitsabstand_mm = config.sicherheitsabstand_mm
-        if beschnittzugabe_mm is None:
-            beschnittzugabe_mm = config.beschnittzugabe_mm
+        dims = self._resolve_dimensions(
+            dpi, zeichen_hoehe_mm, zeichen_breite_mm, sicherheitsabstand_mm, beschnittzugabe_mm
+        )
 
-        # FIXED: Mit Config-Werten berechnen (rechteckige Zeichen!)
-        dims = calculate_print_dimensions(dpi, zeichen_hoehe_mm, zeichen_breite_mm, sicherheitsabstand_mm, beschnittzugabe_mm)
-        
-        self.logger.info("Druckvorbereitung @ {} DPI".format(dpi))
+        self.logger.info("Druckvorbereitung @ {} DPI".format(dims['dpi']))
         self.logger.debug("Input Canvas: {}x{}px".format(canvas.width, canvas.height))
 
         # SCHRITT 1: Pruefen ob Canvas die erwartete Größe hat (RECHTECKIG!)
@@ -134,208 +137,399 @@ class PrintPreparer:
                     dims['canvas_breite_mm'], dims['canvas_hoehe_mm']
                 )
             )
-        
-        # SCHRITT 2: Sicherheitsrand hinzufügen
-        with_safety = self._add_safety_margin(canvas, dims)
 
-        # SCHRITT 3: Beschnittzugabe hinzufügen
-        with_bleed = self._add_bleed(with_safety, dims)
+        # SCHRITT 2+3: Sicherheitsrand + Beschnittzugabe
+        # CHANGED: Ein Ausgabebild, Canvas direkt an (Beschnitt + Sicherheitsrand) eingefügt
+        # (vorher je ein neues Bild für Sicherheitsrand, Beschnitt und Schneidelinien)
+        buffer, origin = self._new_buffer(isinstance(canvas, VectorCanvas), dims, final_size)
+        # Ausgabebild ist an dieser Stelle leer: ohne Maske kopieren (Kanten-Alpha bleibt erhalten)
+        buffer.paste(canvas, origin)
 
-        # CHANGED: Log-Ausgabe für rechteckige Zeichen
-        self.logger.info(
-            "Druckvorbereitung fertig: {}x{}px ({}×{}mm)".format(
-                with_bleed.width, with_bleed.height,
-                dims['datei_breite_mm'], dims['datei_hoehe_mm']
-            )
-        )
-        
         # SCHRITT 4: Schneidelinien (optional)
-        if draw_cut_lines:
-            with_bleed = self._draw_cut_lines(with_bleed, dims)
-        
-        # DPI-Metadaten
-        with_bleed.info['dpi'] = (dpi, dpi)
-        
-        return with_bleed
-    
-    def _add_safety_margin(self, canvas: Image.Image, dims: dict) -> Image.Image:
+        return self.finish_print_buffer(buffer, dims, draw_cut_lines, final_size, s1_border_x)
+
+    def create_print_buffer(
+        self,
+        vector: bool = False,
+        dpi: int = None,
+        zeichen_hoehe_mm: float = None,
+        zeichen_breite_mm: float = None,
+        sicherheitsabstand_mm: float = None,
+        beschnittzugabe_mm: float = None,
+        final_size: bool = False
+    ) -> Tuple[Image.Image, Tuple[int, int], dict]:
         """
-        Fuegt Sicherheitsrand hinzu (RECHTECKIGE Bilder unterstützt!)
+        Legt das druckfertige Ausgabebild an, damit Zeichen direkt hinein komponiert werden
 
-        Beispiel quadratisch: 39×39mm -> 45×45mm
-        Beispiel rechteckig: 28×32mm -> 28×32mm (mit rand=0)
+        NEW: create_zeichen() fügt Text-Template und Grafik direkt an canvas_origin ein,
+        statt ein eigenes Canvas anzulegen, das prepare_for_print() wieder kopiert.
+        Abschluss mit finish_print_buffer().
 
         Args:
-            canvas: Canvas (z.B. 39×39mm oder 28×32mm)
-            dims: Dimensions-Dict (mit separaten Höhen/Breiten)
+            vector: True = VectorCanvas (Vektor-PDF), sonst PIL Image im Farbmodus PNG_COLOR_MODE
+            dpi: Aufloesung
+            zeichen_hoehe_mm: Höhe des fertigen Zeichens (NACH Zuschnitt)
+            zeichen_breite_mm: Breite des fertigen Zeichens (NACH Zuschnitt)
+            sicherheitsabstand_mm: Sicherheitsabstand (Grafik/Text zum fertigen Rand)
+            beschnittzugabe_mm: Beschnittzugabe
+            final_size: True = fertige Größe ohne Beschnitt (Schnittbogen)
 
         Returns:
-            Image mit Sicherheitsrand (z.B. 45×45mm oder 28×32mm)
+            (Ausgabebild, canvas_origin (x, y) der Canvas-Fläche, dims)
         """
-        margin_px = dims['sicherheitsrand_px']
-        # CHANGED: Separate Werte für Höhe und Breite!
-        target_breite_px = dims['endgroesse_breite_px']
-        target_hoehe_px = dims['endgroesse_hoehe_px']
-
-        # CHANGED: Neues Image mit gleichem Farbmodus wie Canvas (RGBA fuer Transparenz)
-        bg_color = PNG_BACKGROUND_COLOR_TRANSPARENT if PNG_COLOR_MODE == PNG_COLOR_MODE_RGBA else BG_COLOR
-        with_margin = Image.new(PNG_COLOR_MODE, (target_breite_px, target_hoehe_px), bg_color)
-
-        # CHANGED: Canvas zentriert einfuegen mit Alpha-Maske bei RGBA
-        # Dies erhält die glatten Konturen (Anti-Aliasing)
-        if canvas.mode == 'RGBA':
-            with_margin.paste(canvas, (margin_px, margin_px), mask=canvas)
-        else:
-            with_margin.paste(canvas, (margin_px, margin_px))
+        dims = self._resolve_dimensions(
+            dpi, zeichen_hoehe_mm, zeichen_breite_mm, sicherheitsabstand_mm, beschnittzugabe_mm
+        )
+        buffer, origin = self._new_buffer(vector, dims, final_size)
+        return buffer, origin, dims
 
-        self.logger.debug(
-            "Sicherheitsrand: +{}mm ({}px) -> {}x{}px (B×H)".format(
-                dims['SICHERHEITSABSTAND_MM'], margin_px,
-                target_breite_px, target_hoehe_px
+    def finish_print_buffer(
+        self,
+        buffer: Image.Image,
+        dims: dict,
+        draw_cut_lines: bool = False,
+        final_size: bool = False,
+        s1_border_x: Optional[int] = None
+    ) -> Image.Image:
+        """
+        Schließt Ausgabebild ab: Schneidelinien (im selben Bild) und DPI-Metadaten
+
+        Args:
+            buffer: Ausgabebild aus create_print_buffer() bzw. prepare_for_print()
+            dims: Dimensions-Dict
+            draw_cut_lines: Schneidelinien
+            final_size: Ausgabebild in fertiger Größe (Linien im Beschnitt werden abgeschnitten)
+            s1_border_x: S1-Layout: Grenze Links/Rechts in Canvas-Pixeln (orange Trennlinie)
+
+        Returns:
+            buffer (druckfertig)
+        """
+        # CHANGED: Log-Ausgabe für rechteckige Zeichen
+        self.logger.info(
+            "Druckvorbereitung fertig{}: {}x{}px ({}×{}mm)".format(
+                " (fertige Größe)" if final_size else "",
+                buffer.width, buffer.height,
+                dims['endgroesse_breite_mm' if final_size else 'datei_breite_mm'],
+                dims['endgroesse_hoehe_mm' if final_size else 'datei_hoehe_mm']
             )
         )
 
-        return with_margin
-    
-    def _add_bleed(self, image: Image.Image, dims: dict) -> Image.Image:
+        if draw_cut_lines:
+            # NEW: Bei fertiger Größe um den Beschnitt verschoben zeichnen (PIL schneidet ab)
+            shift = -dims['beschnitt_px'] if final_size else 0
+            if isinstance(buffer, VectorCanvas):
+                _draw_cut_lines(get_draw(buffer), dims, shift, s1_border_x)
+            else:
+                # CHANGED: Vorgerenderte Ebene aus dem Cache statt pro Zeichen neu zeichnen
+                overlay = _get_cut_line_overlay(
+                    tuple(sorted(dims.items())), buffer.size, buffer.mode, shift, s1_border_x
+                )
+                overlay.apply(buffer)
+            self.logger.info("Schneidelinien eingefügt ({}px Breite)".format(CUT_LINE_WIDTH_PX))
+
+        # DPI-Metadaten
+        buffer.info['dpi'] = (dims['dpi'], dims['dpi'])
+
+        return buffer
+
+    def _resolve_dimensions(
+        self,
+        dpi: int,
+        zeichen_hoehe_mm: float,
+        zeichen_breite_mm: float,
+        sicherheitsabstand_mm: float,
+        beschnittzugabe_mm: float
+    ) -> dict:
+        """Dimensions-Dict, fehlende Werte aus RuntimeConfig"""
+        # RuntimeConfig-Defaults laden falls nicht angegeben
+        from runtime_config import get_config
+        config = get_config()
+        if dpi is None:
+            dpi = config.export_dpi
+        if zeichen_hoehe_mm is None:
+            zeichen_hoehe_mm = config.zeichen_hoehe_mm
+        if zeichen_breite_mm is None:
+            zeichen_breite_mm = config.zeichen_breite_mm
+        if sicherheitsabstand_mm is None:
+            sicherheitsabstand_mm = config.sicherheitsabstand_mm
+        if beschnittzugabe_mm is None:
+            beschnittzugabe_mm = config.beschnittzugabe_mm
+
+        # FIXED: Mit Config-Werten berechnen (rechteckige Zeichen!)
+        dims = calculate_print_dimensions(
+            dpi, zeichen_hoehe_mm, zeichen_breite_mm, sicherheitsabstand_mm, beschnittzugabe_mm
+        )
+        dims['dpi'] = dpi
+        return dims
+
+    def _new_buffer(self, vector: bool, dims: dict, final_size: bool) -> Tuple[Image.Image, Tuple[int, int]]:
         """
-        Fuegt Beschnittzugabe hinzu (RECHTECKIGE Bilder unterstützt!)
+        Neues Ausgabebild (Datei-Größe oder fertige Größe) mit Hintergrund
 
-        Beispiel quadratisch: 45×45mm -> 51×51mm
-        Beispiel rechteckig: 28×32mm -> 34×38mm
+        Beispiel quadratisch: 39×39mm Canvas -> 51×51mm (bzw. 45×45mm bei final_size)
+        Beispiel rechteckig: 28×32mm Canvas, rand=0 -> 34×38mm (bzw. 28×32mm)
 
         Args:
-            image: Image mit Endgröße (z.B. 45×45mm oder 28×32mm)
+            vector: True = VectorCanvas statt PIL Image
             dims: Dimensions-Dict (mit separaten Höhen/Breiten)
+            final_size: True = ohne Beschnitt
 
         Returns:
-            Image mit Beschnitt (z.B. 51×51mm oder 34×38mm)
+            (Ausgabebild, Position der Canvas-Fläche)
         """
-        bleed_px = dims['beschnitt_px']
-        # CHANGED: Separate Werte für Höhe und Breite!
-        target_breite_px = dims['datei_breite_px']
-        target_hoehe_px = dims['datei_hoehe_px']
-
-        # CHANGED: Neues Image mit gleichem Farbmodus wie Canvas (RGBA fuer Transparenz)
-        bg_color = PNG_BACKGROUND_COLOR_TRANSPARENT if PNG_COLOR_MODE == PNG_COLOR_MODE_RGBA else BG_COLOR
-        with_bleed = Image.new(PNG_COLOR_MODE, (target_breite_px, target_hoehe_px), bg_color)
-
-        # CHANGED: Image zentriert einfuegen mit Alpha-Maske bei RGBA
-        # Dies erhält die glatten Konturen (Anti-Aliasing)
-        if image.mode == 'RGBA':
-            with_bleed.paste(image, (bleed_px, bleed_px), mask=image)
+        margin_px = dims['sicherheitsrand_px']
+        if final_size:
+            size = (dims['endgroesse_breite_px'], dims['endgroesse_hoehe_px'])
+        else:
+            size = (dims['datei_breite_px'], dims['datei_hoehe_px'])
+            margin_px += dims['beschnitt_px']
+
+        # CHANGED: Farbmodus wie Canvas (RGBA fuer Transparenz), VectorCanvas für Vektor-PDF
+        if vector:
+            buffer = VectorCanvas(*size)
         else:
-            with_bleed.paste(image, (bleed_px, bleed_px))
+            bg_color = PNG_BACKGROUND_COLOR_TRANSPARENT if PNG_COLOR_MODE == PNG_COLOR_MODE_RGBA else BG_COLOR
+            buffer = Image.new(PNG_COLOR_MODE, size, bg_color)
 
         self.logger.debug(
-            "Beschnittzugabe: +{}mm ({}px) -> {}x{}px (B×H)".format(
-                dims['BESCHNITTZUGABE_MM'], bleed_px,
-                target_breite_px, target_hoehe_px
+            "Ausgabebild: {}x{}px (B×H), Canvas bei +{}px (Sicherheitsrand{})".format(
+                size[0], size[1], margin_px, "" if final_size else " + Beschnitt"
             )
         )
+        return buffer, (margin_px, margin_px)
 
-        return with_bleed
-    
-    def _draw_cut_lines(self, image: Image.Image, dims: dict) -> Image.Image:
-        """
-        Zeichnet Schneidelinien (RECHTECKIGE Bilder unterstützt!)
 
-        ROT: Beschnittkante (z.B. 51×51mm oder 34×38mm)
-        BLAU: Schneidelinie (z.B. 45×45mm oder 28×32mm)
-        GRUEN: Sicherheitsbereich (z.B. 39×39mm oder 28×32mm)
+@lru_cache(maxsize=None)
+def _label_font(size: int):
+    """
+    Font für Schneidelinien-Labels (einmal pro Prozess und Größe aufgelöst)
 
-        Args:
-            image: Image mit Beschnitt (rechteckig möglich!)
-            dims: Dimensions-Dict (mit separaten Höhen/Breiten)
+    Args:
+        size: Schriftgröße
 
-        Returns:
-            Image mit Schneidelinien
+    Returns:
+        FreeTypeFont (Arial) oder PIL-Standardfont
+    """
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except Exception:
+        try:
+            return ImageFont.truetype("C:/Windows/Fonts/arial.ttf", size)
+        except Exception:
+            return ImageFont.load_default()
+
+
+class CutLineOverlay:
+    """
+    Vorgerenderte Schneidelinien-Ebene (nur Bereiche mit Linien/Labels)
+
+    Die Ebene wird einmal auf transparentem Hintergrund gezeichnet - das ergibt
+    vormultipliziertes Alpha (RGBa). Für das Einfügen werden die Farben daraus
+    zurückgerechnet; paste() mit Alpha-Maske ergibt dann dasselbe wie das
+    Zeichnen auf dem Zeichen (bis auf Rundung der Label-Kanten).
+    Gespeichert werden nur Kachelzeilen mit Inhalt, Zeilen mit gleichen
+    Spalten-Bereichen sind zusammengefasst (Ränder statt ganzer Fläche).
+    """
+
+    TILE_PX = 8
+
+    def __init__(self, size: Tuple[int, int], mode: str, draw_func: Callable):
         """
-        img_with_lines = image.copy()
-        draw = ImageDraw.Draw(img_with_lines)
+        Zeichnet und zerlegt die Ebene
 
-        beschnitt_px = dims['beschnitt_px']
-        sicherheit_px = dims['sicherheitsrand_px']
+        Args:
+            size: Bildgröße (Breite, Höhe)
+            mode: Modus des Zielbilds ("RGB" oder "RGBA")
+            draw_func: draw_func(ImageDraw) zeichnet Linien und Labels
+        """
+        layer = Image.new("RGBA", size, (0, 0, 0, 0))
+        draw_func(ImageDraw.Draw(layer))
+
+        # Vormultipliziert -> Farben ohne Alpha (deckend im Zielmodus) + Alpha-Maske
+        alpha = layer.getchannel("A")
+        color = Image.frombytes("RGBa", size, layer.tobytes()).convert("RGBA")
+        color.putalpha(255)
+        color = color.convert(mode)
+
+        self.regions = [
+            (box, color.crop(box), alpha.crop(box)) for box in self._content_boxes(alpha)
+        ]
+        self.pixels = sum((x1 - x0) * (y1 - y0) for (x0, y0, x1, y1), _, _ in self.regions)
+
+    @classmethod
+    def _content_boxes(cls, alpha: Image.Image) -> List[Tuple[int, int, int, int]]:
+        """Rechtecke mit Inhalt (zeilenweise Kachel-Bereiche, gleiche Zeilen zusammengefasst)"""
+        width, height = alpha.size
+        tile = cls.TILE_PX
+
+        # Ein Pixel pro Kachel: > 0, wenn irgendein Pixel der Kachel sichtbar ist
+        tiles = alpha.point(lambda value: 255 if value else 0).reduce(tile)
+        tiles_w, tiles_h = tiles.size
+        occupied = tiles.tobytes()
+
+        rows = []  # (y0, y1, [(x0, x1), ...])
+        for ty in range(tiles_h):
+            y0, y1 = ty * tile, min(height, (ty + 1) * tile)
+            spans = []
+            for tx in range(tiles_w):
+                if not occupied[ty * tiles_w + tx]:
+                    continue
+                x0, x1 = tx * tile, min(width, (tx + 1) * tile)
+                if spans and spans[-1][1] == x0:
+                    spans[-1] = (spans[-1][0], x1)
+                else:
+                    spans.append((x0, x1))
+            if rows and rows[-1][2] == spans and rows[-1][1] == y0:
+                rows[-1] = (rows[-1][0], y1, spans)
+            else:
+                rows.append((y0, y1, spans))
+
+        return [(x0, y0, x1, y1) for y0, y1, spans in rows for x0, x1 in spans]
+
+    def apply(self, image: Image.Image):
+        """Fügt Ebene in image ein (ein paste() pro Bereich)"""
+        for box, color, alpha in self.regions:
+            image.paste(color, box[:2], alpha)
+
+
+@lru_cache(maxsize=32)
+def _get_cut_line_overlay(
+    dims_key: tuple,
+    size: Tuple[int, int],
+    mode: str,
+    shift: int,
+    s1_border_x: Optional[int]
+) -> CutLineOverlay:
+    """
+    Schneidelinien-Ebene aus dem Cache (eine pro Druckmaß, DPI, Versatz und S1-Grenze)
 
-        self.logger.info("Zeichne Schneidelinien ({}px Breite)".format(CUT_LINE_WIDTH_PX))
+    Args:
+        dims_key: tuple(sorted(dims.items())) aus calculate_print_dimensions()
+        size: Größe des Ausgabebilds
+        mode: Modus des Ausgabebilds
+        shift: Versatz (-beschnitt_px bei fertiger Größe)
+        s1_border_x: S1-Grenze in Canvas-Pixeln oder None
 
-        # Font - skaliert mit DPI für bessere Lesbarkeit bei niedrigen Auflösungen
-        # Bei 600 DPI: 24pt (Standard)
-        # Bei 100 DPI: 4pt (min: 8pt) → lesbar
-        dpi = dims.get('dpi', 600)
-        scaled_font_size = max(8, int(CUT_LINE_LABEL_FONT_SIZE * dpi / 600))
-        try:
-            label_font = ImageFont.truetype("arial.ttf", scaled_font_size)
-        except Exception:
-            try:
-                label_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", scaled_font_size)
-            except Exception:
-                label_font = ImageFont.load_default()
-
-        # ROT: Beschnittkante (aeusserster Rand)
-        draw.rectangle(
-            [(CUT_LINE_WIDTH_PX, CUT_LINE_WIDTH_PX),
-             (image.width - CUT_LINE_WIDTH_PX, image.height - CUT_LINE_WIDTH_PX)],
-            outline=CUT_LINE_COLOR_BESCHNITT,
-            width=CUT_LINE_WIDTH_PX
-        )
-        # CHANGED: Label mit Breite×Höhe für rechteckige Zeichen
-        # Label außen mit Standard-Offset
-        draw.text(
-            (CUT_LINE_LABEL_OFFSET_PX, CUT_LINE_LABEL_OFFSET_PX),
-            "BESCHNITT ({:.1f}x{:.1f}mm)".format(
-                dims['datei_breite_mm'], dims['datei_hoehe_mm']
-            ),
-            fill=CUT_LINE_COLOR_BESCHNITT,
-            font=label_font,
-            stroke_width=CUT_LINE_LABEL_STROKE_WIDTH,
-            stroke_fill=CUT_LINE_LABEL_STROKE_COLOR
+    Returns:
+        CutLineOverlay
+    """
+    dims = dict(dims_key)
+    overlay = CutLineOverlay(size, mode, lambda draw: _draw_cut_lines(draw, dims, shift, s1_border_x))
+    logging.getLogger(__name__).info(
+        "Schneidelinien-Ebene erstellt: {}x{}px, {} Bereiche ({:.0f}% der Fläche)".format(
+            size[0], size[1], len(overlay.regions), 100.0 * overlay.pixels / (size[0] * size[1])
         )
+    )
+    return overlay
 
-        # BLAU: Schneidelinie (endgroesse)
-        cut_offset = beschnitt_px
-        draw.rectangle(
-            [(cut_offset, cut_offset),
-             (image.width - cut_offset, image.height - cut_offset)],
-            outline=CUT_LINE_COLOR_SCHNITT,
-            width=CUT_LINE_WIDTH_PX
-        )
-        # CHANGED: Label näher an blauer Linie (kleiner Offset)
-        inner_label_offset = 10  # Kleinerer Offset für innere Labels
-        draw.text(
-            (cut_offset + inner_label_offset, cut_offset + inner_label_offset),
-            "SCHNITT ({:.1f}x{:.1f}mm)".format(
-                dims['endgroesse_breite_mm'], dims['endgroesse_hoehe_mm']
-            ),
-            fill=CUT_LINE_COLOR_SCHNITT,
-            font=label_font,
-            stroke_width=CUT_LINE_LABEL_STROKE_WIDTH,
-            stroke_fill=CUT_LINE_LABEL_STROKE_COLOR
-        )
 
-        # GRUEN: Sicherheitsbereich (Canvas-Größe)
-        safety_offset = beschnitt_px + sicherheit_px
-        draw.rectangle(
-            [(safety_offset, safety_offset),
-             (image.width - safety_offset, image.height - safety_offset)],
-            outline=CUT_LINE_COLOR_SICHERHEIT,
+def _draw_cut_lines(draw, dims: dict, shift: int = 0, s1_border_x: Optional[int] = None):
+    """
+    Zeichnet Schneidelinien (RECHTECKIGE Bilder unterstützt!)
+
+    ROT: Beschnittkante (z.B. 51×51mm oder 34×38mm)
+    BLAU: Schneidelinie (z.B. 45×45mm oder 28×32mm)
+    GRUEN: Sicherheitsbereich (z.B. 39×39mm oder 28×32mm)
+
+    ORANGE: S1-Trennlinie Links/Rechts (optional)
+
+    CHANGED: Modulfunktion - zeichnet in eine Cache-Ebene (PIL) oder direkt (VectorCanvas)
+
+    Args:
+        draw: ImageDraw der Ebene oder VectorCanvas
+        dims: Dimensions-Dict (mit separaten Höhen/Breiten)
+        shift: Versatz aller Linien/Labels in px (-beschnitt_px bei Bild in fertiger Größe)
+        s1_border_x: S1-Grenze Links/Rechts in Canvas-Pixeln (None = keine Trennlinie)
+    """
+
+    # Linien beziehen sich immer auf die Datei-Größe mit Beschnitt
+    datei_breite_px = dims['datei_breite_px']
+    datei_hoehe_px = dims['datei_hoehe_px']
+
+    def at(x, y):
+        return (x + shift, y + shift)
+
+    beschnitt_px = dims['beschnitt_px']
+    sicherheit_px = dims['sicherheitsrand_px']
+
+    # Font - skaliert mit DPI für bessere Lesbarkeit bei niedrigen Auflösungen
+    # Bei 600 DPI: 24pt (Standard)
+    # Bei 100 DPI: 4pt (min: 8pt) → lesbar
+    # CHANGED: Font einmal pro Prozess und Größe aufgelöst (_label_font)
+    dpi = dims.get('dpi', 600)
+    label_font = _label_font(max(8, int(CUT_LINE_LABEL_FONT_SIZE * dpi / 600)))
+
+    # ORANGE: S1-Trennlinie (vorher auf dem Canvas gezeichnet: unter den Schneidelinien,
+    # auf die Canvas-Höhe begrenzt)
+    if s1_border_x is not None:
+        canvas_origin = dims['beschnitt_px'] + sicherheit_px
+        draw.line(
+            [at(canvas_origin + s1_border_x, canvas_origin),
+             at(canvas_origin + s1_border_x, canvas_origin + dims['canvas_hoehe_px'] - 1)],
+            fill=CUT_LINE_COLOR_S1_BORDER,
             width=CUT_LINE_WIDTH_PX
         )
-        # CHANGED: Label näher an grüner Linie (kleiner Offset)
-        draw.text(
-            (safety_offset + inner_label_offset, safety_offset + inner_label_offset),
-            "CANVAS ({:.1f}x{:.1f}mm)".format(
-                dims['canvas_breite_mm'], dims['canvas_hoehe_mm']
-            ),
-            fill=CUT_LINE_COLOR_SICHERHEIT,
-            font=label_font,
-            stroke_width=CUT_LINE_LABEL_STROKE_WIDTH,
-            stroke_fill=CUT_LINE_LABEL_STROKE_COLOR
-        )
 
-        self.logger.info("Alle Schneidelinien gezeichnet")
+    # ROT: Beschnittkante (aeusserster Rand)
+    draw.rectangle(
+        [at(CUT_LINE_WIDTH_PX, CUT_LINE_WIDTH_PX),
+         at(datei_breite_px - CUT_LINE_WIDTH_PX, datei_hoehe_px - CUT_LINE_WIDTH_PX)],
+        outline=CUT_LINE_COLOR_BESCHNITT,
+        width=CUT_LINE_WIDTH_PX
+    )
+    # CHANGED: Label mit Breite×Höhe für rechteckige Zeichen
+    # Label außen mit Standard-Offset
+    draw.text(
+        at(CUT_LINE_LABEL_OFFSET_PX, CUT_LINE_LABEL_OFFSET_PX),
+        "BESCHNITT ({:.1f}x{:.1f}mm)".format(
+            dims['datei_breite_mm'], dims['datei_hoehe_mm']
+        ),
+        fill=CUT_LINE_COLOR_BESCHNITT,
+        font=label_font,
+        stroke_width=CUT_LINE_LABEL_STROKE_WIDTH,
+        stroke_fill=CUT_LINE_LABEL_STROKE_COLOR
+    )
 
-        return img_with_lines
+    # BLAU: Schneidelinie (endgroesse)
+    cut_offset = beschnitt_px
+    draw.rectangle(
+        [at(cut_offset, cut_offset),
+         at(datei_breite_px - cut_offset, datei_hoehe_px - cut_offset)],
+        outline=CUT_LINE_COLOR_SCHNITT,
+        width=CUT_LINE_WIDTH_PX
+    )
+    # CHANGED: Label näher an blauer Linie (kleiner Offset)
+    inner_label_offset = 10  # Kleinerer Offset für innere Labels
+    draw.text(
+        at(cut_offset + inner_label_offset, cut_offset + inner_label_offset),
+        "SCHNITT ({:.1f}x{:.1f}mm)".format(
+            dims['endgroesse_breite_mm'], dims['endgroesse_hoehe_mm']
+        ),
+        fill=CUT_LINE_COLOR_SCHNITT,
+        font=label_font,
+        stroke_width=CUT_LINE_LABEL_STROKE_WIDTH,
+        stroke_fill=CUT_LINE_LABEL_STROKE_COLOR
+    )
+
+    # GRUEN: Sicherheitsbereich (Canvas-Größe)
+    safety_offset = beschnitt_px + sicherheit_px
+    draw.rectangle(
+        [at(safety_offset, safety_offset),
+         at(datei_breite_px - safety_offset, datei_hoehe_px - safety_offset)],
+        outline=CUT_LINE_COLOR_SICHERHEIT,
+        width=CUT_LINE_WIDTH_PX
+    )
+    # CHANGED: Label näher an grüner Linie (kleiner Offset)
+    draw.text(
+        at(safety_offset + inner_label_offset, safety_offset + inner_label_offset),
+        "CANVAS ({:.1f}x{:.1f}mm)".format(
+            dims['canvas_breite_mm'], dims['canvas_hoehe_mm']
+        ),
+        fill=CUT_LINE_COLOR_SICHERHEIT,
+        font=label_font,
+        stroke_width=CUT_LINE_LABEL_STROKE_WIDTH,
+        stroke_fill=CUT_LINE_LABEL_STROKE_COLOR
+    )
 
 
 # REMOVED: prepare_image_for_print() - ungenutzte Wrapper-Funktion (siehe cleanup)
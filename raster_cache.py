@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+raster_cache.py - Persistenter Raster-Cache für gerenderte SVG-Grafiken
+
+Speichert fertig gerenderte (getrimmte + skalierte) SVG-Grafiken auf der Festplatte,
+damit wiederholte Exporte derselben Zeichen-Bibliothek ImageMagick nicht erneut
+aufrufen müssen.
+
+Features:
+- Inhalts-adressiert: Schlüssel = SHA-256 des SVG-Inhalts + Render-Parameter + Renderer
+- Größenbudget mit LRU-Verdrängung (Zugriffszeit = Datei-mtime)
+- Atomare Schreibvorgänge (Temp-Datei + os.replace)
+- Beschädigte Einträge werden erkannt, gelöscht und als Miss behandelt
+- Thread-safe
+
+Verwendung:
+    cache = RasterCache()
+    key = cache.make_key(svg_path, dpi, max_height_mm, max_width_mm, render_scale)
+    image = cache.get(key)
+    if image is None:
+        image = render(...)
+        cache.put(key, image)
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional
+
+from PIL import Image
+
+from logging_manager import LoggingManager
+from svg_source import get_svg_source
+from constants import (
+    SYSTEM_RASTER_CACHE_DIR,
+    SYSTEM_RASTER_CACHE_VERSION,
+    SYSTEM_RASTER_CACHE_COMPRESS_LEVEL,
+    RESAMPLING_FILTER
+)
+
+
+class RasterCache:
+    """
+    Persistenter, inhalts-adressierter Cache für gerenderte SVG-Raster
+
+    Jeder Eintrag ist eine PNG-Datei <schluessel>.png im Cache-Verzeichnis.
+    Die Datei-mtime dient als LRU-Zeitstempel (wird bei jedem Treffer aktualisiert).
+    """
+
+    FILE_SUFFIX = ".png"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_mb: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Initialisiert Raster-Cache
+
+        Args:
+            cache_dir: Cache-Verzeichnis (default: SYSTEM_RASTER_CACHE_DIR)
+            max_size_mb: Größenbudget in MB (default: aus RuntimeConfig)
+            enabled: Cache aktiv (default: aus RuntimeConfig)
+        """
+        self.logger = LoggingManager().get_logger(__name__)
+
+        if max_size_mb is None or enabled is None:
+            from runtime_config import get_config
+            config = get_config()
+            if max_size_mb is None:
+                max_size_mb = config.raster_cache_max_mb
+            if enabled is None:
+                enabled = config.raster_cache_enabled
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else SYSTEM_RASTER_CACHE_DIR
+        self.max_size_bytes = int(max_size_mb) * 1024 * 1024
+        self.enabled = bool(enabled) and self.max_size_bytes > 0
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = Lock()
+        self._total_bytes = 0
+
+        if self.enabled:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._total_bytes = sum(size for _, size, _ in self._scan_entries())
+                self.logger.debug(
+                    f"Raster-Cache aktiv: {self.cache_dir} "
+                    f"({self._total_bytes / 1024 / 1024:.1f} / {max_size_mb} MB)"
+                )
+            except OSError as e:
+                self.logger.warning(f"Raster-Cache deaktiviert (Verzeichnis nicht nutzbar): {e}")
+                self.enabled = False
+
+    def content_hash(self, svg_path: Path) -> Optional[str]:
+        """
+        Liefert SHA-256 des SVG-Inhalts
+
+        CHANGED: Nutzt den Digest des prozessweiten SvgSource-Caches statt die
+        Datei ein zweites Mal zu lesen und separat zu memoisieren.
+
+        Args:
+            svg_path: Pfad zur SVG-Datei
+
+        Returns:
+            Hex-Digest oder None wenn Datei nicht lesbar
+        """
+        source = get_svg_source(svg_path)
+        return source.digest if source is not None else None
+
+    def make_key(
+        self,
+        svg_path: Path,
+        dpi: int,
+        max_height_mm: float,
+        max_width_mm: float,
+        render_scale: float,
+        engine: str = ""
+    ) -> Optional[str]:
+        """
+        Erzeugt Cache-Schlüssel für einen Render-Auftrag
+
+        Args:
+            svg_path: Pfad zur SVG-Datei
+            dpi: Ziel-DPI
+            max_height_mm: Maximale Grafik-Höhe in mm
+            max_width_mm: Maximale Grafik-Breite in mm
+            render_scale: Render-Skalierung
+            engine: SVG-Renderer (unterschiedliche Renderer = unterschiedliche Pixel)
+
+        Returns:
+            Schlüssel (Hex-String) oder None wenn Cache inaktiv / SVG nicht lesbar
+        """
+        if not self.enabled:
+            return None
+
+        digest = self.content_hash(svg_path)
+        if digest is None:
+            return None
+
+        # Box auf 1/1000 mm runden - Float-Rauschen darf keinen Miss erzeugen
+        params = "v{}|{}|{}|{:.3f}x{:.3f}|{:.3f}|{}|{}".format(
+            SYSTEM_RASTER_CACHE_VERSION, digest, int(dpi),
+            max_width_mm, max_height_mm, render_scale, RESAMPLING_FILTER, engine
+        )
+        return hashlib.sha256(params.encode('ascii')).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[Image.Image]:
+        """
+        Liest Eintrag aus dem Cache
+
+        Args:
+            key: Schlüssel aus make_key()
+
+        Returns:
+            PIL Image (vollständig geladen) oder None bei Miss
+        """
+        if key is None:
+            return None
+
+        entry = self._entry_path(key)
+        try:
+            with Image.open(entry) as img:
+                img.load()
+                image = img.copy()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception as e:
+            # Beschädigter Eintrag (z.B. Absturz während Schreiben auf Fremdsystem)
+            self.logger.warning(f"Beschädigter Cache-Eintrag verworfen: {entry.name} ({e})")
+            self._remove_entry(entry)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # LRU: Zugriffszeit aktualisieren
+        try:
+            os.utime(entry, None)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+        return image
+
+    def put(self, key: Optional[str], image: Image.Image):
+        """
+        Schreibt Eintrag atomar in den Cache
+
+        Args:
+            key: Schlüssel aus make_key()
+            image: Gerendertes PIL Image
+        """
+        if key is None:
+            return
+
+        entry = self._entry_path(key)
+        temp_path = None
+        try:
+            # Temp-Datei im selben Verzeichnis -> os.replace ist atomar
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=str(self.cache_dir), prefix=".tmp_", suffix=self.FILE_SUFFIX
+            )
+            with os.fdopen(temp_fd, 'wb') as f:
+                image.save(f, format='PNG', compress_level=SYSTEM_RASTER_CACHE_COMPRESS_LEVEL)
+                f.flush()
+                os.fsync(f.fileno())
+
+            old_size = entry.stat().st_size if entry.exists() else 0
+            os.replace(temp_path, entry)
+            temp_path = None
+
+            new_size = entry.stat().st_size
+            with self._lock:
+                self._total_bytes += new_size - old_size
+                over_budget = self._total_bytes > self.max_size_bytes
+
+            if over_budget:
+                self._evict()
+
+        except Exception as e:
+            self.logger.warning(f"Cache-Eintrag konnte nicht geschrieben werden: {e}")
+        finally:
+            if temp_path is not None:
+                self._remove_entry(Path(temp_path))
+
+    def clear(self):
+        """Löscht alle Cache-Einträge"""
+        for entry, _, _ in self._scan_entries():
+            self._remove_entry(entry)
+        with self._lock:
+            self._total_bytes = 0
+        self.logger.info("Raster-Cache geleert")
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Gibt Cache-Statistik zurück
+
+        Returns:
+            dict: hits, misses, size_mb, max_mb
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size_mb': self._total_bytes / 1024 / 1024,
+                'max_mb': self.max_size_bytes / 1024 / 1024
+            }
+
+    def _entry_path(self, key: str) -> Path:
+        """Pfad der Cache-Datei für Schlüssel"""
+        return self.cache_dir / (key + self.FILE_SUFFIX)
+
+    def _scan_entries(self):
+        """
+        Listet alle Cache-Einträge
+
+        Returns:
+            Liste von (Pfad, Größe in Bytes, mtime)
+        """
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for entry in self.cache_dir.glob("*" + self.FILE_SUFFIX):
+            if entry.name.startswith(".tmp_"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self):
+        """Verdrängt älteste Einträge bis Budget eingehalten ist (Ziel: 90% des Budgets)"""
+        target = int(self.max_size_bytes * 0.9)
+        entries = sorted(self._scan_entries(), key=lambda e: e[2])
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for entry, size, _ in entries:
+            if total <= target:
+                break
+            if self._remove_entry(entry):
+                total -= size
+                removed += 1
+
+        with self._lock:
+            self._total_bytes = total
+
+        self.logger.debug(
+            f"Raster-Cache: {removed} Einträge verdrängt ({total / 1024 / 1024:.1f} MB verbleibend)"
+        )
+
+    def _remove_entry(self, entry: Path) -> bool:
+        """Löscht Cache-Datei (Fehler werden ignoriert)"""
+        try:
+            entry.unlink()
+            return True
+        except OSError:
+            return False
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("RASTER-CACHE TEST")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        svg = tmp_dir / "test.svg"
+        svg.write_text('<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>')
+
+        cache = RasterCache(cache_dir=tmp_dir / "cache", max_size_mb=1, enabled=True)
+        key = cache.make_key(svg, 300, 30.0, 30.0, 2.0)
+
+        print(f"\n[TEST 1] Miss: {cache.get(key) is None}")
+
+        cache.put(key, Image.new('RGBA', (100, 100), (255, 0, 0, 128)))
+        hit = cache.get(key)
+        print(f"[TEST 2] Hit: {hit is not None and hit.size == (100, 100)}")
+
+        other_key = cache.make_key(svg, 600, 30.0, 30.0, 2.0)
+        print(f"[TEST 3] DPI im Schlüssel: {key != other_key}")
+
+        print(f"[TEST 4] Statistik: {cache.get_stats()}")
+
+    print("\n" + "=" * 80)
+    print("[OK] Alle Tests abgeschlossen")
+    print("=" * 80)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+render_pool.py - Prozess-Pool für SVG-Rasterisierung
+
+Wand/ImageMagick und große PIL-Operationen skalieren mit Threads schlecht
+(GIL + interne ImageMagick-Locks). Der Prozess-Pool verteilt das Rendern
+auf langlebige Worker-Prozesse:
+
+- Jeder Worker lädt die SVG-Renderer genau einmal (Initializer)
+- Worker bleiben für die gesamte Batch-Laufzeit bestehen
+- Raster werden als Rohdaten (mode, size, bytes) zurückgegeben,
+  kein PNG-Encode/Decode zwischen den Prozessen
+
+Verwendung:
+    pool = RenderProcessPool(num_workers=8)
+    image = pool.render(svg_path, max_height_mm, max_width_mm, dpi, render_scale)
+    pool.shutdown()
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image
+
+from logging_manager import LoggingManager
+
+
+# Worker-lokale Renderer-Kette (wird pro Prozess einmal im Initializer erzeugt)
+_worker_renderer = None
+
+
+def _init_worker(config_values: Dict[str, Any]):
+    """
+    Initialisiert Worker-Prozess
+
+    CHANGED: Nur die SVG-Renderer-Kette statt eines vollständigen Generators
+    (Raster-Cache, Templates und Text-Overlay bleiben im Elternprozess).
+
+    Args:
+        config_values: RuntimeConfig.to_dict() des Elternprozesses
+    """
+    global _worker_renderer
+
+    from runtime_config import get_config
+    config = get_config()
+    for key, value in config_values.items():
+        setattr(config, key, Path(value) if key == 'zeichen_dir' else value)
+
+    from svg_renderer import SVGRendererChain
+
+    _worker_renderer = SVGRendererChain(config.render_engine)
+
+
+def _render_in_worker(
+    svg_path: str,
+    max_height_mm: float,
+    max_width_mm: float,
+    dpi: int,
+    render_scale: float,
+    engine: str
+) -> Tuple[str, Tuple[int, int], bytes]:
+    """
+    Rendert SVG im Worker-Prozess
+
+    Args:
+        engine: SVG-Renderer des Elternprozesses (Worker lesen keine Laufzeit-Änderungen)
+
+    Returns:
+        Tuple (mode, size, raw_bytes) - günstig zu übertragen
+    """
+    global _worker_renderer
+
+    if _worker_renderer.engine != engine:
+        from svg_renderer import SVGRendererChain
+        _worker_renderer = SVGRendererChain(engine)
+
+    image = _worker_renderer.render(Path(svg_path), max_height_mm, max_width_mm, dpi, render_scale)
+    return image.mode, image.size, image.tobytes()
+
+
+class RenderProcessPool:
+    """
+    Langlebiger Prozess-Pool für SVG-Rasterisierung
+
+    Thread-safe: Mehrere Threads können gleichzeitig render() aufrufen,
+    jeder Aufruf belegt einen Worker-Prozess.
+    """
+
+    def __init__(self, num_workers: Optional[int] = None):
+        """
+        Startet Prozess-Pool
+
+        Args:
+            num_workers: Anzahl Worker-Prozesse (default: Anzahl CPU-Kerne)
+        """
+        from runtime_config import get_config
+
+        self.logger = LoggingManager().get_logger(__name__)
+
+        if num_workers is None or num_workers < 1:
+            num_workers = os.cpu_count() or 1
+
+        self.num_workers = num_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(get_config().to_dict(),)
+        )
+
+        self.logger.info(f"Render-Prozess-Pool gestartet: {num_workers} Worker")
+
+    def submit(
+        self,
+        svg_path: Path,
+        max_height_mm: float,
+        max_width_mm: float,
+        dpi: int,
+        render_scale: float = 1.0,
+        engine: Optional[str] = None
+    ) -> Future:
+        """
+        Reicht Render-Auftrag ein (asynchron)
+
+        Args:
+            engine: SVG-Renderer (default: aus RuntimeConfig)
+
+        Returns:
+            Future mit Rohdaten-Tupel, siehe to_image()
+        """
+        if engine is None:
+            from runtime_config import get_config
+            engine = get_config().render_engine
+
+        return self._executor.submit(
+            _render_in_worker, str(svg_path), max_height_mm, max_width_mm, dpi, render_scale, engine
+        )
+
+    def render(
+        self,
+        svg_path: Path,
+        max_height_mm: float,
+        max_width_mm: float,
+        dpi: int,
+        render_scale: float = 1.0,
+        engine: Optional[str] = None
+    ) -> Image.Image:
+        """
+        Rendert SVG in einem Worker-Prozess (blockierend)
+
+        Args:
+            svg_path: Pfad zur SVG-Datei
+            max_height_mm: Maximale Grafik-Höhe in mm
+            max_width_mm: Maximale Grafik-Breite in mm
+            dpi: Ziel-DPI
+            render_scale: Render-Skalierung
+            engine: SVG-Renderer (default: aus RuntimeConfig)
+
+        Returns:
+            PIL Image
+        """
+        future = self.submit(svg_path, max_height_mm, max_width_mm, dpi, render_scale, engine)
+        return self.to_image(future.result())
+
+    @staticmethod
+    def to_image(raw: Tuple[str, Tuple[int, int], bytes]) -> Image.Image:
+        """
+        Baut PIL Image aus Worker-Rohdaten
+
+        Args:
+            raw: (mode, size, bytes) aus dem Worker
+
+        Returns:
+            PIL Image
+        """
+        mode, size, data = raw
+        return Image.frombytes(mode, size, data)
+
+    def shutdown(self):
+        """Beendet alle Worker-Prozesse"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.logger.info("Render-Prozess-Pool beendet")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
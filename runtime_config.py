@@ -102,7 +102,25 @@ class RuntimeConfig:
             DEFAULT_S1_ZEICHEN_HOEHE_MM,
             DEFAULT_S1_ZEICHEN_BREITE_MM,
             DEFAULT_S1_BESCHNITTZUGABE_MM,
-            DEFAULT_S1_SICHERHEITSABSTAND_MM
+            DEFAULT_S1_SICHERHEITSABSTAND_MM,
+            # NEW: Performance Defaults
+            DEFAULT_RASTER_CACHE_ENABLED,
+            DEFAULT_RASTER_CACHE_MAX_MB,
+            DEFAULT_RENDER_BACKEND,
+            DEFAULT_RENDER_ENGINE,
+            DEFAULT_TEMPLATE_CACHE_SCOPE,
+            DEFAULT_TEMPLATE_CACHE_MAX_MB,
+            DEFAULT_BATCH_ENGINE,
+            DEFAULT_PIPELINE_QUEUE_DEPTH,
+            DEFAULT_MEMORY_BUDGET_MB,
+            DEFAULT_PDF_IMAGE_CODEC,
+            DEFAULT_PDF_FLATE_LEVEL,
+            DEFAULT_PDF_JPEG_QUALITY,
+            DEFAULT_PDF_EXPORT_MODE,
+            DEFAULT_PDF_FILE_WORKERS,
+            DEFAULT_PDF_SINGLE_FILE,
+            DEFAULT_PDF_CHUNK_SIZE,
+            DEFAULT_PDF_CHUNK_SIZE_SCHNITTBOGEN
         )
 
         # Zeichen-Parameter
@@ -151,6 +169,25 @@ class RuntimeConfig:
         self.s1_anzahl_schreiblinien: int = DEFAULT_S1_ANZAHL_SCHREIBLINIEN
         self.s1_staerke_anzeigen: bool = DEFAULT_S1_STAERKE_ANZEIGEN
 
+        # NEW: Performance-Parameter
+        self.raster_cache_enabled: bool = DEFAULT_RASTER_CACHE_ENABLED
+        self.raster_cache_max_mb: int = DEFAULT_RASTER_CACHE_MAX_MB
+        self.render_backend: str = DEFAULT_RENDER_BACKEND
+        self.render_engine: str = DEFAULT_RENDER_ENGINE
+        self.template_cache_scope: str = DEFAULT_TEMPLATE_CACHE_SCOPE
+        self.template_cache_max_mb: int = DEFAULT_TEMPLATE_CACHE_MAX_MB
+        self.batch_engine: str = DEFAULT_BATCH_ENGINE
+        self.pipeline_queue_depth: int = DEFAULT_PIPELINE_QUEUE_DEPTH
+        self.memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB
+        self.pdf_image_codec: str = DEFAULT_PDF_IMAGE_CODEC
+        self.pdf_flate_level: int = DEFAULT_PDF_FLATE_LEVEL
+        self.pdf_jpeg_quality: int = DEFAULT_PDF_JPEG_QUALITY
+        self.pdf_export_mode: str = DEFAULT_PDF_EXPORT_MODE
+        self.pdf_file_workers: int = DEFAULT_PDF_FILE_WORKERS
+        self.pdf_single_file: bool = DEFAULT_PDF_SINGLE_FILE
+        self.pdf_chunk_size: int = DEFAULT_PDF_CHUNK_SIZE
+        self.pdf_chunk_size_schnittbogen: int = DEFAULT_PDF_CHUNK_SIZE_SCHNITTBOGEN
+
         self.logger.debug("Factory Defaults geladen")
 
     def load_from_settings(self, settings):
@@ -205,6 +242,27 @@ class RuntimeConfig:
                 self.s1_anzahl_schreiblinien = getattr(s, 'anzahl_schreiblinien', self.s1_anzahl_schreiblinien)
                 self.s1_staerke_anzeigen = getattr(s, 'staerke_anzeigen', self.s1_staerke_anzeigen)
 
+            # NEW: Performance-Settings
+            if hasattr(settings, 'performance'):
+                p = settings.performance
+                self.raster_cache_enabled = getattr(p, 'raster_cache_enabled', self.raster_cache_enabled)
+                self.raster_cache_max_mb = getattr(p, 'raster_cache_max_mb', self.raster_cache_max_mb)
+                self.render_backend = getattr(p, 'render_backend', self.render_backend)
+                self.render_engine = getattr(p, 'render_engine', self.render_engine)
+                self.template_cache_scope = getattr(p, 'template_cache_scope', self.template_cache_scope)
+                self.template_cache_max_mb = getattr(p, 'template_cache_max_mb', self.template_cache_max_mb)
+                self.batch_engine = getattr(p, 'batch_engine', self.batch_engine)
+                self.pipeline_queue_depth = getattr(p, 'pipeline_queue_depth', self.pipeline_queue_depth)
+                self.memory_budget_mb = getattr(p, 'memory_budget_mb', self.memory_budget_mb)
+                self.pdf_image_codec = getattr(p, 'pdf_image_codec', self.pdf_image_codec)
+                self.pdf_flate_level = getattr(p, 'pdf_flate_level', self.pdf_flate_level)
+                self.pdf_jpeg_quality = getattr(p, 'pdf_jpeg_quality', self.pdf_jpeg_quality)
+                self.pdf_export_mode = getattr(p, 'pdf_export_mode', self.pdf_export_mode)
+                self.pdf_file_workers = getattr(p, 'pdf_file_workers', self.pdf_file_workers)
+                self.pdf_single_file = getattr(p, 'pdf_single_file', self.pdf_single_file)
+                self.pdf_chunk_size = getattr(p, 'pdf_chunk_size', self.pdf_chunk_size)
+                self.pdf_chunk_size_schnittbogen = getattr(p, 'pdf_chunk_size_schnittbogen', self.pdf_chunk_size_schnittbogen)
+
             self.logger.info(f"RuntimeConfig geladen: standard_modus={self.standard_modus}, dpi={self.export_dpi}")
 
         except Exception as e:
@@ -253,6 +311,26 @@ class RuntimeConfig:
                 settings.s1.anzahl_schreiblinien = self.s1_anzahl_schreiblinien
                 settings.s1.staerke_anzeigen = self.s1_staerke_anzeigen
 
+            # NEW: Performance-Settings
+            if hasattr(settings, 'performance'):
+                settings.performance.raster_cache_enabled = self.raster_cache_enabled
+                settings.performance.raster_cache_max_mb = self.raster_cache_max_mb
+                settings.performance.render_backend = self.render_backend
+                settings.performance.render_engine = self.render_engine
+                settings.performance.template_cache_scope = self.template_cache_scope
+                settings.performance.template_cache_max_mb = self.template_cache_max_mb
+                settings.performance.batch_engine = self.batch_engine
+                settings.performance.pipeline_queue_depth = self.pipeline_queue_depth
+                settings.performance.memory_budget_mb = self.memory_budget_mb
+                settings.performance.pdf_image_codec = self.pdf_image_codec
+                settings.performance.pdf_flate_level = self.pdf_flate_level
+                settings.performance.pdf_jpeg_quality = self.pdf_jpeg_quality
+                settings.performance.pdf_export_mode = self.pdf_export_mode
+                settings.performance.pdf_file_workers = self.pdf_file_workers
+                settings.performance.pdf_single_file = self.pdf_single_file
+                settings.performance.pdf_chunk_size = self.pdf_chunk_size
+                settings.performance.pdf_chunk_size_schnittbogen = self.pdf_chunk_size_schnittbogen
+
             self.logger.debug("RuntimeConfig in AppSettings gespeichert")
 
         except Exception as e:
@@ -353,7 +431,25 @@ class RuntimeConfig:
             's1_aspect_locked': self.s1_aspect_locked,
             's1_links_prozent': self.s1_links_prozent,
             's1_anzahl_schreiblinien': self.s1_anzahl_schreiblinien,
-            's1_staerke_anzeigen': self.s1_staerke_anzeigen
+            's1_staerke_anzeigen': self.s1_staerke_anzeigen,
+            # NEW: Performance-Parameter
+            'raster_cache_enabled': self.raster_cache_enabled,
+            'raster_cache_max_mb': self.raster_cache_max_mb,
+            'render_backend': self.render_backend,
+            'render_engine': self.render_engine,
+            'template_cache_scope': self.template_cache_scope,
+            'template_cache_max_mb': self.template_cache_max_mb,
+            'batch_engine': self.batch_engine,
+            'pipeline_queue_depth': self.pipeline_queue_depth,
+            'memory_budget_mb': self.memory_budget_mb,
+            'pdf_image_codec': self.pdf_image_codec,
+            'pdf_flate_level': self.pdf_flate_level,
+            'pdf_jpeg_quality': self.pdf_jpeg_quality,
+            'pdf_export_mode': self.pdf_export_mode,
+            'pdf_file_workers': self.pdf_file_workers,
+            'pdf_single_file': self.pdf_single_file,
+            'pdf_chunk_size': self.pdf_chunk_size,
+            'pdf_chunk_size_schnittbogen': self.pdf_chunk_size_schnittbogen
         }
 
 
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+schnittbogen_layout.py - Seitenaufteilung und statische Seitenebene für Schnittbögen
+
+Bisher haben PDFExporter.create_schnittbogen_pdf() und
+create_schnittbogen_pdf_streaming() Orientierung und Raster jeweils selbst
+berechnet, und jede Seite hat Hinweistext und alle Schnittrahmen einzeln
+gezeichnet. Hier:
+
+- SchnittbogenLayout: Orientierung, Raster und Zellpositionen (einmal pro
+  Zeichengröße und Rändern berechnet, get_schnittbogen_layout() ist gecacht)
+- SchnittbogenPageTemplate: Hinweistext + alle Schnittrahmen als ein Pfad in
+  einer Form XObject, die jede volle Seite nur noch referenziert
+
+Verwendung:
+    layout = get_schnittbogen_layout(45.0, 45.0)
+    template = SchnittbogenPageTemplate(layout)
+    ...
+    template.stamp(c, placed_cells)  # Nach den Zeichen, vor showPage()
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+from reportlab.lib.colors import black
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.units import mm
+
+from constants import DIN_A4_WIDTH_MM, DIN_A4_HEIGHT_MM
+
+
+# Hinweistext für Druckeinstellungen (falls ViewerPreferences nicht greifen)
+PRINT_HINT_TEXT = "WICHTIG: In Druckeinstellungen 'Tatsächliche Größe' (100%) wählen - NICHT skalieren!"
+
+# Linienstärke der Schnittrahmen (Punkte)
+CUT_FRAME_LINE_WIDTH = 0.5
+
+
+@dataclass(frozen=True)
+class SchnittbogenLayout:
+    """
+    Raster eines Schnittbogens (alle Längen in Punkten, ReportLab: (0,0) links-unten)
+
+    Zellgröße = fertige Zeichengröße (NACH Zuschnitt), unabhängig von Schnittlinien.
+    """
+    pagesize: Tuple[float, float]
+    orientation: str                 # "Hochformat" oder "Querformat"
+    cols: int
+    rows: int
+    cell_width: float
+    cell_height: float
+    grid_offset_x: float             # Linker Rand des zentrierten Rasters
+    grid_offset_y: float             # Oberer Rand des zentrierten Rasters
+    margin_h: float
+    margin_v: float
+    portrait_per_page: int
+    landscape_per_page: int
+
+    @property
+    def zeichen_per_page(self) -> int:
+        """Zeichen pro Seite"""
+        return self.cols * self.rows
+
+    def cell_origin(self, pos_on_page: int) -> Tuple[float, float]:
+        """
+        Linke untere Ecke einer Zelle
+
+        Args:
+            pos_on_page: Position auf der Seite (zeilenweise von links oben)
+
+        Returns:
+            (x, y) in Punkten
+        """
+        col = pos_on_page % self.cols
+        row = pos_on_page // self.cols
+        x = self.grid_offset_x + col * self.cell_width
+        y = self.pagesize[1] - self.grid_offset_y - (row + 1) * self.cell_height
+        return x, y
+
+    def describe(self) -> str:
+        """Kurzbeschreibung für das Export-Log"""
+        if self.orientation == "Querformat":
+            other = "{} im Hochformat".format(self.portrait_per_page)
+        else:
+            other = "{} im Querformat".format(self.landscape_per_page)
+        return "{}x{} = {} Zeichen/Seite ({:.1f}x{:.1f}mm Zeichen, A4 {} statt {}, {:.0f}mm h / {:.0f}mm v Rand)".format(
+            self.cols, self.rows, self.zeichen_per_page, self.cell_width / mm, self.cell_height / mm,
+            self.orientation, other, self.margin_h / mm, self.margin_v / mm
+        )
+
+
+@lru_cache(maxsize=32)
+def _compute_layout(
+    zeichen_breite_mm: float,
+    zeichen_hoehe_mm: float,
+    margin_h_mm: float,
+    margin_v_mm: float
+) -> SchnittbogenLayout:
+    """Berechnet Layout (gecacht, Argumente siehe get_schnittbogen_layout)"""
+    margin_h = margin_h_mm * mm
+    margin_v = margin_v_mm * mm
+    cell_width = zeichen_breite_mm * mm
+    cell_height = zeichen_hoehe_mm * mm
+
+    def grid(page_width, page_height):
+        return (int((page_width - 2 * margin_h) / cell_width),
+                int((page_height - 2 * margin_v) / cell_height))
+
+    # NEW v0.8.2: Automatische Hoch/Quer-Erkennung - Orientierung mit mehr Zeichen/Seite
+    portrait_cols, portrait_rows = grid(DIN_A4_WIDTH_MM * mm, DIN_A4_HEIGHT_MM * mm)
+    landscape_cols, landscape_rows = grid(DIN_A4_HEIGHT_MM * mm, DIN_A4_WIDTH_MM * mm)
+    portrait_per_page = portrait_cols * portrait_rows
+    landscape_per_page = landscape_cols * landscape_rows
+
+    if landscape_per_page > portrait_per_page:
+        pagesize, orientation = landscape(A4), "Querformat"
+        cols, rows = landscape_cols, landscape_rows
+    else:
+        # Hochformat ist besser (oder gleich)
+        pagesize, orientation = A4, "Hochformat"
+        cols, rows = portrait_cols, portrait_rows
+
+    # NEW v0.8.2.1: Grid zentrieren (horizontal und vertikal)
+    page_width, page_height = pagesize
+    excess_width = page_width - 2 * margin_h - cols * cell_width
+    excess_height = page_height - 2 * margin_v - rows * cell_height
+
+    return SchnittbogenLayout(
+        pagesize=pagesize,
+        orientation=orientation,
+        cols=cols,
+        rows=rows,
+        cell_width=cell_width,
+        cell_height=cell_height,
+        grid_offset_x=margin_h + excess_width / 2,
+        grid_offset_y=margin_v + excess_height / 2,
+        margin_h=margin_h,
+        margin_v=margin_v,
+        portrait_per_page=portrait_per_page,
+        landscape_per_page=landscape_per_page
+    )
+
+
+def get_schnittbogen_layout(
+    zeichen_breite_mm: float,
+    zeichen_hoehe_mm: float,
+    margin_h_mm: Optional[float] = None,
+    margin_v_mm: Optional[float] = None
+) -> SchnittbogenLayout:
+    """
+    Schnittbogen-Layout für eine Zeichengröße
+
+    Args:
+        zeichen_breite_mm: Breite des fertigen Zeichens
+        zeichen_hoehe_mm: Höhe des fertigen Zeichens
+        margin_h_mm: Seitenrand links/rechts (default: aus Settings)
+        margin_v_mm: Seitenrand oben/unten (default: aus Settings)
+
+    Returns:
+        SchnittbogenLayout (gleiche Argumente -> gleiche Instanz)
+    """
+    if margin_h_mm is None or margin_v_mm is None:
+        # Seitenränder aus Settings laden (NEW v0.8.2)
+        from settings_manager import SettingsManager
+        settings = SettingsManager().load_settings()
+        if margin_h_mm is None:
+            margin_h_mm = getattr(settings, 'pdf_margin_horizontal_mm', 10)
+        if margin_v_mm is None:
+            margin_v_mm = getattr(settings, 'pdf_margin_vertical_mm', 10)
+
+    return _compute_layout(
+        float(zeichen_breite_mm), float(zeichen_hoehe_mm), float(margin_h_mm), float(margin_v_mm)
+    )
+
+
+def draw_print_hint(canvas_obj, pagesize: Tuple[float, float]):
+    """
+    Zeichnet Hinweistext für korrekte Druckeinstellungen (oben UND unten)
+
+    Args:
+        canvas_obj: ReportLab Canvas
+        pagesize: Seitengröße (Punkte)
+    """
+    w, h = pagesize
+    canvas_obj.saveState()
+    canvas_obj.setFont("Helvetica", 8)
+    canvas_obj.setFillColorRGB(0.5, 0.5, 0.5)  # Grau
+    text_width = canvas_obj.stringWidth(PRINT_HINT_TEXT, "Helvetica", 8)
+    # Zentriert am oberen Rand, knapp unterhalb
+    canvas_obj.drawString((w - text_width) / 2, h - 8 * mm, PRINT_HINT_TEXT)
+    # Zentriert am unteren Rand, knapp oberhalb
+    canvas_obj.drawString((w - text_width) / 2, 8 * mm, PRINT_HINT_TEXT)
+    canvas_obj.restoreState()
+
+
+class SchnittbogenPageTemplate:
+    """
+    Statische Ebene einer Schnittbogen-Seite: Hinweistext + schwarze Schnittrahmen
+
+    Volle Seiten referenzieren eine Form XObject (einmal pro Canvas definiert),
+    teilweise gefüllte Seiten (letzte Seite, fehlgeschlagene Zeichen) zeichnen nur
+    die Rahmen der platzierten Zeichen - als ein Pfad statt einem rect() pro Zelle. Bei SegmentedCanvas wird die Form in
+    jedem Segment neu definiert (pdf_merge fasst identische Objekte zusammen).
+    """
+
+    FORM_NAME = "Schnittbogenseite"
+
+    def __init__(self, layout: SchnittbogenLayout):
+        """
+        Args:
+            layout: SchnittbogenLayout der Seiten
+        """
+        self.layout = layout
+        self._form_canvas = None
+        self.stamped = 0
+
+    def _draw(self, canvas_obj, cells: Sequence[int]):
+        """Zeichnet Hinweistext und Rahmen der Zellen cells (Positionen auf der Seite)"""
+        layout = self.layout
+        draw_print_hint(canvas_obj, layout.pagesize)
+
+        canvas_obj.saveState()
+        canvas_obj.setStrokeColor(black)
+        canvas_obj.setLineWidth(CUT_FRAME_LINE_WIDTH)
+        path = canvas_obj.beginPath()
+        for pos in cells:
+            x, y = layout.cell_origin(pos)
+            path.rect(x, y, layout.cell_width, layout.cell_height)
+        canvas_obj.drawPath(path, stroke=1, fill=0)
+        canvas_obj.restoreState()
+
+    def stamp(self, canvas_obj, placed_cells: Sequence[int]):
+        """
+        Zeichnet statische Ebene auf die aktuelle Seite (nach den Zeichen, damit die
+        Rahmen wie bisher über den Bildern liegen)
+
+        FIXED: Rahmen nur für platzierte Zeichen - fehlgeschlagene Zellen bleiben
+        wie bisher leer (ohne Rahmen).
+
+        Args:
+            canvas_obj: ReportLab Canvas
+            placed_cells: Positionen der platzierten Zeichen auf dieser Seite
+        """
+        if len(set(placed_cells)) < self.layout.zeichen_per_page:
+            self._draw(canvas_obj, sorted(set(placed_cells)))
+            return
+
+        if self._form_canvas is not canvas_obj:
+            canvas_obj.beginForm(self.FORM_NAME)
+            self._draw(canvas_obj, range(self.layout.zeichen_per_page))
+            canvas_obj.endForm()
+            self._form_canvas = canvas_obj
+        canvas_obj.doForm(self.FORM_NAME)
+        self.stamped += 1
+
+
+if __name__ == "__main__":
+    # Test
+    from io import BytesIO
+    from reportlab.pdfgen import canvas
+
+    print("=== SCHNITTBOGEN-LAYOUT TEST ===\n")
+
+    layout = get_schnittbogen_layout(45.0, 45.0, 10, 10)
+    print(f"45x45mm: {layout.describe()}")
+    assert layout is get_schnittbogen_layout(45, 45, 10.0, 10.0), "Layout nicht gecacht"
+    assert layout.zeichen_per_page == 24
+
+    s1 = get_schnittbogen_layout(90.0, 45.0, 10, 10)
+    print(f"90x45mm: {s1.describe()}")
+
+    c = canvas.Canvas(BytesIO(), pagesize=layout.pagesize)
+    template = SchnittbogenPageTemplate(layout)
+    for _ in range(3):
+        template.stamp(c, range(layout.zeichen_per_page))
+        c.showPage()
+    template.stamp(c, range(5))
+    data = c.getpdfdata()
+    print(f"4 Seiten, {template.stamped} mit Form XObject, {len(data)} Bytes")
+    assert data.count(b"/Subtype /Form") == 1
@@ -41,6 +41,23 @@ from constants import (
     DEFAULT_S1_LINKS_PROZENT,
     DEFAULT_S1_ANZAHL_SCHREIBLINIEN,
     DEFAULT_S1_STAERKE_ANZEIGEN,
+    DEFAULT_RASTER_CACHE_ENABLED,
+    DEFAULT_RASTER_CACHE_MAX_MB,
+    DEFAULT_RENDER_BACKEND,
+    DEFAULT_RENDER_ENGINE,
+    DEFAULT_TEMPLATE_CACHE_SCOPE,
+    DEFAULT_TEMPLATE_CACHE_MAX_MB,
+    DEFAULT_BATCH_ENGINE,
+    DEFAULT_PIPELINE_QUEUE_DEPTH,
+    DEFAULT_MEMORY_BUDGET_MB,
+    DEFAULT_PDF_IMAGE_CODEC,
+    DEFAULT_PDF_FLATE_LEVEL,
+    DEFAULT_PDF_JPEG_QUALITY,
+    DEFAULT_PDF_EXPORT_MODE,
+    DEFAULT_PDF_FILE_WORKERS,
+    DEFAULT_PDF_SINGLE_FILE,
+    DEFAULT_PDF_CHUNK_SIZE,
+    DEFAULT_PDF_CHUNK_SIZE_SCHNITTBOGEN,
 )
 
 
@@ -145,6 +162,49 @@ class S1Settings:
     auto_adjust_font_size: bool = DEFAULT_AUTO_ADJUST_FONT_SIZE
 
 
+@dataclass
+class PerformanceSettings:
+    """
+    Einstellungen fuer Render-Performance (NEW)
+
+    Attributes:
+        raster_cache_enabled: Persistenten Raster-Cache fuer gerenderte SVGs verwenden
+        raster_cache_max_mb: Groessenbudget des Raster-Caches in MB (LRU-Verdraengung)
+        render_backend: SVG-Rendering in Threads ("thread") oder Worker-Prozessen ("process")
+        render_engine: SVG-Renderer ("auto", "imagemagick", "cairosvg")
+        template_cache_scope: Lebensdauer des Template-Speichers ("batch" oder "session")
+        template_cache_max_mb: Groessenbudget des Template-Speichers in MB
+        batch_engine: Batch-Verarbeitung in Stapeln ("chunked") oder als Pipeline ("pipeline")
+        pipeline_queue_depth: Max. wartende Zeichen pro Pipeline-Stufe
+        memory_budget_mb: RAM-Budget fuer Zeichen in Bearbeitung in MB (0 = automatisch)
+        pdf_image_codec: Bild-Kodierung im PDF ("flate", "jpeg2000", "jpeg")
+        pdf_flate_level: zlib-Stufe fuer Codec "flate" (1-9)
+        pdf_jpeg_quality: JPEG-Qualitaet fuer Codec "jpeg" (50-100)
+        pdf_export_mode: PDF-Exportmodus ("raster" = Bild, "vector" = Vektorgrafik + PDF-Text)
+        pdf_file_workers: Gleichzeitig erstellte PDF-Dateien (0 = automatisch, 1 = nacheinander)
+        pdf_single_file: Eine PDF-Datei aus parallel erstellten Teilen statt mehrerer Dateien
+        pdf_chunk_size: Seiten pro Einzelzeichen-PDF-Datei (0 = eine Datei)
+        pdf_chunk_size_schnittbogen: Seiten pro Schnittbogen-PDF-Datei (0 = eine Datei)
+    """
+    raster_cache_enabled: bool = DEFAULT_RASTER_CACHE_ENABLED
+    raster_cache_max_mb: int = DEFAULT_RASTER_CACHE_MAX_MB
+    render_backend: str = DEFAULT_RENDER_BACKEND
+    render_engine: str = DEFAULT_RENDER_ENGINE
+    template_cache_scope: str = DEFAULT_TEMPLATE_CACHE_SCOPE
+    template_cache_max_mb: int = DEFAULT_TEMPLATE_CACHE_MAX_MB
+    batch_engine: str = DEFAULT_BATCH_ENGINE
+    pipeline_queue_depth: int = DEFAULT_PIPELINE_QUEUE_DEPTH
+    memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB
+    pdf_image_codec: str = DEFAULT_PDF_IMAGE_CODEC
+    pdf_flate_level: int = DEFAULT_PDF_FLATE_LEVEL
+    pdf_jpeg_quality: int = DEFAULT_PDF_JPEG_QUALITY
+    pdf_export_mode: str = DEFAULT_PDF_EXPORT_MODE
+    pdf_file_workers: int = DEFAULT_PDF_FILE_WORKERS
+    pdf_single_file: bool = DEFAULT_PDF_SINGLE_FILE
+    pdf_chunk_size: int = DEFAULT_PDF_CHUNK_SIZE
+    pdf_chunk_size_schnittbogen: int = DEFAULT_PDF_CHUNK_SIZE_SCHNITTBOGEN
+
+
 @dataclass
 class AppSettings:
     """
@@ -155,6 +215,7 @@ class AppSettings:
         zeichen: Zeichen-Einstellungen
         grafik: Grafik-Einstellungen
         s1: S1-Layout-Einstellungen (NEW v0.9)
+        performance: Performance-Einstellungen (NEW)
         log_level: Log-Level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         standard_layout: Standard-Layout beim Start (S1 oder S2) (NEW v0.8.2)
         standard_export_format: Standard-Exportformat (PNG, PDF_SINGLE, PDF_SHEET) (NEW v0.8.2)
@@ -165,6 +226,7 @@ class AppSettings:
     zeichen: ZeichenSettings = None
     grafik: GrafikSettings = None
     s1: S1Settings = None  # NEW: S1-Layout Einstellungen
+    performance: PerformanceSettings = None  # NEW: Performance-Einstellungen
     log_level: str = "INFO"  # Default: INFO (nicht DEBUG!)
     standard_layout: str = DEFAULT_STANDARD_LAYOUT
     standard_export_format: str = DEFAULT_STANDARD_EXPORT_FORMAT
@@ -179,6 +241,8 @@ class AppSettings:
             self.grafik = GrafikSettings()
         if self.s1 is None:  # NEW
             self.s1 = S1Settings()
+        if self.performance is None:  # NEW
+            self.performance = PerformanceSettings()
 
 
 class SettingsManager:
@@ -238,12 +302,14 @@ class SettingsManager:
             zeichen_data = data.get('zeichen', {})
             grafik_data = data.get('grafik', {})
             s1_data = data.get('s1', {})  # NEW: S1-Settings laden
+            performance_data = data.get('performance', {})  # NEW: Performance-Settings laden
 
             settings = AppSettings(
                 zeichen_ordner=data.get('zeichen_ordner', 'Taktische_Zeichen_Grafikvorlagen'),
                 zeichen=ZeichenSettings(**zeichen_data),
                 grafik=GrafikSettings(**grafik_data),
                 s1=S1Settings(**s1_data),  # NEW: S1-Settings
+                performance=PerformanceSettings(**performance_data),  # NEW: Performance-Settings
                 log_level=data.get('log_level', 'INFO'),  # BUGFIX v0.8.2: Log-Level laden
                 standard_layout=data.get('standard_layout', 'S2'),  # NEW v0.8.2
                 standard_export_format=data.get('standard_export_format', 'PNG'),  # NEW v0.8.2
@@ -276,6 +342,7 @@ class SettingsManager:
                 'zeichen': asdict(settings.zeichen),
                 'grafik': asdict(settings.grafik),
                 's1': asdict(settings.s1),  # NEW: S1-Settings speichern
+                'performance': asdict(settings.performance),  # NEW: Performance-Settings speichern
                 'log_level': settings.log_level,  # BUGFIX v0.8.2: Log-Level speichern
                 'standard_layout': settings.standard_layout,  # NEW v0.8.2
                 'standard_export_format': settings.standard_export_format,  # NEW v0.8.2
@@ -12,8 +12,6 @@ Version: 0.4.0 (Font-Pruefung implementiert)
 from pathlib import Path
 from typing import List, Dict, Optional, Set, Tuple
 import logging
-import re
-import xml.etree.ElementTree as ET
 import os
 from datetime import datetime
 
@@ -485,13 +483,14 @@ class SVGLoaderLocal:
             return False
         
         # Inhalt pruefen (muss mit < beginnen)
-        try:
-            content = svg_path.read_text(encoding='utf-8')
-            if not content.strip().startswith('<'):
-                self.logger.error("Kein gueltiges SVG (startet nicht mit <): {}".format(svg_path))
-                return False
-        except Exception as e:
-            self.logger.error("Fehler beim Lesen der SVG: {}".format(e))
+        # CHANGED: Einmal geladenes SvgSource statt eigenem Lesezugriff
+        from svg_source import get_svg_source
+        source = get_svg_source(svg_path)
+        if source is None:
+            self.logger.error("Fehler beim Lesen der SVG: {}".format(svg_path))
+            return False
+        if not source.is_valid:
+            self.logger.error("Kein gueltiges SVG (startet nicht mit <): {}".format(svg_path))
             return False
         
         return True
@@ -510,58 +509,20 @@ class SVGLoaderLocal:
             self.logger.error("SVG existiert nicht: {}".format(svg_path))
             return (False, set())
 
-        try:
-            # SVG-Datei parsen
-            tree = ET.parse(str(svg_path))
-            root = tree.getroot()
-
-            # Namespace fuer SVG
-            namespaces = {
-                'svg': 'http://www.w3.org/2000/svg',
-                '': 'http://www.w3.org/2000/svg'
-            }
-
-            fonts = set()
-            has_text = False
-
-            # Suche nach <text> und <tspan> Elementen
-            # Mit und ohne Namespace
-            for text_elem in root.iter():
-                tag_name = text_elem.tag.split('}')[-1] if '}' in text_elem.tag else text_elem.tag
-
-                if tag_name in ['text', 'tspan']:
-                    has_text = True
-
-                    # Font-family aus style Attribut extrahieren
-                    style = text_elem.get('style', '')
-                    if 'font-family' in style:
-                        # Format: "font-family:Arial" oder "font-family: Arial, sans-serif"
-                        match = re.search(r'font-family:\s*([^;]+)', style)
-                        if match:
-                            font_str = match.group(1).strip()
-                            # Mehrere Fonts durch Komma getrennt
-                            for font in font_str.split(','):
-                                font = font.strip().strip('"').strip("'")
-                                if font:
-                                    fonts.add(font)
-
-                    # Font-family als direktes Attribut
-                    font_family = text_elem.get('font-family', '')
-                    if font_family:
-                        for font in font_family.split(','):
-                            font = font.strip().strip('"').strip("'")
-                            if font:
-                                fonts.add(font)
-
-            return (has_text, fonts)
-
-        except ET.ParseError as e:
-            self.logger.warning("SVG Parse-Fehler in {}: {}".format(svg_path.name, e))
+        # CHANGED: Einmal geladenes und geparstes SvgSource (kein eigenes ET.parse)
+        from svg_source import get_svg_source
+        source = get_svg_source(svg_path)
+        if source is None:
+            self.logger.error("Fehler beim Font-Check {}: nicht lesbar".format(svg_path.name))
             return (False, set())
-        except Exception as e:
-            self.logger.error("Fehler beim Font-Check {}: {}".format(svg_path.name, e))
+
+        if source.parse_error is not None:
+            self.logger.warning("SVG Parse-Fehler in {}: {}".format(svg_path.name, source.parse_error))
             return (False, set())
 
+        has_text, fonts = source.text_font_info
+        return (has_text, set(fonts))
+
     def scan_fonts_in_category(self, category: str) -> Dict[str, Set[str]]:
         """
         Scannt alle SVGs in einer Kategorie nach verwendeten Fonts
@@ -0,0 +1,975 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+svg_renderer.py - Austauschbare SVG-Renderer mit automatischem Fallback
+
+Alle Renderer liefern dasselbe Ergebnis-Format:
+getrimmte Grafik, maximal groß in die Ziel-Box (mm @ DPI) eingepasst,
+Seitenverhältnis beibehalten, Farbmodus PNG_COLOR_MODE.
+
+Zwei-Stufen-Rendering: Die Inhalts-Box wird einmal pro SVG bei niedriger
+Auflösung gemessen (persistent), danach wird nur der Ausschnitt direkt in
+Zielgröße gerastert - kein Vollbild bei dpi * render_scale mehr.
+
+Renderer:
+- ImageMagickRenderer: Wand/ImageMagick (Delegate rsvg/MSVG) - immer vorhanden
+- CairoSVGRenderer:    cairosvg (in-process, optional) - deutlich schneller
+
+SVGRendererChain wählt pro SVG den bevorzugten Renderer und fällt automatisch
+auf den nächsten zurück, wenn ein Renderer fehlschlägt oder ein ungültiges
+Ergebnis liefert (leer, falsche Größe).
+
+compare_renderers() misst Zeit und Pixel-Abweichung aller verfügbaren Renderer.
+
+Verwendung:
+    chain = SVGRendererChain()
+    image = chain.render(svg_path, max_height_mm=30, max_width_mm=39, dpi=600)
+"""
+
+import json
+import os
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+
+from PIL import Image, ImageChops, ImageStat
+
+from logging_manager import LoggingManager
+from constants import (
+    RESAMPLING_FILTER,
+    RESAMPLING_RENDER_SCALE_BIG_SVG,
+    RESAMPLING_RENDER_SCALE_MED_SVG,
+    RESAMPLING_RENDER_SCALE_SMALL_SVG,
+    RESAMPLING_MAX_PX_SIZE_BIG,
+    RESAMPLING_MAX_PX_SIZE_MED,
+    PNG_COLOR_MODE,
+    RENDER_ENGINE_AUTO,
+    RENDER_ENGINE_IMAGEMAGICK,
+    RENDER_ENGINE_CAIROSVG,
+    SYSTEM_BBOX_CACHE_DIR,
+    SYSTEM_BBOX_CACHE_MAX_ENTRIES,
+    SYSTEM_BBOX_CACHE_VERSION,
+    SYSTEM_BBOX_PREPASS_MAX_PX,
+    SYSTEM_CSS_PX_PER_INCH,
+    mm_to_pixels
+)
+from svg_source import get_svg_source
+
+
+# ImageMagick-Filtername -> nächster PIL-Filter (Einpassen auf Zielgröße)
+_PIL_RESAMPLING = {
+    'lanczos': Image.Resampling.LANCZOS,
+    'mitchell': Image.Resampling.BICUBIC,
+    'catrom': Image.Resampling.BICUBIC,
+    'cubic': Image.Resampling.BICUBIC,
+    'gaussian': Image.Resampling.BICUBIC,
+    'box': Image.Resampling.BOX,
+    'nearest': Image.Resampling.NEAREST,
+}
+_FINAL_RESAMPLING = _PIL_RESAMPLING.get(RESAMPLING_FILTER, Image.Resampling.LANCZOS)
+
+
+def sanitize_svg_content(svg_path: Path) -> Optional[bytes]:
+    """
+    Liefert SVG-Inhalt bereinigt von ungültigen UTF-8-Zeichen (im Speicher)
+
+    Dies verhindert Warnungen wie:
+    "Invalid UTF-8 string passed to pango_layout_set_text()"
+
+    CHANGED: Keine temporäre Datei mehr - Renderer lesen die Bytes direkt (Blob).
+    Die Bytes stammen aus dem memoisierten SvgSource (pro Inhalts-Hash).
+
+    Args:
+        svg_path: Pfad zur SVG-Datei
+
+    Returns:
+        Bereinigte Bytes oder None bei Blanko-Zeichen / nicht lesbarer Datei
+    """
+    source = get_svg_source(svg_path)
+    return source.sanitized if source is not None else None
+
+
+def wand_to_raw_rgba(wand_image) -> Tuple[int, int, bytes]:
+    """
+    Exportiert Wand-Bild als rohe 8-Bit-RGBA-Daten (ohne PNG-Kodierung)
+
+    Gemeinsamer Übergabe-Pfad für Generator (-> PIL) und Vorschau (-> QImage):
+    kein zlib-Komprimieren und -Dekomprimieren pro Rendering.
+
+    Args:
+        wand_image: wand.image.Image
+
+    Returns:
+        Tuple (Breite, Höhe, Bytes) - Zeilen ohne Padding, nicht vormultipliziert
+    """
+    wand_image.depth = 8  # Q16-Builds liefern sonst 16 Bit pro Kanal
+    return wand_image.width, wand_image.height, wand_image.make_blob('RGBA')
+
+
+def wand_to_pil(wand_image) -> Image.Image:
+    """
+    Konvertiert Wand-Bild ohne Kopie der Pixeldaten in ein PIL Image (RGBA)
+
+    Args:
+        wand_image: wand.image.Image
+
+    Returns:
+        PIL Image (teilt den Puffer, wird bei Schreibzugriff kopiert)
+    """
+    width, height, data = wand_to_raw_rgba(wand_image)
+    return Image.frombuffer('RGBA', (width, height), data, 'raw', 'RGBA', 0, 1)
+
+
+# ================================================================================================
+# SVG-GEOMETRIE + INHALTS-BOX (Vorab-Pass)
+# ================================================================================================
+
+# Längeneinheiten -> CSS-Pixel
+_UNIT_TO_PX = {
+    '': 1.0,
+    'px': 1.0,
+    'pt': SYSTEM_CSS_PX_PER_INCH / 72.0,
+    'pc': SYSTEM_CSS_PX_PER_INCH / 6.0,
+    'mm': SYSTEM_CSS_PX_PER_INCH / 25.4,
+    'cm': SYSTEM_CSS_PX_PER_INCH / 2.54,
+    'in': SYSTEM_CSS_PX_PER_INCH,
+}
+_LENGTH_RE = re.compile(r'^\s*([0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*(px|pt|pc|mm|cm|in)?\s*$')
+_SVG_ROOT_RE = re.compile(r'<svg\b[^>]*>', re.DOTALL)
+_ROOT_SIZE_ATTR_RE = re.compile(r'''\s(width|height|viewBox)\s*=\s*("[^"]*"|'[^']*')''')
+
+
+@dataclass
+class SvgGeometry:
+    """
+    Geometrie des SVG-Root-Elements
+
+    Attributes:
+        viewbox: (x, y, Breite, Höhe) in Benutzereinheiten
+        width_px: Intrinsische Breite in CSS-Pixel
+        height_px: Intrinsische Höhe in CSS-Pixel
+        root_start: Start des <svg>-Tags im Text
+        root_end: Ende des <svg>-Tags im Text
+    """
+    viewbox: Tuple[float, float, float, float]
+    width_px: float
+    height_px: float
+    root_start: int
+    root_end: int
+
+    @property
+    def px_per_unit(self) -> float:
+        """CSS-Pixel pro Benutzereinheit"""
+        return self.width_px / self.viewbox[2]
+
+
+def _parse_length(value: Optional[str]) -> Optional[float]:
+    """Parst SVG-Länge in CSS-Pixel (None bei Prozent/em/ungültig)"""
+    if value is None:
+        return None
+    match = _LENGTH_RE.match(value)
+    if not match:
+        return None
+    return float(match.group(1)) * _UNIT_TO_PX[match.group(2) or '']
+
+
+def parse_svg_geometry(svg_text: str) -> Optional[SvgGeometry]:
+    """
+    Liest viewBox und intrinsische Größe aus dem SVG-Root
+
+    Args:
+        svg_text: SVG-Inhalt
+
+    Returns:
+        SvgGeometry oder None wenn die Geometrie nicht eindeutig ist
+        (fehlende Größe, Prozentangaben, nicht-uniforme Skalierung)
+    """
+    root = _SVG_ROOT_RE.search(svg_text)
+    if root is None:
+        return None
+
+    attrs = {name: value[1:-1] for name, value in _ROOT_SIZE_ATTR_RE.findall(root.group(0))}
+
+    viewbox = None
+    if 'viewBox' in attrs:
+        try:
+            parts = [float(p) for p in attrs['viewBox'].replace(',', ' ').split()]
+        except ValueError:
+            return None
+        if len(parts) != 4 or parts[2] <= 0 or parts[3] <= 0:
+            return None
+        viewbox = tuple(parts)
+
+    width_px = _parse_length(attrs.get('width'))
+    height_px = _parse_length(attrs.get('height'))
+
+    if viewbox is None:
+        if not width_px or not height_px:
+            return None
+        viewbox = (0.0, 0.0, width_px, height_px)
+    if width_px is None and 'width' not in attrs:
+        width_px = viewbox[2] * (height_px / viewbox[3] if height_px else 1.0)
+    if height_px is None and 'height' not in attrs:
+        height_px = viewbox[3] * (width_px / viewbox[2] if width_px else 1.0)
+    if not width_px or not height_px:
+        return None
+
+    # Nur uniforme Skalierung (sonst verschiebt preserveAspectRatio den Inhalt)
+    scale_x = width_px / viewbox[2]
+    scale_y = height_px / viewbox[3]
+    if abs(scale_x - scale_y) > 1e-3 * max(scale_x, scale_y):
+        return None
+
+    return SvgGeometry(viewbox, width_px, height_px, root.start(), root.end())
+
+
+def crop_svg_to_viewbox(svg_text: str, geometry: SvgGeometry, box: Tuple[float, float, float, float]) -> str:
+    """
+    Setzt viewBox/width/height des Root-Elements auf einen Ausschnitt
+
+    Args:
+        svg_text: SVG-Inhalt
+        geometry: Geometrie aus parse_svg_geometry()
+        box: Ausschnitt (x, y, Breite, Höhe) in Benutzereinheiten
+
+    Returns:
+        SVG-Inhalt, der nur den Ausschnitt zeigt (Größe in CSS-Pixel)
+    """
+    root_tag = svg_text[geometry.root_start:geometry.root_end]
+    root_tag = _ROOT_SIZE_ATTR_RE.sub('', root_tag)
+    scale = geometry.px_per_unit
+    new_attrs = ' width="{:.4f}px" height="{:.4f}px" viewBox="{:.6f} {:.6f} {:.6f} {:.6f}"'.format(
+        box[2] * scale, box[3] * scale, *box
+    )
+    root_tag = root_tag[:4] + new_attrs + root_tag[4:]
+    return svg_text[:geometry.root_start] + root_tag + svg_text[geometry.root_end:]
+
+
+def content_bbox(image: Image.Image) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Bounding-Box des Inhalts (wie ImageMagick trim: Hintergrund = Eckpixel-Farbe)
+
+    Args:
+        image: Gerastertes SVG
+
+    Returns:
+        (links, oben, rechts, unten) oder None wenn kein Inhalt
+    """
+    background = Image.new(image.mode, image.size, image.getpixel((0, 0)))
+    return ImageChops.difference(image, background).getbbox(alpha_only=False)
+
+
+class ContentBoxStore:
+    """
+    Persistente Inhalts-Boxen pro SVG-Inhalts-Hash
+
+    Eine Box wird einmal per Vorab-Pass (niedrige Auflösung) ermittelt und
+    als JSON-Datei <hash>.json gespeichert - alle weiteren Renderings desselben
+    SVGs (jede DPI, jede Größe) nutzen sie ohne erneuten Vorab-Pass.
+
+    NEW: Begrenzt auf max_entries Dateien (wie RasterCache: Datei-mtime als
+    LRU-Zeitstempel, älteste Einträge werden verdrängt).
+    """
+
+    FILE_SUFFIX = ".json"
+
+    def __init__(
+        self,
+        cache_dir: Path = SYSTEM_BBOX_CACHE_DIR,
+        max_entries: int = SYSTEM_BBOX_CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialisiert Speicher
+
+        Args:
+            cache_dir: Verzeichnis für JSON-Dateien
+            max_entries: Max. Einträge (Dateien und In-Memory)
+        """
+        self.logger = LoggingManager().get_logger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max(1, max_entries)
+        self._lock = Lock()
+        self._memo: "OrderedDict[str, Dict]" = OrderedDict()
+        self._entry_count: Optional[int] = None  # Dateien im Verzeichnis (beim ersten put() gezählt)
+
+    def get(self, digest: str) -> Optional[Dict]:
+        """
+        Liefert gespeicherte Box
+
+        Returns:
+            dict mit 'box' und 'tight' (Benutzereinheiten) bzw. 'empty', oder None
+        """
+        with self._lock:
+            entry = self._memo.get(digest)
+            if entry is not None:
+                self._memo.move_to_end(digest)
+                return entry
+
+        entry_path = self._entry_path(digest)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('version') != SYSTEM_BBOX_CACHE_VERSION:
+            return None
+
+        # LRU: Zugriffszeit aktualisieren (einmal pro Prozess, danach aus dem Speicher)
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+
+        with self._lock:
+            self._remember_locked(digest, entry)
+        return entry
+
+    def put(self, digest: str, entry: Dict):
+        """Speichert Box (atomar, Fehler werden nur geloggt)"""
+        entry = dict(entry, version=SYSTEM_BBOX_CACHE_VERSION)
+        with self._lock:
+            self._remember_locked(digest, entry)
+
+        entry_path = self._entry_path(digest)
+        temp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=str(self.cache_dir), prefix=".tmp_", suffix=self.FILE_SUFFIX)
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            is_new = not entry_path.exists()
+            os.replace(temp_path, entry_path)
+            temp_path = None
+
+            with self._lock:
+                if self._entry_count is None:
+                    self._entry_count = len(self._scan_entries())
+                elif is_new:
+                    self._entry_count += 1
+                over_limit = self._entry_count > self.max_entries
+            if over_limit:
+                self._evict()
+        except OSError as e:
+            self.logger.debug(f"Inhalts-Box konnte nicht gespeichert werden: {e}")
+        finally:
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def _remember_locked(self, digest: str, entry: Dict):
+        """In-Memory-Eintrag (LRU, max_entries) - Aufrufer hält _lock"""
+        self._memo[digest] = entry
+        self._memo.move_to_end(digest)
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+
+    def _entry_path(self, digest: str) -> Path:
+        """Pfad der JSON-Datei für Inhalts-Hash"""
+        return self.cache_dir / (digest + self.FILE_SUFFIX)
+
+    def _scan_entries(self) -> List[Tuple[Path, float]]:
+        """
+        Listet alle Einträge
+
+        Returns:
+            Liste von (Pfad, mtime)
+        """
+        entries = []
+        for entry in self.cache_dir.glob("*" + self.FILE_SUFFIX):
+            if entry.name.startswith(".tmp_"):
+                continue
+            try:
+                entries.append((entry, entry.stat().st_mtime))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self):
+        """Verdrängt älteste Einträge bis Limit eingehalten ist (Ziel: 90% des Limits)"""
+        entries = sorted(self._scan_entries(), key=lambda e: e[1])
+        target = int(self.max_entries * 0.9)
+
+        remaining = len(entries)
+        for entry, _ in entries:
+            if remaining <= target:
+                break
+            try:
+                entry.unlink()
+                remaining -= 1
+            except OSError:
+                continue
+
+        with self._lock:
+            self._entry_count = remaining
+
+        self.logger.debug(f"Inhalts-Box-Cache: {len(entries) - remaining} Einträge verdrängt ({remaining} verbleibend)")
+
+
+# Prozessweiter Speicher (Vorab-Pass nur einmal pro SVG-Inhalt)
+_content_box_store = ContentBoxStore()
+
+
+# ================================================================================================
+# RENDERER
+# ================================================================================================
+
+class SVGRenderer:
+    """
+    Basisklasse für SVG-Renderer
+
+    Gemeinsame Pipeline (Unterklassen implementieren nur _rasterize()):
+    1. Inhalts-Box ermitteln: Vorab-Pass bei niedriger Auflösung
+       (einmal pro SVG-Inhalt, persistent in SYSTEM_BBOX_CACHE_DIR)
+    2. Nur den Ausschnitt (viewBox) direkt in Zielgröße rastern
+    3. Restrand trimmen (auf Zielgröße, nicht auf Vollbild) und einpassen
+
+    SVGs ohne eindeutige Geometrie werden wie bisher komplett gerastert und getrimmt.
+    """
+
+    name = ""
+
+    def __init__(self):
+        """Initialisiert Renderer"""
+        self.logger = LoggingManager().get_logger(__name__)
+        self.content_boxes = _content_box_store
+
+    def is_available(self) -> bool:
+        """Prüft ob die Renderer-Bibliothek geladen werden kann"""
+        return True
+
+    def _rasterize(self, svg_data: bytes, resolution: float, svg_path: Path) -> Image.Image:
+        """
+        Rastert SVG-Bytes ohne Trimmen/Skalieren
+
+        Args:
+            svg_data: Bereinigte SVG-Bytes
+            resolution: Auflösung in DPI (96 = 1 CSS-Pixel pro Pixel)
+            svg_path: Originalpfad (für Logs / relative Referenzen)
+
+        Returns:
+            PIL Image (RGBA)
+        """
+        raise NotImplementedError
+
+    def render(
+        self,
+        svg_path: Path,
+        max_height_mm: float,
+        max_width_mm: float,
+        dpi: int,
+        render_scale: float = 1.0
+    ) -> Image.Image:
+        """
+        Rendert SVG getrimmt und in die Ziel-Box eingepasst
+
+        Args:
+            svg_path: Pfad zur SVG-Datei
+            max_height_mm: Maximale Grafik-Höhe in mm
+            max_width_mm: Maximale Grafik-Breite in mm
+            dpi: Ziel-DPI
+            render_scale: Überabtastung beim Rendern (1.0 = automatisch) - nur für das
+                vollständige Rendern ohne eindeutige SVG-Geometrie
+
+        Returns:
+            PIL Image
+        """
+        max_width_px = mm_to_pixels(max_width_mm, dpi)
+        max_height_px = mm_to_pixels(max_height_mm, dpi)
+
+        # Bereinigte Bytes aus dem SvgSource (verhindert Pango UTF-8 Warnungen)
+        source = get_svg_source(svg_path)
+        if source is None:
+            raise FileNotFoundError(f"SVG nicht lesbar: {svg_path}")
+        digest, svg_data = source.digest, source.sanitized
+
+        svg_text = svg_data.decode('utf-8')
+        geometry = parse_svg_geometry(svg_text)
+
+        if geometry is None:
+            self.logger.debug(f"SVG-Geometrie nicht eindeutig, rendere vollständig: {svg_path.name}")
+            render_scale = self._resolve_render_scale(render_scale, max_width_px, max_height_px)
+            image = self._render_full(svg_data, svg_path, dpi * render_scale)
+        else:
+            image = self._render_cropped(svg_text, geometry, digest, svg_path, max_width_px, max_height_px)
+
+        # SCHRITT 3: Auf Zielgröße einpassen (Seitenverhältnis beibehalten)
+        final_width, final_height = self._fit_size(image.width, image.height, max_width_px, max_height_px)
+        self.logger.info(
+            "Skalierung: {}x{}px -> {}x{}px".format(image.width, image.height, final_width, final_height)
+        )
+        if (final_width, final_height) != image.size:
+            image = image.resize((final_width, final_height), _FINAL_RESAMPLING)
+
+        return self._to_output_mode(image)
+
+    def _render_full(self, svg_data: bytes, svg_path: Path, resolution: float) -> Image.Image:
+        """Rastert komplettes SVG und trimmt (Fallback ohne Inhalts-Box)"""
+        image = self._rasterize(svg_data, resolution, svg_path)
+        bbox = content_bbox(image)
+        if bbox is None:
+            raise ValueError(f"SVG ohne sichtbaren Inhalt: {svg_path.name}")
+        self.logger.info(
+            "SVG gerendert @ {:.0f} DPI: {}x{}px, getrimmt auf {}x{}px".format(
+                resolution, image.width, image.height, bbox[2] - bbox[0], bbox[3] - bbox[1]
+            )
+        )
+        return image.crop(bbox)
+
+    def _render_cropped(
+        self,
+        svg_text: str,
+        geometry: SvgGeometry,
+        digest: str,
+        svg_path: Path,
+        max_width_px: int,
+        max_height_px: int
+    ) -> Image.Image:
+        """
+        Rastert nur die Inhalts-Box direkt in Zielgröße
+
+        FIXED: Ohne render_scale-Überabtastung - nur der Rand des Vorab-Passes wird
+        zusätzlich gerastert (sonst wieder z.B. 4-fache Fläche bei render_scale 2.0).
+
+        Returns:
+            Getrimmtes PIL Image (>= Zielgröße um den Vorab-Pass-Rand, wird danach nur verkleinert)
+        """
+        boxes = self.content_boxes.get(digest)
+        if boxes is None:
+            boxes = self._measure_content_box(svg_text, geometry, svg_path)
+            self.content_boxes.put(digest, boxes)
+        if boxes.get('empty'):
+            raise ValueError(f"SVG ohne sichtbaren Inhalt: {svg_path.name}")
+
+        box = boxes['box']
+        tight = boxes['tight']
+        px_per_unit = geometry.px_per_unit
+
+        # Auflösung so, dass der (unscharfe) Inhalt die Ziel-Box füllt; Rand-Unsicherheit des
+        # Vorab-Passes durch Überabtastung abdecken, damit danach nur verkleinert wird
+        fit = min(max_width_px / (tight[2] * px_per_unit), max_height_px / (tight[3] * px_per_unit))
+        oversample = max(box[2] / tight[2], box[3] / tight[3])
+        resolution = SYSTEM_CSS_PX_PER_INCH * fit * oversample
+
+        cropped = crop_svg_to_viewbox(svg_text, geometry, tuple(box)).encode('utf-8')
+        image = self._rasterize(cropped, resolution, svg_path)
+
+        bbox = content_bbox(image)
+        if bbox is None:
+            raise ValueError(f"SVG ohne sichtbaren Inhalt: {svg_path.name}")
+
+        self.logger.info(
+            "SVG-Ausschnitt gerendert @ {:.0f} DPI: {}x{}px, getrimmt auf {}x{}px".format(
+                resolution, image.width, image.height, bbox[2] - bbox[0], bbox[3] - bbox[1]
+            )
+        )
+        return image.crop(bbox)
+
+    def _measure_content_box(self, svg_text: str, geometry: SvgGeometry, svg_path: Path) -> Dict:
+        """
+        Vorab-Pass: Inhalts-Box bei niedriger Auflösung messen
+
+        Returns:
+            dict mit 'tight' (gemessen) und 'box' (um 1 Pixel erweitert, auf viewBox begrenzt)
+            in Benutzereinheiten, oder {'empty': True}
+        """
+        longest_px = max(geometry.width_px, geometry.height_px)
+        resolution = SYSTEM_CSS_PX_PER_INCH * SYSTEM_BBOX_PREPASS_MAX_PX / longest_px
+        image = self._rasterize(svg_text.encode('utf-8'), resolution, svg_path)
+
+        bbox = content_bbox(image)
+        if bbox is None:
+            return {'empty': True}
+
+        # Rasterpixel -> Benutzereinheiten
+        vx, vy, vw, vh = geometry.viewbox
+        unit_x = vw / image.width
+        unit_y = vh / image.height
+        left, top, right, bottom = bbox
+
+        tight = [vx + left * unit_x, vy + top * unit_y, (right - left) * unit_x, (bottom - top) * unit_y]
+
+        # 1 Pixel Sicherheitsrand (Antialiasing), nicht über die viewBox hinaus
+        x0 = max(vx, tight[0] - unit_x)
+        y0 = max(vy, tight[1] - unit_y)
+        x1 = min(vx + vw, tight[0] + tight[2] + unit_x)
+        y1 = min(vy + vh, tight[1] + tight[3] + unit_y)
+
+        self.logger.debug(
+            "Inhalts-Box {} @ {}x{}px Vorab-Pass: {}".format(svg_path.name, image.width, image.height, bbox)
+        )
+        return {'tight': tight, 'box': [x0, y0, x1 - x0, y1 - y0]}
+
+    def _resolve_render_scale(self, render_scale: float, max_width_px: int, max_height_px: int) -> float:
+        """
+        Bestimmt effektive Render-Skalierung
+
+        Fallback auf altes Verhalten wenn render_scale == 1.0
+        (Smart Render Scale basierend auf Zeichengröße)
+        """
+        if render_scale != 1.0:
+            self.logger.debug(f"Verwende render_scale aus Profil: {render_scale}")
+            return render_scale
+
+        if max_width_px > RESAMPLING_MAX_PX_SIZE_BIG or max_height_px > RESAMPLING_MAX_PX_SIZE_BIG:
+            render_scale = RESAMPLING_RENDER_SCALE_BIG_SVG  # Sehr große Zeichen
+            self.logger.debug("Sehr großes Zeichen: render_scale={}".format(render_scale))
+        elif max_width_px > RESAMPLING_MAX_PX_SIZE_MED or max_height_px > 1000:
+            render_scale = RESAMPLING_RENDER_SCALE_MED_SVG  # Große Zeichen
+            self.logger.debug("Großes Zeichen: render_scale={}".format(render_scale))
+        else:
+            render_scale = RESAMPLING_RENDER_SCALE_SMALL_SVG
+            self.logger.debug("Kleines Zeichen: render_scale={}".format(render_scale))
+        return render_scale
+
+    @staticmethod
+    def _fit_size(width: int, height: int, max_width_px: int, max_height_px: int) -> Tuple[int, int]:
+        """
+        Berechnet Zielgröße (so groß wie möglich, Seitenverhältnis beibehalten)
+
+        Returns:
+            Tuple (final_width, final_height) in Pixel
+        """
+        # Nimm den KLEINEREN Faktor (damit nichts ueber Limits geht)
+        scale = min(max_width_px / width, max_height_px / height)
+        return max(1, int(width * scale)), max(1, int(height * scale))
+
+    @staticmethod
+    def _to_output_mode(image: Image.Image) -> Image.Image:
+        """Konvertiert in PNG_COLOR_MODE (RGB: auf Weiß flachrechnen)"""
+        if image.mode == PNG_COLOR_MODE:
+            return image
+        if PNG_COLOR_MODE == 'RGB' and 'A' in image.getbands():
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert(PNG_COLOR_MODE)
+
+
+class ImageMagickRenderer(SVGRenderer):
+    """Renderer über Wand/ImageMagick (Delegate rsvg/MSVG)"""
+
+    name = RENDER_ENGINE_IMAGEMAGICK
+
+    def is_available(self) -> bool:
+        """Prüft ob Wand/ImageMagick geladen werden kann"""
+        try:
+            import wand.image  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def _rasterize(self, svg_data: bytes, resolution: float, svg_path: Path) -> Image.Image:
+        """Rastert SVG-Bytes mit ImageMagick (Blob-Eingabe, keine Temp-Datei)"""
+        from wand.api import library
+        from wand.compat import encode_filename
+        from wand.image import Image as WandImage
+
+        with WandImage() as img:
+            # FIXED: Dateiname statt "buffer.svg" (format='svg') - ImageMagick und der
+            # rsvg-Delegate lösen relative Referenzen (xlink:href, Fonts) relativ zur
+            # SVG-Datei auf, wie beim früheren Lesen über filename=
+            library.MagickSetFilename(img.wand, b'svg:' + encode_filename(str(svg_path.resolve())))
+            img.read(blob=svg_data, resolution=max(1, round(resolution)))
+            # CHANGED: Rohe RGBA-Pixel statt PNG-Blob (Alpha-Kanal bleibt erhalten)
+            return wand_to_pil(img)
+
+
+class CairoSVGRenderer(SVGRenderer):
+    """
+    In-Process-Renderer über cairosvg (optional)
+
+    Kein Delegate-Prozess: das SVG wird direkt im Python-Prozess über Cairo gerastert.
+    """
+
+    name = RENDER_ENGINE_CAIROSVG
+
+    def is_available(self) -> bool:
+        """Prüft ob cairosvg inkl. Cairo-Bibliothek geladen werden kann"""
+        try:
+            import cairosvg  # noqa: F401
+            return True
+        except (ImportError, OSError):
+            # OSError: cairocffi findet die native Cairo-Bibliothek nicht
+            return False
+
+    def _rasterize(self, svg_data: bytes, resolution: float, svg_path: Path) -> Image.Image:
+        """Rastert SVG-Bytes mit cairosvg"""
+        import cairosvg
+
+        # scale: CSS-Pixel (1/96 Zoll) -> Ziel-Auflösung; url: relative Referenzen auflösen
+        png_data = cairosvg.svg2png(
+            bytestring=svg_data,
+            scale=resolution / SYSTEM_CSS_PX_PER_INCH,
+            url=str(svg_path)
+        )
+
+        with Image.open(BytesIO(png_data)) as rendered:
+            return rendered.convert('RGBA')
+
+
+# Alle bekannten Renderer (Reihenfolge = Präferenz bei RENDER_ENGINE_AUTO)
+_RENDERER_CLASSES = {
+    RENDER_ENGINE_CAIROSVG: CairoSVGRenderer,
+    RENDER_ENGINE_IMAGEMAGICK: ImageMagickRenderer,
+}
+
+
+def get_available_renderers() -> List[SVGRenderer]:
+    """
+    Liefert alle verfügbaren Renderer (Präferenz-Reihenfolge für "auto")
+
+    Returns:
+        Liste instanziierter Renderer
+    """
+    renderers = []
+    for renderer_class in _RENDERER_CLASSES.values():
+        renderer = renderer_class()
+        if renderer.is_available():
+            renderers.append(renderer)
+    return renderers
+
+
+def is_valid_render_output(image: Optional[Image.Image], max_width_px: int, max_height_px: int) -> bool:
+    """
+    Prüft Renderer-Ergebnis auf Plausibilität
+
+    Ungültig sind: kein Bild, leere Größe, Überschreitung der Ziel-Box
+    sowie vollständig leere (transparente oder einfarbige) Bilder.
+
+    Args:
+        image: Renderer-Ergebnis
+        max_width_px: Maximale Breite in Pixel
+        max_height_px: Maximale Höhe in Pixel
+
+    Returns:
+        bool: True wenn gültig
+    """
+    if image is None or image.width < 1 or image.height < 1:
+        return False
+
+    # 1px Toleranz für Rundung
+    if image.width > max_width_px + 1 or image.height > max_height_px + 1:
+        return False
+
+    if 'A' in image.getbands():
+        if image.getchannel('A').getextrema()[1] == 0:
+            return False
+    else:
+        if all(low == high for low, high in image.getextrema()):
+            return False
+
+    return True
+
+
+class SVGRendererChain:
+    """
+    Wählt pro SVG einen Renderer mit automatischem Fallback
+
+    - Bevorzugter Renderer laut render_engine (RuntimeConfig)
+    - Bei Fehler oder ungültigem Ergebnis: nächster verfügbarer Renderer
+    - Renderer, die für ein SVG versagt haben, werden für dieses SVG
+      (Pfad + mtime) nicht erneut versucht
+    - Thread-safe
+    """
+
+    def __init__(self, engine: Optional[str] = None, renderers: Optional[List[SVGRenderer]] = None):
+        """
+        Initialisiert Renderer-Kette
+
+        Args:
+            engine: "auto", "imagemagick" oder "cairosvg" (default: aus RuntimeConfig)
+            renderers: Kandidaten (default: alle verfügbaren Renderer)
+        """
+        self.logger = LoggingManager().get_logger(__name__)
+
+        if engine is None:
+            from runtime_config import get_config
+            engine = get_config().render_engine
+
+        self.engine = engine
+        available = renderers if renderers is not None else get_available_renderers()
+
+        if engine == RENDER_ENGINE_AUTO:
+            self.renderers = available
+        else:
+            # Gewählter Renderer zuerst, übrige als Fallback
+            self.renderers = sorted(available, key=lambda r: r.name != engine)
+            if self.renderers and self.renderers[0].name != engine:
+                self.logger.warning(f"Renderer '{engine}' nicht verfügbar - verwende Fallback")
+
+        if not self.renderers:
+            self.logger.warning("Kein SVG-Renderer verfügbar (Wand/ImageMagick oder cairosvg fehlt)")
+
+        self._rejected: Dict[str, Set[Tuple[str, int]]] = {r.name: set() for r in self.renderers}
+        self._lock = Lock()
+
+        self.logger.debug(
+            "SVG-Renderer: {} (Reihenfolge: {})".format(engine, [r.name for r in self.renderers])
+        )
+
+    def render(
+        self,
+        svg_path: Path,
+        max_height_mm: float,
+        max_width_mm: float,
+        dpi: int,
+        render_scale: float = 1.0
+    ) -> Image.Image:
+        """
+        Rendert SVG mit dem ersten Renderer, der ein gültiges Ergebnis liefert
+
+        Args: siehe SVGRenderer.render
+
+        Returns:
+            PIL Image
+
+        Raises:
+            RuntimeError: Wenn kein Renderer ein gültiges Ergebnis liefert
+        """
+        max_width_px = mm_to_pixels(max_width_mm, dpi)
+        max_height_px = mm_to_pixels(max_height_mm, dpi)
+        svg_id = self._svg_id(svg_path)
+        last_error = "kein Renderer verfügbar"
+
+        for renderer in self.renderers:
+            with self._lock:
+                if svg_id in self._rejected[renderer.name]:
+                    continue
+
+            try:
+                image = renderer.render(svg_path, max_height_mm, max_width_mm, dpi, render_scale)
+                if is_valid_render_output(image, max_width_px, max_height_px):
+                    return image
+                last_error = "ungültiges Ergebnis"
+            except Exception as e:
+                last_error = str(e)
+
+            self.logger.warning(
+                f"Renderer '{renderer.name}' für {svg_path.name} verworfen ({last_error}) - Fallback"
+            )
+            with self._lock:
+                self._rejected[renderer.name].add(svg_id)
+
+        raise RuntimeError(f"Kein Renderer konnte {svg_path.name} rendern: {last_error}")
+
+    @staticmethod
+    def _svg_id(svg_path: Path) -> Tuple[str, int]:
+        """Identität eines SVGs (Pfad + mtime) für Fallback-Gedächtnis"""
+        try:
+            return str(svg_path), svg_path.stat().st_mtime_ns
+        except OSError:
+            return str(svg_path), 0
+
+
+def compare_renderers(
+    svg_paths: List[Path],
+    dpi: int = 300,
+    max_height_mm: float = 39.0,
+    max_width_mm: float = 39.0,
+    render_scale: float = 1.0
+) -> List[Dict]:
+    """
+    Vergleicht alle verfügbaren Renderer (Zeit + Pixel-Abweichung)
+
+    Referenz für die Pixel-Abweichung ist ImageMagick (falls verfügbar),
+    sonst der erste verfügbare Renderer. Abweichende Ergebnisgrößen werden
+    vor dem Vergleich auf die Referenzgröße skaliert.
+
+    Args:
+        svg_paths: Zu rendernde SVG-Dateien
+        dpi: Ziel-DPI
+        max_height_mm: Maximale Grafik-Höhe in mm
+        max_width_mm: Maximale Grafik-Breite in mm
+        render_scale: Render-Skalierung
+
+    Returns:
+        Liste von Dicts: svg, renderer, seconds, size, diff_percent, error
+    """
+    renderers = sorted(get_available_renderers(), key=lambda r: r.name != RENDER_ENGINE_IMAGEMAGICK)
+    results = []
+
+    for svg_path in svg_paths:
+        reference = None
+        for renderer in renderers:
+            entry = {
+                'svg': svg_path.name,
+                'renderer': renderer.name,
+                'seconds': None,
+                'size': None,
+                'diff_percent': None,
+                'error': None
+            }
+            try:
+                start = time.perf_counter()
+                image = renderer.render(svg_path, max_height_mm, max_width_mm, dpi, render_scale)
+                entry['seconds'] = time.perf_counter() - start
+                entry['size'] = image.size
+
+                if reference is None:
+                    reference = image
+                    entry['diff_percent'] = 0.0
+                else:
+                    entry['diff_percent'] = _pixel_diff_percent(reference, image)
+            except Exception as e:
+                entry['error'] = str(e)
+            results.append(entry)
+
+    return results
+
+
+def _pixel_diff_percent(reference: Image.Image, candidate: Image.Image) -> float:
+    """
+    Mittlere absolute Pixel-Abweichung in Prozent (0 = identisch)
+
+    Args:
+        reference: Referenzbild
+        candidate: Vergleichsbild (wird bei Bedarf auf Referenzgröße skaliert)
+    """
+    ref = reference.convert('RGBA')
+    cand = candidate.convert('RGBA')
+    if cand.size != ref.size:
+        cand = cand.resize(ref.size, Image.Resampling.LANCZOS)
+
+    stat = ImageStat.Stat(ImageChops.difference(ref, cand))
+    return sum(stat.mean) / len(stat.mean) / 255.0 * 100.0
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("SVG-RENDERER TEST")
+    print("=" * 80)
+
+    available = get_available_renderers()
+    print(f"\nVerfügbare Renderer: {[r.name for r in available]}")
+
+    print("\n[TEST] Ergebnis-Validierung")
+    print(f"  Leeres RGBA ungültig:  {not is_valid_render_output(Image.new('RGBA', (10, 10)), 20, 20)}")
+    print(f"  Zu groß ungültig:      {not is_valid_render_output(Image.new('RGB', (30, 30)), 20, 20)}")
+    test_image = Image.new('RGBA', (10, 10))
+    test_image.putpixel((5, 5), (0, 0, 0, 255))
+    print(f"  Inhalt gültig:         {is_valid_render_output(test_image, 20, 20)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg = Path(tmp) / "test.svg"
+        svg.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+            '<rect x="10" y="10" width="80" height="40" fill="red"/></svg>'
+        )
+        for row in compare_renderers([svg]):
+            print(f"  {row}")
+
+    print("\n" + "=" * 80)
+    print("[OK] Alle Tests abgeschlossen")
+    print("=" * 80)
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+svg_source.py - Einmal geladenes SVG-Dokument für alle Prüfungen
+
+Pro Zeichen wurde die SVG-Datei bisher mehrfach gelesen (Validierung,
+Pseudo-SVG-Erkennung, PNG-Extraktion, Bereinigung, Font-Prüfungen) und
+zweimal mit ElementTree geparst. SvgSource lädt die Bytes genau einmal
+und leitet alles Weitere lazy daraus ab.
+
+Features:
+- Memoisiert pro (Pfad, mtime, Größe) - unveränderte Dateien werden nie erneut gelesen
+- Inhalts-adressiert: identische SVGs unter verschiedenen Pfaden teilen sich ein Objekt
+- Größenbudget mit LRU-Verdrängung
+- Thread-safe
+
+Verwendung:
+    source = get_svg_source(svg_path)
+    if source is not None and source.is_valid:
+        data = source.sanitized
+"""
+
+import base64
+import hashlib
+import re
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from functools import cached_property
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Set, Tuple
+
+from logging_manager import LoggingManager
+from constants import SYSTEM_SVG_SOURCE_CACHE_MAX_MB
+
+
+# Generische Schriftfamilien (keine installierbaren Schriftarten)
+GENERIC_FONT_FAMILIES = {'serif', 'sans-serif', 'monospace', 'cursive', 'fantasy'}
+
+_PSEUDO_PNG_MARKER = 'data:image/png;base64,'
+_EMBEDDED_PNG_RE = re.compile(r'data:image/png;base64,([A-Za-z0-9+/=]+)')
+_VECTOR_ELEMENTS = ['<path', '<circle', '<rect', '<polygon', '<polyline', '<line', '<ellipse']
+
+
+def _split_font_families(value: str) -> Set[str]:
+    """Zerlegt "Arial, 'DejaVu Sans'" in einzelne Schriftnamen"""
+    fonts = set()
+    for font in value.split(','):
+        font = font.strip().strip("'\"")
+        if font:
+            fonts.add(font)
+    return fonts
+
+
+class SvgSource:
+    """
+    Inhalt einer SVG-Datei mit lazy abgeleiteten Eigenschaften
+
+    Alle Eigenschaften werden beim ersten Zugriff berechnet und danach
+    wiederverwendet. Das Objekt ist unveränderlich (Datei-Änderung = neues Objekt).
+    """
+
+    def __init__(self, path: Path, raw: bytes):
+        """
+        Args:
+            path: Pfad, unter dem der Inhalt zuerst geladen wurde
+            raw: Dateiinhalt
+        """
+        self.path = path
+        self.raw = raw
+        self.digest = hashlib.sha256(raw).hexdigest()
+
+    @cached_property
+    def text(self) -> Optional[str]:
+        """Inhalt als Text (striktes UTF-8), None bei ungültiger Kodierung"""
+        try:
+            return self.raw.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+
+    @cached_property
+    def is_valid(self) -> bool:
+        """Gültig: nicht leer, UTF-8, beginnt mit '<'"""
+        return bool(self.raw) and self.text is not None and self.text.strip().startswith('<')
+
+    @cached_property
+    def is_pseudo(self) -> bool:
+        """Pseudo-SVG: nur eingebettetes PNG, keine Vektor-Elemente"""
+        if self.text is None:
+            return False
+        has_png = _PSEUDO_PNG_MARKER in self.text
+        has_vector = any(elem in self.text for elem in _VECTOR_ELEMENTS)
+        return has_png and not has_vector
+
+    @cached_property
+    def embedded_png(self) -> Optional[bytes]:
+        """Erstes eingebettetes PNG (dekodiert) oder None"""
+        if self.text is None:
+            return None
+        match = _EMBEDDED_PNG_RE.search(self.text)
+        if not match:
+            return None
+        return base64.b64decode(match.group(1))
+
+    @cached_property
+    def sanitized(self) -> bytes:
+        """Inhalt ohne ungültige UTF-8-Zeichen (verhindert Pango-Warnungen)"""
+        if self.text is not None:
+            return self.raw
+        return self.raw.decode('utf-8', errors='ignore').encode('utf-8')
+
+    @cached_property
+    def _parsed(self) -> Tuple[Optional[ET.Element], Optional[str]]:
+        """XML-Baum (einmal geparst) und ggf. Parse-Fehler"""
+        try:
+            return ET.fromstring(self.raw), None
+        except ET.ParseError as e:
+            return None, str(e)
+
+    @property
+    def xml_root(self) -> Optional[ET.Element]:
+        """Root-Element oder None bei Parse-Fehler"""
+        return self._parsed[0]
+
+    @property
+    def parse_error(self) -> Optional[str]:
+        """Parse-Fehler oder None"""
+        return self._parsed[1]
+
+    @cached_property
+    def text_font_info(self) -> Tuple[bool, Set[str]]:
+        """
+        Schriftarten in <text>/<tspan>-Elementen
+
+        Returns:
+            Tuple: (hat_text_elemente, set_von_font_families)
+        """
+        root = self.xml_root
+        if root is None:
+            return False, set()
+
+        fonts = set()
+        has_text = False
+        for elem in root.iter():
+            tag_name = elem.tag.split('}')[-1] if isinstance(elem.tag, str) else ''
+            if tag_name not in ('text', 'tspan'):
+                continue
+            has_text = True
+
+            # Format: "font-family:Arial" oder "font-family: Arial, sans-serif"
+            match = re.search(r'font-family:\s*([^;]+)', elem.get('style', ''))
+            if match:
+                fonts |= _split_font_families(match.group(1))
+            fonts |= _split_font_families(elem.get('font-family', ''))
+
+        return has_text, fonts
+
+    @cached_property
+    def font_families(self) -> Set[str]:
+        """
+        Alle Schriftarten im Dokument (Attribute + style), ohne generische Familien
+        """
+        root = self.xml_root
+        if root is None:
+            return set()
+
+        fonts = set()
+        for elem in root.iter():
+            fonts |= _split_font_families(elem.get('font-family', ''))
+
+            style = elem.get('style')
+            if style and 'font-family' in style:
+                # Parse CSS: "font-size:12px;font-family:'Arial';color:black"
+                for declaration in style.split(';'):
+                    if 'font-family' in declaration and ':' in declaration:
+                        fonts |= _split_font_families(declaration.split(':', 1)[1])
+
+        return fonts - GENERIC_FONT_FAMILIES
+
+
+class SvgSourceCache:
+    """
+    Memoisiert SvgSource-Objekte pro (Pfad, mtime, Größe) und Inhalts-Hash
+    """
+
+    def __init__(self, max_size_mb: int = SYSTEM_SVG_SOURCE_CACHE_MAX_MB):
+        """
+        Args:
+            max_size_mb: Größenbudget in MB (Summe der Rohdaten)
+        """
+        self.logger = LoggingManager().get_logger(__name__)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = Lock()
+        self._by_stat: Dict[Tuple[str, int, int], str] = {}
+        self._by_digest: "OrderedDict[str, SvgSource]" = OrderedDict()
+        # FIXED: Rückverweise, damit _by_stat nicht mit jeder Änderung einer Datei wächst
+        self._stat_by_path: Dict[str, Tuple[str, int, int]] = {}  # Pfad -> aktueller Stat-Schlüssel
+        self._stats_by_digest: Dict[str, Set[Tuple[str, int, int]]] = {}
+        self._total_bytes = 0
+
+    def get(self, svg_path: Path) -> Optional[SvgSource]:
+        """
+        Liefert SvgSource für Pfad
+
+        Args:
+            svg_path: Pfad zur SVG-Datei
+
+        Returns:
+            SvgSource oder None (Blanko-Zeichen / Datei fehlt / nicht lesbar)
+        """
+        from svg_loader_local import SVGLoaderLocal
+
+        # Blanko-Zeichen sind virtuelle Pfade, keine echten Dateien
+        if SVGLoaderLocal.is_blanko_zeichen(svg_path):
+            return None
+
+        try:
+            stat = svg_path.stat()
+        except OSError:
+            return None
+
+        stat_key = (str(svg_path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._by_stat.get(stat_key)
+            source = self._by_digest.get(digest) if digest is not None else None
+            if source is not None:
+                self._by_digest.move_to_end(digest)
+                self.hits += 1
+                return source
+
+        try:
+            raw = svg_path.read_bytes()
+        except OSError as e:
+            self.logger.debug(f"SVG nicht lesbar: {svg_path} ({e})")
+            return None
+
+        source = SvgSource(svg_path, raw)
+
+        with self._lock:
+            self.misses += 1
+            self._remember_stat_locked(stat_key, source.digest)
+            existing = self._by_digest.get(source.digest)
+            if existing is not None:
+                # Gleicher Inhalt unter anderem Pfad (oder parallel geladen)
+                self._by_digest.move_to_end(source.digest)
+                return existing
+
+            self._by_digest[source.digest] = source
+            self._total_bytes += len(raw)
+            while self._total_bytes > self.max_size_bytes and len(self._by_digest) > 1:
+                evicted_digest, evicted = self._by_digest.popitem(last=False)
+                self._total_bytes -= len(evicted.raw)
+                for evicted_key in list(self._stats_by_digest.get(evicted_digest, ())):
+                    self._forget_stat_locked(evicted_key)
+            return source
+
+    def _remember_stat_locked(self, stat_key: Tuple[str, int, int], digest: str):
+        """Stat-Schlüssel -> Digest (ersetzt den alten Schlüssel desselben Pfads) - Aufrufer hält _lock"""
+        old_key = self._stat_by_path.get(stat_key[0])
+        if old_key is not None and old_key != stat_key:
+            self._forget_stat_locked(old_key)
+        self._by_stat[stat_key] = digest
+        self._stat_by_path[stat_key[0]] = stat_key
+        self._stats_by_digest.setdefault(digest, set()).add(stat_key)
+
+    def _forget_stat_locked(self, stat_key: Tuple[str, int, int]):
+        """Entfernt Stat-Schlüssel samt Rückverweisen - Aufrufer hält _lock"""
+        digest = self._by_stat.pop(stat_key, None)
+        if self._stat_by_path.get(stat_key[0]) == stat_key:
+            del self._stat_by_path[stat_key[0]]
+        keys = self._stats_by_digest.get(digest)
+        if keys is not None:
+            keys.discard(stat_key)
+            if not keys:
+                del self._stats_by_digest[digest]
+
+    def clear(self):
+        """Leert Cache"""
+        with self._lock:
+            self._by_stat.clear()
+            self._by_digest.clear()
+            self._stat_by_path.clear()
+            self._stats_by_digest.clear()
+            self._total_bytes = 0
+
+
+# Prozessweiter Cache (Loader, Generator, Renderer und Font-Tracker teilen sich die Objekte)
+_svg_source_cache = SvgSourceCache()
+
+
+def get_svg_source_cache_bytes() -> int:
+    """Rohdaten im prozessweiten SVG-Cache (für MemoryScheduler)"""
+    return _svg_source_cache._total_bytes
+
+
+def get_svg_source(svg_path: Path) -> Optional[SvgSource]:
+    """
+    Liefert das (memoisierte) SvgSource-Objekt für eine Datei
+
+    Args:
+        svg_path: Pfad zur SVG-Datei
+
+    Returns:
+        SvgSource oder None (Blanko-Zeichen / Datei fehlt / nicht lesbar)
+    """
+    return _svg_source_cache.get(svg_path)
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    import tempfile
+
+    print("=" * 80)
+    print("SVG-SOURCE TEST")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        svg = Path(tmp) / "test.svg"
+        svg.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg"><text font-family="Arial, sans-serif">A</text>'
+            '<rect/></svg>',
+            encoding='utf-8'
+        )
+
+        source = get_svg_source(svg)
+        print(f"\n[TEST 1] Gültig: {source.is_valid}")
+        print(f"[TEST 2] Pseudo-SVG: {source.is_pseudo}")
+        print(f"[TEST 3] Text-Fonts: {source.text_font_info}")
+        print(f"[TEST 4] Font-Familien: {source.font_families}")
+        print(f"[TEST 5] Memoisiert: {get_svg_source(svg) is source}")
+
+    print("\n" + "=" * 80)
+    print("[OK] Alle Tests abgeschlossen")
+    print("=" * 80)
@@ -41,14 +41,12 @@ Version: 0.3.5-templates
 
 from pathlib import Path
 from PIL import Image, ImageDraw
-from wand.image import Image as WandImage
-import re
-import base64
 from io import BytesIO
 import sys
 import math
-from typing import List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Tuple, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from threading import Lock
 import time
 
@@ -69,13 +67,7 @@ from constants import (
     PLACEHOLDER_STAERKE_DIGITS,
     PLACEHOLDER_RUF_LENGTH,
     DEFAULT_FONT_SIZE,
-    RESAMPLING_FILTER,
     EXPORT_PNG_COMPRESS_LEVEL,
-    RESAMPLING_RENDER_SCALE_BIG_SVG,
-    RESAMPLING_RENDER_SCALE_MED_SVG,
-    RESAMPLING_RENDER_SCALE_SMALL_SVG,
-    RESAMPLING_MAX_PX_SIZE_BIG,
-    RESAMPLING_MAX_PX_SIZE_MED,
     PNG_COLOR_MODE,  # NEW: Farbmodus (RGBA fuer Transparenz)
     PNG_COLOR_MODE_RGBA,  # NEW: RGBA-Konstante
     PNG_BACKGROUND_COLOR_TRANSPARENT,  # NEW: Transparente Hintergrundfarbe
@@ -89,19 +81,42 @@ from constants import (
     S1_STAERKE_LEFT_MARGIN_FACTOR,  # NEW: Linker Rand für handschriftliche Zahlen (Stärkeangabe)
     S1_STAERKE_GAP_FACTOR,  # NEW: Gap zwischen letztem Slash und Unterstrich (Stärkeangabe)
     S1_STAERKE_SLASH_COUNT,  # NEW: Anzahl Schrägstriche (Stärkeangabe)
+    RENDER_BACKEND_PROCESS,  # NEW: Prozess-Pool Render-Backend
+    TEMPLATE_CACHE_SCOPE_SESSION,  # NEW: Template-Speicher über Batches hinweg
+    BATCH_ENGINE_PIPELINE,  # NEW: Stufen-Pipeline statt Stapel
     LINE_HEIGHT_FACTOR,  # NEW: Zeilenabstand-Faktor (S1-Layout)
     SYSTEM_POINTS_PER_INCH,  # NEW: Points per Inch (S1-Layout)
     DEFAULT_S1_LINKS_PROZENT,  # NEW: S1 Layout Links/Rechts Aufteilung
     DEFAULT_S1_ANZAHL_SCHREIBLINIEN,  # NEW: S1 Layout Anzahl Schreiblinien
     DEFAULT_S1_STAERKE_ANZEIGEN,  # NEW: S1 Layout Stärke anzeigen
     create_staerke_placeholder,  # NEW: Stärke-Platzhalter generieren (S1-Layout)
-    mm_to_pixels,
-    ZEICHEN_SIZE_THRESHOLD_VERY_LARGE_MM,  # Schwellwert für sehr große Zeichen
-    ZEICHEN_SIZE_THRESHOLD_LARGE_MM  # Schwellwert für große Zeichen
+    mm_to_pixels
 )
 from svg_loader_local import SVGLoaderLocal
 from text_overlay import TextOverlayPlaceholder, ZeichenConfig
 from print_preparer import PrintPreparer
+from raster_cache import RasterCache
+from svg_source import get_svg_source
+from template_store import TemplateStore
+from batch_pipeline import BatchPipeline, PipelineStage
+from memory_scheduler import MemoryScheduler
+from svg_renderer import SVGRendererChain, ImageMagickRenderer, sanitize_svg_content
+from vector_canvas import VectorCanvas, get_draw, load_vector_graphic
+
+
+class _PipelineJob:
+    """Zeichen auf dem Weg durch die Batch-Pipeline (Rendern -> Komponieren -> Kodieren -> Schreiben)"""
+
+    __slots__ = ('svg_path', 'config', 'svg_template', 'image', 'png_data', 'output_file', 'timings')
+
+    def __init__(self, svg_path: Path, config: ZeichenConfig):
+        self.svg_path = svg_path
+        self.config = config
+        self.svg_template = None
+        self.image = None
+        self.png_data = None
+        self.output_file = None
+        self.timings = {'render': 0.0, 'generate': 0.0, 'export': 0.0}
 
 
 class TaktischeZeichenGenerator:
@@ -127,11 +142,52 @@ class TaktischeZeichenGenerator:
         self.svg_loader = SVGLoaderLocal(zeichen_dir)
         self.text_overlay = TextOverlayPlaceholder()
         self.print_preparer = PrintPreparer()
+        self.raster_cache = RasterCache()  # NEW: Persistenter Raster-Cache
+        self.render_pool = None  # NEW: Optionaler Prozess-Pool (render_backend="process")
+        self.svg_renderer = SVGRendererChain()  # NEW: Renderer-Auswahl mit Fallback
+        self.template_store = TemplateStore()  # NEW: Stapelübergreifender Template-Speicher
 
         EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
         self.logger.info("TaktischeZeichenGenerator initialisiert")
 
+    def start_render_pool(self, num_workers: Optional[int] = None):
+        """
+        Startet Prozess-Pool für SVG-Rasterisierung (falls noch nicht aktiv)
+
+        Der Pool bleibt bis shutdown_render_pool() bestehen und wird von allen
+        Batch-Methoden und PDF-Exportern dieses Generators genutzt.
+
+        Args:
+            num_workers: Anzahl Worker-Prozesse (default: Anzahl CPU-Kerne)
+        """
+        if self.render_pool is not None:
+            return
+
+        from render_pool import RenderProcessPool
+        self.render_pool = RenderProcessPool(num_workers)
+
+    def shutdown_render_pool(self):
+        """Beendet Prozess-Pool (falls aktiv)"""
+        if self.render_pool is not None:
+            self.render_pool.shutdown()
+            self.render_pool = None
+
+    def apply_render_backend(self, render_backend: Optional[str], num_workers: int):
+        """
+        Aktiviert das gewünschte Render-Backend
+
+        Args:
+            render_backend: "thread" oder "process" (None = aus RuntimeConfig)
+            num_workers: Anzahl Worker-Prozesse für das Prozess-Backend
+        """
+        if render_backend is None:
+            from runtime_config import get_config
+            render_backend = get_config().render_backend
+
+        if render_backend == RENDER_BACKEND_PROCESS:
+            self.start_render_pool(num_workers)
+
     def _get_max_grafik_groesse_mm(self) -> float:
         """
         Berechnet maximale Grafikgröße aus RuntimeConfig
@@ -175,17 +231,9 @@ class TaktischeZeichenGenerator:
             if SVGLoaderLocal.is_blanko_zeichen(svg_path):
                 return False
 
-            # Datei muss existieren
-            if not svg_path.exists():
-                return False
-
-            content = svg_path.read_text(encoding='utf-8')
-
-            has_png = 'data:image/png;base64,' in content
-            vector_elements = ['<path', '<circle', '<rect', '<polygon', '<polyline', '<line', '<ellipse']
-            has_vector = any(elem in content for elem in vector_elements)
-
-            return has_png and not has_vector
+            # CHANGED: Einmal geladenes SvgSource (Datei muss existieren)
+            source = get_svg_source(svg_path)
+            return source is not None and source.is_pseudo
 
         except Exception as e:
             self.logger.warning("Konnte SVG nicht pruefen: {}".format(e))
@@ -195,13 +243,13 @@ class TaktischeZeichenGenerator:
         """Extrahiert PNG aus Pseudo-SVG"""
         self.logger.info("Pseudo-SVG erkannt - extrahiere PNG")
         
-        content = svg_path.read_text(encoding='utf-8')
-        match = re.search(r'data:image/png;base64,([A-Za-z0-9+/=]+)', content)
-        
-        if not match:
+        # CHANGED: PNG aus einmal geladenem SvgSource
+        source = get_svg_source(svg_path)
+        png_data = source.embedded_png if source is not None else None
+
+        if png_data is None:
             raise ValueError("Kein eingebettetes PNG gefunden")
-        
-        png_data = base64.b64decode(match.group(1))
+
         pil_image = Image.open(BytesIO(png_data))
 
         # CHANGED: RGBA beibehalten statt RGB-Konvertierung
@@ -225,7 +273,7 @@ class TaktischeZeichenGenerator:
                 ←   70%   → 5% ← 25% →
 
         Args:
-            draw: ImageDraw-Objekt
+            draw: ImageDraw-Objekt (oder VectorCanvas beim Vektor-PDF)
             y_pos: Y-Position der Schreiblinie (Baseline)
             line_x_start: Linke Grenze (mit Margin)
             line_x_end: Rechte Grenze (mit Margin)
@@ -298,46 +346,20 @@ class TaktischeZeichenGenerator:
             )
         )
 
-    def _sanitize_svg_content(self, svg_path: Path) -> Path:
+    def _sanitize_svg_content(self, svg_path: Path) -> Optional[bytes]:
         """
-        Bereinigt SVG-Inhalt von ungültigen UTF-8-Zeichen
+        Liefert SVG-Inhalt bereinigt von ungültigen UTF-8-Zeichen
 
-        Dies verhindert Warnungen wie:
-        "Invalid UTF-8 string passed to pango_layout_set_text()"
+        CHANGED: Bereinigung im Speicher (svg_renderer.sanitize_svg_content),
+        keine temporäre Datei mehr. Ergebnis wird pro Inhalts-Hash gecacht.
 
         Args:
             svg_path: Pfad zur SVG-Datei
 
         Returns:
-            Path zur bereinigten temporären SVG-Datei
+            Bereinigte SVG-Bytes oder None (Blanko-Zeichen / Datei nicht lesbar)
         """
-        try:
-            # FIXED: Blanko-Zeichen sind virtuelle Pfade, keine echten Dateien
-            if SVGLoaderLocal.is_blanko_zeichen(svg_path):
-                return svg_path
-
-            # FIXED: Datei muss existieren
-            if not svg_path.exists():
-                return svg_path
-
-            # Lese SVG mit error='ignore' um ungueltige UTF-8 Zeichen zu ueberspringen
-            with open(svg_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # Schreibe bereinigten Inhalt in temporaere Datei
-            import tempfile
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.svg', prefix='sanitized_')
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            # Schliesse den File Descriptor
-            import os
-            os.close(temp_fd)
-
-            return Path(temp_path)
-        except Exception as e:
-            self.logger.debug(f"SVG-Bereinigung fehlgeschlagen, verwende Original: {e}")
-            return svg_path
+        return sanitize_svg_content(svg_path)
 
     def _svg_to_image_imagemagick(
         self,
@@ -348,126 +370,32 @@ class TaktischeZeichenGenerator:
         render_scale: float = 1.0  # v7.1 Phase 2: Übergeben aus ZeichenConfig
     ) -> Image.Image:
         """
-        Konvertiert SVG mit ImageMagick (Fallback)
+        Konvertiert SVG mit ImageMagick (ohne Renderer-Auswahl)
 
-        OPTIMIERT: ERST hochskalieren, DANN trimmen!
-
-        Workflow:
-        1. SVG bei hoher Aufloesung rendern (3x Zielgroesse fuer Praezision)
-        2. Bei hoher Aufloesung trimmen (praezise!)
-        3. Auf Zielgroesse skalieren
-
-        Vorteil: Trimming bei hoher Aufloesung ist viel genauer
+        CHANGED: Implementierung liegt in svg_renderer.ImageMagickRenderer
 
         Args:
             render_scale: Skalierungsfaktor (v7.1 Phase 2: aus RenderProfile)
         """
-        self.logger.info("Konvertiere mit ImageMagick (Fallback)")
-
-        max_width_px = mm_to_pixels(max_width_mm, dpi)
-        max_height_px = mm_to_pixels(max_height_mm, dpi)
-
-        # v7.1 Phase 2: render_scale wird aus ZeichenConfig.render_scale übergeben
-        # Fallback auf altes Verhalten wenn render_scale == 1.0
-        if render_scale == 1.0:
-            # LEGACY: Smart Render Scale basierend auf Zeichengröße (Fallback)
-            self.logger.debug(f"Datei: {svg_path}")
-            if max_width_px > RESAMPLING_MAX_PX_SIZE_BIG or max_height_px > RESAMPLING_MAX_PX_SIZE_BIG:
-                render_scale = RESAMPLING_RENDER_SCALE_BIG_SVG  # Sehr große Zeichen
-                self.logger.debug("Sehr großes Zeichen: render_scale={}".format(render_scale))
-            elif max_width_px > RESAMPLING_MAX_PX_SIZE_MED or max_height_px > 1000:
-                render_scale = RESAMPLING_RENDER_SCALE_MED_SVG  # Große Zeichen
-                self.logger.debug("Großes Zeichen: render_scale={}".format(render_scale))
-            else:
-                render_scale = RESAMPLING_RENDER_SCALE_SMALL_SVG
-                self.logger.debug("Kleines Zeichen: render_scale={}".format(render_scale))
-        else:
-            self.logger.debug(f"Verwende render_scale aus Profil: {render_scale}")
+        return ImageMagickRenderer().render(svg_path, max_height_mm, max_width_mm, dpi, render_scale)
 
-        # Bereinige SVG vor dem Rendern (verhindert Pango UTF-8 Warnungen)
-        sanitized_svg_path = self._sanitize_svg_content(svg_path)
-        temp_file_created = (sanitized_svg_path != svg_path)
-
-        try:
-            with WandImage(filename=str(sanitized_svg_path), resolution=int(dpi * render_scale)) as img:
-                # SCHRITT 1: SVG bei hoher Aufloesung rendern
-                orig_w = img.width
-                orig_h = img.height
-
-                self.logger.info(
-                    "SVG gerendert @ {}x DPI: {}x{}px".format(
-                        render_scale, orig_w, orig_h
-                    )
-                )
-
-                # SCHRITT 2: Bei HOHER Aufloesung trimmen (praezise!)
-                img.trim(fuzz=0)
-
-                trimmed_width = img.width
-                trimmed_height = img.height
-
-                if trimmed_width != orig_w or trimmed_height != orig_h:
-                    self.logger.info(
-                        "SVG getrimmt @ high-res: {}x{} -> {}x{}px".format(
-                            orig_w, orig_h,
-                            trimmed_width, trimmed_height
-                        )
-                    )
-
-                # SCHRITT 3: Skalierung auf Zielgroesse berechnen
-                # Grafik soll so gross wie moeglich werden:
-                # - Nicht breiter als max_width_px
-                # - Nicht hoeher als max_height_px
-                # - Seitenverhaeltnis beibehalten
-
-                # Berechne was die Grafik bei 1x Aufloesung waere
-                current_width_1x = trimmed_width / render_scale
-                current_height_1x = trimmed_height / render_scale
-
-                # Berechne Skalierungsfaktoren
-                scale_w = max_width_px / current_width_1x
-                scale_h = max_height_px / current_height_1x
-
-                # Nimm den KLEINEREN Faktor (damit nichts ueber Limits geht)
-                scale = min(scale_w, scale_h)
-
-                # Finale Groesse
-                final_width = int(current_width_1x * scale)
-                final_height = int(current_height_1x * scale)
-
-                self.logger.info(
-                    "Skalierung: {}x{} @ 1x -> {}x{}px (Faktor: {:.3f})".format(
-                        int(current_width_1x), int(current_height_1x),
-                        final_width, final_height, scale
-                    )
-                )
-
-                # SCHRITT 4: Auf Zielgroesse skalieren
-                # OPTIMIZED: 'catrom' Filter ist schneller als 'lanczos' bei guter Qualität
-                img.resize(final_width, final_height, filter=RESAMPLING_FILTER)
-
-                # CHANGED: Alpha-Kanal beibehalten fuer Transparenz (fuer Druck auf farbigem Untergrund)
-                # REMOVED: img.alpha_channel = 'remove'
-                # Transparenz bleibt erhalten -> PNG mit RGBA statt RGB
-
-                png_blob = img.make_blob('png')
-
-            pil_image = Image.open(BytesIO(png_blob))
+    def _render_svg(
+        self,
+        svg_path: Path,
+        max_height_mm: float,
+        max_width_mm: float,
+        dpi: int,
+        render_scale: float = 1.0
+    ) -> Image.Image:
+        """
+        Rendert SVG mit dem konfigurierten Renderer (inkl. Fallback)
 
-            # CHANGED: RGBA beibehalten statt RGB-Konvertierung
-            if pil_image.mode != PNG_COLOR_MODE:
-                pil_image = pil_image.convert(PNG_COLOR_MODE)
+        NEW: Renderer-Auswahl über SVGRendererChain (render_engine)
 
-            return pil_image
-        finally:
-            # Cleanup: Temporäre Datei löschen falls erstellt
-            if temp_file_created:
-                try:
-                    import os
-                    os.unlink(sanitized_svg_path)
-                    self.logger.debug(f"Temporäre SVG-Datei gelöscht: {sanitized_svg_path}")
-                except Exception as e:
-                    self.logger.debug(f"Fehler beim Löschen der temporären SVG: {e}")
+        Args:
+            render_scale: Skalierungsfaktor (aus RenderProfile)
+        """
+        return self.svg_renderer.render(svg_path, max_height_mm, max_width_mm, dpi, render_scale)
 
     def _svg_to_image(
         self,
@@ -478,10 +406,11 @@ class TaktischeZeichenGenerator:
         render_scale: float = 1.0  # v7.1 Phase 2: Übergeben aus ZeichenConfig
     ) -> Image.Image:
         """
-        Konvertiert SVG zu PIL Image (2-Stufen-Strategie)
+        Konvertiert SVG zu PIL Image (3-Stufen-Strategie)
 
         1. Pseudo-SVG Check (PNG-in-SVG-Wrapper)
-        2. ImageMagick Rendering
+        2. Raster-Cache Lookup (Inhalts-Hash + Render-Parameter + Renderer)
+        3. SVG-Rendering mit konfiguriertem Renderer (nur bei Cache-Miss)
 
         Args:
             render_scale: Skalierungsfaktor (v7.1 Phase 2: aus RenderProfile)
@@ -504,13 +433,92 @@ class TaktischeZeichenGenerator:
                 pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
                 return pil_image
 
-            # SCHRITT 2: ImageMagick Rendering
-            return self._svg_to_image_imagemagick(svg_path, max_height_mm, max_width_mm, dpi, render_scale)
+            # SCHRITT 2: Raster-Cache (NEW)
+            cache_key = self.raster_cache.make_key(
+                svg_path, dpi, max_height_mm, max_width_mm, render_scale,
+                engine=self.svg_renderer.engine
+            )
+            pil_image = self.raster_cache.get(cache_key)
+            if pil_image is not None:
+                self.logger.debug(f"Raster-Cache Treffer: {svg_path.name}")
+                return pil_image
+
+            # SCHRITT 3: SVG-Rendering (im Prozess-Pool falls aktiv)
+            if self.render_pool is not None:
+                pil_image = self.render_pool.render(
+                    svg_path, max_height_mm, max_width_mm, dpi, render_scale,
+                    engine=self.svg_renderer.engine
+                )
+            else:
+                pil_image = self._render_svg(svg_path, max_height_mm, max_width_mm, dpi, render_scale)
+            self.raster_cache.put(cache_key, pil_image)
+            return pil_image
 
         except Exception as e:
             self.logger.error("Fehler bei SVG-Konvertierung: {}".format(e))
             raise
 
+    def _svg_to_graphic(
+        self,
+        svg_path: Path,
+        max_height_mm: float,
+        max_width_mm: float,
+        dpi: int,
+        render_scale: float = 1.0,
+        vector: bool = False
+    ):
+        """
+        Grafik für das Zeichen: Vektorgrafik (Vektor-PDF) oder gerastertes Bild
+
+        NEW: Im Vektor-Modus wird das SVG über svglib geladen und in dieselbe Box
+        eingepasst wie beim Rastern. Pseudo-SVGs und SVGs, die svglib nicht lesen
+        kann (oder ohne svglib), werden wie bisher gerastert.
+
+        Returns:
+            VectorGraphic oder PIL Image
+        """
+        if vector and not self._is_pseudo_svg(svg_path):
+            source = get_svg_source(svg_path)
+            if source is not None:
+                graphic = load_vector_graphic(
+                    svg_path, source.digest,
+                    mm_to_pixels(max_width_mm, dpi), mm_to_pixels(max_height_mm, dpi)
+                )
+                if graphic is not None:
+                    return graphic
+
+        return self._svg_to_image(svg_path, max_height_mm, max_width_mm, dpi, render_scale)
+
+    @staticmethod
+    def _clip_to_canvas(
+        image: Image.Image,
+        x_offset: int,
+        y_offset: int,
+        canvas_breite_px: int,
+        canvas_hoehe_px: int
+    ) -> Tuple[Image.Image, int, int]:
+        """
+        Schneidet Grafik auf die Canvas-Fläche zu (beim Einfügen ins Ausgabebild würde sie
+        sonst in Sicherheitsrand/Beschnitt ragen)
+
+        Args:
+            image: Grafik
+            x_offset: X-Position auf dem Canvas (kann negativ sein)
+            y_offset: Y-Position auf dem Canvas (kann negativ sein)
+            canvas_breite_px: Canvas-Breite
+            canvas_hoehe_px: Canvas-Höhe
+
+        Returns:
+            (Grafik, x_offset, y_offset) - unverändert, wenn sie ganz auf den Canvas passt
+        """
+        left = max(0, -x_offset)
+        top = max(0, -y_offset)
+        right = min(image.width, canvas_breite_px - x_offset)
+        bottom = min(image.height, canvas_hoehe_px - y_offset)
+        if (left, top, right, bottom) == (0, 0, image.width, image.height):
+            return image, x_offset, y_offset
+        return image.crop((left, top, right, bottom)), x_offset + left, y_offset + top
+
     def calculate_max_grafik_size_mm(self) -> float:
         """Berechnet maximale Grafik-Groesse fuer alle Modi"""
         sicherer_bereich_mm = self._get_max_grafik_groesse_mm()
@@ -554,7 +562,9 @@ class TaktischeZeichenGenerator:
         text_template: Optional[Image.Image] = None,
         svg_template: Optional[Image.Image] = None,
         return_image: bool = False,
-        track_timing: bool = False
+        track_timing: bool = False,
+        vector: bool = False,
+        final_size: bool = False
     ):
         """
         Erstellt druckfertiges Zeichen
@@ -567,6 +577,9 @@ class TaktischeZeichenGenerator:
             svg_template: Optional vorbereitete SVG-Grafik (PERFORMANCE BOOST!)
             return_image: True = PIL Image zurückgeben, False = Datei speichern (default)
             track_timing: True = Zeitmessung pro Schritt zurückgeben (für Statistik)
+            vector: True = VectorCanvas statt PIL Image (Vektor-PDF, nur mit return_image=True,
+                Templates werden ignoriert)
+            final_size: True = fertige Größe ohne Beschnitt (Schnittbogen, nur mit return_image=True)
 
         Returns:
             Path: Pfad zur gespeicherten Datei (wenn return_image=False und track_timing=False)
@@ -575,6 +588,13 @@ class TaktischeZeichenGenerator:
         """
         import time
 
+        if vector and not return_image:
+            raise ValueError("Vektor-Zeichen können nur zurückgegeben werden (return_image=True)")
+        if final_size and not return_image:
+            raise ValueError("Zeichen in fertiger Größe können nur zurückgegeben werden (return_image=True)")
+        if vector:
+            text_template = svg_template = None  # Templates sind gerastert
+
         # NEW: Zeitmessung initialisieren
         timings = {
             'render': 0.0,      # SVG-Rendering
@@ -667,12 +687,13 @@ class TaktischeZeichenGenerator:
                     self.logger.info("MIT_TEXT: Berechnete Grafikgröße {}x{}mm (verfügbar nach Text)".format(
                         max_grafik_width_mm, max_grafik_height_mm))
 
-            zeichen_image = self._svg_to_image(
+            zeichen_image = self._svg_to_graphic(
                 svg_path,
                 max_height_mm=max_grafik_height_mm,  # ~21.8mm (begrenzt durch Text)
                 max_width_mm=max_grafik_width_mm,     # 39mm (volle Breite!)
                 dpi=config.dpi,
-                render_scale=config.render_scale  # v7.1 Phase 2
+                render_scale=config.render_scale,  # v7.1 Phase 2
+                vector=vector  # NEW: Vektor-PDF
             )
 
             # NEW: Zeitmessung Rendering stoppen
@@ -698,19 +719,39 @@ class TaktischeZeichenGenerator:
         canvas_hoehe_px = mm_to_pixels(canvas_hoehe_mm, config.dpi)
         canvas_breite_px = mm_to_pixels(canvas_breite_mm, config.dpi)
 
+        # CHANGED: Ein Ausgabebild in Datei-Größe (bzw. fertiger Größe), Text-Template und
+        # Grafik werden direkt an die Canvas-Position eingefügt. Ein eigenes Canvas gibt es nur
+        # noch, wenn Text gezeichnet werden muss (ohne Template) oder im Vektor-Modus.
+        print_ready_image, canvas_origin, print_dims = self.print_preparer.create_print_buffer(
+            vector,
+            config.dpi,
+            zeichen_hoehe_mm=config.zeichen_hoehe_mm,
+            zeichen_breite_mm=config.zeichen_breite_mm,
+            sicherheitsabstand_mm=config.sicherheitsabstand_mm,
+            beschnittzugabe_mm=config.beschnittzugabe_mm,
+            final_size=final_size  # NEW: Schnittbogen ohne Beschnitt
+        )
+
         # NEU: Template-Optimierung
         if text_template is not None:
-            # Template klonen (schnell!)
-            canvas = text_template.copy()
+            # CHANGED: Template direkt ins Ausgabebild (statt Kopie als Canvas)
+            print_ready_image.paste(text_template, canvas_origin)
+            canvas = None
             self.logger.debug("Verwende Text-Template (optimiert)")
-        else:
+        elif vector or config.modus != MODUS_OHNE_TEXT:
             # Traditionell: Neues Canvas + Text zeichnen
             # CHANGED: RGBA-Canvas mit transparentem Hintergrund (rechteckig)
             bg_color = PNG_BACKGROUND_COLOR_TRANSPARENT if PNG_COLOR_MODE == PNG_COLOR_MODE_RGBA else PNG_BACKGROUND_COLOR_WHITE
-            canvas = Image.new(PNG_COLOR_MODE, (canvas_breite_px, canvas_hoehe_px), bg_color)
+            if vector:
+                canvas = VectorCanvas(canvas_breite_px, canvas_hoehe_px)  # NEW: Vektor-PDF
+            else:
+                canvas = Image.new(PNG_COLOR_MODE, (canvas_breite_px, canvas_hoehe_px), bg_color)
 
             if config.modus != MODUS_OHNE_TEXT:
                 self.text_overlay.draw_text_on_canvas(canvas, config)
+        else:
+            # CHANGED: Ohne Text leere Canvas-Fläche im Ausgabebild
+            canvas = None
 
         # NEW: Grafik nur einfügen wenn NICHT Blanko!
         if not is_blanko:
@@ -732,16 +773,30 @@ class TaktischeZeichenGenerator:
                 # Mit Text: Grafik immer oben
                 y_offset = 0
 
+            if canvas is None:
+                # CHANGED: Direkt ins Ausgabebild - auf die Canvas-Fläche begrenzen wie bisher
+                zeichen_image, x_offset, y_offset = self._clip_to_canvas(
+                    zeichen_image, x_offset, y_offset, canvas_breite_px, canvas_hoehe_px
+                )
+                target = print_ready_image
+                x_offset += canvas_origin[0]
+                y_offset += canvas_origin[1]
+            else:
+                target = canvas
+
             # CHANGED: Bei RGBA Alpha-Kanal als Maske verwenden
             # Dies erhält die glatten Konturen (Anti-Aliasing) und verhindert schwarze Flächen
             if zeichen_image.mode == 'RGBA':
-                canvas.paste(zeichen_image, (x_offset, y_offset), mask=zeichen_image)
+                target.paste(zeichen_image, (x_offset, y_offset), mask=zeichen_image)
             else:
-                canvas.paste(zeichen_image, (x_offset, y_offset))
+                target.paste(zeichen_image, (x_offset, y_offset))
         else:
             # Blanko-Zeichen: Keine Grafik, nur weißer Canvas + Text
             self.logger.info("BLANKO-Zeichen: Keine Grafik gerendert")
 
+        if canvas is not None:
+            print_ready_image.paste(canvas, canvas_origin)
+
         # NEW: Zeitmessung Generierung stoppen
         timings['generate'] = time.time() - generate_start
         self.logger.debug("Generierungs-Zeit: {:.3f}s".format(timings['generate']))
@@ -749,15 +804,9 @@ class TaktischeZeichenGenerator:
         # NEW: Zeitmessung Export starten
         export_start = time.time()
 
-        # CHANGED: Config-Werte an prepare_for_print übergeben (mit Breite & Beschnitt)
-        print_ready_image = self.print_preparer.prepare_for_print(
-            canvas,
-            config.dpi,
-            draw_cut_lines=draw_cut_lines,
-            zeichen_hoehe_mm=config.zeichen_hoehe_mm,
-            zeichen_breite_mm=config.zeichen_breite_mm,
-            sicherheitsabstand_mm=config.sicherheitsabstand_mm,
-            beschnittzugabe_mm=config.beschnittzugabe_mm
+        # CHANGED: Nur noch Schneidelinien + Metadaten (Ränder sind schon im Ausgabebild)
+        print_ready_image = self.print_preparer.finish_print_buffer(
+            print_ready_image, print_dims, draw_cut_lines, final_size
         )
 
         # NEU: return_image Parameter
@@ -808,7 +857,9 @@ class TaktischeZeichenGenerator:
         text_template: Optional[Image.Image] = None,
         svg_template: Optional[Image.Image] = None,
         return_image: bool = False,
-        track_timing: bool = False
+        track_timing: bool = False,
+        vector: bool = False,
+        final_size: bool = False
     ):
         """
         Erstellt druckfertiges S1-Layout Zeichen (Doppelschild)
@@ -828,6 +879,9 @@ class TaktischeZeichenGenerator:
             svg_template: Optional vorbereitete SVG-Grafik (PERFORMANCE BOOST!)
             return_image: True = PIL Image zurückgeben, False = Datei speichern (default)
             track_timing: True = Zeitmessung pro Schritt zurückgeben (für Statistik)
+            vector: True = VectorCanvas statt PIL Image (Vektor-PDF, nur mit return_image=True,
+                Templates werden ignoriert)
+            final_size: True = fertige Größe ohne Beschnitt (Schnittbogen, nur mit return_image=True)
 
         Returns:
             Path: Pfad zur gespeicherten Datei (wenn return_image=False und track_timing=False)
@@ -836,6 +890,13 @@ class TaktischeZeichenGenerator:
         """
         import time
 
+        if vector and not return_image:
+            raise ValueError("Vektor-Zeichen können nur zurückgegeben werden (return_image=True)")
+        if final_size and not return_image:
+            raise ValueError("Zeichen in fertiger Größe können nur zurückgegeben werden (return_image=True)")
+        if vector:
+            svg_template = None  # Templates sind gerastert (text_template wird im S1-Layout nicht genutzt)
+
         # NEW: Zeitmessung initialisieren
         timings = {
             'render': 0.0,      # SVG-Rendering
@@ -867,11 +928,18 @@ class TaktischeZeichenGenerator:
 
         # CHANGED: RGBA-Canvas mit transparentem Hintergrund
         bg_color = PNG_BACKGROUND_COLOR_TRANSPARENT if PNG_COLOR_MODE == PNG_COLOR_MODE_RGBA else PNG_BACKGROUND_COLOR_WHITE
-        canvas = Image.new(PNG_COLOR_MODE, (canvas_breite_px, canvas_hoehe_px), bg_color)
+        # NEW: Vektor-PDF zeichnet auf VectorCanvas (gleiche Pixel-Koordinaten)
+        if vector:
+            canvas = VectorCanvas(canvas_breite_px, canvas_hoehe_px)
+        else:
+            canvas = Image.new(PNG_COLOR_MODE, (canvas_breite_px, canvas_hoehe_px), bg_color)
 
         # SCHRITT 1: Linker Bereich - Grafik + Text (wie S2-Layout)
         links_breite_px = int(canvas_breite_px * (s1_links_prozent / 100.0))
-        links_bereich = Image.new(PNG_COLOR_MODE, (links_breite_px, canvas_hoehe_px), bg_color)
+        if vector:
+            links_bereich = VectorCanvas(links_breite_px, canvas_hoehe_px)
+        else:
+            links_bereich = Image.new(PNG_COLOR_MODE, (links_breite_px, canvas_hoehe_px), bg_color)
 
         # Blanko-Zeichen erkennen
         is_blanko = SVGLoaderLocal.is_blanko_zeichen(svg_path)
@@ -922,12 +990,13 @@ class TaktischeZeichenGenerator:
                 verfuegbare_hoehe_mm = canvas_hoehe_mm
 
             # Grafik rendern (mit Breite des linken Bereichs)
-            zeichen_image = self._svg_to_image(
+            zeichen_image = self._svg_to_graphic(
                 svg_path,
                 max_height_mm=verfuegbare_hoehe_mm,
                 max_width_mm=links_breite_mm,
                 dpi=config.dpi,
-                render_scale=config.render_scale
+                render_scale=config.render_scale,
+                vector=vector  # NEW: Vektor-PDF
             )
 
             # NEW: Zeitmessung Rendering beenden
@@ -986,7 +1055,7 @@ class TaktischeZeichenGenerator:
             line_x_end_links = links_breite_px  # Bis zur Trennlinie (kein Margin rechts)
 
             # ImageDraw für linke Seite
-            draw_links = ImageDraw.Draw(links_bereich)
+            draw_links = get_draw(links_bereich)  # CHANGED: PIL Image oder VectorCanvas
 
             # Schreiblinien zeichnen (GLEICHE Y-Positionen wie rechte Seite!)
             # Erste Linie GENAU am bottom_offset (wie Text auf linker Seite)
@@ -1020,13 +1089,14 @@ class TaktischeZeichenGenerator:
 
         # SCHRITT 2: Rechter Bereich - Schreiblinien
         # CHANGED v0.8.2.2: Überspringen für BLANKO_S1_LEER (komplett leer)
+        s1_border_x = None  # NEW: Grenze Links/Rechts für orange Trennlinie
         if str(svg_path.stem) != "BLANKO_S1_LEER":
             rechts_start_px = links_breite_px
             rechts_breite_px = canvas_breite_px - links_breite_px
             rechts_breite_mm = canvas_breite_mm * ((100 - s1_links_prozent) / 100.0)
 
             # ImageDraw für Linien
-            draw = ImageDraw.Draw(canvas)
+            draw = get_draw(canvas)  # CHANGED: PIL Image oder VectorCanvas
 
             # Schreiblinien-Parameter berechnen (NEUE LOGIK: Anzahl → Zeilenhöhe → Schriftgröße)
             anzahl_zeilen = s1_anzahl_schreiblinien  # INPUT vom User (3-10)
@@ -1092,16 +1162,11 @@ class TaktischeZeichenGenerator:
                     )
 
             # SCHRITT 3.5: Orange Trennlinie zwischen Links/Rechts (nur bei Hilfslinien)
+            # CHANGED: Wird mit den Schneidelinien aus der gecachten Ebene eingefügt
             if draw_cut_lines:
-                from constants import CUT_LINE_COLOR_S1_BORDER, CUT_LINE_WIDTH_PX
-                # Vertikale Linie bei rechts_start_px (Grenze zwischen Links und Rechts)
-                draw.line(
-                    [(rechts_start_px, 0), (rechts_start_px, canvas_hoehe_px)],
-                    fill=CUT_LINE_COLOR_S1_BORDER,
-                    width=CUT_LINE_WIDTH_PX
-                )
+                s1_border_x = rechts_start_px
                 self.logger.debug(
-                    "S1-Trennlinie (orange) gezeichnet bei x={}px ({:.1f}%)".format(
+                    "S1-Trennlinie (orange) bei x={}px ({:.1f}%)".format(
                         rechts_start_px, s1_links_prozent
                     )
                 )
@@ -1122,7 +1187,9 @@ class TaktischeZeichenGenerator:
             zeichen_hoehe_mm=config.zeichen_hoehe_mm,
             zeichen_breite_mm=config.zeichen_breite_mm,
             sicherheitsabstand_mm=config.sicherheitsabstand_mm,
-            beschnittzugabe_mm=config.beschnittzugabe_mm
+            beschnittzugabe_mm=config.beschnittzugabe_mm,
+            final_size=final_size,  # NEW: Schnittbogen ohne Beschnitt
+            s1_border_x=s1_border_x
         )
 
         # NEW: Zeitmessung Export-Phase beenden
@@ -1161,7 +1228,8 @@ class TaktischeZeichenGenerator:
         progress_callback: Optional[callable] = None,
         preparing_callback: Optional[callable] = None,
         use_templates: bool = True,
-        chunk_size: Optional[int] = None
+        chunk_size: Optional[int] = None,
+        render_backend: Optional[str] = None
     ) -> Tuple[List[Path], List[Tuple[str, str]]]:
         """
         Erstellt mehrere S1-Layout Zeichen parallel mit Multithreading
@@ -1171,6 +1239,7 @@ class TaktischeZeichenGenerator:
         - Template-System für Text und SVG (wie S2)
         - Reduziert RAM-Verbrauch massiv
         - Templates werden nach jedem Chunk explizit freigegeben
+        - CHANGED: Templates liegen im TemplateStore (Verdrängung nach Bytes, optional sitzungsweit)
         - Aggressive Garbage Collection
         - Detailliertes Performance-Tracking
 
@@ -1184,7 +1253,9 @@ class TaktischeZeichenGenerator:
             progress_callback: Optional callback(current, total, svg_name, status)
             preparing_callback: Optional callback(status_text) für Vorbereitungsphase
             use_templates: Template-Optimierung nutzen (default: True)
-            chunk_size: Anzahl Zeichen pro Chunk (default: num_threads * 4)
+            chunk_size: Anzahl Zeichen pro Chunk (default: aus Speicherbudget; batch_engine="pipeline":
+                max. Zeichen gleichzeitig in der Pipeline)
+            render_backend: "thread" oder "process" (default: aus RuntimeConfig)
 
         Returns:
             Tuple: (successful_files, errors)
@@ -1194,28 +1265,30 @@ class TaktischeZeichenGenerator:
         if not tasks:
             return ([], [])
 
-        # NEW: Stapelgröße berechnen (falls nicht angegeben)
-        if chunk_size is None:
-            from constants import DEFAULT_PNG_CHUNK_MULTIPLIER
-
-            # Zeichengröße aus erstem Task ermitteln
-            if tasks:
-                first_config = tasks[0][1]
-                max_dimension = max(first_config.zeichen_hoehe_mm, first_config.zeichen_breite_mm)
-
-                # Dynamische Stapelgröße basierend auf Zeichengröße
-                if max_dimension > ZEICHEN_SIZE_THRESHOLD_VERY_LARGE_MM:
-                    multiplier = 1
-                    self.logger.info(f"Sehr große Zeichen ({max_dimension}mm): Reduzierte Stapelgröße für häufige GC")
-                elif max_dimension > ZEICHEN_SIZE_THRESHOLD_LARGE_MM:
-                    multiplier = 2
-                    self.logger.info(f"Große Zeichen ({max_dimension}mm): Reduzierte Stapelgröße für häufige GC")
-                else:
-                    multiplier = DEFAULT_PNG_CHUNK_MULTIPLIER
+        # NEW: Render-Backend aktivieren (Prozess-Pool bleibt für Folge-Batches bestehen)
+        self.apply_render_backend(render_backend, num_threads)
+
+        # NEW: Pipeline-Engine (Stufen mit begrenzten Warteschlangen statt Stapel)
+        from runtime_config import get_config
+        if get_config().batch_engine == BATCH_ENGINE_PIPELINE:
+            return self._create_batch_pipelined(
+                tasks, draw_cut_lines, num_threads, progress_callback, preparing_callback,
+                use_templates, chunk_size=chunk_size,
+                s1_options={
+                    's1_links_prozent': s1_links_prozent,
+                    's1_anzahl_schreiblinien': s1_anzahl_schreiblinien,
+                    's1_staerke_anzeigen': s1_staerke_anzeigen
+                }
+            )
 
-                chunk_size = num_threads * multiplier
-            else:
-                chunk_size = num_threads * DEFAULT_PNG_CHUNK_MULTIPLIER
+        self.begin_template_batch()  # NEW: Template-Speicher für diesen Batch vorbereiten
+
+        # CHANGED: Threads und Stapelgröße aus Speicherbudget (statt Größen-Schwellwerten
+        # für das erste Zeichen) - gemischte Aufträge richten sich nach dem größten Zeichen
+        scheduler = MemoryScheduler()
+        num_threads = scheduler.plan_threads(tasks, num_threads)
+        if chunk_size is None:
+            chunk_size = scheduler.plan_chunk_size(tasks, num_threads)
 
         self.logger.info("Stapelbasierte Verarbeitung: Stapelgröße = {} Zeichen".format(chunk_size))
 
@@ -1267,6 +1340,7 @@ class TaktischeZeichenGenerator:
             # NEW: Templates NUR für aktuellen Chunk erstellen
             text_templates = {}
             svg_templates = {}
+            svg_template_jobs = {}
 
             if use_templates:
                 self.logger.info("Erstelle Templates für Stapel {}/{}...".format(chunk_idx + 1, num_chunks))
@@ -1276,12 +1350,14 @@ class TaktischeZeichenGenerator:
                     preparing_callback("Stapel {}/{}: Erstelle Text-Templates...".format(chunk_idx + 1, num_chunks))
 
                 # Text-Templates (nur für chunk_tasks!)
-                text_template_keys_seen = set()
-                for i, (svg_path, config) in enumerate(chunk_tasks):
+                # CHANGED: Aus stapelübergreifendem Template-Speicher (nur bei Miss erstellen)
+                for svg_path, config in chunk_tasks:
                     template_key = self._get_template_key(config)
-                    if template_key not in text_template_keys_seen:
-                        text_templates[template_key] = self._create_text_template(config)
-                        text_template_keys_seen.add(template_key)
+                    if template_key not in text_templates:
+                        text_templates[template_key] = self.template_store.get_or_create(
+                            self._template_store_key("text", template_key, config),
+                            partial(self._create_text_template, config)
+                        )
 
                 # NEW: Status-Callback für SVG-Templates
                 if preparing_callback:
@@ -1289,79 +1365,41 @@ class TaktischeZeichenGenerator:
 
                 # SVG-Templates (nur für chunk_tasks!)
                 # CRITICAL: Für S1 müssen wir die linke Bereich-Breite berücksichtigen
-                svg_template_keys_seen = set()
                 for svg_path, config in chunk_tasks:
                     # CRITICAL: S1 SVG-Templates brauchen s1_links_prozent im Key
                     svg_template_key = self._get_svg_template_key(svg_path, config) + f"_s1_{s1_links_prozent}"
-                    if svg_template_key not in svg_template_keys_seen:
-                        try:
-                            # FIXED: Blanko-Zeichen haben keine Grafik, kein Template noetig
-                            if SVGLoaderLocal.is_blanko_zeichen(svg_path):
-                                svg_template_keys_seen.add(svg_template_key)
-                                continue
-
-                            if preparing_callback:
-                                preparing_callback("Stapel {}/{}: Rendere SVG-Template {}/{} ({})...".format(
-                                    chunk_idx + 1, num_chunks,
-                                    len(svg_template_keys_seen) + 1,
-                                    len(chunk_tasks),
-                                    svg_path.stem))
-
-                            # S1-spezifisches SVG-Template erstellen (linke Bereich-Breite)
-                            canvas_hoehe_mm = config.zeichen_hoehe_mm - (2 * config.sicherheitsabstand_mm)
-                            canvas_breite_mm = config.zeichen_breite_mm - (2 * config.sicherheitsabstand_mm)
-                            links_breite_mm = canvas_breite_mm * (s1_links_prozent / 100.0)
-
-                            # Text-Hoehe berechnen (falls Text-Modus)
-                            if config.modus != "nur_grafik":
-                                from dataclasses import replace
-                                temp_config = replace(
-                                    config,
-                                    zeichen_breite_mm=links_breite_mm,
-                                    zeichen_hoehe_mm=canvas_hoehe_mm
-                                )
-                                text_height_mm = self.text_overlay.calculate_text_height_mm(temp_config)
-                                verfuegbare_hoehe_mm = canvas_hoehe_mm - text_height_mm - config.abstand_grafik_text_mm
-                            else:
-                                verfuegbare_hoehe_mm = canvas_hoehe_mm
-
-                            # SVG rendern fuer linken Bereich
-                            svg_templates[svg_template_key] = self._svg_to_image(
-                                svg_path,
-                                max_height_mm=verfuegbare_hoehe_mm,
-                                max_width_mm=links_breite_mm,
-                                dpi=config.dpi,
-                                render_scale=config.render_scale
-                            )
-                            svg_template_keys_seen.add(svg_template_key)
-                        except Exception as e:
-                            self.logger.warning("SVG-Template für {} konnte nicht erstellt werden: {}".format(
-                                svg_path.stem, str(e)))
-                            self.logger.debug("Fallback: Zeichen werden ohne SVG-Template gerendert")
+                    # FIXED: Blanko-Zeichen haben keine Grafik, kein Template noetig
+                    if svg_template_key in svg_template_jobs or SVGLoaderLocal.is_blanko_zeichen(svg_path):
+                        continue
+                    svg_template_jobs[svg_template_key] = (
+                        svg_path,
+                        self._template_store_key("svg", svg_template_key, config, svg_path),
+                        partial(self._create_s1_svg_template, svg_path, config, s1_links_prozent)
+                    )
 
-                self.logger.info("Templates erstellt: {} Text-Templates, {} SVG-Templates".format(
-                    len(text_templates), len(svg_templates)))
+                # CHANGED: SVG-Templates werden in _compose_chunk parallel zur Verarbeitung gerendert
+                self.logger.info("Templates vorbereitet: {} Text-Templates, {} SVG-Templates".format(
+                    len(text_templates), len(svg_template_jobs)))
 
                 if preparing_callback:
                     preparing_callback("Stapel {}/{}: Starte Verarbeitung...".format(chunk_idx + 1, num_chunks))
 
-            # NEW: Worker-Funktion (innerhalb Chunk, hat Zugriff auf text_templates/svg_templates)
-            def worker(svg_path: Path, config: ZeichenConfig):
+            def s1_svg_template_key(svg_path: Path, config: ZeichenConfig) -> str:
+                """S1 SVG-Template-Key (inkl. s1_links_prozent)"""
+                return self._get_svg_template_key(svg_path, config) + f"_s1_{s1_links_prozent}"
+
+            # NEW: Worker-Funktion (innerhalb Chunk, hat Zugriff auf text_templates)
+            # CHANGED: SVG-Template wird von _compose_chunk übergeben, sobald es fertig ist
+            def worker(svg_path: Path, config: ZeichenConfig, svg_template: Optional[Image.Image]):
                 """Worker-Funktion für einen Thread"""
                 try:
-                    # Templates holen (falls aktiviert)
+                    # Text-Template holen (falls aktiviert)
                     text_template = None
-                    svg_template = None
 
                     if use_templates:
-                        # Text-Template
                         template_key = self._get_template_key(config)
                         text_template = text_templates.get(template_key)
 
-                        # SVG-Template (PERFORMANCE BOOST!)
-                        svg_template_key = self._get_svg_template_key(svg_path, config) + f"_s1_{s1_links_prozent}"
-                        svg_template = svg_templates.get(svg_template_key)
-
                     # NEW: Zeichen mit Zeitmessung erstellen
                     result = self.create_zeichen_s1(
                         svg_path, config,
@@ -1383,42 +1421,37 @@ class TaktischeZeichenGenerator:
                     return (False, None, error_msg, None)
 
             try:
-                # NEW: ThreadPoolExecutor für aktuellen Chunk
-                with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                    # Nur chunk_tasks submiten (nicht alle tasks!)
-                    futures = {}
-                    for svg_path, config in chunk_tasks:
-                        future = executor.submit(worker, svg_path, config)
-                        futures[future] = (svg_path, config)
-
-                    # Ergebnisse einsammeln
-                    for future in as_completed(futures):
-                        svg_path, config = futures[future]
-                        success, output_file, error_msg, timings = future.result()
-
-                        # Thread-safe Update
-                        with stats_lock:
-                            completed += 1
-
-                            if success:
-                                successful_files.append(output_file)
-                                # NEW: Zeitmessungen sammeln
-                                if timings:
-                                    all_timings.append(timings)
-                            else:
-                                errors.append((config.zeichen_id, error_msg))
-
-                            # Progress Callback (mit globaler Position!)
-                            if progress_callback:
-                                status = "OK" if success else "FEHLER"
-                                progress_callback(completed, total_kopien, svg_path.stem, status)
+                # CHANGED: Templates und Zeichen im selben Pool, Zeichen starten sobald ihr Template fertig ist
+                for svg_path, config, result in self._compose_chunk(
+                    chunk_tasks, svg_template_jobs, svg_templates, s1_svg_template_key, worker, num_threads,
+                    status_prefix="Stapel {}/{}".format(chunk_idx + 1, num_chunks),
+                    preparing_callback=preparing_callback
+                ):
+                    success, output_file, error_msg, timings = result
+
+                    # Thread-safe Update
+                    with stats_lock:
+                        completed += 1
+
+                        if success:
+                            successful_files.append(output_file)
+                            # NEW: Zeitmessungen sammeln
+                            if timings:
+                                all_timings.append(timings)
+                        else:
+                            errors.append((config.zeichen_id, error_msg))
+
+                        # Progress Callback (mit globaler Position!)
+                        if progress_callback:
+                            status = "OK" if success else "FEHLER"
+                            progress_callback(completed, total_kopien, svg_path.stem, status)
 
             except Exception as e:
                 self.logger.error(f"Fehler in Stapel {chunk_idx + 1}: {e}")
                 raise
 
             finally:
-                # NEW: Template-Cleanup nach Chunk (WICHTIG für Ressourcen-Freigabe!)
+                # CHANGED: Nur Stapel-Referenzen freigeben - der Template-Speicher verdrängt nach Bytes
                 self.logger.info("Stapel {}/{} abgeschlossen, gebe Templates frei...".format(chunk_idx + 1, num_chunks))
                 text_templates.clear()
                 svg_templates.clear()
@@ -1430,6 +1463,7 @@ class TaktischeZeichenGenerator:
                 self.logger.debug("Templates freigegeben und Garbage Collection durchgeführt (2x)")
 
         # END Chunk-Loop
+        self.end_template_batch()  # NEW: Templates freigeben (außer bei Sitzungs-Speicher)
 
         # NEW: Zeit-Messung Ende und Statistik-Ausgabe
         end_time = time.time()
@@ -1482,6 +1516,13 @@ class TaktischeZeichenGenerator:
         self.logger.info("Kopien exportiert: {}".format(len(successful_files)))
         self.logger.info("Fehler: {}".format(len(errors)))
         self.logger.info("Gesamtzeit: {}".format(time_str))
+        cache_stats = self.raster_cache.get_stats()  # NEW: Raster-Cache Statistik
+        self.logger.info("Raster-Cache: {} Treffer | {} Misses | {:.1f} MB belegt".format(
+            cache_stats['hits'], cache_stats['misses'], cache_stats['size_mb']))
+        template_stats = self.template_store.get_stats()  # NEW: Template-Speicher Statistik
+        self.logger.info("Template-Cache: {} Treffer | {} Misses | {} verdrängt | {:.1f} MB belegt".format(
+            template_stats['hits'], template_stats['misses'], template_stats['evictions'],
+            template_stats['size_mb']))
         self.logger.info("-" * 80)
 
         if all_timings:
@@ -1561,7 +1602,8 @@ class TaktischeZeichenGenerator:
         progress_callback: Optional[callable] = None,
         preparing_callback: Optional[callable] = None,
         use_templates: bool = True,
-        chunk_size: Optional[int] = None  # NEW: Stapelgröße für Ressourcen-Optimierung
+        chunk_size: Optional[int] = None,  # NEW: Stapelgröße für Ressourcen-Optimierung
+        render_backend: Optional[str] = None  # NEW: "thread" oder "process"
     ) -> Tuple[List[Path], List[Tuple[str, str]]]:
         """
         Erstellt mehrere Zeichen parallel mit Multithreading
@@ -1570,6 +1612,7 @@ class TaktischeZeichenGenerator:
         - Stapelbasierte Verarbeitung: Templates werden nur für Teilmengen erstellt
         - Reduziert RAM-Verbrauch von ~2,5 GB auf ~250 MB (bei 100 Zeichen)
         - Templates werden nach jedem Chunk explizit freigegeben
+        - CHANGED: Templates liegen im TemplateStore (Verdrängung nach Bytes, optional sitzungsweit)
 
         Args:
             tasks: Liste von (svg_path, config) Tupeln
@@ -1578,7 +1621,9 @@ class TaktischeZeichenGenerator:
             progress_callback: Optional callback(current, total, svg_name, status)
             preparing_callback: Optional callback(status_text) für Vorbereitungsphase
             use_templates: Template-Optimierung nutzen (default: True)
-            chunk_size: Anzahl Zeichen pro Chunk (default: num_threads * 4)
+            chunk_size: Anzahl Zeichen pro Chunk (default: aus Speicherbudget; batch_engine="pipeline":
+                max. Zeichen gleichzeitig in der Pipeline)
+            render_backend: "thread" oder "process" (default: aus RuntimeConfig)
 
         Returns:
             Tuple: (successful_files, errors)
@@ -1596,32 +1641,25 @@ class TaktischeZeichenGenerator:
         if not tasks:
             return ([], [])
 
-        # NEW: Stapelgröße berechnen (falls nicht angegeben)
-        # Bei großen Zeichen: Kleinere Stapel für häufigere Garbage Collection
-        if chunk_size is None:
-            from constants import DEFAULT_PNG_CHUNK_MULTIPLIER
-
-            # Zeichengröße aus erstem Task ermitteln
-            if tasks:
-                first_config = tasks[0][1]
-                max_dimension = max(first_config.zeichen_hoehe_mm, first_config.zeichen_breite_mm)
-
-                # Dynamische Stapelgröße basierend auf Zeichengröße
-                if max_dimension > ZEICHEN_SIZE_THRESHOLD_VERY_LARGE_MM:
-                    # Sehr große Zeichen: Sehr kleine Stapel (häufige GC!)
-                    multiplier = 1  # z.B. 6 Threads × 1 = 6 Zeichen/Stapel
-                    self.logger.info(f"Sehr große Zeichen ({max_dimension}mm): Reduzierte Stapelgröße für häufige GC")
-                elif max_dimension > ZEICHEN_SIZE_THRESHOLD_LARGE_MM:
-                    # Große Zeichen: Kleine Stapel
-                    multiplier = 2  # z.B. 6 Threads × 2 = 12 Zeichen/Stapel
-                    self.logger.info(f"Große Zeichen ({max_dimension}mm): Reduzierte Stapelgröße für häufige GC")
-                else:
-                    # Normale Zeichen: Standard-Stapelgröße
-                    multiplier = DEFAULT_PNG_CHUNK_MULTIPLIER
+        # NEW: Render-Backend aktivieren (Prozess-Pool bleibt für Folge-Batches bestehen)
+        self.apply_render_backend(render_backend, num_threads)
 
-                chunk_size = num_threads * multiplier
-            else:
-                chunk_size = num_threads * DEFAULT_PNG_CHUNK_MULTIPLIER
+        # NEW: Pipeline-Engine (Stufen mit begrenzten Warteschlangen statt Stapel)
+        from runtime_config import get_config
+        if get_config().batch_engine == BATCH_ENGINE_PIPELINE:
+            return self._create_batch_pipelined(
+                tasks, draw_cut_lines, num_threads, progress_callback, preparing_callback,
+                use_templates, chunk_size=chunk_size
+            )
+
+        self.begin_template_batch()  # NEW: Template-Speicher für diesen Batch vorbereiten
+
+        # CHANGED: Threads und Stapelgröße aus Speicherbudget (statt Größen-Schwellwerten
+        # für das erste Zeichen) - gemischte Aufträge richten sich nach dem größten Zeichen
+        scheduler = MemoryScheduler()
+        num_threads = scheduler.plan_threads(tasks, num_threads)
+        if chunk_size is None:
+            chunk_size = scheduler.plan_chunk_size(tasks, num_threads)
 
         self.logger.info("Stapelbasierte Verarbeitung: Stapelgröße = {} Zeichen".format(chunk_size))
 
@@ -1674,6 +1712,7 @@ class TaktischeZeichenGenerator:
             # NEW: Templates NUR für aktuellen Chunk erstellen
             text_templates = {}
             svg_templates = {}
+            svg_template_jobs = {}
 
             if use_templates:
                 self.logger.info("Erstelle Templates für Stapel {}/{}...".format(chunk_idx + 1, num_chunks))
@@ -1683,68 +1722,51 @@ class TaktischeZeichenGenerator:
                     preparing_callback("Stapel {}/{}: Erstelle Text-Templates...".format(chunk_idx + 1, num_chunks))
 
                 # Text-Templates (nur für chunk_tasks!)
-                text_template_keys_seen = set()
-                for i, (svg_path, config) in enumerate(chunk_tasks):
+                # CHANGED: Aus stapelübergreifendem Template-Speicher (nur bei Miss erstellen)
+                for svg_path, config in chunk_tasks:
                     template_key = self._get_template_key(config)
-                    if template_key not in text_template_keys_seen:
-                        text_templates[template_key] = self._create_text_template(config)
-                        text_template_keys_seen.add(template_key)
+                    if template_key not in text_templates:
+                        text_templates[template_key] = self.template_store.get_or_create(
+                            self._template_store_key("text", template_key, config),
+                            partial(self._create_text_template, config)
+                        )
 
                 # NEW: Status-Callback für SVG-Templates
                 if preparing_callback:
                     preparing_callback("Stapel {}/{}: Erstelle SVG-Templates...".format(chunk_idx + 1, num_chunks))
 
                 # SVG-Templates (nur fuer chunk_tasks!)
-                svg_template_keys_seen = set()
                 for svg_path, config in chunk_tasks:
                     svg_template_key = self._get_svg_template_key(svg_path, config)
-                    if svg_template_key not in svg_template_keys_seen:
-                        try:
-                            # FIXED: Blanko-Zeichen haben keine Grafik, kein Template noetig
-                            if SVGLoaderLocal.is_blanko_zeichen(svg_path):
-                                svg_template_keys_seen.add(svg_template_key)
-                                continue
-
-                            # NEW: Status-Update pro SVG-Template (mit Dateinamen)
-                            if preparing_callback:
-                                preparing_callback("Stapel {}/{}: Rendere SVG-Template {}/{} ({})...".format(
-                                    chunk_idx + 1, num_chunks,
-                                    len(svg_template_keys_seen) + 1,
-                                    len(chunk_tasks),
-                                    svg_path.stem))
-
-                            svg_templates[svg_template_key] = self._create_svg_template(svg_path, config)
-                            svg_template_keys_seen.add(svg_template_key)
-                        except Exception as e:
-                            # FIXED: Template-Fehler loggen, aber Export fortsetzen
-                            self.logger.warning("SVG-Template für {} konnte nicht erstellt werden: {}".format(
-                                svg_path.stem, str(e)))
-                            self.logger.debug("Fallback: Zeichen werden ohne SVG-Template gerendert")
+                    # FIXED: Blanko-Zeichen haben keine Grafik, kein Template noetig
+                    if svg_template_key in svg_template_jobs or SVGLoaderLocal.is_blanko_zeichen(svg_path):
+                        continue
+                    svg_template_jobs[svg_template_key] = (
+                        svg_path,
+                        self._template_store_key("svg", svg_template_key, config, svg_path),
+                        partial(self._create_svg_template, svg_path, config)
+                    )
 
-                self.logger.info("Templates erstellt: {} Text-Templates, {} SVG-Templates".format(
-                    len(text_templates), len(svg_templates)))
+                # CHANGED: SVG-Templates werden in _compose_chunk parallel zur Verarbeitung gerendert
+                self.logger.info("Templates vorbereitet: {} Text-Templates, {} SVG-Templates".format(
+                    len(text_templates), len(svg_template_jobs)))
 
                 # NEW: Status-Callback für Start der Verarbeitung
                 if preparing_callback:
                     preparing_callback("Stapel {}/{}: Starte Verarbeitung...".format(chunk_idx + 1, num_chunks))
 
-            # NEW: Worker-Funktion (innerhalb Chunk, hat Zugriff auf text_templates/svg_templates)
-            def worker(svg_path: Path, config: ZeichenConfig):
+            # NEW: Worker-Funktion (innerhalb Chunk, hat Zugriff auf text_templates)
+            # CHANGED: SVG-Template wird von _compose_chunk übergeben, sobald es fertig ist
+            def worker(svg_path: Path, config: ZeichenConfig, svg_template: Optional[Image.Image]):
                 """Worker-Funktion für einen Thread"""
                 try:
-                    # Templates holen (falls aktiviert)
+                    # Text-Template holen (falls aktiviert)
                     text_template = None
-                    svg_template = None
 
                     if use_templates:
-                        # Text-Template
                         template_key = self._get_template_key(config)
                         text_template = text_templates.get(template_key)
 
-                        # SVG-Template (PERFORMANCE BOOST!)
-                        svg_template_key = self._get_svg_template_key(svg_path, config)
-                        svg_template = svg_templates.get(svg_template_key)
-
                     # NEW: Zeichen mit Zeitmessung erstellen
                     result = self.create_zeichen(
                         svg_path, config, draw_cut_lines,
@@ -1765,36 +1787,31 @@ class TaktischeZeichenGenerator:
                     return (False, None, error_msg, None)
 
             try:
-                # NEW: ThreadPoolExecutor für aktuellen Chunk
-                with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                    # Nur chunk_tasks submiten (nicht alle tasks!)
-                    futures = {}
-                    for svg_path, config in chunk_tasks:
-                        future = executor.submit(worker, svg_path, config)
-                        futures[future] = (svg_path, config)
-
-                    # Ergebnisse einsammeln
-                    for future in as_completed(futures):
-                        svg_path, config = futures[future]
-                        success, output_file, error_msg, timings = future.result()
-
-                        # Thread-safe Update
-                        with stats_lock:
-                            completed += 1
-
-                            if success:
-                                successful_files.append(output_file)
-                                # NEW: Zeitmessungen sammeln
-                                if timings:
-                                    all_timings.append(timings)
-                            else:
-                                errors.append((config.zeichen_id, error_msg))
-
-                            # Progress Callback (mit globaler Position!)
-                            if progress_callback:
-                                status = "OK" if success else "FEHLER"
-                                progress_callback(completed, total_kopien, svg_path.stem, status)
-                        pass
+                # CHANGED: Templates und Zeichen im selben Pool, Zeichen starten sobald ihr Template fertig ist
+                for svg_path, config, result in self._compose_chunk(
+                    chunk_tasks, svg_template_jobs, svg_templates, self._get_svg_template_key, worker,
+                    num_threads,
+                    status_prefix="Stapel {}/{}".format(chunk_idx + 1, num_chunks),
+                    preparing_callback=preparing_callback
+                ):
+                    success, output_file, error_msg, timings = result
+
+                    # Thread-safe Update
+                    with stats_lock:
+                        completed += 1
+
+                        if success:
+                            successful_files.append(output_file)
+                            # NEW: Zeitmessungen sammeln
+                            if timings:
+                                all_timings.append(timings)
+                        else:
+                            errors.append((config.zeichen_id, error_msg))
+
+                        # Progress Callback (mit globaler Position!)
+                        if progress_callback:
+                            status = "OK" if success else "FEHLER"
+                            progress_callback(completed, total_kopien, svg_path.stem, status)
 
             except Exception as e:
                 # Explizites Exception-Logging
@@ -1802,7 +1819,7 @@ class TaktischeZeichenGenerator:
                 raise  # Re-raise für äußere Fehlerbehandlung
 
             finally:
-                # NEW: Template-Cleanup nach Chunk (WICHTIG für Ressourcen-Freigabe!)
+                # CHANGED: Nur Stapel-Referenzen freigeben - der Template-Speicher verdrängt nach Bytes
                 # v7.1 Phase 2: Aggressivere Garbage Collection für große Zeichen
                 self.logger.info("Stapel {}/{} abgeschlossen, gebe Templates frei...".format(chunk_idx + 1, num_chunks))
                 text_templates.clear()
@@ -1815,6 +1832,7 @@ class TaktischeZeichenGenerator:
                 self.logger.debug("Templates freigegeben und Garbage Collection durchgeführt (2x)")
 
         # END Chunk-Loop
+        self.end_template_batch()  # NEW: Templates freigeben (außer bei Sitzungs-Speicher)
 
         # NEW: Zeit-Messung Ende und Statistik-Ausgabe
         end_time = time.time()
@@ -1871,6 +1889,13 @@ class TaktischeZeichenGenerator:
         self.logger.info("Kopien exportiert: {}".format(len(successful_files)))
         self.logger.info("Fehler: {}".format(len(errors)))
         self.logger.info("Gesamtzeit: {}".format(time_str))
+        cache_stats = self.raster_cache.get_stats()  # NEW: Raster-Cache Statistik
+        self.logger.info("Raster-Cache: {} Treffer | {} Misses | {:.1f} MB belegt".format(
+            cache_stats['hits'], cache_stats['misses'], cache_stats['size_mb']))
+        template_stats = self.template_store.get_stats()  # NEW: Template-Speicher Statistik
+        self.logger.info("Template-Cache: {} Treffer | {} Misses | {} verdrängt | {:.1f} MB belegt".format(
+            template_stats['hits'], template_stats['misses'], template_stats['evictions'],
+            template_stats['size_mb']))
         self.logger.info("-" * 80)
 
         if all_timings:
@@ -1910,6 +1935,23 @@ class TaktischeZeichenGenerator:
 
         Überschreibt existierende Dateien ohne Fehler.
         """
+        output_file = self._export_path(zeichen_id, modus, with_cut_lines, output_dir)
+        image.save(str(output_file), dpi=(dpi, dpi), compress_level=EXPORT_PNG_COMPRESS_LEVEL)
+
+        return output_file
+
+    def _export_path(
+        self,
+        zeichen_id: str,
+        modus: str,
+        with_cut_lines: bool = False,
+        output_dir: Path = None
+    ) -> Path:
+        """
+        Ziel-Pfad für PNG-Export (legt Ordner an)
+
+        NEW: Aus _export_image herausgelöst (Pipeline kodiert und schreibt in getrennten Stufen)
+        """
         # CHANGED: output_dir Parameter hinzugefügt
         if output_dir is None:
             output_dir = EXPORT_DIR
@@ -1923,9 +1965,6 @@ class TaktischeZeichenGenerator:
         if output_file.exists():
             self.logger.debug("Überschreibe existierende Datei: {}".format(filename))
 
-
-        image.save(str(output_file), dpi=(dpi, dpi), compress_level=EXPORT_PNG_COMPRESS_LEVEL)
-
         return output_file
 
     def _get_template_key(self, config: ZeichenConfig) -> str:
@@ -2088,6 +2127,423 @@ class TaktischeZeichenGenerator:
         self.logger.debug("SVG-Template erstellt: {}".format(self._get_svg_template_key(svg_path, config)))
         return zeichen_image
 
+    def _create_s1_svg_template(
+        self,
+        svg_path: Path,
+        config: ZeichenConfig,
+        s1_links_prozent: int
+    ) -> Image.Image:
+        """
+        Rendert SVG-Grafik als Template für den linken S1-Bereich
+
+        Args:
+            svg_path: Pfad zur SVG-Datei
+            config: Zeichen-Konfiguration
+            s1_links_prozent: Breite des linken Bereichs in Prozent
+
+        Returns:
+            PIL Image der gerenderten SVG-Grafik (ohne Canvas/Text)
+        """
+        canvas_hoehe_mm = config.zeichen_hoehe_mm - (2 * config.sicherheitsabstand_mm)
+        canvas_breite_mm = config.zeichen_breite_mm - (2 * config.sicherheitsabstand_mm)
+        links_breite_mm = canvas_breite_mm * (s1_links_prozent / 100.0)
+
+        # Text-Hoehe berechnen (falls Text-Modus)
+        if config.modus != "nur_grafik":
+            from dataclasses import replace
+            temp_config = replace(
+                config,
+                zeichen_breite_mm=links_breite_mm,
+                zeichen_hoehe_mm=canvas_hoehe_mm
+            )
+            text_height_mm = self.text_overlay.calculate_text_height_mm(temp_config)
+            verfuegbare_hoehe_mm = canvas_hoehe_mm - text_height_mm - config.abstand_grafik_text_mm
+        else:
+            verfuegbare_hoehe_mm = canvas_hoehe_mm
+
+        # SVG rendern fuer linken Bereich
+        return self._svg_to_image(
+            svg_path,
+            max_height_mm=verfuegbare_hoehe_mm,
+            max_width_mm=links_breite_mm,
+            dpi=config.dpi,
+            render_scale=config.render_scale
+        )
+
+    def _template_store_key(
+        self,
+        kind: str,
+        template_key: str,
+        config: ZeichenConfig,
+        svg_path: Optional[Path] = None
+    ) -> tuple:
+        """
+        Schlüssel für den Template-Speicher
+
+        Die Template-Keys beschreiben nur die Unterschiede innerhalb eines Batches.
+        Über Batches (Sitzung) hinweg können sich Abmessungen, Fonts oder die SVG-Datei
+        ändern - daher zusätzlich alle Config-Felder (ohne Zeichen-ID) und der
+        SVG-Inhalts-Hash.
+
+        Args:
+            kind: "text" oder "svg"
+            template_key: Key aus _get_template_key / _get_svg_template_key
+            config: Zeichen-Konfiguration
+            svg_path: SVG-Pfad (nur für SVG-Templates)
+
+        Returns:
+            Hashbarer Schlüssel
+        """
+        from dataclasses import replace
+        fingerprint = repr(replace(config, zeichen_id="", svg_path=Path()))
+
+        if svg_path is None:
+            return (kind, template_key, fingerprint)
+
+        source = get_svg_source(svg_path)
+        return (kind, template_key, fingerprint, source.digest if source is not None else str(svg_path))
+
+    def begin_template_batch(self):
+        """Übernimmt Budget aus RuntimeConfig und setzt Zähler für die Batch-Statistik zurück"""
+        from runtime_config import get_config
+        config = get_config()
+
+        if config.template_cache_scope != TEMPLATE_CACHE_SCOPE_SESSION:
+            self.template_store.clear()
+        self.template_store.set_max_size_mb(config.template_cache_max_mb)
+        self.template_store.reset_stats()
+
+    def end_template_batch(self):
+        """Gibt Templates frei, sofern sie nicht für die gesamte Sitzung gehalten werden"""
+        from runtime_config import get_config
+        if get_config().template_cache_scope != TEMPLATE_CACHE_SCOPE_SESSION:
+            self.template_store.clear()
+
+    def _compose_chunk(
+        self,
+        chunk_tasks: List[Tuple[Path, ZeichenConfig]],
+        svg_template_jobs: dict,
+        svg_templates: dict,
+        svg_template_key: Callable[[Path, ZeichenConfig], str],
+        worker: Callable,
+        num_threads: int,
+        status_prefix: str = "",
+        preparing_callback: Optional[callable] = None
+    ) -> Iterator[Tuple[Path, ZeichenConfig, tuple]]:
+        """
+        Rendert SVG-Templates und erstellt Zeichen im selben Thread-Pool
+
+        CHANGED: Früher wurden alle SVG-Templates eines Stapels seriell gerendert und
+        erst danach die Zeichen parallel erstellt. Jetzt werden die Templates als
+        Futures in den Pool eingereicht - ein Zeichen startet, sobald sein Template
+        fertig ist. Zeichen ohne Template (Blanko, Template im Speicher) starten sofort.
+
+        Args:
+            chunk_tasks: Liste von (svg_path, config) Tupeln des Stapels
+            svg_template_jobs: Dict {template_key: (svg_path, store_key, render_callable)}
+            svg_templates: Dict, wird mit fertigen Templates befüllt (Freigabe durch Aufrufer)
+            svg_template_key: Liefert Template-Key für (svg_path, config)
+            worker: worker(svg_path, config, svg_template) -> Ergebnis-Tupel
+            num_threads: Anzahl Threads
+            status_prefix: Präfix für Status-Meldungen (z.B. "Stapel 1/3")
+            preparing_callback: Optional callback(status_text)
+
+        Yields:
+            (svg_path, config, worker_ergebnis) in Fertigstellungs-Reihenfolge
+        """
+        def on_error(svg_path: Path, error: Exception):
+            # FIXED: Template-Fehler loggen, aber Export fortsetzen
+            self.logger.warning("SVG-Template für {} konnte nicht erstellt werden: {}".format(
+                svg_path.stem, str(error)))
+            self.logger.debug("Fallback: Zeichen werden ohne SVG-Template gerendert")
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            pending = {}  # Future -> ("template", template_key, svg_path, store_key) | ("zeichen", ...)
+            rendering = set()
+
+            # Templates zuerst einreichen (FIFO: sie starten vor allen wartenden Zeichen)
+            for template_key, (svg_path, store_key, render) in svg_template_jobs.items():
+                cached = self.template_store.get(store_key)
+                if cached is not None:
+                    svg_templates[template_key] = cached
+                    continue
+                pending[executor.submit(render)] = ("template", template_key, svg_path, store_key)
+                rendering.add(template_key)
+
+            if preparing_callback and rendering:
+                preparing_callback("{}: Rendere {} SVG-Templates parallel zur Verarbeitung...".format(
+                    status_prefix, len(rendering)))
+
+            def submit(svg_path: Path, config: ZeichenConfig, svg_template):
+                future = executor.submit(worker, svg_path, config, svg_template)
+                pending[future] = ("zeichen", svg_path, config)
+
+            # Zeichen warten nur auf ihr eigenes Template
+            waiting = {}
+            for svg_path, config in chunk_tasks:
+                template_key = svg_template_key(svg_path, config)
+                if template_key in rendering:
+                    waiting.setdefault(template_key, []).append((svg_path, config))
+                else:
+                    submit(svg_path, config, svg_templates.get(template_key))
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, *info = pending.pop(future)
+
+                    if kind == "template":
+                        template_key, svg_path, store_key = info
+                        try:
+                            svg_templates[template_key] = future.result()
+                            self.template_store.put(store_key, svg_templates[template_key])
+                        except Exception as e:
+                            on_error(svg_path, e)
+                        for task_svg_path, task_config in waiting.pop(template_key, []):
+                            submit(task_svg_path, task_config, svg_templates.get(template_key))
+                        continue
+
+                    svg_path, config = info
+                    yield svg_path, config, future.result()
+
+    def create_pipeline_stages(
+        self,
+        draw_cut_lines: bool = False,
+        num_threads: int = 4,
+        use_templates: bool = True,
+        s1_options: Optional[dict] = None,
+        vector: bool = False,
+        final_size: bool = False
+    ) -> List[PipelineStage]:
+        """
+        Erstellt die Stufen "render" und "compose" für eine BatchPipeline
+
+        Eingabe der ersten Stufe: (svg_path, config). Ausgabe: _PipelineJob mit
+        druckfertigem Bild in job.image. PNG-Export hängt "encode"/"write" an,
+        PDF-Exporter können eigene Stufen anhängen.
+
+        Args:
+            draw_cut_lines: Schnittlinien zeichnen
+            num_threads: Anzahl Threads für CPU-Stufen
+            use_templates: Text-/SVG-Templates aus dem Template-Speicher verwenden
+            s1_options: None = Standard-Layout, sonst Dict mit s1_links_prozent,
+                s1_anzahl_schreiblinien und s1_staerke_anzeigen (S1-Layout)
+            vector: True = VectorCanvas in job.image (Vektor-PDF, ohne Templates)
+            final_size: True = Bild in fertiger Größe ohne Beschnitt (Schnittbogen, nur Raster)
+
+        Returns:
+            Liste von PipelineStage
+        """
+        import time
+
+        if vector:
+            use_templates = False  # Templates sind gerastert
+            final_size = False  # Vektor: Zuschnitt per Clipping beim Platzieren
+
+        def render(task) -> _PipelineJob:
+            job = _PipelineJob(*task)
+            if not use_templates or SVGLoaderLocal.is_blanko_zeichen(job.svg_path):
+                return job
+
+            render_start = time.time()
+            if s1_options is None:
+                template_key = self._get_svg_template_key(job.svg_path, job.config)
+                factory = partial(self._create_svg_template, job.svg_path, job.config)
+            else:
+                links_prozent = s1_options['s1_links_prozent']
+                template_key = self._get_svg_template_key(job.svg_path, job.config) + f"_s1_{links_prozent}"
+                factory = partial(self._create_s1_svg_template, job.svg_path, job.config, links_prozent)
+
+            try:
+                job.svg_template = self.template_store.get_or_create(
+                    self._template_store_key("svg", template_key, job.config, job.svg_path), factory
+                )
+            except Exception as e:
+                # FIXED: Template-Fehler loggen, aber Export fortsetzen (Zeichen rendert selbst)
+                self.logger.warning("SVG-Template für {} konnte nicht erstellt werden: {}".format(
+                    job.svg_path.stem, str(e)))
+            job.timings['render'] = time.time() - render_start
+            return job
+
+        def compose(job: _PipelineJob) -> _PipelineJob:
+            text_template = None
+            if use_templates:
+                template_key = self._get_template_key(job.config)
+                text_template = self.template_store.get_or_create(
+                    self._template_store_key("text", template_key, job.config),
+                    partial(self._create_text_template, job.config)
+                )
+
+            if s1_options is None:
+                image, timings = self.create_zeichen(
+                    job.svg_path, job.config, draw_cut_lines,
+                    text_template, job.svg_template,
+                    return_image=True, track_timing=True, vector=vector, final_size=final_size
+                )
+            else:
+                image, timings = self.create_zeichen_s1(
+                    job.svg_path, job.config,
+                    s1_options['s1_links_prozent'],
+                    s1_options['s1_anzahl_schreiblinien'],
+                    s1_options['s1_staerke_anzeigen'],
+                    draw_cut_lines,
+                    text_template, job.svg_template,
+                    return_image=True, track_timing=True, vector=vector, final_size=final_size
+                )
+
+            job.svg_template = None
+            job.image = image
+            for step, duration in timings.items():
+                job.timings[step] = job.timings.get(step, 0.0) + duration
+            return job
+
+        return [
+            PipelineStage("render", render, workers=self._render_stage_workers(num_threads)),
+            PipelineStage("compose", compose, workers=max(1, num_threads)),
+        ]
+
+    def _render_stage_workers(self, num_threads: int) -> int:
+        """Threads der Render-Stufe (beim Prozess-Backend so viele wie Worker-Prozesse)"""
+        if self.render_pool is not None:
+            return max(num_threads, self.render_pool.num_workers)
+        return max(1, num_threads)
+
+    def _create_batch_pipelined(
+        self,
+        tasks: List[Tuple[Path, ZeichenConfig]],
+        draw_cut_lines: bool,
+        num_threads: int,
+        progress_callback: Optional[callable] = None,
+        preparing_callback: Optional[callable] = None,
+        use_templates: bool = True,
+        s1_options: Optional[dict] = None,
+        chunk_size: Optional[int] = None
+    ) -> Tuple[List[Path], List[Tuple[str, str]]]:
+        """
+        Batch-Export als Pipeline: Rendern -> Komponieren -> PNG-Kodieren -> Schreiben
+
+        NEW: Statt Stapel mit Barriere (Templates, Pool, Warten, GC) laufen die Stufen
+        überlappend. Der Speicher ist durch die Warteschlangentiefe begrenzt
+        (RuntimeConfig.pipeline_queue_depth), nicht durch eine Stapelgröße.
+
+        NEW: MemoryScheduler lässt Zeichen nur zu, solange der geschätzte Spitzenbedarf
+        ins Speicherbudget passt (RuntimeConfig.memory_budget_mb), und korrigiert die
+        Schätzung anhand des gemessenen Prozess-Speichers.
+
+        Args:
+            tasks: Liste von (svg_path, config) Tupeln
+            draw_cut_lines: Schnittlinien zeichnen
+            num_threads: Anzahl Threads für CPU-Stufen
+            progress_callback: Optional callback(current, total, svg_name, status)
+            preparing_callback: Optional callback(status_text)
+            use_templates: Template-Optimierung nutzen
+            s1_options: None = Standard-Layout, sonst S1-Parameter (siehe create_pipeline_stages)
+            chunk_size: Max. Zeichen gleichzeitig in der Pipeline (None = aus Stufen/Warteschlangen)
+
+        Returns:
+            Tuple: (successful_files, errors)
+        """
+        import time
+        from runtime_config import get_config
+
+        def encode(job: _PipelineJob) -> _PipelineJob:
+            encode_start = time.time()
+            buffer = BytesIO()
+            job.image.save(buffer, format='PNG', dpi=(job.config.dpi, job.config.dpi),
+                           compress_level=EXPORT_PNG_COMPRESS_LEVEL)
+            job.image = None  # Rohbild sofort freigeben
+            job.png_data = buffer.getvalue()
+            job.timings['export'] += time.time() - encode_start
+            return job
+
+        def write(job: _PipelineJob) -> _PipelineJob:
+            write_start = time.time()
+            modus = job.config.modus if s1_options is None else "s1_layout"
+            job.output_file = self._export_path(
+                job.config.zeichen_id, modus, draw_cut_lines, job.config.output_dir
+            )
+            job.output_file.write_bytes(job.png_data)
+            job.png_data = None
+            job.timings['export'] += time.time() - write_start
+            return job
+
+        scheduler = MemoryScheduler()
+        num_threads = scheduler.plan_threads(tasks, num_threads)
+
+        stages = self.create_pipeline_stages(draw_cut_lines, num_threads, use_templates, s1_options)
+        stages += [
+            PipelineStage("encode", encode, workers=max(1, num_threads // 2)),
+            PipelineStage("write", write, workers=1),
+        ]
+        # Explizite Stapelgröße begrenzt die Zeichen in Bearbeitung (statt Stapel-Barriere)
+        pipeline = BatchPipeline(stages, queue_depth=get_config().pipeline_queue_depth,
+                                 max_in_flight=chunk_size, admission=scheduler)
+
+        self.logger.info("Pipeline-Verarbeitung: {} Zeichen | Stufen: {} | Max. in Bearbeitung: {}{}".format(
+            len(tasks), ", ".join("{} ({})".format(s.name, s.workers) for s in stages),
+            pipeline.max_in_flight, " (Stapelgröße)" if chunk_size else ""))
+        if preparing_callback:
+            preparing_callback("Starte Verarbeitung ({} Zeichen)...".format(len(tasks)))
+
+        self.begin_template_batch()
+        start_time = time.time()
+        successful_files = []
+        errors = []
+        all_timings = []
+
+        try:
+            for completed, (_, (svg_path, config), job, error) in enumerate(pipeline.run(tasks), start=1):
+                if error is None:
+                    successful_files.append(job.output_file)
+                    all_timings.append(job.timings)
+                    self.logger.info("ERFOLGREICH: {}".format(job.output_file.name))
+                else:
+                    self.logger.error("FEHLER bei {}: {}".format(config.zeichen_id, str(error)))
+                    errors.append((config.zeichen_id, str(error)))
+
+                if progress_callback:
+                    progress_callback(completed, len(tasks), svg_path.stem,
+                                      "OK" if error is None else "FEHLER")
+        finally:
+            self.end_template_batch()
+
+        # Statistik
+        elapsed_time = time.time() - start_time
+        self.logger.info("=" * 80)
+        self.logger.info("EXPORT-STATISTIK (Pipeline)")
+        self.logger.info("=" * 80)
+        self.logger.info("Kopien exportiert: {}".format(len(successful_files)))
+        self.logger.info("Fehler: {}".format(len(errors)))
+        self.logger.info("Gesamtzeit: {:.1f} Sekunden ({:.2f}s pro Kopie)".format(
+            elapsed_time, elapsed_time / len(tasks)))
+        cache_stats = self.raster_cache.get_stats()
+        self.logger.info("Raster-Cache: {} Treffer | {} Misses | {:.1f} MB belegt".format(
+            cache_stats['hits'], cache_stats['misses'], cache_stats['size_mb']))
+        template_stats = self.template_store.get_stats()
+        self.logger.info("Template-Cache: {} Treffer | {} Misses | {} verdrängt | {:.1f} MB belegt".format(
+            template_stats['hits'], template_stats['misses'], template_stats['evictions'],
+            template_stats['size_mb']))
+        memory_stats = scheduler.get_stats()
+        self.logger.info("Speicher: Budget {:.0f} MB | Spitze geschätzt {:.0f} MB | gemessen {:.0f} MB | "
+                         "Korrektur x{:.2f} | {} Wartezeiten".format(
+                             memory_stats['budget_mb'], memory_stats['peak_estimated_mb'],
+                             memory_stats['peak_measured_mb'], memory_stats['correction'],
+                             memory_stats['waits']))
+        self.logger.info("-" * 80)
+        self.logger.info("AUSLASTUNG PRO STUFE:")
+        for name, stage_stats in pipeline.get_stats().items():
+            self.logger.info("  {:<8} {:>2} Worker | {:>5} Zeichen | {:7.2f}s belegt | {:5.1f}% ausgelastet".format(
+                name, stage_stats['workers'], stage_stats['items'], stage_stats['busy_s'],
+                stage_stats['utilization'] * 100))
+        if all_timings:
+            totals = [t['render'] + t['generate'] + t['export'] for t in all_timings]
+            self.logger.info("ZEITSTATISTIK PRO KOPIE (alle Schritte):")
+            self.logger.info("  Min: {:.3f}s | Max: {:.3f}s | Durchschnitt: {:.3f}s".format(
+                min(totals), max(totals), sum(totals) / len(totals)))
+        self.logger.info("=" * 80)
+
+        return (successful_files, errors)
+
     def scan_available_zeichen(self) -> dict:
         """Scannt verfuegbare Zeichen"""
         all_svgs = self.svg_loader.get_all_svgs()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+template_store.py - Stapelübergreifender Speicher für Text- und SVG-Templates
+
+Bisher wurden Templates pro Stapel (Chunk) erstellt und danach verworfen.
+Liegen Kopien eines Zeichens in mehreren Stapeln oder nutzt ein großer Auftrag
+denselben OV-Text, wurden dieselben Templates immer wieder neu gerendert.
+
+TemplateStore hält Templates für den gesamten Batch (optional die gesamte
+Sitzung) und verdrängt nach Speicherbedarf (LRU in Bytes), nicht nach Stapel.
+
+Features:
+- Größenbudget in MB (Bytes = Breite x Höhe x Kanäle)
+- LRU-Verdrängung
+- Treffer/Miss/Verdrängungs-Zähler für die Export-Statistik
+- Thread-safe, gleichzeitige Anfragen nach demselben Template rendern es nur einmal
+
+Verwendung:
+    store = TemplateStore(max_size_mb=512)
+    template = store.get_or_create(key, lambda: render_template())
+"""
+
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, Hashable, Optional
+
+from PIL import Image
+
+from logging_manager import LoggingManager
+
+
+# Alle lebenden Template-Speicher (für get_template_store_bytes())
+_stores: "weakref.WeakSet[TemplateStore]" = weakref.WeakSet()
+
+
+def image_size_bytes(image: Image.Image) -> int:
+    """Speicherbedarf eines PIL Images (unkomprimiert)"""
+    return image.width * image.height * len(image.getbands())
+
+
+def get_template_store_bytes() -> int:
+    """Summe aller Template-Speicher dieses Prozesses (für MemoryScheduler)"""
+    return sum(store._total_bytes for store in list(_stores))
+
+
+class TemplateStore:
+    """
+    Speicherbegrenzter LRU-Speicher für PIL-Templates
+    """
+
+    def __init__(self, max_size_mb: Optional[int] = None):
+        """
+        Initialisiert Template-Speicher
+
+        Args:
+            max_size_mb: Größenbudget in MB (default: aus RuntimeConfig)
+        """
+        self.logger = LoggingManager().get_logger(__name__)
+
+        if max_size_mb is None:
+            from runtime_config import get_config
+            max_size_mb = get_config().template_cache_max_mb
+
+        self.max_size_bytes = int(max_size_mb) * 1024 * 1024
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = Lock()
+        self._entries: "OrderedDict[Hashable, Image.Image]" = OrderedDict()
+        self._creating: Dict[Hashable, Future] = {}  # NEW: Templates, die gerade erstellt werden
+        self._total_bytes = 0
+        _stores.add(self)
+
+    def set_max_size_mb(self, max_size_mb: int):
+        """
+        Ändert Größenbudget (verdrängt sofort falls nötig)
+
+        Args:
+            max_size_mb: Größenbudget in MB
+        """
+        with self._lock:
+            self.max_size_bytes = int(max_size_mb) * 1024 * 1024
+            self._evict_locked()
+
+    def get(self, key: Hashable) -> Optional[Image.Image]:
+        """
+        Liest Template (zählt Treffer/Miss)
+
+        Args:
+            key: Template-Schlüssel
+
+        Returns:
+            PIL Image oder None
+        """
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: Hashable, image: Image.Image):
+        """
+        Speichert Template
+
+        Templates größer als das Gesamtbudget werden nicht gespeichert.
+
+        Args:
+            key: Template-Schlüssel
+            image: PIL Image
+        """
+        size = image_size_bytes(image)
+        with self._lock:
+            if size > self.max_size_bytes:
+                return
+
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= image_size_bytes(old)
+
+            self._entries[key] = image
+            self._total_bytes += size
+            self._evict_locked()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Image.Image]) -> Image.Image:
+        """
+        Liest Template oder erstellt und speichert es
+
+        CHANGED: Fragen mehrere Threads gleichzeitig dasselbe fehlende Template an,
+        erstellt nur der erste es - die anderen warten auf dessen Ergebnis.
+
+        Args:
+            key: Template-Schlüssel
+            factory: Erzeugt das Template bei Miss
+
+        Returns:
+            PIL Image
+
+        Raises:
+            Exception: Fehler der Factory (auch für wartende Threads)
+        """
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+
+            creating = self._creating.get(key)
+            if creating is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._creating[key] = Future()
+
+        if creating is not None:
+            return creating.result()
+
+        try:
+            image = factory()
+        except Exception as e:
+            with self._lock:
+                self._creating.pop(key).set_exception(e)
+            raise
+
+        self.put(key, image)
+        with self._lock:
+            self._creating.pop(key).set_result(image)
+        return image
+
+    def clear(self):
+        """Entfernt alle Templates"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def reset_stats(self):
+        """Setzt Zähler zurück (z.B. zu Beginn eines Batches)"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Gibt Statistik zurück
+
+        Returns:
+            dict: hits, misses, evictions, entries, size_mb, max_mb
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size_mb': self._total_bytes / 1024 / 1024,
+                'max_mb': self.max_size_bytes / 1024 / 1024
+            }
+
+    def _evict_locked(self):
+        """Verdrängt älteste Templates bis Budget eingehalten ist (Lock muss gehalten werden)"""
+        while self._total_bytes > self.max_size_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= image_size_bytes(evicted)
+            self.evictions += 1
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("TEMPLATE-STORE TEST")
+    print("=" * 80)
+
+    store = TemplateStore(max_size_mb=1)
+
+    # 512x512 RGB = 0.75 MB
+    first = store.get_or_create("a", lambda: Image.new('RGB', (512, 512)))
+    print(f"\n[TEST 1] Miss + Erstellen: {store.get_stats()}")
+
+    store.get_or_create("a", lambda: Image.new('RGB', (1, 1)))
+    print(f"[TEST 2] Treffer: {store.get_stats()['hits'] == 1}")
+
+    store.put("b", Image.new('RGB', (512, 512)))
+    print(f"[TEST 3] Verdrängung: {store.get('a') is None and store.get_stats()['evictions'] == 1}")
+
+    print("\n" + "=" * 80)
+    print("[OK] Alle Tests abgeschlossen")
+    print("=" * 80)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+text_layout.py - Gemessene Texte, Font-Metriken und Zeilenumbrüche (memoisiert)
+
+TextOverlayPlaceholder hat bisher für jede Messung ein 1000x1000px-Bild
+(TEMP_IMAGE_SIZE_PX) angelegt, nur um ImageDraw.textbbox() aufzurufen - pro
+Zeichen dutzendfach (Platzhalter auffüllen, Text-Höhe, Umbruch, Validierung).
+Hier:
+
+- Messung direkt mit font.getbbox() (gleiches Ergebnis wie textbbox((0, 0), ...),
+  ohne Bild)
+- Messungen, maximale Ascent/Descent und Zwei-Zeilen-Umbrüche sind pro
+  (Font, Text) memoisiert. Fonts kommen aus font_registry (ein Objekt pro
+  Schriftart/Pixelgröße), der Font steht also für Schriftart, Größe und DPI.
+- Thread-safe (functools.lru_cache)
+
+Verwendung:
+    font = get_font("Arial", 83)
+    width = text_width_px(font, "OV: ____")
+    line1, line2 = wrap_to_two_lines(font, "Langer Freitext", 900)
+"""
+
+import logging
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from constants import SYSTEM_TEXT_LAYOUT_CACHE_SIZE
+
+
+# Test-String für maximale Ascent/Descent:
+# - Hohe Buchstaben: T, l, d, f, h, k (maximaler Ascent)
+# - Tiefe Buchstaben: g, y, p, q, j, _ (maximaler Descent)
+# - Zahlen und Sonderzeichen: 0-9, /, =, - (für Stärke-Zeile)
+METRICS_TEST_STRING = "Tlfhk_gyqj0123456789/=-:OV"
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=SYSTEM_TEXT_LAYOUT_CACHE_SIZE)
+def text_bbox(font, text: str) -> Tuple[int, int, int, int]:
+    """
+    Text-Box relativ zur Baseline-Startposition (wie ImageDraw.textbbox((0, 0), ...))
+
+    Args:
+        font: PIL-Font (FreeTypeFont oder ImageFont)
+        text: Text (eine Zeile)
+
+    Returns:
+        (links, oben, rechts, unten) in Pixeln
+    """
+    return tuple(font.getbbox(text))
+
+
+def text_width_px(font, text: str) -> int:
+    """
+    Breite des Texts (Text-Box, nicht Vorschub)
+
+    Args:
+        font: PIL-Font
+        text: Text (eine Zeile)
+
+    Returns:
+        Breite in Pixeln
+    """
+    bbox = text_bbox(font, text)
+    return bbox[2] - bbox[0]
+
+
+@lru_cache(maxsize=256)
+def font_metrics(font) -> Tuple[int, int]:
+    """
+    MAXIMALE Ascent/Descent eines Fonts (für gleiche Baseline über alle Zeichen)
+
+    Args:
+        font: PIL-Font
+
+    Returns:
+        (max_ascent, max_descent) in Pixeln (bbox oben/unten von METRICS_TEST_STRING)
+    """
+    bbox = text_bbox(font, METRICS_TEST_STRING)
+    return bbox[1], bbox[3]
+
+
+@lru_cache(maxsize=SYSTEM_TEXT_LAYOUT_CACHE_SIZE)
+def find_two_line_split(font, text: str, max_width_px: int) -> Optional[Tuple[str, str]]:
+    """
+    Trennstelle an Leerzeichen/Bindestrichen mit möglichst vielen Wörtern in Zeile 1
+
+    Args:
+        font: PIL-Font
+        text: Text, der nicht auf eine Zeile passt
+        max_width_px: Maximale Zeilenbreite
+
+    Returns:
+        (zeile1, zeile2) wenn beide Zeilen passen, sonst None
+    """
+    words = text.replace("-", "- ").split()  # Bindestriche werden zu Trennstellen
+
+    best = None
+    for i in range(1, len(words)):
+        line1_candidate = " ".join(words[:i])
+        line2_candidate = " ".join(words[i:])
+
+        # Pruefe zuerst line1 - wenn diese zu lang ist, koennen wir abbrechen
+        if text_width_px(font, line1_candidate) > max_width_px:
+            break
+
+        # Wenn beide passen, speichern und weitermachen (versuche mehr in line1 zu packen)
+        if text_width_px(font, line2_candidate) <= max_width_px:
+            best = (line1_candidate, line2_candidate)
+
+    return best
+
+
+@lru_cache(maxsize=SYSTEM_TEXT_LAYOUT_CACHE_SIZE)
+def wrap_to_two_lines(font, text: str, max_width_px: int) -> Tuple[str, str]:
+    """
+    Bricht Text auf zwei Zeilen um (einzeilig passender Text steht in Zeile 2)
+
+    Strategie:
+    1. Passt der Text auf eine Zeile → ("", text)
+    2. Sonst an Leerzeichen/Bindestrichen umbrechen (find_two_line_split)
+    3. Falls kein Leerzeichen oder kein passender Umbruch: hart in der Mitte
+
+    Args:
+        font: PIL-Font
+        text: Text zum Umbrechen
+        max_width_px: Maximale Breite in Pixel (Canvas-Breite)
+
+    Returns:
+        (zeile1, zeile2)
+    """
+    text_width = text_width_px(font, text)
+    if text_width <= max_width_px:
+        return "", text
+
+    logger.debug("Text zu lang ({}px > {}px): '{}' - Umbrechen...".format(text_width, max_width_px, text))
+
+    mid = len(text) // 2
+    if len(text.replace("-", "- ").split()) <= 1:
+        # Kein Leerzeichen → Harter Umbruch
+        return text[:mid], text[mid:]
+
+    split = find_two_line_split(font, text, max_width_px)
+    if split is not None:
+        logger.debug("Text umgebrochen: '{}' | '{}'".format(*split))
+        return split
+
+    # Fallback: Harter Umbruch in der Mitte
+    logger.warning("Kein guter Umbruch gefunden, harter Umbruch bei Position {}".format(mid))
+    return text[:mid], text[mid:]
+
+
+def clear_caches():
+    """Leert alle Layout-Caches (z.B. nach FontRegistry.clear())"""
+    for cached in (text_bbox, font_metrics, find_two_line_split, wrap_to_two_lines):
+        cached.cache_clear()
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    import time
+    from PIL import Image, ImageDraw
+    from font_registry import get_font
+
+    print("=" * 80)
+    print("TEXT-LAYOUT TEST")
+    print("=" * 80)
+
+    font = get_font("Arial", 83)
+    draw = ImageDraw.Draw(Image.new('RGB', (1000, 1000)))
+    for sample in (METRICS_TEST_STRING, "OV: ________", "Stärke: __/__/__/__  "):
+        assert text_bbox(font, sample) == tuple(draw.textbbox((0, 0), sample, font=font)), sample
+    print("\ngetbbox() == textbbox((0, 0)) [OK]")
+    print(f"Metriken: ascent/descent = {font_metrics(font)}")
+    print(f"Umbruch: {wrap_to_two_lines(font, 'Technisches Hilfswerk Ortsverband', 300)}")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        text_width_px(font, "OV: ________")
+    print(f"1000x text_width_px(): {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"Cache: {text_bbox.cache_info()}")
+
+    print("\n" + "=" * 80)
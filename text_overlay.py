@@ -24,14 +24,16 @@ NEU v7.3 - Text-Positionierung für bessere UX:
 - Grafik-Position bleibt weiterhin konsistent über alle Modi
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageFont
 from pathlib import Path
 import logging
 from dataclasses import dataclass
 from typing import Optional, List, Union
 
 from runtime_config import get_config
-from font_manager import FontManager
+from font_registry import get_font
+from vector_canvas import get_draw
+from text_layout import find_two_line_split, font_metrics, text_width_px, wrap_to_two_lines
 from constants import (
     MODUS_OV_STAERKE,
     MODUS_ORT_STAERKE,
@@ -54,7 +56,6 @@ from constants import (
     DEFAULT_ZEICHEN_BREITE_MM,
     DEFAULT_BESCHNITTZUGABE_MM,
     POINTS_PER_INCH,
-    TEMP_IMAGE_SIZE_PX,  # NEW: Für präzisere Textmessungen
     create_placeholder_text,
     create_staerke_placeholder,
     mm_to_pixels,
@@ -249,17 +250,12 @@ class TextOverlayPlaceholder:
             # Kein Text-Modus
             return 0.0
 
-        # Temp-Canvas für Breiten-Messung
-        temp_img = Image.new('RGB', (TEMP_IMAGE_SIZE_PX, TEMP_IMAGE_SIZE_PX))
-        temp_draw = ImageDraw.Draw(temp_img)
-
         # Breiteste Zeile finden
         max_width_px = 0
         for line in lines:
-            bbox = temp_draw.textbbox((0, 0), line, font=font)
-            text_width_px = bbox[2] - bbox[0]
-            if text_width_px > max_width_px:
-                max_width_px = text_width_px
+            line_width_px = text_width_px(font, line)
+            if line_width_px > max_width_px:
+                max_width_px = line_width_px
 
         # In mm umrechnen
         text_width_mm = pixels_to_mm(max_width_px, config.dpi)
@@ -330,7 +326,7 @@ class TextOverlayPlaceholder:
         # NEW v0.8.2.1: MODUS_SCHREIBLINIE_STAERKE - Zeichne echte Linie statt Unterstriche
         if config.modus == MODUS_SCHREIBLINIE_STAERKE:
             from constants import S1_LINE_COLOR, S1_LINE_WIDTH, S1_LINE_MARGIN_MM, mm_to_pixels
-            draw = ImageDraw.Draw(canvas)
+            draw = get_draw(canvas)  # CHANGED: PIL Image oder VectorCanvas (Vektor-PDF)
 
             # FIXED v0.8.2.2: Margin und Breite wie rechte Seite
             # Nutze die volle config.zeichen_breite_mm (= Breite des linken Bereichs im S1-Layout)
@@ -412,13 +408,9 @@ class TextOverlayPlaceholder:
         # Font laden
         font = self._load_font(config.font_size, config.dpi, config.font_family)
 
-        # Temporaeres Draw-Objekt
-        temp_img = Image.new('RGB', (TEMP_IMAGE_SIZE_PX, TEMP_IMAGE_SIZE_PX))
-        temp_draw = ImageDraw.Draw(temp_img)
         
         # Breite der Staerke-Zeile
-        staerke_bbox = temp_draw.textbbox((0, 0), staerke_line, font=font)
-        staerke_width_px = staerke_bbox[2] - staerke_bbox[0]
+        staerke_width_px = text_width_px(font, staerke_line)
         
         self.logger.debug("Staerke: '{}' = {}px".format(staerke_line, staerke_width_px))
         
@@ -429,8 +421,7 @@ class TextOverlayPlaceholder:
             ov_text = ov_prefix + config.ov_name
 
             # NEU v0.8.1: Prüfe ob OV-Name zu lang ist
-            ov_bbox = temp_draw.textbbox((0, 0), ov_text, font=font)
-            ov_width = ov_bbox[2] - ov_bbox[0]
+            ov_width = text_width_px(font, ov_text)
 
             # Wenn OV-Name breiter als Stärke-Zeile → prüfe Umbruch
             canvas_breite_mm = config.zeichen_breite_mm - (2 * config.sicherheitsabstand_mm)
@@ -452,8 +443,7 @@ class TextOverlayPlaceholder:
             # CHANGED: Stoppe BEVOR wir Staerke-Breite erreichen!
             while True:
                 test_line = ov_line + "_"
-                test_bbox = temp_draw.textbbox((0, 0), test_line, font=font)
-                test_width_px = test_bbox[2] - test_bbox[0]
+                test_width_px = text_width_px(font, test_line)
 
                 # Wenn mit einem weiteren "_" die Breite UEBER Staerke waere, stoppen!
                 if test_width_px > staerke_width_px:
@@ -467,8 +457,7 @@ class TextOverlayPlaceholder:
                     break
         
         # Aktuelle Breiten messen
-        ov_bbox = temp_draw.textbbox((0, 0), ov_line, font=font)
-        ov_width_px = ov_bbox[2] - ov_bbox[0]
+        ov_width_px = text_width_px(font, ov_line)
         
         self.logger.debug("OV: '{}' = {}px".format(ov_line, ov_width_px))
         
@@ -485,8 +474,7 @@ class TextOverlayPlaceholder:
             prev_ov_line = ov_line
             prev_ov_width = ov_width_px
             ov_line += " "
-            ov_bbox = temp_draw.textbbox((0, 0), ov_line, font=font)
-            ov_width_px = ov_bbox[2] - ov_bbox[0]
+            ov_width_px = text_width_px(font, ov_line)
 
             # FIXED: Wenn wir zu weit überschießen (>10px), nutze vorherige Version
             if ov_width_px > target_width + 10:
@@ -507,8 +495,7 @@ class TextOverlayPlaceholder:
             prev_staerke_line = staerke_line
             prev_staerke_width = staerke_width_px
             staerke_line += " "
-            staerke_bbox = temp_draw.textbbox((0, 0), staerke_line, font=font)
-            staerke_width_px = staerke_bbox[2] - staerke_bbox[0]
+            staerke_width_px = text_width_px(font, staerke_line)
 
             # FIXED: Wenn wir zu weit überschießen (>10px), nutze vorherige Version
             if staerke_width_px > target_width + 10:
@@ -522,11 +509,9 @@ class TextOverlayPlaceholder:
                 break
         
         # Finale Breiten
-        ov_bbox = temp_draw.textbbox((0, 0), ov_line, font=font)
-        ov_width_px = ov_bbox[2] - ov_bbox[0]
+        ov_width_px = text_width_px(font, ov_line)
         
-        staerke_bbox = temp_draw.textbbox((0, 0), staerke_line, font=font)
-        staerke_width_px = staerke_bbox[2] - staerke_bbox[0]
+        staerke_width_px = text_width_px(font, staerke_line)
         
         diff = abs(ov_width_px - staerke_width_px)
         
@@ -562,13 +547,8 @@ class TextOverlayPlaceholder:
         # Font laden
         font = self._load_font(config.font_size, config.dpi, config.font_family)
 
-        # Temporaeres Draw-Objekt
-        temp_img = Image.new('RGB', (TEMP_IMAGE_SIZE_PX, TEMP_IMAGE_SIZE_PX))
-        temp_draw = ImageDraw.Draw(temp_img)
-
         # Breite der Staerke-Zeile
-        staerke_bbox = temp_draw.textbbox((0, 0), staerke_line, font=font)
-        staerke_width_px = staerke_bbox[2] - staerke_bbox[0]
+        staerke_width_px = text_width_px(font, staerke_line)
 
         # Ort-Zeile (analog zu OV-Zeile)
         ort_prefix = "Ort: "
@@ -579,8 +559,7 @@ class TextOverlayPlaceholder:
 
             while True:
                 test_line = ort_line + "_"
-                test_bbox = temp_draw.textbbox((0, 0), test_line, font=font)
-                test_width_px = test_bbox[2] - test_bbox[0]
+                test_width_px = text_width_px(font, test_line)
 
                 if test_width_px > staerke_width_px:
                     break
@@ -591,14 +570,12 @@ class TextOverlayPlaceholder:
                     break
 
         # Breiten angleichen (wie bei OV)
-        ort_bbox = temp_draw.textbbox((0, 0), ort_line, font=font)
-        ort_width_px = ort_bbox[2] - ort_bbox[0]
+        ort_width_px = text_width_px(font, ort_line)
 
         if ort_width_px < staerke_width_px:
             while ort_width_px < staerke_width_px:
                 test_line = ort_line + " "
-                test_bbox = temp_draw.textbbox((0, 0), test_line, font=font)
-                test_width_px = test_bbox[2] - test_bbox[0]
+                test_width_px = text_width_px(font, test_line)
 
                 if test_width_px > staerke_width_px:
                     break
@@ -628,21 +605,15 @@ class TextOverlayPlaceholder:
         # Font laden
         font = self._load_font(config.font_size, config.dpi, config.font_family)
 
-        # Temporaeres Draw-Objekt
-        temp_img = Image.new('RGB', (TEMP_IMAGE_SIZE_PX, TEMP_IMAGE_SIZE_PX))
-        temp_draw = ImageDraw.Draw(temp_img)
-
         # Breite der Staerke-Zeile
-        staerke_bbox = temp_draw.textbbox((0, 0), staerke_line, font=font)
-        staerke_width_px = staerke_bbox[2] - staerke_bbox[0]
+        staerke_width_px = text_width_px(font, staerke_line)
 
         # Schreiblinie: Nur Unterstriche (kein Präfix)
         schreiblinie = ""
 
         while True:
             test_line = schreiblinie + "_"
-            test_bbox = temp_draw.textbbox((0, 0), test_line, font=font)
-            test_width_px = test_bbox[2] - test_bbox[0]
+            test_width_px = text_width_px(font, test_line)
 
             if test_width_px > staerke_width_px:
                 break
@@ -653,14 +624,12 @@ class TextOverlayPlaceholder:
                 break
 
         # Breiten angleichen
-        schreib_bbox = temp_draw.textbbox((0, 0), schreiblinie, font=font)
-        schreib_width_px = schreib_bbox[2] - schreib_bbox[0]
+        schreib_width_px = text_width_px(font, schreiblinie)
 
         if schreib_width_px < staerke_width_px:
             while schreib_width_px < staerke_width_px:
                 test_line = schreiblinie + " "
-                test_bbox = temp_draw.textbbox((0, 0), test_line, font=font)
-                test_width_px = test_bbox[2] - test_bbox[0]
+                test_width_px = text_width_px(font, test_line)
 
                 if test_width_px > staerke_width_px:
                     break
@@ -701,73 +670,8 @@ class TextOverlayPlaceholder:
         """
         font = self._load_font(font_size, dpi, font_family)
 
-        # Temporäres Draw-Objekt für Breitenmessung
-        temp_img = Image.new('RGB', (TEMP_IMAGE_SIZE_PX, TEMP_IMAGE_SIZE_PX))
-        temp_draw = ImageDraw.Draw(temp_img)
-
-        # Test: Passt der Text auf eine Zeile?
-        bbox = temp_draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-
-        if text_width <= max_width_px:
-            # Text passt auf eine Zeile → in Zeile 2 (unten)
-            return ["", text]
-
-        self.logger.debug(
-            "Text zu lang ({}px > {}px): '{}' - Umbrechen...".format(
-                text_width, max_width_px, text
-            )
-        )
-
-        # Text muss umgebrochen werden
-        # Strategie: An Leerzeichen oder Bindestrichen trennen
-        words = text.replace("-", "- ").split()  # Bindestriche werden zu Trennstellen
-
-        if len(words) <= 1:
-            # Kein Leerzeichen → Harter Umbruch
-            mid = len(text) // 2
-            return [text[:mid], text[mid:]]
-
-        # Versuche intelligenten Umbruch: Suche optimale Trennstelle
-        # Strategie: So viele Woerter wie moeglich in Zeile 1 packen
-        best_line1 = ""
-        best_line2 = text
-
-        for i in range(1, len(words)):
-            line1_candidate = " ".join(words[:i])
-            line2_candidate = " ".join(words[i:])
-
-            # Pruefe zuerst line1 - wenn diese zu lang ist, koennen wir abbrechen
-            bbox1 = temp_draw.textbbox((0, 0), line1_candidate, font=font)
-            width1 = bbox1[2] - bbox1[0]
-
-            if width1 > max_width_px:
-                # line1 zu lang -> keine weiteren Worte mehr moeglich
-                break
-
-            # Pruefe line2
-            bbox2 = temp_draw.textbbox((0, 0), line2_candidate, font=font)
-            width2 = bbox2[2] - bbox2[0]
-
-            # Wenn beide passen, speichern und weitermachen (versuche mehr in line1 zu packen)
-            if width2 <= max_width_px:
-                best_line1 = line1_candidate
-                best_line2 = line2_candidate
-                # Weiter iterieren, um mehr Woerter in line1 zu packen
-            # Sonst: line2 zu lang, aber line1 passt noch -> weiter versuchen
-
-        if best_line1:
-            self.logger.debug(
-                "Text umgebrochen: '{}' | '{}'".format(best_line1, best_line2)
-            )
-            return [best_line1, best_line2]
-        else:
-            # Fallback: Harter Umbruch in der Mitte
-            mid = len(text) // 2
-            self.logger.warning(
-                "Kein guter Umbruch gefunden, harter Umbruch bei Position {}".format(mid)
-            )
-            return [text[:mid], text[mid:]]
+        # CHANGED: Umbruch memoisiert pro (Font, Text, Breite) - siehe text_layout
+        return list(wrap_to_two_lines(font, text, max_width_px))
 
     def validate_text_fits(
         self,
@@ -803,22 +707,17 @@ class TextOverlayPlaceholder:
         # Font laden
         font = self._load_font(config.font_size, config.dpi, config.font_family)
 
-        # Temporaeres Draw-Objekt fuer Breitenmessung
-        temp_img = Image.new('RGB', (TEMP_IMAGE_SIZE_PX, TEMP_IMAGE_SIZE_PX))
-        temp_draw = ImageDraw.Draw(temp_img)
-
         # Messe Text-Breite
-        bbox = temp_draw.textbbox((0, 0), text, font=font)
-        text_width_px = bbox[2] - bbox[0]
+        text_width = text_width_px(font, text)
 
         # Pruefe ob Text auf eine Zeile passt
-        if text_width_px <= max_width_px:
+        if text_width <= max_width_px:
             return (True, None, 1)
 
         # Text passt nicht auf eine Zeile
         self.logger.debug(
             "Text-Validierung: '{}' zu lang ({}px > {}px)".format(
-                text, text_width_px, max_width_px
+                text, text_width, max_width_px
             )
         )
 
@@ -842,10 +741,8 @@ class TextOverlayPlaceholder:
             line1 = text[:mid]
             line2 = text[mid:]
 
-            bbox1 = temp_draw.textbbox((0, 0), line1, font=font)
-            bbox2 = temp_draw.textbbox((0, 0), line2, font=font)
-            width1 = bbox1[2] - bbox1[0]
-            width2 = bbox2[2] - bbox2[0]
+            width1 = text_width_px(font, line1)
+            width2 = text_width_px(font, line2)
 
             if width1 <= max_width_px and width2 <= max_width_px:
                 return (True, None, 2)
@@ -857,29 +754,7 @@ class TextOverlayPlaceholder:
                 return (False, warning, 3)  # Schaetzung: 3+ Zeilen benoetigt
 
         # Versuche intelligenten Umbruch (gleiche Logik wie _wrap_text_to_two_lines)
-        found_valid_split = False
-        for i in range(1, len(words)):
-            line1_candidate = " ".join(words[:i])
-            line2_candidate = " ".join(words[i:])
-
-            # Pruefe zuerst line1
-            bbox1 = temp_draw.textbbox((0, 0), line1_candidate, font=font)
-            width1 = bbox1[2] - bbox1[0]
-
-            if width1 > max_width_px:
-                # line1 zu lang -> abbrechen
-                break
-
-            # Pruefe line2
-            bbox2 = temp_draw.textbbox((0, 0), line2_candidate, font=font)
-            width2 = bbox2[2] - bbox2[0]
-
-            if width2 <= max_width_px:
-                # Text passt auf 2 Zeilen
-                found_valid_split = True
-                # Weiter versuchen, optimale Trennstelle zu finden
-
-        if found_valid_split:
+        if find_two_line_split(font, text, max_width_px) is not None:
             return (True, None, 2)
 
         # Kein gueter Umbruch gefunden → Text passt nicht auf 2 Zeilen
@@ -997,20 +872,8 @@ class TextOverlayPlaceholder:
         """
         font = self._load_font(font_size, dpi)
 
-        # Temporäres Draw-Objekt
-        temp_img = Image.new('RGB', (TEMP_IMAGE_SIZE_PX, TEMP_IMAGE_SIZE_PX))
-        temp_draw = ImageDraw.Draw(temp_img)
-
-        # Test-String mit allen relevanten Zeichen:
-        # - Hohe Buchstaben: T, l, d, f, h, k (maximaler Ascent)
-        # - Tiefe Buchstaben: g, y, p, q, j, _ (maximaler Descent)
-        # - Zahlen und Sonderzeichen: 0-9, /, =, - (für Stärke-Zeile)
-        test_string = "Tlfhk_gyqj0123456789/=-:OV"
-
-        bbox = temp_draw.textbbox((0, 0), test_string, font=font)
-
-        max_ascent = bbox[1]    # Abstand Baseline -> Oberkante
-        max_descent = bbox[3]   # Abstand Baseline -> Unterkante
+        # CHANGED: Messung mit font.getbbox(), memoisiert pro Font (text_layout.font_metrics)
+        max_ascent, max_descent = font_metrics(font)
 
         self.logger.debug(
             "Max Font-Metrics für {}pt @ {}dpi: ascent={}px, descent={}px".format(
@@ -1122,7 +985,7 @@ class TextOverlayPlaceholder:
             font_size: Schriftgroesse
             dpi: Aufloesung
         """
-        draw = ImageDraw.Draw(canvas)
+        draw = get_draw(canvas)  # CHANGED: PIL Image oder VectorCanvas (Vektor-PDF)
         font = self._load_font(font_size, dpi)
 
         # WICHTIG: draw.text() verwendet die Y-Position als BASELINE, nicht als Oberkante!
@@ -1148,8 +1011,7 @@ class TextOverlayPlaceholder:
         # Die längste Zeile ist immer die letzte (Stärke oder Ruf)
         longest_line = lines[-1]  # Letzte Zeile ist immer die längste
         
-        bbox = draw.textbbox((0, 0), longest_line, font=font)
-        text_width = bbox[2] - bbox[0]
+        text_width = text_width_px(font, longest_line)  # CHANGED: Gleiche Messung, memoisiert
         
         # Zentriere die längste Zeile im Canvas
         x_start = (canvas.width - text_width) // 2
@@ -1173,6 +1035,7 @@ class TextOverlayPlaceholder:
         Laedt Font mit Fallback-Mechanismus
 
             WICHTIG: Testet mehrere Varianten um Encoding-Probleme zu vermeiden
+            (font_registry: einmal pro Schriftart, danach aus dem Font-Cache)
 
         Args:
             font_size: Schriftgröße in Punkten
@@ -1189,44 +1052,8 @@ class TextOverlayPlaceholder:
 
         font_size_px = int((font_size / POINTS_PER_INCH) * dpi)
 
-        # FontManager für Fallback verwenden
-        font_mgr = FontManager()
-        actual_font, _ = font_mgr.check_and_get_font(font_family)
-
-        # Versuche Schriftart zu laden. Mehrere Varianten testen (mit und ohne .lower())
-        font_paths = [
-            # Variante 1: Original-Name (Case-Sensitive)
-            f"{actual_font}.ttf",
-            
-            # Variante 2: Windows Fonts mit Original-Name
-            f"C:/Windows/Fonts/{actual_font}.ttf",
-            
-            # Variante 3: Lowercase (für Standard-Fonts wie "arial")
-            f"{actual_font.lower()}.ttf",
-            
-            # Variante 4: Windows Fonts mit Lowercase
-            f"C:/Windows/Fonts/{actual_font.lower()}.ttf",
-            
-            # Variante 5: Vollständiger Name als Fallback
-            actual_font
-        ]
-        
-        # Alle Varianten durchprobieren
-        for font_path in font_paths:
-            try:
-                font = ImageFont.truetype(font_path, font_size_px)
-                self.logger.debug(f"Font geladen: {actual_font} ({font_size_px}px) via '{font_path}'")
-                return font
-            except Exception:
-                # Nächste Variante probieren
-                continue
-
-        # Fallback: System-Default
-        self.logger.warning(
-            f"Schriftart '{actual_font}' konnte nicht geladen werden. "
-            f"Verwende Default-Font. Alle Pfade getestet: {len(font_paths)}"
-        )
-        return ImageFont.load_default()
+        # CHANGED: Auflösung (inkl. FontManager-Fallback) einmal pro Prozess, Fonts gecacht
+        return get_font(font_family, font_size_px)
 
 
 if __name__ == "__main__":
@@ -25,7 +25,13 @@ from constants import (
     mm_to_pixels,
     pixels_to_mm,
     AVAILABLE_MODI,
-    AVAILABLE_GRAFIK_POSITIONS
+    AVAILABLE_GRAFIK_POSITIONS,
+    AVAILABLE_RENDER_BACKENDS,
+    AVAILABLE_RENDER_ENGINES,
+    AVAILABLE_TEMPLATE_CACHE_SCOPES,
+    AVAILABLE_BATCH_ENGINES,
+    AVAILABLE_PDF_IMAGE_CODECS,
+    AVAILABLE_PDF_EXPORT_MODES
 )
 
 
@@ -444,7 +450,25 @@ class RuntimeConfigValidator:
             's1_zeichen_breite_mm': self._validate_zeichen_breite,
             's1_beschnittzugabe_mm': self._validate_beschnittzugabe,
             's1_sicherheitsabstand_mm': self._validate_sicherheitsabstand,
-            's1_anzahl_schreiblinien': self._validate_s1_anzahl_schreiblinien
+            's1_anzahl_schreiblinien': self._validate_s1_anzahl_schreiblinien,
+            # NEW: Performance-Einstellungen
+            'raster_cache_enabled': self._validate_bool,
+            'raster_cache_max_mb': self._validate_raster_cache_max_mb,
+            'render_backend': self._validate_render_backend,
+            'render_engine': self._validate_render_engine,
+            'template_cache_scope': self._validate_template_cache_scope,
+            'template_cache_max_mb': self._validate_template_cache_max_mb,
+            'batch_engine': self._validate_batch_engine,
+            'pipeline_queue_depth': self._validate_pipeline_queue_depth,
+            'memory_budget_mb': self._validate_memory_budget_mb,
+            'pdf_image_codec': self._validate_pdf_image_codec,
+            'pdf_flate_level': self._validate_pdf_flate_level,
+            'pdf_jpeg_quality': self._validate_pdf_jpeg_quality,
+            'pdf_export_mode': self._validate_pdf_export_mode,
+            'pdf_file_workers': self._validate_pdf_file_workers,
+            'pdf_single_file': self._validate_bool,
+            'pdf_chunk_size': self._validate_pdf_chunk_size,
+            'pdf_chunk_size_schnittbogen': self._validate_pdf_chunk_size
         }
 
         # Validator für Key finden
@@ -573,6 +597,122 @@ class RuntimeConfigValidator:
 
         return True, None
 
+    def _validate_raster_cache_max_mb(self, value: int) -> Tuple[bool, Optional[str]]:
+        """Validiert Größenbudget des Raster-Caches (0 = deaktiviert)"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False, f"Cache-Größe muss Integer sein, ist aber {type(value)}"
+
+        if value < 0 or value > 102400:
+            return False, f"Cache-Größe muss zwischen 0 und 102400 MB liegen (ist: {value})"
+
+        return True, None
+
+    def _validate_render_backend(self, value: str) -> Tuple[bool, Optional[str]]:
+        """Validiert Render-Backend"""
+        if value not in AVAILABLE_RENDER_BACKENDS:
+            return False, f"Ungültiges Render-Backend '{value}'. Erlaubt: {AVAILABLE_RENDER_BACKENDS}"
+        return True, None
+
+    def _validate_render_engine(self, value: str) -> Tuple[bool, Optional[str]]:
+        """Validiert SVG-Renderer"""
+        if value not in AVAILABLE_RENDER_ENGINES:
+            return False, f"Ungültiger SVG-Renderer '{value}'. Erlaubt: {AVAILABLE_RENDER_ENGINES}"
+        return True, None
+
+    def _validate_template_cache_scope(self, value: str) -> Tuple[bool, Optional[str]]:
+        """Validiert Lebensdauer des Template-Speichers"""
+        if value not in AVAILABLE_TEMPLATE_CACHE_SCOPES:
+            return False, f"Ungültiger Template-Speicher '{value}'. Erlaubt: {AVAILABLE_TEMPLATE_CACHE_SCOPES}"
+        return True, None
+
+    def _validate_template_cache_max_mb(self, value: int) -> Tuple[bool, Optional[str]]:
+        """Validiert Größenbudget des Template-Speichers (0 = keine stapelübergreifende Wiederverwendung)"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False, f"Template-Speicher-Größe muss Integer sein, ist aber {type(value)}"
+
+        if value < 0 or value > 65536:
+            return False, f"Template-Speicher-Größe muss zwischen 0 und 65536 MB liegen (ist: {value})"
+
+        return True, None
+
+    def _validate_batch_engine(self, value: str) -> Tuple[bool, Optional[str]]:
+        """Validiert Batch-Engine"""
+        if value not in AVAILABLE_BATCH_ENGINES:
+            return False, f"Ungültige Batch-Engine '{value}'. Erlaubt: {AVAILABLE_BATCH_ENGINES}"
+        return True, None
+
+    def _validate_pipeline_queue_depth(self, value: int) -> Tuple[bool, Optional[str]]:
+        """Validiert Warteschlangentiefe der Pipeline-Stufen"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False, f"Warteschlangentiefe muss Integer sein, ist aber {type(value)}"
+
+        if value < 1 or value > 256:
+            return False, f"Warteschlangentiefe muss zwischen 1 und 256 liegen (ist: {value})"
+
+        return True, None
+
+    def _validate_memory_budget_mb(self, value: int) -> Tuple[bool, Optional[str]]:
+        """Validiert RAM-Budget des Speicher-Schedulers (0 = automatisch)"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False, f"Speicherbudget muss Integer sein, ist aber {type(value)}"
+
+        if value != 0 and (value < 256 or value > 262144):
+            return False, f"Speicherbudget muss 0 (automatisch) oder 256-262144 MB sein (ist: {value})"
+
+        return True, None
+
+    def _validate_pdf_image_codec(self, value: str) -> Tuple[bool, Optional[str]]:
+        """Validiert Bild-Kodierung im PDF"""
+        if value not in AVAILABLE_PDF_IMAGE_CODECS:
+            return False, f"Ungültige PDF-Bildkodierung '{value}'. Erlaubt: {AVAILABLE_PDF_IMAGE_CODECS}"
+        return True, None
+
+    def _validate_pdf_flate_level(self, value: int) -> Tuple[bool, Optional[str]]:
+        """Validiert zlib-Stufe der PDF-Bildkodierung"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False, f"Flate-Stufe muss Integer sein, ist aber {type(value)}"
+
+        if value < 1 or value > 9:
+            return False, f"Flate-Stufe muss zwischen 1 und 9 liegen (ist: {value})"
+
+        return True, None
+
+    def _validate_pdf_jpeg_quality(self, value: int) -> Tuple[bool, Optional[str]]:
+        """Validiert JPEG-Qualität der PDF-Bildkodierung"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False, f"JPEG-Qualität muss Integer sein, ist aber {type(value)}"
+
+        if value < 50 or value > 100:
+            return False, f"JPEG-Qualität muss zwischen 50 und 100 liegen (ist: {value})"
+
+        return True, None
+
+    def _validate_pdf_export_mode(self, value: str) -> Tuple[bool, Optional[str]]:
+        """Validiert PDF-Exportmodus"""
+        if value not in AVAILABLE_PDF_EXPORT_MODES:
+            return False, f"Ungültiger PDF-Exportmodus '{value}'. Erlaubt: {AVAILABLE_PDF_EXPORT_MODES}"
+        return True, None
+
+    def _validate_pdf_file_workers(self, value: int) -> Tuple[bool, Optional[str]]:
+        """Validiert Anzahl gleichzeitig erstellter PDF-Dateien (0 = automatisch)"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False, f"PDF-Datei-Worker muss Integer sein, ist aber {type(value)}"
+
+        if value < 0 or value > 64:
+            return False, f"PDF-Datei-Worker muss zwischen 0 und 64 liegen (ist: {value})"
+
+        return True, None
+
+    def _validate_pdf_chunk_size(self, value: int) -> Tuple[bool, Optional[str]]:
+        """Validiert Seiten pro PDF-Datei (0 = eine Datei)"""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return False, f"Seiten pro PDF-Datei muss Integer sein, ist aber {type(value)}"
+
+        if value < 0 or value > 100000:
+            return False, f"Seiten pro PDF-Datei muss zwischen 0 und 100000 liegen (ist: {value})"
+
+        return True, None
+
     def _validate_placeholder_length(self, value: int) -> Tuple[bool, Optional[str]]:
         """Validiert Platzhalter-Länge"""
         if not isinstance(value, int):
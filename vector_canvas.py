@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+vector_canvas.py - Aufzeichnende Zeichenfläche für den Vektor-PDF-Export
+
+Beim Raster-Export wird jedes Zeichen mit 300-600 DPI gerastert, der Text als
+Pixel gesetzt und das Bild ins PDF eingebettet - obwohl Quelle (SVG) und Ziel
+(PDF) Vektorformate sind.
+
+VectorCanvas verhält sich für den bestehenden Layout-Code (create_zeichen,
+create_zeichen_s1, TextOverlayPlaceholder, PrintPreparer) wie ein PIL Image
+(width, height, mode, info, copy, paste) und wie ein ImageDraw (line,
+rectangle, text, textbbox). Es wird aber nicht gerastert, sondern
+aufgezeichnet - in denselben Pixel-Koordinaten, also mit derselben
+Layout-Mathematik. Beim PDF-Export werden die Operationen abgespielt:
+- Linien/Rechtecke -> PDF-Pfade
+- Text             -> PDF-Text (dieselbe TrueType-Schrift, eingebettet)
+- SVG-Grafik       -> ReportLab-Drawing über svglib (optional)
+- Pseudo-SVGs      -> Bild (wie beim Raster-Export)
+
+Ohne svglib werden SVG-Grafiken gerastert eingebettet, Text und Linien
+bleiben Vektoren.
+
+Verwendung:
+    page = generator.create_zeichen(svg_path, config, return_image=True, vector=True)
+    page.draw_pdf(canvas_obj, x, y, width, height, place_image)
+"""
+
+import hashlib
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from logging_manager import LoggingManager
+from pdf_image_codec import EncodedImage, encode_pdf_image
+from text_layout import text_bbox
+from constants import PNG_COLOR_MODE, SYSTEM_VECTOR_DRAWING_CACHE_SIZE
+
+# Optional: svglib für SVG -> ReportLab-Drawing
+try:
+    from svglib.svglib import svg2rlg
+    from reportlab.graphics import renderPDF
+    SVGLIB_AVAILABLE = True
+except ImportError:
+    SVGLIB_AVAILABLE = False
+
+# Ersatzschrift, wenn die PIL-Schrift nicht als TrueType eingebettet werden kann
+_FALLBACK_FONT = "Helvetica"
+
+_font_lock = Lock()
+_pdf_fonts: Dict[str, str] = {}  # Schrift-Schlüssel -> registrierter PDF-Schriftname
+
+_drawing_lock = Lock()
+_drawings: Dict[str, Any] = {}  # SVG-Inhalts-Hash -> ReportLab-Drawing (None = nicht lesbar)
+
+_svglib_warned = False
+
+
+def get_draw(canvas) -> Any:
+    """
+    Zeichen-Objekt für eine Zeichenfläche (ImageDraw für PIL, sonst die Fläche selbst)
+
+    Args:
+        canvas: PIL Image oder VectorCanvas
+
+    Returns:
+        Objekt mit line(), rectangle(), text(), textbbox()
+    """
+    if isinstance(canvas, VectorCanvas):
+        return canvas
+    return ImageDraw.Draw(canvas)
+
+
+@dataclass
+class VectorGraphic:
+    """
+    SVG-Grafik als ReportLab-Drawing, auf Zielgröße eingepasst
+
+    Attributes:
+        drawing: ReportLab-Drawing (svglib)
+        bounds: Inhalts-Box im Drawing (x0, y0, x1, y1) - entspricht dem Trimmen beim Rastern
+        width: Breite in Pixeln (Layout-Koordinaten)
+        height: Höhe in Pixeln (Layout-Koordinaten)
+        key: Eindeutiger Schlüssel (SVG-Inhalts-Hash + Größe)
+    """
+    drawing: Any
+    bounds: Tuple[float, float, float, float]
+    width: float
+    height: float
+    key: str
+    mode: str = 'RGBA'
+
+    def copy(self) -> 'VectorGraphic':
+        """Unveränderlich - Kopie ist das Objekt selbst (wie Template-Kopien im Raster-Export)"""
+        return self
+
+
+def load_vector_graphic(
+    svg_path: Path,
+    digest: str,
+    max_width_px: float,
+    max_height_px: float
+) -> Optional[VectorGraphic]:
+    """
+    Lädt SVG als Drawing und passt die Inhalts-Box in die Ziel-Box ein
+
+    Args:
+        svg_path: Pfad zur SVG-Datei
+        digest: Inhalts-Hash (Cache-Schlüssel)
+        max_width_px: Maximale Breite in Pixeln
+        max_height_px: Maximale Höhe in Pixeln
+
+    Returns:
+        VectorGraphic oder None (svglib fehlt / SVG nicht lesbar -> Raster-Fallback)
+    """
+    global _svglib_warned
+    logger = LoggingManager().get_logger(__name__)
+
+    if not SVGLIB_AVAILABLE:
+        if not _svglib_warned:
+            logger.warning("svglib nicht installiert - SVG-Grafiken werden im Vektor-PDF gerastert")
+            _svglib_warned = True
+        return None
+
+    with _drawing_lock:
+        cached = digest in _drawings
+        drawing = _drawings.get(digest)
+
+    if not cached:
+        try:
+            drawing = svg2rlg(str(svg_path))
+        except Exception as e:
+            logger.warning(f"svglib konnte {svg_path.name} nicht lesen ({e}) - rastere Grafik")
+            drawing = None
+        with _drawing_lock:
+            if len(_drawings) >= SYSTEM_VECTOR_DRAWING_CACHE_SIZE:
+                _drawings.pop(next(iter(_drawings)))
+            _drawings[digest] = drawing
+
+    if drawing is None:
+        return None
+
+    bounds = drawing.getBounds()
+    if bounds is None or bounds[2] <= bounds[0] or bounds[3] <= bounds[1]:
+        logger.warning(f"SVG ohne sichtbaren Inhalt im Drawing: {svg_path.name} - rastere Grafik")
+        return None
+
+    content_width = bounds[2] - bounds[0]
+    content_height = bounds[3] - bounds[1]
+    scale = min(max_width_px / content_width, max_height_px / content_height)
+    width = content_width * scale
+    height = content_height * scale
+
+    return VectorGraphic(
+        drawing=drawing,
+        bounds=tuple(bounds),
+        width=width,
+        height=height,
+        key="{}_{:.3f}x{:.3f}".format(digest, width, height)
+    )
+
+
+def _rgb(color) -> Tuple[float, float, float]:
+    """PIL-Farbe (Grauwert, RGB, RGBA) -> ReportLab RGB 0..1"""
+    if color is None:
+        return (0.0, 0.0, 0.0)
+    if isinstance(color, int):
+        return (color / 255.0,) * 3
+    return tuple(c / 255.0 for c in color[:3])
+
+
+def _font_key(font) -> Optional[Tuple[str, Any]]:
+    """Schlüssel + Quelle einer PIL-Schrift (None = nicht als TrueType einbettbar)"""
+    path = getattr(font, 'path', None)
+    if isinstance(path, (str, Path)):
+        return str(path), str(path)
+    if hasattr(path, 'getvalue'):
+        data = path.getvalue()
+        return hashlib.sha1(data).hexdigest(), data
+    return None
+
+
+def _pdf_font_name(font) -> str:
+    """
+    Registriert die PIL-Schrift einmal als ReportLab-TTFont (thread-safe)
+
+    Returns:
+        PDF-Schriftname (Ersatzschrift, falls nicht einbettbar)
+    """
+    key = _font_key(font)
+    if key is None:
+        return _FALLBACK_FONT
+
+    font_id, source = key
+    with _font_lock:
+        name = _pdf_fonts.get(font_id)
+        if name is None:
+            name = "TZFont{}".format(len(_pdf_fonts))
+            try:
+                pdfmetrics.registerFont(TTFont(name, BytesIO(source) if isinstance(source, bytes) else source))
+            except Exception as e:
+                LoggingManager().get_logger(__name__).warning(
+                    f"Schrift {getattr(font, 'getname', lambda: ('?',))()[0]} nicht einbettbar ({e}) - "
+                    f"verwende {_FALLBACK_FONT}")
+                name = _FALLBACK_FONT
+            _pdf_fonts[font_id] = name
+        return name
+
+
+class VectorCanvas:
+    """
+    Zeichenfläche, die PIL-Zeichenbefehle aufzeichnet statt zu rastern
+
+    Koordinaten sind Pixel bei der DPI des Zeichens (wie im Raster-Export),
+    Ursprung links oben. Erst draw_pdf() rechnet in PDF-Punkte um.
+    """
+
+    def __init__(self, width: int, height: int):
+        """
+        Initialisiert leere Fläche
+
+        Args:
+            width: Breite in Pixeln
+            height: Höhe in Pixeln
+        """
+        self.width = width
+        self.height = height
+        self.mode = PNG_COLOR_MODE
+        self.info: Dict[str, Any] = {}
+        self._ops: List[tuple] = []
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(Breite, Höhe) wie PIL Image.size"""
+        return self.width, self.height
+
+    # --------------------------------------------------------------------------------------------
+    # PIL Image
+    # --------------------------------------------------------------------------------------------
+
+    def copy(self) -> 'VectorCanvas':
+        """Kopie mit eigener Operationsliste"""
+        clone = VectorCanvas(self.width, self.height)
+        clone.info = dict(self.info)
+        clone._ops = list(self._ops)
+        return clone
+
+    def paste(self, im, box=None, mask=None):
+        """
+        Fügt Fläche, Vektorgrafik oder PIL-Bild ein (mask wird ignoriert - PDF ist transparent)
+
+        Args:
+            im: VectorCanvas, VectorGraphic oder PIL Image
+            box: (x, y) linke obere Ecke in Pixeln
+        """
+        x, y = (box or (0, 0))[:2]
+        if isinstance(im, VectorCanvas):
+            self._ops.append(('canvas', x, y, im))
+        elif isinstance(im, VectorGraphic):
+            self._ops.append(('graphic', x, y, im))
+        else:
+            self._ops.append(('image', x, y, im))
+
+    # --------------------------------------------------------------------------------------------
+    # PIL ImageDraw
+    # --------------------------------------------------------------------------------------------
+
+    def line(self, xy, fill=None, width=0, **kwargs):
+        """Linie/Polylinie wie ImageDraw.line (Breite in Pixeln)"""
+        points = [tuple(p) for p in xy] if isinstance(xy[0], (tuple, list)) else list(zip(xy[::2], xy[1::2]))
+        self._ops.append(('line', tuple(points), fill, max(1, width)))
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        """Rechteck wie ImageDraw.rectangle (Rahmen nach innen, Eckpunkte inklusive)"""
+        (x0, y0), (x1, y1) = xy if isinstance(xy[0], (tuple, list)) else (xy[:2], xy[2:])
+        self._ops.append(('rect', x0, y0, x1, y1, fill, outline, width))
+
+    def text(self, xy, text, fill=None, font=None, stroke_width=0, stroke_fill=None, **kwargs):
+        """Text wie ImageDraw.text (Anker "la": xy = links / Oberlänge)"""
+        if font is None:
+            font = ImageDraw.Draw(Image.new('L', (1, 1))).getfont()
+        self._ops.append(('text', xy[0], xy[1], text, fill, font, stroke_width, stroke_fill))
+
+    @staticmethod
+    def textbbox(xy, text, font=None, **kwargs):
+        """Text-Box wie ImageDraw.textbbox (identische Messung wie beim Rastern)"""
+        if font is None or kwargs:
+            return ImageDraw.Draw(Image.new('L', (1, 1))).textbbox(xy, text, font=font, **kwargs)
+        # CHANGED: Ohne Zusatz-Optionen memoisierte Messung (text_layout, font.getbbox)
+        left, top, right, bottom = text_bbox(font, text)
+        return (left + xy[0], top + xy[1], right + xy[0], bottom + xy[1])
+
+    # --------------------------------------------------------------------------------------------
+    # PDF
+    # --------------------------------------------------------------------------------------------
+
+    def encode_images(self, codec: Optional[str] = None) -> 'VectorCanvas':
+        """
+        Kodiert eingefügte PIL-Bilder (Pseudo-SVGs / Raster-Fallback) für das PDF
+
+        Läuft in Worker-Threads, damit der PDF-Writer nur noch Bytes einbettet.
+
+        Args:
+            codec: Bild-Kodierung (default: RuntimeConfig)
+
+        Returns:
+            self
+        """
+        for i, op in enumerate(self._ops):
+            if op[0] == 'image' and isinstance(op[3], Image.Image):
+                self._ops[i] = ('image', op[1], op[2], encode_pdf_image(op[3], codec))
+            elif op[0] == 'canvas':
+                op[3].encode_images(codec)
+        return self
+
+    @property
+    def digest(self) -> str:
+        """Hash der Operationen (Erkennung identischer Seiten im PDF)"""
+        return hashlib.sha1(repr(self._describe()).encode('utf-8')).hexdigest()
+
+    def _describe(self) -> list:
+        """Vergleichbare Beschreibung aller Operationen"""
+        described = []
+        for op in self._ops:
+            kind = op[0]
+            if kind == 'canvas':
+                described.append((kind, op[1], op[2], op[3]._describe()))
+            elif kind == 'graphic':
+                described.append((kind, op[1], op[2], op[3].key))
+            elif kind == 'image':
+                data = op[3].digest if isinstance(op[3], EncodedImage) else id(op[3])
+                described.append((kind, op[1], op[2], data))
+            elif kind == 'text':
+                key = _font_key(op[5])
+                described.append(op[:5] + (key[0] if key else None, op[5].size) + op[6:])
+            else:
+                described.append(op)
+        return described
+
+    def draw_pdf(
+        self,
+        canvas_obj,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        place_image: Callable[[EncodedImage, float, float], None]
+    ):
+        """
+        Spielt die Fläche in ein ReportLab-Canvas ab (nur aus dem Writer-Thread)
+
+        Args:
+            canvas_obj: ReportLab Canvas (Seite oder Form XObject)
+            x, y: Position (links unten, Punkte)
+            width, height: Größe (Punkte) - Pixel werden darauf skaliert
+            place_image: place_image(encoded, breite, höhe) zeichnet ein kodiertes Bild
+                in (0, 0, breite, höhe) des aktuellen Koordinatensystems
+        """
+        canvas_obj.saveState()
+        # Pixel-Koordinaten, Ursprung links oben (Y nach unten wie in PIL)
+        canvas_obj.translate(x, y + height)
+        canvas_obj.scale(width / self.width, -height / self.height)
+        canvas_obj.setLineCap(0)
+        self._replay(canvas_obj, place_image)
+        canvas_obj.restoreState()
+
+    def _replay(self, c, place_image):
+        """Zeichnet alle Operationen im Pixel-Koordinatensystem"""
+        for op in self._ops:
+            kind = op[0]
+
+            if kind == 'line':
+                _, points, fill, width = op
+                c.setStrokeColorRGB(*_rgb(fill))
+                c.setLineWidth(width)
+                path = c.beginPath()
+                # Pixelmitte wie beim Rastern
+                path.moveTo(points[0][0] + 0.5, points[0][1] + 0.5)
+                for px, py in points[1:]:
+                    path.lineTo(px + 0.5, py + 0.5)
+                c.drawPath(path, stroke=1, fill=0)
+
+            elif kind == 'rect':
+                _, x0, y0, x1, y1, fill, outline, width = op
+                if fill is not None:
+                    c.setFillColorRGB(*_rgb(fill))
+                    c.rect(x0, y0, x1 + 1 - x0, y1 + 1 - y0, stroke=0, fill=1)
+                if outline is not None and width > 0:
+                    # PIL zeichnet den Rahmen nach innen
+                    c.setStrokeColorRGB(*_rgb(outline))
+                    c.setLineWidth(width)
+                    c.rect(x0 + width / 2, y0 + width / 2, x1 + 1 - x0 - width, y1 + 1 - y0 - width,
+                           stroke=1, fill=0)
+
+            elif kind == 'text':
+                self._replay_text(c, *op[1:])
+
+            elif kind == 'graphic':
+                _, gx, gy, graphic = op
+                bx0, by0, bx1, _ = graphic.bounds
+                scale = graphic.width / (bx1 - bx0)
+                c.saveState()
+                c.translate(gx, gy + graphic.height)
+                c.scale(scale, -scale)
+                c.translate(-bx0, -by0)
+                renderPDF.draw(graphic.drawing, c, 0, 0)
+                c.restoreState()
+
+            elif kind == 'image':
+                _, ix, iy, encoded = op
+                if not isinstance(encoded, EncodedImage):
+                    encoded = encode_pdf_image(encoded)
+                c.saveState()
+                c.translate(ix, iy + encoded.height)
+                c.scale(1, -1)
+                place_image(encoded, encoded.width, encoded.height)
+                c.restoreState()
+
+            elif kind == 'canvas':
+                _, cx, cy, child = op
+                c.saveState()
+                c.translate(cx, cy)
+                child._replay(c, place_image)
+                c.restoreState()
+
+    @staticmethod
+    def _replay_text(c, x, y, text, fill, font, stroke_width, stroke_fill):
+        """Text an PIL-Position (Oberlänge) -> PDF-Grundlinie"""
+        font_name = _pdf_font_name(font)
+        font_size = getattr(font, 'size', 10)
+        ascent = font.getmetrics()[0] if hasattr(font, 'getmetrics') else font_size * 0.8
+
+        c.saveState()
+        c.translate(x, y + ascent)
+        c.scale(1, -1)  # Text wieder aufrecht
+        if stroke_width:
+            # Kontur unter dem Text (wie PIL stroke_fill), Füllung darüber
+            c.setStrokeColorRGB(*_rgb(stroke_fill))
+            c.setLineWidth(2 * stroke_width)
+            c.setLineJoin(1)
+            outline = c.beginText(0, 0)
+            outline.setFont(font_name, font_size)
+            outline.setTextRenderMode(1)
+            outline.textOut(text)
+            c.drawText(outline)
+        c.setFillColorRGB(*_rgb(fill))
+        label = c.beginText(0, 0)
+        label.setFont(font_name, font_size)
+        label.textOut(text)
+        c.drawText(label)
+        c.restoreState()
+
+
+# ================================================================================================
+# TESTING
+# ================================================================================================
+
+if __name__ == "__main__":
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.units import mm
+
+    print("=" * 80)
+    print("VECTOR-CANVAS TEST")
+    print("=" * 80)
+
+    surface = VectorCanvas(600, 600)
+    draw = get_draw(surface)
+    draw.rectangle([(3, 3), (596, 596)], outline=(255, 0, 0), width=3)
+    draw.line([(50, 500), (550, 500)], fill=(80, 80, 80), width=1)
+    draw.text((50, 420), "OV Test", fill=(0, 0, 0), font=ImageDraw.Draw(Image.new('L', (1, 1))).getfont())
+
+    output = Path("test_vector_canvas.pdf")
+    c = canvas.Canvas(str(output), pagesize=(51 * mm, 51 * mm))
+    surface.draw_pdf(c, 0, 0, 51 * mm, 51 * mm, place_image=lambda *args: None)
+    c.save()
+
+    print(f"\nsvglib verfügbar: {SVGLIB_AVAILABLE}")
+    print(f"Operationen: {len(surface._ops)} | Digest: {surface.digest[:12]}")
+    print(f"[OK] Gespeichert: {output} ({output.stat().st_size} Bytes)")
+    print("=" * 80)